@@ -0,0 +1,159 @@
+"""작업 프로파일 (Action Profiler) 모듈
+
+"다음 작업 프로파일"을 켜면 다음에 실행되는 단면 그리기, 부력검토,
+DXF 내보내기 중 하나를 cProfile로 측정하고, 측정 결과와 그 시점의 프로젝트
+JSON을 묶음(zip)으로 저장한다. 사용자가 느리다고 보고한 프로젝트를
+그대로 재현해 분석할 수 있다.
+
+묶음 파일 내용
+    meta.json      : 작업 이름, 시각, 소요 시간, Python/플랫폼, 계산 코드 버전
+    project.json   : 측정 시점의 프로젝트 데이터
+    profile.pstats : cProfile 원본 (python -m pstats / snakeviz 등)
+    profile.txt    : 누적 시간순 상위 함수 목록
+"""
+
+import cProfile
+import functools
+import io
+import json
+import marshal
+import os
+import platform
+import pstats
+import sys
+import time
+import zipfile
+from contextlib import contextmanager
+from utils import get_app_data_dir
+from result_cache import code_version
+
+TOP_FUNCTIONS = 60    # profile.txt에 적을 함수 수
+
+
+def default_profile_dir():
+    return get_app_data_dir('profiles')
+
+
+class ActionProfiler:
+    """다음 작업 한 번을 프로파일하고 묶음 파일로 저장"""
+
+    def __init__(self, snapshot=None, directory=None, on_captured=None, on_failed=None):
+        self.snapshot = snapshot              # 프로젝트 데이터를 돌려주는 함수
+        self.directory = directory or default_profile_dir()
+        self.on_captured = on_captured        # 저장 후 호출 (묶음 경로)
+        self.on_failed = on_failed            # 저장 실패 시 호출 (예외)
+        self.armed = False
+        self._profile = None
+
+    def arm(self):
+        """다음 작업 측정 예약"""
+        self.armed = True
+
+    def disarm(self):
+        self.armed = False
+
+    def run(self, action, func, *args, **kwargs):
+        """예약되어 있으면 func 실행을 프로파일 (작업 안에서 다시 불린 작업은 그대로 실행)"""
+        if not self.armed or self._profile is not None:
+            return func(*args, **kwargs)
+        self.armed = False
+        project = self._take_snapshot()
+        profile = cProfile.Profile()
+        self._profile = profile
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.disable()
+            elapsed = time.perf_counter() - start
+            self._profile = None
+            self._finish(action, profile, project, elapsed)
+
+    def _finish(self, action, profile, project, elapsed):
+        """묶음 저장 후 결과 알림
+
+        저장/알림 중 오류는 on_failed로만 알리고 밖으로 내보내지 않는다
+        (측정한 작업의 반환값이나 예외를 가리지 않도록).
+        """
+        try:
+            path = self.save_bundle(action, profile, project, elapsed)
+            if self.on_captured:
+                self.on_captured(path)
+        except Exception as e:
+            if self.on_failed:
+                try:
+                    self.on_failed(e)
+                except Exception:
+                    pass
+
+    @contextmanager
+    def paused(self):
+        """측정 중에 사용자 입력 대기(대화상자) 구간을 제외"""
+        profile = self._profile
+        if profile is None:
+            yield
+            return
+        profile.disable()
+        try:
+            yield
+        finally:
+            profile.enable()
+
+    def _take_snapshot(self):
+        if self.snapshot is None:
+            return None
+        try:
+            return self.snapshot()
+        except Exception as e:
+            return {'error': f"프로젝트 데이터 수집 실패: {e}"}
+
+    def save_bundle(self, action, profile, project, elapsed):
+        """묶음 파일(zip) 저장 → 경로"""
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = time.strftime('%Y%m%d_%H%M%S')
+        path = os.path.join(self.directory, f"profile_{action}_{stamp}.zip")
+
+        text = io.StringIO()
+        stats = pstats.Stats(profile, stream=text)
+        stats.sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+        # pstats.Stats.dump_stats와 같은 형식
+        raw = marshal.dumps(stats.stats)
+
+        try:
+            version = code_version()
+        except OSError:
+            version = None
+        meta = {
+            'action': action, 'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'elapsed': elapsed, 'python': sys.version, 'platform': platform.platform(),
+            'code_version': version,
+        }
+        try:
+            with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+                zf.writestr('meta.json', json.dumps(meta, ensure_ascii=False, indent=2))
+                zf.writestr('project.json', json.dumps(project, ensure_ascii=False, indent=2))
+                zf.writestr('profile.pstats', raw)
+                zf.writestr('profile.txt', text.getvalue())
+        except Exception:
+            # 쓰다 만 묶음 파일은 남기지 않음
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+        return path
+
+
+def profiled_action(name):
+    """MainWindow 메서드를 '다음 작업 프로파일' 대상으로 지정하는 데코레이터
+
+    창의 action_profiler가 예약된 상태일 때만 측정하고, 아니면 바로 실행한다.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = getattr(self, 'action_profiler', None)
+            if profiler is None or not profiler.armed:
+                return method(self, *args, **kwargs)
+            return profiler.run(name, method, self, *args, **kwargs)
+        return wrapper
+    return decorator
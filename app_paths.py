@@ -0,0 +1,12 @@
+"""프로그램 데이터 폴더 경로 모듈
+
+Qt를 쓰지 않는 명령행 도구(프로젝트 라이브러리 등)도 사용할 수 있도록 utils와
+분리해 두었다. utils.get_app_data_dir는 이 함수를 다시 내보낸다.
+"""
+
+import os
+
+
+def get_app_data_dir(*parts):
+    """프로그램 데이터 폴더 경로 (~/.esc_culvert/...). 폴더는 만들지 않음"""
+    return os.path.join(os.path.expanduser('~'), '.esc_culvert', *parts)
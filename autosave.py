@@ -0,0 +1,180 @@
+"""자동 저장 (Autosave) 모듈
+
+편집 내용을 (경로, 값) 변경기록으로 저널 파일에 덧붙이고, 일정 개수/시간마다
+전체 JSON 체크포인트를 원자적으로(임시 파일 + rename) 기록한다.
+모든 디스크 쓰기는 백그라운드 스레드에서 수행하며 GUI 스레드는 큐에
+넣기만 한다. 비정상 종료 후에는 체크포인트에 저널을 재생해 복구한다.
+
+자동저장 상태 형식: {'filePath': 현재 파일 경로, 'project': 프로젝트 데이터}
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from project_paths import apply_changes
+
+CHECKPOINT_FILE = 'autosave.json'
+JOURNAL_FILE = 'autosave.journal'
+
+
+def atomic_write_json(path, data, indent=None):
+    """임시 파일에 쓴 뒤 rename하여 JSON 파일을 원자적으로 교체"""
+    tmp_path = path + '.tmp'
+    separators = None if indent else (',', ':')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent, separators=separators)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_autosave(directory):
+    """자동저장 복구 (체크포인트 + 저널 재생). 없으면 None
+
+    저널 마지막 줄이 쓰는 도중 끊겼으면 그 줄은 무시한다.
+    """
+    checkpoint_path = os.path.join(directory, CHECKPOINT_FILE)
+    journal_path = os.path.join(directory, JOURNAL_FILE)
+    if not os.path.exists(checkpoint_path):
+        return None
+    with open(checkpoint_path, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+
+    if os.path.exists(journal_path):
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                apply_changes(state, [(record['p'], record['v'])])
+    return state
+
+
+class AutosaveJournal:
+    """백그라운드 자동저장 기록기
+
+    디스크 쓰기 오류(OSError)가 나도 기록 스레드는 계속 동작한다. 오류는 on_error(메시지)로
+    알리고 (연속된 오류는 한 번만), 다음 기록 때 메모리의 상태로 체크포인트부터 다시 쓴다.
+    on_error는 기록 스레드에서 호출되므로 GUI에서는 시그널 등으로 넘겨 받아야 한다.
+    """
+
+    CHECKPOINT_EVERY = 200       # 체크포인트 간격 (변경기록 수)
+    CHECKPOINT_INTERVAL = 60.0   # 체크포인트 간격 (초, 변경이 있을 때만)
+
+    def __init__(self, directory, on_error=None):
+        self.directory = directory
+        self.checkpoint_path = os.path.join(directory, CHECKPOINT_FILE)
+        self.journal_path = os.path.join(directory, JOURNAL_FILE)
+        self.on_error = on_error
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def start(self, state):
+        """초기 상태로 체크포인트를 만들고 기록 스레드 시작"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='autosave', daemon=True)
+            self._thread.start()
+        self._queue.put(('reset', state))
+
+    def record(self, changes):
+        """변경기록 추가 [(경로, 값), ...] - GUI 스레드에서 호출 (블록 없음)"""
+        if changes:
+            self._queue.put(('changes', changes))
+
+    def close(self, discard=True):
+        """기록 스레드 종료 (discard=True면 정상 종료로 보고 자동저장 파일 삭제)"""
+        if self._thread is None:
+            return
+        self._queue.put(('close', discard))
+        self._thread.join()
+        self._thread = None
+
+    # ── 백그라운드 스레드 ──
+
+    def _report(self, error):
+        if self.on_error is None:
+            return
+        try:
+            self.on_error(f"자동저장 실패: {error}")
+        except Exception:
+            pass
+
+    def _run(self):
+        state = None
+        journal = None      # None이면 다음 기록 때 체크포인트부터 다시 씀
+        pending = 0
+        failing = False
+        last_checkpoint = time.monotonic()
+
+        def checkpoint():
+            nonlocal journal, pending, last_checkpoint
+            close_journal()
+            os.makedirs(self.directory, exist_ok=True)
+            atomic_write_json(self.checkpoint_path, state)
+            # 체크포인트 이후 저널을 비움 (재생은 값 설정이므로 중복 적용해도 무방)
+            journal = open(self.journal_path, 'w', encoding='utf-8')
+            pending = 0
+            last_checkpoint = time.monotonic()
+
+        def close_journal():
+            nonlocal journal
+            if journal is not None:
+                try:
+                    journal.close()
+                except OSError:
+                    pass
+                journal = None
+
+        while True:
+            try:
+                command, arg = self._queue.get(timeout=self.CHECKPOINT_INTERVAL)
+            except queue.Empty:
+                command, arg = 'idle', None
+
+            if command == 'close':
+                close_journal()
+                try:
+                    if arg:
+                        for path in (self.checkpoint_path, self.journal_path):
+                            if os.path.exists(path):
+                                os.remove(path)
+                    elif state is not None:
+                        atomic_write_json(self.checkpoint_path, state)
+                except OSError as e:
+                    self._report(e)
+                return
+
+            try:
+                if command == 'idle':
+                    if state is not None and (pending or journal is None):
+                        checkpoint()
+                elif command == 'reset':
+                    state = arg
+                    checkpoint()
+                elif command == 'changes' and state is not None:
+                    apply_changes(state, arg)
+                    if journal is None:
+                        checkpoint()
+                    else:
+                        for path, value in arg:
+                            journal.write(json.dumps({'p': list(path), 'v': value},
+                                                     ensure_ascii=False, separators=(',', ':')))
+                            journal.write('\n')
+                        pending += len(arg)
+                        # 큐에 쌓인 기록이 없을 때만 디스크 동기화
+                        if self._queue.empty():
+                            journal.flush()
+                            os.fsync(journal.fileno())
+                        if (pending >= self.CHECKPOINT_EVERY
+                                or time.monotonic() - last_checkpoint >= self.CHECKPOINT_INTERVAL):
+                            checkpoint()
+                failing = False
+            except OSError as e:
+                # 저널이 어디까지 기록됐는지 알 수 없으므로 닫고 다음에 체크포인트부터 다시 씀
+                close_journal()
+                if not failing:
+                    self._report(e)
+                failing = True
@@ -0,0 +1,232 @@
+"""성능 측정 (Benchmark) 모듈
+
+단면 조합 코퍼스(1 ~ 10련 × 연속벽/기둥 × 부상방지저판 유/무)에 대해
+부력검토 보고서, 암거 DXF 생성, 분할 도형 DXF 생성, 화면 표시(display_dxf)
+단계별 시간과 도형/씬 아이템 개수, 최대 메모리를 측정하고 저장된 기준값과
+비교한다. 화면 표시는 Qt offscreen 플랫폼에서 실행하므로 창이 뜨지 않는다.
+
+사용 예
+    python benchmark.py                       # 측정 + 기준값 비교 (기준값이 없으면 저장)
+    python benchmark.py --save-baseline       # 기준값 갱신
+    python benchmark.py --threshold 0.3 --repeat 5
+기준값보다 느려진 단계가 있으면 종료 코드 1을 반환한다.
+"""
+
+import argparse
+import gc
+import itertools
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication, QGraphicsScene
+from utils import get_app_data_dir, create_culvert_dxf, display_dxf
+from buoyancy_check import generate_buoyancy_report, create_buoyancy_shapes_dxf
+from autosave import atomic_write_json
+
+DEFAULT_THRESHOLD = 0.25     # 기준값 대비 허용 증가율 (25%)
+DEFAULT_REPEAT = 3
+STAGES = ['buoyancy_report', 'culvert_dxf', 'buoyancy_shapes_dxf', 'display_dxf']
+
+
+def default_baseline_path():
+    return os.path.join(get_app_data_dir('benchmark'), 'baseline.json')
+
+
+def benchmark_corpus():
+    """측정용 단면 목록 [(이름, 단면제원, 지반정보), ...]"""
+    cases = []
+    for n, wall_type, af_use in itertools.product(range(1, 11), ['연속벽', '기둥'], [False, True]):
+        haunch = {'upper': {'width': 300, 'height': 300}, 'lower': {'width': 300, 'height': 300}}
+        section_data = {
+            'culvert_count': n, 'H': 4200, 'H4': 0,
+            'B': [4000.0] * n, 'UT': 600, 'LT': 800, 'WL': 600, 'WR': 600,
+            'middle_walls': [{'type': wall_type, 'thickness': 600} for _ in range(n - 1)],
+            'haunch': {'leftWall': haunch, 'rightWall': haunch,
+                       'middleWalls': [haunch for _ in range(n - 1)]},
+            'columnGirder': {'columnCTC': 3000, 'columnWidth': 500,
+                             'upperAdditionalHeight': 200, 'lowerAdditionalHeight': 200},
+            'antiFloat': {'use': af_use, 'leftExtension': 500, 'rightExtension': 500, 'thickness': 300},
+        }
+        ground_info = {'earthCoverDepth': 2000, 'groundwaterLevel': 1500,
+                       'frictionAngle': 30, 'soilUnitWeight': 18.0}
+        name = f"{n}련-{wall_type}-{'AF' if af_use else 'noAF'}"
+        cases.append((name, section_data, ground_info))
+    return cases
+
+
+def _stage_functions(section_data, ground_info, scene):
+    """단계별 측정 함수 (반환값은 개수 집계용)
+
+    display_dxf는 미리 만든 도면으로 화면 표시만 측정한다
+    (도면 생성 시간은 culvert_dxf 단계에서 따로 측정).
+    """
+    doc = create_culvert_dxf(section_data, ground_info)
+    return {
+        'buoyancy_report': lambda: generate_buoyancy_report(section_data, ground_info),
+        'culvert_dxf': lambda: create_culvert_dxf(section_data, ground_info),
+        'buoyancy_shapes_dxf': lambda: create_buoyancy_shapes_dxf(section_data),
+        'display_dxf': lambda: display_dxf(doc, scene),
+    }
+
+
+def _best_time(func, repeat):
+    """repeat회 중 최소 시간 (s)"""
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _peak_memory(func):
+    """실행 중 Python 최대 할당량 (byte, tracemalloc)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _process_peak_rss():
+    """프로세스 최대 상주 메모리 (byte, 지원하지 않는 OS는 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+_app = None
+
+
+def _qt_app():
+    """씬 생성에 필요한 QApplication (이미 있으면 그대로 사용)"""
+    global _app
+    _app = QApplication.instance() or QApplication([])
+    return _app
+
+
+def run_benchmark(repeat=DEFAULT_REPEAT, cases=None, progress=None):
+    """전체 코퍼스 측정
+
+    Returns:
+        dict: {'cases': {이름: {단계: {'time', 'peak'}, 'entities', 'scene_items'}},
+               'totals': {단계: 시간 합계}, 'peak_rss': byte}
+    """
+    _qt_app()
+    scene = QGraphicsScene()
+    # 예열: 첫 호출의 초기화 비용(글꼴, 선 종류 등)은 측정에서 제외
+    cases = cases or benchmark_corpus()
+    _stage_functions(cases[0][1], cases[0][2], scene)['display_dxf']()
+
+    results = {}
+    totals = dict.fromkeys(STAGES, 0.0)
+    for k, (name, section_data, ground_info) in enumerate(cases):
+        funcs = _stage_functions(section_data, ground_info, scene)
+        row = {}
+        for stage in STAGES:
+            elapsed = _best_time(funcs[stage], repeat)
+            row[stage] = {'time': elapsed, 'peak': _peak_memory(funcs[stage])}
+            totals[stage] += elapsed
+        row['entities'] = len(create_culvert_dxf(section_data, ground_info).modelspace())
+        row['shape_entities'] = len(create_buoyancy_shapes_dxf(section_data).modelspace())
+        funcs['display_dxf']()
+        row['scene_items'] = len(scene.items())
+        results[name] = row
+        if progress:
+            progress(k + 1, len(cases), name)
+
+    scene.clear()
+    return {'cases': results, 'totals': totals, 'peak_rss': _process_peak_rss(),
+            'repeat': repeat, 'python': sys.version.split()[0]}
+
+
+def compare_with_baseline(result, baseline, threshold=DEFAULT_THRESHOLD):
+    """기준값 비교 → [(단계, 기준 시간, 현재 시간, 비율, 회귀 여부), ...]
+
+    단계별 코퍼스 전체 합계 시간으로 비교한다 (개별 사례는 잡음이 큼).
+    도형/아이템 개수가 달라진 사례도 함께 돌려준다.
+    """
+    rows = []
+    for stage in STAGES:
+        old = baseline.get('totals', {}).get(stage)
+        new = result['totals'][stage]
+        if not old:
+            continue
+        ratio = new / old
+        rows.append((stage, old, new, ratio, ratio > 1.0 + threshold))
+    changed_counts = []
+    for name, row in result['cases'].items():
+        old_row = baseline.get('cases', {}).get(name)
+        if not old_row:
+            continue
+        for key in ('entities', 'shape_entities', 'scene_items'):
+            if old_row.get(key) != row[key]:
+                changed_counts.append((name, key, old_row.get(key), row[key]))
+    return rows, changed_counts
+
+
+def format_result(result):
+    """측정 결과 표 (사례별 ms)"""
+    lines = [f"{'사례':<18}" + ''.join(f"{s:>21}" for s in STAGES) + f"{'도형':>7}{'아이템':>7}{'최대메모리(KB)':>14}"]
+    for name, row in result['cases'].items():
+        peak = max(row[s]['peak'] for s in STAGES) / 1024
+        lines.append(f"{name:<18}" + ''.join(f"{row[s]['time'] * 1000:>19.2f}ms" for s in STAGES)
+                     + f"{row['entities']:>7}{row['scene_items']:>7}{peak:>14,.0f}")
+    lines.append(f"{'합계':<18}" + ''.join(f"{result['totals'][s] * 1000:>19.1f}ms" for s in STAGES))
+    if result['peak_rss']:
+        lines.append(f"프로세스 최대 RSS = {result['peak_rss'] / 1024 / 1024:,.1f} MB")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='부력검토/DXF/화면표시 성능 측정')
+    parser.add_argument('--baseline', default=None, help='기준값 파일 경로')
+    parser.add_argument('--save-baseline', action='store_true', help='측정 결과를 기준값으로 저장')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='허용 증가율 (기본 0.25 = 25%%)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='단계별 반복 횟수')
+    parser.add_argument('--output', default=None, help='측정 결과 JSON 저장 경로')
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(args.repeat, progress=lambda i, n, name: print(
+        f"\r측정 중 {i}/{n} {name:<18}", end='', file=sys.stderr, flush=True))
+    print(file=sys.stderr)
+    print(format_result(result))
+    if args.output:
+        atomic_write_json(args.output, result, indent=2)
+
+    baseline_path = args.baseline or default_baseline_path()
+    if args.save_baseline or not os.path.exists(baseline_path):
+        os.makedirs(os.path.dirname(os.path.abspath(baseline_path)), exist_ok=True)
+        atomic_write_json(baseline_path, result, indent=2)
+        print(f"기준값 저장: {baseline_path}")
+        return 0
+
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    rows, changed_counts = compare_with_baseline(result, baseline, args.threshold)
+    print(f"\n기준값 비교 ({baseline_path}, 허용 +{args.threshold:.0%})")
+    regressed = False
+    for stage, old, new, ratio, regression in rows:
+        mark = "  ← 느려짐" if regression else ""
+        print(f"  {stage:<22}{old * 1000:>10.1f}ms → {new * 1000:>10.1f}ms  ({ratio:.2f}×){mark}")
+        regressed = regressed or regression
+    for name, key, old, new in changed_counts:
+        print(f"  {name}: {key} {old} → {new}")
+    return 1 if regressed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,14 +1,17 @@
 """부력 검토 (Buoyancy Check) 모듈"""
 
 import ezdxf
-from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QTextEdit, QPushButton,
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QPushButton,
                               QHBoxLayout)
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
 from utils import setup_dimstyle
+from section_layout import get_section_layout
+from instrumentation import timed
+from report_viewer import ReportViewer
 
 GAMMA_C = 24.5   # 콘크리트 단위중량 (kN/m³)
 GAMMA_W = 9.81   # 물의 단위중량 (kN/m³)
+REQUIRED_FS = 1.20   # 필요 안전율
 
 
 def _fmt(val):
@@ -28,20 +31,29 @@ def _fmt3(val):
     return f"{val:,.3f}"
 
 
-def generate_buoyancy_report(section_data, ground_info):
-    """부력검토 계산 보고서 생성
+def _default_haunch():
+    return {'upper': {'width': 300, 'height': 300},
+            'lower': {'width': 300, 'height': 300}}
+
+
+def decompose_section(section_data):
+    """구조물 단면을 사각형/삼각형으로 분할하여 자중 산정 (단위 m 당)
 
     Args:
         section_data: 단면제원 데이터 (dict)
-        ground_info: 지반정보 데이터 (dict)
 
     Returns:
-        str: 상세 계산 보고서 텍스트
+        list: 분할 도형 목록. 각 항목은 dict
+            no      : 도형 번호
+            kind    : '사각형' / '삼각형'
+            name    : 도형 이름 (예: '좌측벽체', '중간벽1 상부헌치 (양쪽 2개)')
+            group   : 'member' (슬래브/벽체/기둥) / 'haunch' / 'antiFloat'
+            area    : 단위m 환산 면적 (mm²/m)
+            weight  : 무게 (kN/m)
+            heading : 도형 앞에 표시할 보고서 줄
+            detail  : 산정식 보고서 줄
     """
-    # ── 데이터 추출 ──
-    culvert_count = int(section_data.get('culvert_count', 3))
     H = float(section_data.get('H', 4200))
-    B_list = [float(b) for b in section_data.get('B', [4000] * culvert_count)]
     UT = float(section_data.get('UT', 600))
     LT = float(section_data.get('LT', 800))
     WL = float(section_data.get('WL', 600))
@@ -51,10 +63,6 @@ def generate_buoyancy_report(section_data, ground_info):
     column_girder = section_data.get('columnGirder', {})
     anti_float = section_data.get('antiFloat', {})
 
-    earth_cover = float(ground_info.get('earthCoverDepth', 2000))
-    gwl = float(ground_info.get('groundwaterLevel', 3000))
-    gamma_s = float(ground_info.get('soilUnitWeight', 18.0))
-
     # 기둥/종거더 데이터
     ctc = float(column_girder.get('columnCTC', 3000))
     col_width = float(column_girder.get('columnWidth', 500))
@@ -62,14 +70,8 @@ def generate_buoyancy_report(section_data, ground_info):
     lower_add_h = float(column_girder.get('lowerAdditionalHeight', 200))
 
     # 헌치 데이터
-    left_haunch = haunch_data.get('leftWall', {
-        'upper': {'width': 300, 'height': 300},
-        'lower': {'width': 300, 'height': 300}
-    })
-    right_haunch = haunch_data.get('rightWall', {
-        'upper': {'width': 300, 'height': 300},
-        'lower': {'width': 300, 'height': 300}
-    })
+    left_haunch = haunch_data.get('leftWall', _default_haunch())
+    right_haunch = haunch_data.get('rightWall', _default_haunch())
     middle_haunches = haunch_data.get('middleWalls', [])
 
     # 부상방지저판 데이터
@@ -78,10 +80,159 @@ def generate_buoyancy_report(section_data, ground_info):
     af_right_ext = float(anti_float.get('rightExtension', 500))
     af_thickness = float(anti_float.get('thickness', 300))
 
-    # ── 기본 치수 계산 ──
-    total_inner_width = sum(B_list)
-    total_mw_thickness = sum(float(mw.get('thickness', 0)) for mw in middle_walls)
-    total_width = WL + total_inner_width + total_mw_thickness + WR
+    total_width = get_section_layout(section_data).total_width
+
+    shapes = []
+
+    def add_shape(kind, name, group, area, detail, heading=None):
+        weight = GAMMA_C * area / 1e6
+        shapes.append({
+            'no': len(shapes) + 1, 'kind': kind, 'name': name, 'group': group,
+            'area': area, 'weight': weight,
+            'heading': heading or [], 'detail': detail(weight)
+        })
+
+    def add_rect(name, w, h, full_formula=True):
+        area = w * h
+        formula = "γc × A / 10⁶ = " if full_formula else ""
+        add_shape('사각형', name, 'member', area, lambda weight: [
+            f"     크기 = {_fmt(w)} × {_fmt(h)} mm",
+            f"     면적 A = {_fmt(w)} × {_fmt(h)} = {_fmt(area)} mm²",
+            f"     무게 W = {formula}{_fmt2(GAMMA_C)} × {_fmt(area)} / 10⁶ = {_fmt2(weight)} kN/m"
+        ])
+
+    # ── 사각형: 상부슬래브 / 하부슬래브 / 좌측벽체 ──
+    add_rect("상부슬래브", total_width, UT)
+    add_rect("하부슬래브", total_width, LT)
+    add_rect("좌측벽체", WL, H)
+
+    # ── 중간벽체 ──
+    for i, mw in enumerate(middle_walls):
+        mw_thickness = float(mw.get('thickness', 600))
+        mw_type = mw.get('type', '연속벽')
+        mw_haunch = middle_haunches[i] if i < len(middle_haunches) else _default_haunch()
+
+        if mw_type == '연속벽':
+            # 연속벽 → 단일 사각형
+            add_rect(f"중간벽체{i+1} (연속벽)", mw_thickness, H, full_formula=False)
+            continue
+
+        # 기둥 → 상부종거더 + 하부종거더 + 기둥본체
+        mh_upper_h = float(mw_haunch['upper']['height'])
+        mh_lower_h = float(mw_haunch['lower']['height'])
+        heading = [f"   ---- 중간벽체{i+1} (기둥, CTC={_fmt(ctc)} mm) ----", ""]
+
+        # 상부종거더 / 하부종거더 (연속부재)
+        upper_girder_h = mh_upper_h + upper_add_h
+        lower_girder_h = mh_lower_h + lower_add_h
+        for pos, haunch_h, add_h, girder_h in (("상부", mh_upper_h, upper_add_h, upper_girder_h),
+                                               ("하부", mh_lower_h, lower_add_h, lower_girder_h)):
+            area = mw_thickness * girder_h
+            add_shape('사각형', f"중간벽체{i+1} {pos}종거더 (연속)", 'member', area,
+                      lambda weight: [
+                f"     거더높이 = 헌치높이({_fmt(haunch_h)}) + 추가높이({_fmt(add_h)})"
+                f" = {_fmt(girder_h)} mm",
+                f"     크기 = {_fmt(mw_thickness)} × {_fmt(girder_h)} mm",
+                f"     면적 A = {_fmt(mw_thickness)} × {_fmt(girder_h)} = {_fmt(area)} mm²",
+                f"     무게 W = {_fmt2(GAMMA_C)} × {_fmt(area)} / 10⁶ = {_fmt2(weight)} kN/m"
+            ], heading=heading if pos == "상부" else None)
+
+        # 기둥 본체 (CTC 고려)
+        col_clear_h = H - upper_girder_h - lower_girder_h
+        if col_clear_h > 0 and ctc > 0:
+            area_full = mw_thickness * col_clear_h
+            area_per_m = area_full * col_width / ctc
+            add_shape('사각형', f"중간벽체{i+1} 기둥본체 (CTC 고려)", 'member', area_per_m, lambda weight: [
+                f"     기둥높이 = H({_fmt(H)}) - 상부거더({_fmt(upper_girder_h)})"
+                f" - 하부거더({_fmt(lower_girder_h)}) = {_fmt(col_clear_h)} mm",
+                f"     기둥 단면적 = {_fmt(mw_thickness)} × {_fmt(col_clear_h)}"
+                f" = {_fmt(area_full)} mm²",
+                f"     단위m 환산 = {_fmt(area_full)} × 기둥폭({_fmt(col_width)})"
+                f" / CTC({_fmt(ctc)})",
+                f"                = {_fmt2(area_per_m)} mm²/m",
+                f"     무게 W = {_fmt2(GAMMA_C)} × {_fmt2(area_per_m)} / 10⁶"
+                f" = {_fmt2(weight)} kN/m"
+            ])
+
+    # ── 사각형: 우측벽체 ──
+    add_rect("우측벽체", WR, H, full_formula=False)
+
+    # ── 삼각형: 헌치 ──
+    def add_haunch_triangle(label, w, h, count=1):
+        if w <= 0 or h <= 0:
+            return
+        area = count * 0.5 * w * h
+        prefix = f"{count} × " if count != 1 else ""
+        add_shape('삼각형', label, 'haunch', area, lambda weight: [
+            f"     면적 = {prefix}0.5 × {_fmt(w)} × {_fmt(h)} = {_fmt2(area)} mm²",
+            f"     무게 W = {_fmt2(GAMMA_C)} × {_fmt2(area)} / 10⁶ = {_fmt2(weight)} kN/m"
+        ])
+
+    # 좌측벽 헌치
+    add_haunch_triangle("좌측벽 상부헌치", float(left_haunch['upper']['width']),
+                        float(left_haunch['upper']['height']))
+    add_haunch_triangle("좌측벽 하부헌치", float(left_haunch['lower']['width']),
+                        float(left_haunch['lower']['height']))
+
+    # 중간벽 헌치: 연속벽/기둥 모두 양쪽 헌치 (×2) - 헌치는 인접 셀로 돌출되어 거더와 별개
+    for i, mw in enumerate(middle_walls):
+        mw_haunch = middle_haunches[i] if i < len(middle_haunches) else _default_haunch()
+        add_haunch_triangle(f"중간벽{i+1} 상부헌치 (양쪽 2개)", float(mw_haunch['upper']['width']),
+                            float(mw_haunch['upper']['height']), count=2)
+        add_haunch_triangle(f"중간벽{i+1} 하부헌치 (양쪽 2개)", float(mw_haunch['lower']['width']),
+                            float(mw_haunch['lower']['height']), count=2)
+
+    # 우측벽 헌치
+    add_haunch_triangle("우측벽 상부헌치", float(right_haunch['upper']['width']),
+                        float(right_haunch['upper']['height']))
+    add_haunch_triangle("우측벽 하부헌치", float(right_haunch['lower']['width']),
+                        float(right_haunch['lower']['height']))
+
+    # ── 부상방지저판 ──
+    if af_use:
+        af_total_width = af_left_ext + total_width + af_right_ext
+        area = af_total_width * af_thickness
+        add_shape('사각형', "부상방지저판", 'antiFloat', area, lambda weight: [
+            f"     폭 = {_fmt(af_left_ext)} + {_fmt(total_width)} + {_fmt(af_right_ext)}"
+            f" = {_fmt(af_total_width)} mm",
+            f"     크기 = {_fmt(af_total_width)} × {_fmt(af_thickness)} mm",
+            f"     면적 A = {_fmt(af_total_width)} × {_fmt(af_thickness)} = {_fmt(area)} mm²",
+            f"     무게 W = {_fmt2(GAMMA_C)} × {_fmt(area)} / 10⁶ = {_fmt2(weight)} kN/m"
+        ])
+
+    return shapes
+
+
+def calculate_buoyancy(section_data, ground_info, shapes=None):
+    """부력검토 수치 계산 (보고서 없이)
+
+    Args:
+        section_data: 단면제원 데이터 (dict)
+        ground_info: 지반정보 데이터 (dict)
+        shapes: decompose_section 결과 (없으면 새로 계산)
+
+    Returns:
+        dict: total_width, total_height, bottom_width, bottom_depth (mm),
+              total_weight(Wc), soil_weight(Ws), buoyancy(U), total_resist(R) (kN/m),
+              hw (mm), fs (부력이 없으면 None), ok, shapes
+    """
+    if shapes is None:
+        shapes = decompose_section(section_data)
+
+    H = float(section_data.get('H', 4200))
+    UT = float(section_data.get('UT', 600))
+    LT = float(section_data.get('LT', 800))
+    anti_float = section_data.get('antiFloat', {})
+    af_use = anti_float.get('use', False)
+    af_left_ext = float(anti_float.get('leftExtension', 500))
+    af_right_ext = float(anti_float.get('rightExtension', 500))
+    af_thickness = float(anti_float.get('thickness', 300))
+
+    earth_cover = float(ground_info.get('earthCoverDepth', 2000))
+    gwl = float(ground_info.get('groundwaterLevel', 3000))
+    gamma_s = float(ground_info.get('soilUnitWeight', 18.0))
+
+    total_width = get_section_layout(section_data).total_width
     total_height = LT + H + UT
 
     # 부력 계산용 하단 치수
@@ -92,6 +243,77 @@ def generate_buoyancy_report(section_data, ground_info):
         bottom_width = total_width
         bottom_depth = earth_cover + total_height
 
+    total_weight = 0.0
+    for shape in shapes:
+        total_weight += shape['weight']
+
+    soil_area = total_width * earth_cover
+    soil_weight = gamma_s * soil_area / 1e6
+
+    hw = bottom_depth - gwl
+    if hw <= 0:
+        hw = 0
+        buoyancy = 0
+    else:
+        buoyancy = GAMMA_W * (hw / 1000) * (bottom_width / 1000)
+
+    total_resist = total_weight + soil_weight
+    fs = total_resist / buoyancy if buoyancy > 0 else None
+
+    return {
+        'total_width': total_width, 'total_height': total_height,
+        'bottom_width': bottom_width, 'bottom_depth': bottom_depth,
+        'total_weight': total_weight, 'soil_area': soil_area, 'soil_weight': soil_weight,
+        'hw': hw, 'buoyancy': buoyancy, 'total_resist': total_resist,
+        'fs': fs, 'ok': fs is None or fs >= REQUIRED_FS, 'shapes': shapes
+    }
+
+
+def generate_buoyancy_report(section_data, ground_info):
+    """부력검토 계산 보고서 생성
+
+    Args:
+        section_data: 단면제원 데이터 (dict)
+        ground_info: 지반정보 데이터 (dict)
+
+    Returns:
+        str: 상세 계산 보고서 텍스트
+    """
+    # ── 데이터 추출 ──
+    culvert_count = int(section_data.get('culvert_count', 3))
+    H = float(section_data.get('H', 4200))
+    B_list = [float(b) for b in section_data.get('B', [4000] * culvert_count)]
+    UT = float(section_data.get('UT', 600))
+    LT = float(section_data.get('LT', 800))
+    WL = float(section_data.get('WL', 600))
+    WR = float(section_data.get('WR', 600))
+    middle_walls = section_data.get('middle_walls', [])
+    anti_float = section_data.get('antiFloat', {})
+
+    earth_cover = float(ground_info.get('earthCoverDepth', 2000))
+    gwl = float(ground_info.get('groundwaterLevel', 3000))
+    gamma_s = float(ground_info.get('soilUnitWeight', 18.0))
+
+    # 부상방지저판 데이터
+    af_use = anti_float.get('use', False)
+    af_left_ext = float(anti_float.get('leftExtension', 500))
+    af_right_ext = float(anti_float.get('rightExtension', 500))
+    af_thickness = float(anti_float.get('thickness', 300))
+
+    # ── 계산 ──
+    result = calculate_buoyancy(section_data, ground_info)
+    total_width = result['total_width']
+    total_height = result['total_height']
+    bottom_width = result['bottom_width']
+    bottom_depth = result['bottom_depth']
+    total_weight = result['total_weight']
+    soil_area = result['soil_area']
+    soil_weight = result['soil_weight']
+    hw = result['hw']
+    buoyancy = result['buoyancy']
+    total_resist = result['total_resist']
+    fs = result['fs']
+
     # ── 보고서 생성 ──
     lines = []
 
@@ -151,219 +373,17 @@ def generate_buoyancy_report(section_data, ground_info):
     add("   ※ 구조물 단면을 사각형/삼각형으로 분할하여 산정합니다.")
     add()
 
-    shape_no = 0
-    total_weight = 0.0
-
-    # ── 사각형: 상부슬래브 ──
-    shape_no += 1
-    area = total_width * UT
-    weight = GAMMA_C * area / 1e6
-    total_weight += weight
-    add(f"   [사각형 No.{shape_no}] 상부슬래브")
-    add(f"     크기 = {_fmt(total_width)} × {_fmt(UT)} mm")
-    add(f"     면적 A = {_fmt(total_width)} × {_fmt(UT)} = {_fmt(area)} mm²")
-    add(f"     무게 W = γc × A / 10⁶ = {_fmt2(GAMMA_C)} × {_fmt(area)} / 10⁶ = {_fmt2(weight)} kN/m")
-    add()
-
-    # ── 사각형: 하부슬래브 ──
-    shape_no += 1
-    area = total_width * LT
-    weight = GAMMA_C * area / 1e6
-    total_weight += weight
-    add(f"   [사각형 No.{shape_no}] 하부슬래브")
-    add(f"     크기 = {_fmt(total_width)} × {_fmt(LT)} mm")
-    add(f"     면적 A = {_fmt(total_width)} × {_fmt(LT)} = {_fmt(area)} mm²")
-    add(f"     무게 W = γc × A / 10⁶ = {_fmt2(GAMMA_C)} × {_fmt(area)} / 10⁶ = {_fmt2(weight)} kN/m")
-    add()
-
-    # ── 사각형: 좌측벽체 ──
-    shape_no += 1
-    area = WL * H
-    weight = GAMMA_C * area / 1e6
-    total_weight += weight
-    add(f"   [사각형 No.{shape_no}] 좌측벽체")
-    add(f"     크기 = {_fmt(WL)} × {_fmt(H)} mm")
-    add(f"     면적 A = {_fmt(WL)} × {_fmt(H)} = {_fmt(area)} mm²")
-    add(f"     무게 W = γc × A / 10⁶ = {_fmt2(GAMMA_C)} × {_fmt(area)} / 10⁶ = {_fmt2(weight)} kN/m")
-    add()
-
-    # ── 중간벽체 ──
-    for i, mw in enumerate(middle_walls):
-        mw_thickness = float(mw.get('thickness', 600))
-        mw_type = mw.get('type', '연속벽')
-        mw_haunch = (middle_haunches[i] if i < len(middle_haunches) else
-                     {'upper': {'width': 300, 'height': 300},
-                      'lower': {'width': 300, 'height': 300}})
-
-        if mw_type == '연속벽':
-            # 연속벽 → 단일 사각형
-            shape_no += 1
-            area = mw_thickness * H
-            weight = GAMMA_C * area / 1e6
-            total_weight += weight
-            add(f"   [사각형 No.{shape_no}] 중간벽체{i+1} (연속벽)")
-            add(f"     크기 = {_fmt(mw_thickness)} × {_fmt(H)} mm")
-            add(f"     면적 A = {_fmt(mw_thickness)} × {_fmt(H)} = {_fmt(area)} mm²")
-            add(f"     무게 W = {_fmt2(GAMMA_C)} × {_fmt(area)} / 10⁶ = {_fmt2(weight)} kN/m")
-            add()
-        else:
-            # 기둥 → 상부종거더 + 하부종거더 + 기둥본체
-            mh_upper_h = float(mw_haunch['upper']['height'])
-            mh_lower_h = float(mw_haunch['lower']['height'])
-
-            add(f"   ---- 중간벽체{i+1} (기둥, CTC={_fmt(ctc)} mm) ----")
-            add()
-
-            # 상부종거더 (연속부재)
-            upper_girder_h = mh_upper_h + upper_add_h
-            shape_no += 1
-            area = mw_thickness * upper_girder_h
-            weight = GAMMA_C * area / 1e6
-            total_weight += weight
-            add(f"   [사각형 No.{shape_no}] 중간벽체{i+1} 상부종거더 (연속)")
-            add(f"     거더높이 = 헌치높이({_fmt(mh_upper_h)}) + 추가높이({_fmt(upper_add_h)})"
-                f" = {_fmt(upper_girder_h)} mm")
-            add(f"     크기 = {_fmt(mw_thickness)} × {_fmt(upper_girder_h)} mm")
-            add(f"     면적 A = {_fmt(mw_thickness)} × {_fmt(upper_girder_h)} = {_fmt(area)} mm²")
-            add(f"     무게 W = {_fmt2(GAMMA_C)} × {_fmt(area)} / 10⁶ = {_fmt2(weight)} kN/m")
-            add()
-
-            # 하부종거더 (연속부재)
-            lower_girder_h = mh_lower_h + lower_add_h
-            shape_no += 1
-            area = mw_thickness * lower_girder_h
-            weight = GAMMA_C * area / 1e6
-            total_weight += weight
-            add(f"   [사각형 No.{shape_no}] 중간벽체{i+1} 하부종거더 (연속)")
-            add(f"     거더높이 = 헌치높이({_fmt(mh_lower_h)}) + 추가높이({_fmt(lower_add_h)})"
-                f" = {_fmt(lower_girder_h)} mm")
-            add(f"     크기 = {_fmt(mw_thickness)} × {_fmt(lower_girder_h)} mm")
-            add(f"     면적 A = {_fmt(mw_thickness)} × {_fmt(lower_girder_h)} = {_fmt(area)} mm²")
-            add(f"     무게 W = {_fmt2(GAMMA_C)} × {_fmt(area)} / 10⁶ = {_fmt2(weight)} kN/m")
-            add()
-
-            # 기둥 본체 (CTC 고려)
-            col_clear_h = H - upper_girder_h - lower_girder_h
-            if col_clear_h > 0 and ctc > 0:
-                shape_no += 1
-                area_full = mw_thickness * col_clear_h
-                area_per_m = area_full * col_width / ctc
-                weight = GAMMA_C * area_per_m / 1e6
-                total_weight += weight
-                add(f"   [사각형 No.{shape_no}] 중간벽체{i+1} 기둥본체 (CTC 고려)")
-                add(f"     기둥높이 = H({_fmt(H)}) - 상부거더({_fmt(upper_girder_h)})"
-                    f" - 하부거더({_fmt(lower_girder_h)}) = {_fmt(col_clear_h)} mm")
-                add(f"     기둥 단면적 = {_fmt(mw_thickness)} × {_fmt(col_clear_h)}"
-                    f" = {_fmt(area_full)} mm²")
-                add(f"     단위m 환산 = {_fmt(area_full)} × 기둥폭({_fmt(col_width)})"
-                    f" / CTC({_fmt(ctc)})")
-                add(f"                = {_fmt2(area_per_m)} mm²/m")
-                add(f"     무게 W = {_fmt2(GAMMA_C)} × {_fmt2(area_per_m)} / 10⁶"
-                    f" = {_fmt2(weight)} kN/m")
-                add()
-
-    # ── 사각형: 우측벽체 ──
-    shape_no += 1
-    area = WR * H
-    weight = GAMMA_C * area / 1e6
-    total_weight += weight
-    add(f"   [사각형 No.{shape_no}] 우측벽체")
-    add(f"     크기 = {_fmt(WR)} × {_fmt(H)} mm")
-    add(f"     면적 A = {_fmt(WR)} × {_fmt(H)} = {_fmt(area)} mm²")
-    add(f"     무게 W = {_fmt2(GAMMA_C)} × {_fmt(area)} / 10⁶ = {_fmt2(weight)} kN/m")
-    add()
-
-    # ── 삼각형: 헌치 ──
-    add("   ── 헌치 (삼각형) ──")
-    add()
-
-    def add_haunch_triangle(label, w, h, scale=1.0, scale_desc=None):
-        nonlocal shape_no, total_weight
-        if w <= 0 or h <= 0:
-            return
-        shape_no += 1
-        area = 0.5 * w * h
-        if scale != 1.0 and scale_desc:
-            area_eff = area * scale
-            weight = GAMMA_C * area_eff / 1e6
-            total_weight += weight
-            add(f"   [삼각형 No.{shape_no}] {label}")
-            add(f"     면적 = 0.5 × {_fmt(w)} × {_fmt(h)} = {_fmt2(area)} mm²")
-            add(f"     단위m 환산 = {_fmt2(area)} × {scale_desc} = {_fmt2(area_eff)} mm²/m")
-            add(f"     무게 W = {_fmt2(GAMMA_C)} × {_fmt2(area_eff)} / 10⁶ = {_fmt2(weight)} kN/m")
-        else:
-            weight = GAMMA_C * area / 1e6
-            total_weight += weight
-            add(f"   [삼각형 No.{shape_no}] {label}")
-            add(f"     면적 = 0.5 × {_fmt(w)} × {_fmt(h)} = {_fmt2(area)} mm²")
-            add(f"     무게 W = {_fmt2(GAMMA_C)} × {_fmt2(area)} / 10⁶ = {_fmt2(weight)} kN/m")
-        add()
-
-    # 좌측벽 헌치
-    add_haunch_triangle(
-        "좌측벽 상부헌치",
-        float(left_haunch['upper']['width']),
-        float(left_haunch['upper']['height']))
-    add_haunch_triangle(
-        "좌측벽 하부헌치",
-        float(left_haunch['lower']['width']),
-        float(left_haunch['lower']['height']))
-
-    # 중간벽 헌치
-    for i, mw in enumerate(middle_walls):
-        mw_haunch = (middle_haunches[i] if i < len(middle_haunches) else
-                     {'upper': {'width': 300, 'height': 300},
-                      'lower': {'width': 300, 'height': 300}})
-
-        # 연속벽/기둥 모두: 양쪽 헌치 (×2) - 헌치는 인접 셀로 돌출되어 거더와 별개
-        mu_w = float(mw_haunch['upper']['width'])
-        mu_h = float(mw_haunch['upper']['height'])
-        if mu_w > 0 and mu_h > 0:
-            shape_no += 1
-            area = 2 * 0.5 * mu_w * mu_h
-            weight = GAMMA_C * area / 1e6
-            total_weight += weight
-            add(f"   [삼각형 No.{shape_no}] 중간벽{i+1} 상부헌치 (양쪽 2개)")
-            add(f"     면적 = 2 × 0.5 × {_fmt(mu_w)} × {_fmt(mu_h)} = {_fmt2(area)} mm²")
-            add(f"     무게 W = {_fmt2(GAMMA_C)} × {_fmt2(area)} / 10⁶ = {_fmt2(weight)} kN/m")
-            add()
-
-        ml_w = float(mw_haunch['lower']['width'])
-        ml_h = float(mw_haunch['lower']['height'])
-        if ml_w > 0 and ml_h > 0:
-            shape_no += 1
-            area = 2 * 0.5 * ml_w * ml_h
-            weight = GAMMA_C * area / 1e6
-            total_weight += weight
-            add(f"   [삼각형 No.{shape_no}] 중간벽{i+1} 하부헌치 (양쪽 2개)")
-            add(f"     면적 = 2 × 0.5 × {_fmt(ml_w)} × {_fmt(ml_h)} = {_fmt2(area)} mm²")
-            add(f"     무게 W = {_fmt2(GAMMA_C)} × {_fmt2(area)} / 10⁶ = {_fmt2(weight)} kN/m")
-            add()
-
-    # 우측벽 헌치
-    add_haunch_triangle(
-        "우측벽 상부헌치",
-        float(right_haunch['upper']['width']),
-        float(right_haunch['upper']['height']))
-    add_haunch_triangle(
-        "우측벽 하부헌치",
-        float(right_haunch['lower']['width']),
-        float(right_haunch['lower']['height']))
-
-    # ── 부상방지저판 ──
-    if af_use:
-        shape_no += 1
-        af_total_width = af_left_ext + total_width + af_right_ext
-        area = af_total_width * af_thickness
-        weight = GAMMA_C * area / 1e6
-        total_weight += weight
-        add(f"   [사각형 No.{shape_no}] 부상방지저판")
-        add(f"     폭 = {_fmt(af_left_ext)} + {_fmt(total_width)} + {_fmt(af_right_ext)}"
-            f" = {_fmt(af_total_width)} mm")
-        add(f"     크기 = {_fmt(af_total_width)} × {_fmt(af_thickness)} mm")
-        add(f"     면적 A = {_fmt(af_total_width)} × {_fmt(af_thickness)} = {_fmt(area)} mm²")
-        add(f"     무게 W = {_fmt2(GAMMA_C)} × {_fmt(area)} / 10⁶ = {_fmt2(weight)} kN/m")
+    haunch_heading = ["   ── 헌치 (삼각형) ──", ""]
+    for shape in result['shapes']:
+        if shape['group'] != 'member' and haunch_heading:
+            lines.extend(haunch_heading)
+            haunch_heading = None
+        lines.extend(shape['heading'])
+        add(f"   [{shape['kind']} No.{shape['no']}] {shape['name']}")
+        lines.extend(shape['detail'])
         add()
+    if haunch_heading:
+        lines.extend(haunch_heading)
 
     add("   " + "─" * 51)
     add(f"   구조물 자중 합계 (Wc) = {_fmt2(total_weight)} kN/m")
@@ -374,8 +394,6 @@ def generate_buoyancy_report(section_data, ground_info):
     # ────────────────────────────────────────
     add("4. 상재토 무게 (단위 m 당)")
     add("─" * 55)
-    soil_area = total_width * earth_cover
-    soil_weight = gamma_s * soil_area / 1e6
     add(f"   토피고 = {_fmt(earth_cover)} mm = {_fmt3(earth_cover / 1000)} m")
     add(f"   폭    = {_fmt(total_width)} mm = {_fmt3(total_width / 1000)} m")
     add(f"   면적  = {_fmt(total_width)} × {_fmt(earth_cover)} = {_fmt(soil_area)} mm²")
@@ -398,17 +416,13 @@ def generate_buoyancy_report(section_data, ground_info):
     add(f"   지하수위            = {_fmt(gwl)} mm (지표면 기준)")
     add()
 
-    hw = bottom_depth - gwl
     if hw <= 0:
-        hw = 0
-        buoyancy = 0
         add("   → 지하수위가 구조물 하단보다 깊으므로 부력이 발생하지 않음")
     else:
         add(f"   수두 높이 (hw) = {_fmt(bottom_depth)} - {_fmt(gwl)}"
             f" = {_fmt(hw)} mm = {_fmt3(hw / 1000)} m")
         add(f"   부력 작용 폭   = {_fmt(bottom_width)} mm = {_fmt3(bottom_width / 1000)} m")
         add()
-        buoyancy = GAMMA_W * (hw / 1000) * (bottom_width / 1000)
         add(f"   부력 (U) = γw × hw × B_bottom")
         add(f"            = {_fmt2(GAMMA_W)} × {_fmt3(hw / 1000)} × {_fmt3(bottom_width / 1000)}")
         add(f"            = {_fmt2(buoyancy)} kN/m")
@@ -420,7 +434,6 @@ def generate_buoyancy_report(section_data, ground_info):
     add("6. 안전율 검토")
     add("─" * 55)
 
-    total_resist = total_weight + soil_weight
     add(f"   저항력 (R) = Wc + Ws")
     add(f"              = {_fmt2(total_weight)} + {_fmt2(soil_weight)}")
     add(f"              = {_fmt2(total_resist)} kN/m")
@@ -428,18 +441,17 @@ def generate_buoyancy_report(section_data, ground_info):
     add(f"   부력 (U)   = {_fmt2(buoyancy)} kN/m")
     add()
 
-    if buoyancy > 0:
-        fs = total_resist / buoyancy
+    if fs is not None:
         add(f"   안전율 (FS) = R / U")
         add(f"               = {_fmt2(total_resist)} / {_fmt2(buoyancy)}")
         add(f"               = {_fmt2(fs)}")
         add()
-        add(f"   필요 안전율 ≥ 1.20")
+        add(f"   필요 안전율 ≥ {_fmt2(REQUIRED_FS)}")
         add()
-        if fs >= 1.20:
-            add(f"   FS = {_fmt2(fs)} ≥ 1.20  →  O.K.")
+        if fs >= REQUIRED_FS:
+            add(f"   FS = {_fmt2(fs)} ≥ {_fmt2(REQUIRED_FS)}  →  O.K.")
         else:
-            add(f"   FS = {_fmt2(fs)} < 1.20  →  N.G.")
+            add(f"   FS = {_fmt2(fs)} < {_fmt2(REQUIRED_FS)}  →  N.G.")
     else:
         add("   지하수위가 구조물 하단보다 깊으므로 부력이 작용하지 않습니다.")
         add("   부력 검토가 필요하지 않습니다. → O.K.")
@@ -450,10 +462,12 @@ def generate_buoyancy_report(section_data, ground_info):
     return '\n'.join(lines)
 
 
-def create_buoyancy_shapes_dxf(section_data):
+@timed('geometry.create_buoyancy_shapes_dxf')
+def create_buoyancy_shapes_dxf(section_data, pick_index=None):
     """부력검토용 - 단면을 번호 매긴 삼각형/사각형으로 분할하여 DXF 생성
 
     번호는 generate_buoyancy_report()의 도형 번호와 일치합니다.
+    pick_index가 주어지면 각 도형을 "No.N 이름" 태그로 등록합니다.
     """
     doc = ezdxf.new('R2010')
     msp = doc.modelspace()
@@ -474,10 +488,9 @@ def create_buoyancy_shapes_dxf(section_data):
     column_girder = section_data.get('columnGirder', {})
     anti_float = section_data.get('antiFloat', {})
 
-    total_inner_width = sum(B_list)
-    total_mw_thickness = sum(float(mw.get('thickness', 0)) for mw in middle_walls)
-    total_width = WL + total_inner_width + total_mw_thickness + WR
-    total_height = LT + H + UT
+    layout = get_section_layout(section_data)
+    total_width = layout.total_width
+    total_height = layout.total_height
 
     upper_add_h = float(column_girder.get('upperAdditionalHeight', 0))
     lower_add_h = float(column_girder.get('lowerAdditionalHeight', 0))
@@ -513,10 +526,16 @@ def create_buoyancy_shapes_dxf(section_data):
         th = min(w * 0.13, h * 0.13, 220)
         return max(th, 60)
 
-    def _add_rect(x1, y1, x2, y2, name, color):
+    def _register(points, name, target):
+        """선택 인덱스에 도형 등록"""
+        if pick_index is not None:
+            pick_index.add_region(f"No.{shape_no} {name}", points, target)
+
+    def _add_rect(x1, y1, x2, y2, name, color, target=None):
         """사각형 외곽선 + 번호/이름 라벨"""
         nonlocal shape_no
         shape_no += 1
+        _register([(x1, y1), (x2, y1), (x2, y2), (x1, y2)], name, target)
         msp.add_lwpolyline(
             [(x1, y1), (x2, y1), (x2, y2), (x1, y2), (x1, y1)],
             dxfattribs={'color': color})
@@ -533,10 +552,11 @@ def create_buoyancy_shapes_dxf(section_data):
                 'insert': (cx - len(name) * nth * 0.45, cy - th * 0.9),
                 'height': nth, 'color': CLR_NAME})
 
-    def _add_rect_dashed(x1, y1, x2, y2, name, color):
+    def _add_rect_dashed(x1, y1, x2, y2, name, color, target=None):
         """점선 사각형 (기둥본체용)"""
         nonlocal shape_no
         shape_no += 1
+        _register([(x1, y1), (x2, y1), (x2, y2), (x1, y2)], name, target)
         for p1, p2 in [((x1, y1), (x2, y1)), ((x2, y1), (x2, y2)),
                         ((x2, y2), (x1, y2)), ((x1, y2), (x1, y1))]:
             msp.add_line(p1, p2, dxfattribs={'color': color, 'linetype': 'DASHED'})
@@ -548,11 +568,12 @@ def create_buoyancy_shapes_dxf(section_data):
             'insert': (cx - len(num) * th * 0.3, cy),
             'height': th, 'color': CLR_NUM})
 
-    def _add_tri(p1, p2, p3, color, label=True):
+    def _add_tri(p1, p2, p3, color, label=True, name="헌치", target=None):
         """삼각형 외곽선 + 라벨 (label=False면 외곽선만)"""
         nonlocal shape_no
         if label:
             shape_no += 1
+        _register([p1, p2, p3], name, target)
         msp.add_lwpolyline([p1, p2, p3, p1], dxfattribs={'color': color})
         if label:
             cx = (p1[0] + p2[0] + p3[0]) / 3
@@ -572,44 +593,38 @@ def create_buoyancy_shapes_dxf(section_data):
          (0, total_height), (0, 0)],
         dxfattribs={'color': CLR_OUTLINE})
     # 내공 윤곽선
-    x_off = WL
     for i in range(culvert_count):
-        B = B_list[i]
-        left, right = x_off, x_off + B
+        left, right = layout.cell(i)
         msp.add_lwpolyline(
             [(left, LT), (right, LT), (right, LT + H),
              (left, LT + H), (left, LT)],
             dxfattribs={'color': CLR_OUTLINE})
-        x_off += B
-        if i < len(middle_walls):
-            x_off += float(middle_walls[i].get('thickness', 0))
 
     # ══════════════════════════════════════════
     # 도형 번호 (generate_buoyancy_report 순서와 동일)
     # ══════════════════════════════════════════
 
     # [사각형] 상부슬래브
-    _add_rect(0, LT + H, total_width, total_height, "상부슬래브", CLR_RECT)
+    _add_rect(0, LT + H, total_width, total_height, "상부슬래브", CLR_RECT, ('UT',))
 
     # [사각형] 하부슬래브
-    _add_rect(0, 0, total_width, LT, "하부슬래브", CLR_RECT)
+    _add_rect(0, 0, total_width, LT, "하부슬래브", CLR_RECT, ('LT',))
 
     # [사각형] 좌측벽체
-    _add_rect(0, LT, WL, LT + H, "좌측벽", CLR_RECT)
+    _add_rect(0, LT, WL, LT + H, "좌측벽", CLR_RECT, ('WL',))
 
     # [중간벽체]
-    x_off = WL
     for i in range(culvert_count):
-        x_off += B_list[i]
         if i < len(middle_walls):
             mw = middle_walls[i]
-            mw_t = float(mw.get('thickness', 600))
+            x_off, x_right = layout.middle_wall(i)
+            mw_t = x_right - x_off
             mw_type = mw.get('type', '연속벽')
             mw_h = middle_haunches[i] if i < len(middle_haunches) else {}
 
             if mw_type == '연속벽':
                 _add_rect(x_off, LT, x_off + mw_t, LT + H,
-                          f"중간벽{i+1}", CLR_RECT)
+                          f"중간벽{i+1}", CLR_RECT, ('middle_walls', i, 'thickness'))
             else:
                 mh_u_h = float(mw_h.get('upper', {}).get('height', 0))
                 mh_l_h = float(mw_h.get('lower', {}).get('height', 0))
@@ -618,21 +633,19 @@ def create_buoyancy_shapes_dxf(section_data):
 
                 # 상부종거더 (연속)
                 _add_rect(x_off, LT + H - ug_h, x_off + mw_t, LT + H,
-                          f"상부거더", CLR_GIRDER)
+                          f"상부거더", CLR_GIRDER, ('columnGirder', 'upperAdditionalHeight'))
                 # 하부종거더 (연속)
                 _add_rect(x_off, LT, x_off + mw_t, LT + lg_h,
-                          f"하부거더", CLR_GIRDER)
+                          f"하부거더", CLR_GIRDER, ('columnGirder', 'lowerAdditionalHeight'))
                 # 기둥본체 (CTC - 점선)
                 col_bot = LT + lg_h
                 col_top = LT + H - ug_h
                 if col_top > col_bot:
                     _add_rect_dashed(x_off, col_bot, x_off + mw_t, col_top,
-                                     f"기둥{i+1}", CLR_GIRDER)
-
-            x_off += mw_t
+                                     f"기둥{i+1}", CLR_GIRDER, ('columnGirder', 'columnWidth'))
 
     # [사각형] 우측벽체
-    _add_rect(total_width - WR, LT, total_width, LT + H, "우측벽", CLR_RECT)
+    _add_rect(total_width - WR, LT, total_width, LT + H, "우측벽", CLR_RECT, ('WR',))
 
     # ── 헌치 (삼각형) ──
 
@@ -640,35 +653,39 @@ def create_buoyancy_shapes_dxf(section_data):
     lu_w = float(left_haunch.get('upper', {}).get('width', 0))
     lu_h = float(left_haunch.get('upper', {}).get('height', 0))
     if lu_w > 0 and lu_h > 0:
-        _add_tri((WL, LT + H), (WL + lu_w, LT + H), (WL, LT + H - lu_h), CLR_TRI)
+        _add_tri((WL, LT + H), (WL + lu_w, LT + H), (WL, LT + H - lu_h), CLR_TRI,
+                 name="좌측벽 상부헌치", target=('haunch', 'leftWall', 'upper'))
 
     # 좌측벽 하부헌치
     ll_w = float(left_haunch.get('lower', {}).get('width', 0))
     ll_h = float(left_haunch.get('lower', {}).get('height', 0))
     if ll_w > 0 and ll_h > 0:
-        _add_tri((WL, LT), (WL + ll_w, LT), (WL, LT + ll_h), CLR_TRI)
+        _add_tri((WL, LT), (WL + ll_w, LT), (WL, LT + ll_h), CLR_TRI,
+                 name="좌측벽 하부헌치", target=('haunch', 'leftWall', 'lower'))
 
     # 중간벽 헌치 (연속벽/기둥 모두 - 양쪽 2개를 같은 번호로)
-    x_off = WL
     for i in range(culvert_count):
-        x_off += B_list[i]
         if i < len(middle_walls):
-            mw = middle_walls[i]
-            mw_t = float(mw.get('thickness', 600))
+            x_off, x_right = layout.middle_wall(i)
+            mw_t = x_right - x_off
             mw_h = middle_haunches[i] if i < len(middle_haunches) else {}
 
             mu_w = float(mw_h.get('upper', {}).get('width', 0))
             mu_h = float(mw_h.get('upper', {}).get('height', 0))
             if mu_w > 0 and mu_h > 0:
                 # 좌측 삼각형 (번호 부여)
+                hu_name = f"중간벽{i+1} 상부헌치"
+                hu_target = ('haunch', 'middleWalls', i, 'upper')
                 _add_tri(
                     (x_off, LT + H), (x_off - mu_w, LT + H),
-                    (x_off, LT + H - mu_h), CLR_TRI, label=True)
+                    (x_off, LT + H - mu_h), CLR_TRI, label=True,
+                    name=hu_name, target=hu_target)
                 cur_no = shape_no
                 # 우측 삼각형 (같은 번호 - 외곽선만)
                 _add_tri(
                     (x_off + mw_t, LT + H), (x_off + mw_t + mu_w, LT + H),
-                    (x_off + mw_t, LT + H - mu_h), CLR_TRI, label=False)
+                    (x_off + mw_t, LT + H - mu_h), CLR_TRI, label=False,
+                    name=hu_name, target=hu_target)
                 # 우측에도 번호 표시
                 cx2 = (x_off + mw_t + x_off + mw_t + mu_w + x_off + mw_t) / 3
                 cy2 = (LT + H + LT + H + LT + H - mu_h) / 3
@@ -680,13 +697,17 @@ def create_buoyancy_shapes_dxf(section_data):
             ml_w = float(mw_h.get('lower', {}).get('width', 0))
             ml_h = float(mw_h.get('lower', {}).get('height', 0))
             if ml_w > 0 and ml_h > 0:
+                hl_name = f"중간벽{i+1} 하부헌치"
+                hl_target = ('haunch', 'middleWalls', i, 'lower')
                 _add_tri(
                     (x_off, LT), (x_off - ml_w, LT),
-                    (x_off, LT + ml_h), CLR_TRI, label=True)
+                    (x_off, LT + ml_h), CLR_TRI, label=True,
+                    name=hl_name, target=hl_target)
                 cur_no = shape_no
                 _add_tri(
                     (x_off + mw_t, LT), (x_off + mw_t + ml_w, LT),
-                    (x_off + mw_t, LT + ml_h), CLR_TRI, label=False)
+                    (x_off + mw_t, LT + ml_h), CLR_TRI, label=False,
+                    name=hl_name, target=hl_target)
                 cx2 = (x_off + mw_t + x_off + mw_t + ml_w + x_off + mw_t) / 3
                 cy2 = (LT + LT + LT + ml_h) / 3
                 th2 = min(_text_h(ml_w, ml_h), 130)
@@ -694,27 +715,27 @@ def create_buoyancy_shapes_dxf(section_data):
                     'insert': (cx2 - 4 * th2 * 0.3, cy2 - th2 * 0.4),
                     'height': th2, 'color': CLR_NUM})
 
-            x_off += mw_t
-
     # 우측벽 상부헌치
     rw_left = total_width - WR
     ru_w = float(right_haunch.get('upper', {}).get('width', 0))
     ru_h = float(right_haunch.get('upper', {}).get('height', 0))
     if ru_w > 0 and ru_h > 0:
         _add_tri((rw_left, LT + H), (rw_left - ru_w, LT + H),
-                 (rw_left, LT + H - ru_h), CLR_TRI)
+                 (rw_left, LT + H - ru_h), CLR_TRI,
+                 name="우측벽 상부헌치", target=('haunch', 'rightWall', 'upper'))
 
     # 우측벽 하부헌치
     rl_w = float(right_haunch.get('lower', {}).get('width', 0))
     rl_h = float(right_haunch.get('lower', {}).get('height', 0))
     if rl_w > 0 and rl_h > 0:
         _add_tri((rw_left, LT), (rw_left - rl_w, LT),
-                 (rw_left, LT + rl_h), CLR_TRI)
+                 (rw_left, LT + rl_h), CLR_TRI,
+                 name="우측벽 하부헌치", target=('haunch', 'rightWall', 'lower'))
 
     # 부상방지저판
     if af_use and af_t > 0:
         _add_rect(-af_left, -af_t, total_width + af_right, 0,
-                  "부상방지저판", CLR_AF)
+                  "부상방지저판", CLR_AF, ('antiFloat', 'thickness'))
 
     # ══════════════════════════════════════════
     # 치수선 추가
@@ -761,17 +782,13 @@ def create_buoyancy_shapes_dxf(section_data):
     ).render()
 
     # 각 내공 폭 (상단)
-    x_off = WL
     for i in range(culvert_count):
-        B = B_list[i]
+        left, right = layout.cell(i)
         msp.add_linear_dim(
-            base=(x_off + B / 2, total_height + dim_offset),
-            p1=(x_off, total_height), p2=(x_off + B, total_height),
+            base=((left + right) / 2, total_height + dim_offset),
+            p1=(left, total_height), p2=(right, total_height),
             dimstyle="EZDXF"
         ).render()
-        x_off += B
-        if i < len(middle_walls):
-            x_off += float(middle_walls[i].get('thickness', 0))
 
     # 좌측벽 WL (상단)
     msp.add_linear_dim(
@@ -789,17 +806,14 @@ def create_buoyancy_shapes_dxf(section_data):
 
     # 중간벽 치수 (상단)
     if middle_walls:
-        x_off = WL
         for i in range(culvert_count):
-            x_off += B_list[i]
             if i < len(middle_walls):
-                mw_t = float(middle_walls[i].get('thickness', 0))
+                w_left, w_right = layout.middle_wall(i)
                 msp.add_linear_dim(
-                    base=(x_off + mw_t / 2, total_height + dim_offset),
-                    p1=(x_off, total_height), p2=(x_off + mw_t, total_height),
+                    base=((w_left + w_right) / 2, total_height + dim_offset),
+                    p1=(w_left, total_height), p2=(w_right, total_height),
                     dimstyle="EZDXF"
                 ).render()
-                x_off += mw_t
 
     # 부상방지저판 치수
     if af_use and af_left > 0:
@@ -815,34 +829,28 @@ def create_buoyancy_shapes_dxf(section_data):
             angle=90, dimstyle="EZDXF"
         ).render()
 
+    if pick_index is not None:
+        pick_index.add_endpoints_from_doc(doc)
+        pick_index.build()
+
     return doc
 
 
 class BuoyancyCheckDialog(QDialog):
-    """부력검토 결과 팝업 대화상자"""
+    """부력검토 결과 팝업 대화상자 (긴 보고서는 보이는 줄만 그림)"""
 
-    def __init__(self, report_text, parent=None):
+    def __init__(self, report_text, parent=None, title="부력 검토 결과", stations=None):
         super().__init__(parent)
-        self.setWindowTitle("부력 검토 결과")
+        self.setWindowTitle(title)
         self.setMinimumSize(700, 600)
         self.resize(750, 850)
         self.setWindowFlags(self.windowFlags() | Qt.WindowMaximizeButtonHint)
 
         layout = QVBoxLayout(self)
 
-        # 텍스트 뷰어
-        self.text_edit = QTextEdit()
-        self.text_edit.setReadOnly(True)
-        self.text_edit.setFont(QFont("Consolas", 10))
-        self.text_edit.setPlainText(report_text)
-        self.text_edit.setStyleSheet("""
-            QTextEdit {
-                background-color: #fafafa;
-                border: 1px solid #ddd;
-                padding: 10px;
-            }
-        """)
-        layout.addWidget(self.text_edit)
+        # 보고서 뷰어 (목차/측점 이동/검색)
+        self.viewer = ReportViewer(report_text, stations)
+        layout.addWidget(self.viewer)
 
         # 버튼 영역
         btn_layout = QHBoxLayout()
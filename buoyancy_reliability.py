@@ -0,0 +1,313 @@
+"""부력 신뢰성 해석 (Monte Carlo) 모듈
+
+지하수위, 흙 단위중량, 콘크리트 단위중량, 부재 두께 시공오차, 토피 오차를
+확률변수로 놓고 표본마다 부력 안전율을 계산하여 파괴확률(FS < 1.0)과
+안전율 분포를 구한다.
+
+콘크리트 면적은 부재 두께에 대해 2차 이하 다항식이므로(폭 × 두께),
+decompose_section을 기준값 주변에서 중앙차분하여 얻은 기울기/헤시안으로
+표본 전체를 행렬 연산 한 번에 정확히 계산한다 (표본별 Python 반복 없음).
+표본이 많으면 덩어리(chunk)로 나누어 메모리를 제한한다.
+표본당 계산이 수 μs 이하라 100만 표본도 1초 안에 끝나므로 프로세스 병렬화는
+하지 않는다 (작업자 시작/모듈 로드 비용이 계산 시간과 비슷해 이득이 없었다).
+"""
+
+import copy
+import math
+import numpy as np
+from buoyancy_check import GAMMA_C, GAMMA_W, REQUIRED_FS, decompose_section, calculate_buoyancy
+from section_layout import get_section_layout
+
+DEFAULT_SAMPLES = 1_000_000
+CHUNK_SIZE = 250_000
+FAILURE_FS = 1.0       # 한계상태: 저항 < 부력
+
+# 확률변수 기본 분포 (mean이 None이면 입력값 사용)
+#   dist: 'normal' / 'lognormal' / 'uniform' / 'fixed'
+#   std 또는 cov(변동계수), uniform은 low/high (평균 대비 편차), min/max는 절단값
+DEFAULT_VARIABLES = {
+    'gwl': {'dist': 'normal', 'std': 500.0, 'min': 0.0},           # 지하수위 (지표면에서 깊이, mm)
+    'gamma_s': {'dist': 'normal', 'cov': 0.05},                     # 흙 단위중량 (kN/m³)
+    'gamma_c': {'dist': 'normal', 'cov': 0.02, 'mean': GAMMA_C},    # 콘크리트 단위중량 (kN/m³)
+    'thickness': {'dist': 'normal', 'std': 10.0},                   # 부재 두께 시공오차 (mm, 부재별 독립)
+    'earth_cover': {'dist': 'normal', 'std': 50.0, 'min': 0.0},     # 토피 (mm)
+}
+
+
+def _thickness_params(section_data):
+    """시공오차를 적용할 부재 두께 (이름, 데이터 경로, 기본값)"""
+    params = [('UT', ('UT',), 600), ('LT', ('LT',), 800),
+              ('WL', ('WL',), 600), ('WR', ('WR',), 600)]
+    for i, _ in enumerate(section_data.get('middle_walls', [])):
+        params.append((f"중간벽{i+1}", ('middle_walls', i, 'thickness'), 600))
+    if (section_data.get('antiFloat', {}) or {}).get('use', False):
+        params.append(('부상방지저판', ('antiFloat', 'thickness'), 300))
+    return params
+
+
+def _perturb(section_data, params, deltas):
+    """부재 두께에 오차를 더한 단면제원 복사본"""
+    data = copy.deepcopy(section_data)
+    for (_, path, default), delta in zip(params, deltas):
+        if not delta:
+            continue
+        target = data
+        for key in path[:-1]:
+            target = target[key] if isinstance(target, list) else target.setdefault(key, {})
+        target[path[-1]] = float(target.get(path[-1], default)) + delta
+    return data
+
+
+def _section_quantities(section_data):
+    """[콘크리트 면적 (mm²/m), 전체 폭, 구조물 높이 (mm)]"""
+    area = sum(shape['area'] for shape in decompose_section(section_data))
+    total_width = get_section_layout(section_data).total_width
+    total_height = (float(section_data.get('LT', 800)) + float(section_data.get('H', 4200))
+                    + float(section_data.get('UT', 600)))
+    return np.array([area, total_width, total_height])
+
+
+class BuoyancyModel:
+    """표본 계산용 단면 모델 (두께 오차에 대한 2차 전개)
+
+    q(δ) = q0 + J·δ + ½ δᵀ·Hq·δ  (q = 콘크리트 면적, 전체 폭, 구조물 높이)
+    """
+
+    def __init__(self, section_data, ground_info, step=1.0):
+        self.params = _thickness_params(section_data)
+        self.names = [name for name, _, _ in self.params]
+        n = len(self.params)
+        self.q0 = _section_quantities(section_data)
+
+        def q(*offsets):
+            deltas = np.zeros(n)
+            for i, d in offsets:
+                deltas[i] += d
+            return _section_quantities(_perturb(section_data, self.params, deltas))
+
+        # 중앙차분 (2차 다항식이므로 오차 없음)
+        self.gradient = np.zeros((3, n))
+        self.hessian = np.zeros((3, n, n))
+        plus = [q((i, step)) for i in range(n)]
+        minus = [q((i, -step)) for i in range(n)]
+        for i in range(n):
+            self.gradient[:, i] = (plus[i] - minus[i]) / (2 * step)
+            self.hessian[:, i, i] = (plus[i] - 2 * self.q0 + minus[i]) / step ** 2
+            for j in range(i):
+                mixed = (q((i, step), (j, step)) - plus[i] - plus[j] + self.q0) / step ** 2
+                self.hessian[:, i, j] = self.hessian[:, j, i] = mixed
+
+        anti_float = section_data.get('antiFloat', {}) or {}
+        self.af_use = bool(anti_float.get('use', False))
+        self.af_extension = (float(anti_float.get('leftExtension', 500))
+                             + float(anti_float.get('rightExtension', 500))) if self.af_use else 0.0
+        self.af_thickness = float(anti_float.get('thickness', 300)) if self.af_use else 0.0
+        self.af_index = self.names.index('부상방지저판') if self.af_use else None
+
+        self.earth_cover = float(ground_info.get('earthCoverDepth', 2000))
+        self.gwl = float(ground_info.get('groundwaterLevel', 3000))
+        self.gamma_s = float(ground_info.get('soilUnitWeight', 18.0))
+
+    def quantities(self, deltas):
+        """(표본, 부재) 두께 오차 → (3, 표본) [면적, 폭, 높이]"""
+        linear = self.gradient @ deltas.T
+        quadratic = np.einsum('sn,knm,sm->ks', deltas, self.hessian, deltas, optimize=True)
+        return self.q0[:, np.newaxis] + linear + 0.5 * quadratic
+
+    def safety_factor(self, gwl, gamma_s, gamma_c, deltas, earth_cover):
+        """표본별 부력 안전율 (부력이 없으면 inf)"""
+        area, total_width, total_height = self.quantities(deltas)
+        concrete_weight = gamma_c * area / 1e6
+        soil_weight = gamma_s * total_width * earth_cover / 1e6
+        bottom_depth = earth_cover + total_height
+        bottom_width = total_width
+        if self.af_use:
+            bottom_depth = bottom_depth + self.af_thickness + deltas[:, self.af_index]
+            bottom_width = bottom_width + self.af_extension
+        hw = np.maximum(bottom_depth - gwl, 0.0)
+        buoyancy = GAMMA_W * (hw / 1000) * (bottom_width / 1000)
+        resist = concrete_weight + soil_weight
+        with np.errstate(divide='ignore'):
+            return np.where(buoyancy > 0, resist / np.where(buoyancy > 0, buoyancy, 1.0), np.inf)
+
+
+def _sample(rng, spec, mean, size):
+    """분포 정의에 따라 표본 생성"""
+    mean = spec.get('mean', mean)
+    mean = float(mean if mean is not None else 0.0)
+    dist = spec.get('dist', 'normal')
+    std = float(spec['std']) if 'std' in spec else float(spec.get('cov', 0.0)) * abs(mean)
+    if dist == 'fixed' or (dist in ('normal', 'lognormal') and std == 0):
+        values = np.full(size, mean)
+    elif dist == 'normal':
+        values = rng.normal(mean, std, size)
+    elif dist == 'lognormal':
+        sigma = math.sqrt(math.log(1.0 + (std / mean) ** 2))
+        values = rng.lognormal(math.log(mean) - sigma ** 2 / 2, sigma, size)
+    elif dist == 'uniform':
+        values = rng.uniform(mean + float(spec.get('low', -std)), mean + float(spec.get('high', std)), size)
+    else:
+        raise ValueError(f"지원하지 않는 분포: {dist}")
+    if 'min' in spec or 'max' in spec:
+        values = np.clip(values, spec.get('min', -np.inf), spec.get('max', np.inf))
+    return values
+
+
+def _simulate_chunk(model, variables, size, seed):
+    """표본 size개의 안전율 (덩어리 단위)"""
+    rng = np.random.default_rng(seed)
+    gwl = _sample(rng, variables['gwl'], model.gwl, size)
+    gamma_s = _sample(rng, variables['gamma_s'], model.gamma_s, size)
+    gamma_c = _sample(rng, variables['gamma_c'], GAMMA_C, size)
+    earth_cover = _sample(rng, variables['earth_cover'], model.earth_cover, size)
+    deltas = np.column_stack([_sample(rng, variables['thickness'], 0.0, size)
+                              for _ in model.names]) if model.names else np.zeros((size, 0))
+    return model.safety_factor(gwl, gamma_s, gamma_c, deltas, earth_cover)
+
+
+class MonteCarloResult:
+    """Monte Carlo 부력 해석 결과"""
+
+    def __init__(self, fs, deterministic_fs, variables, names):
+        self.n_samples = len(fs)
+        self.deterministic_fs = deterministic_fs
+        self.variables = variables
+        self.thickness_names = names
+        failed = fs < FAILURE_FS
+        self.pf = float(failed.mean())                                  # 파괴확률 P(FS < 1.0)
+        self.p_below_required = float((fs < REQUIRED_FS).mean())       # P(FS < 필요안전율)
+        # 추정 오차 (이항분포 표준오차, 변동계수)
+        self.std_error = math.sqrt(self.pf * (1 - self.pf) / self.n_samples)
+        self.pf_cov = self.std_error / self.pf if self.pf > 0 else None
+        self.reliability_index = _reliability_index(self.pf)
+
+        finite = fs[np.isfinite(fs)]
+        self.p_no_buoyancy = 1.0 - len(finite) / self.n_samples
+        self.fs_mean = float(finite.mean()) if len(finite) else None
+        self.fs_std = float(finite.std()) if len(finite) else None
+        # 분위 안전율 (부력 없음 표본은 FS = ∞로 가장 큰 값; 보간하면 ∞ - ∞ = NaN이 되므로
+        # 실제 표본값을 취하는 역누적분포 방식 사용)
+        levels = (0.001, 0.01, 0.05, 0.5, 0.95)
+        self.quantiles = (dict(zip(levels, np.quantile(fs, levels, method='inverted_cdf')))
+                          if self.n_samples else {})
+        edges = np.linspace(0.0, 3.0, 61)
+        self.histogram = (np.histogram(np.minimum(fs, edges[-1]), bins=edges)[0], edges)
+
+        # 수렴 추정: 누적 표본 수에 따른 파괴확률
+        checkpoints = [n for n in (10 ** k for k in range(3, 8)) if n < self.n_samples] + [self.n_samples]
+        cumulative = np.cumsum(failed)
+        self.convergence = [(n, float(cumulative[n - 1] / n)) for n in checkpoints]
+
+
+def _reliability_index(pf):
+    """파괴확률 → 신뢰도지수 β = -Φ⁻¹(pf)"""
+    if pf <= 0:
+        return math.inf
+    if pf >= 1:
+        return -math.inf
+    # 이분법으로 표준정규분포 역함수 (math.erfc 사용)
+    lo, hi = -40.0, 40.0
+    for _ in range(100):
+        mid = (lo + hi) / 2
+        if 0.5 * math.erfc(mid / math.sqrt(2)) > pf:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+
+def run_monte_carlo(section_data, ground_info, n_samples=DEFAULT_SAMPLES, variables=None,
+                    seed=None, chunk_size=CHUNK_SIZE):
+    """Monte Carlo 부력 신뢰성 해석
+
+    Args:
+        section_data: 단면제원 데이터
+        ground_info: 지반정보 데이터 (각 확률변수의 평균값)
+        n_samples: 표본 수
+        variables: 확률변수 분포 정의 (DEFAULT_VARIABLES에 덮어씀)
+        seed: 난수 시드 (같으면 같은 결과)
+        chunk_size: 덩어리 크기 (메모리 제한)
+
+    Returns:
+        MonteCarloResult
+    """
+    merged = {name: dict(spec) for name, spec in DEFAULT_VARIABLES.items()}
+    for name, spec in (variables or {}).items():
+        merged.setdefault(name, {}).update(spec)
+
+    model = BuoyancyModel(section_data, ground_info)
+    sizes = [min(chunk_size, n_samples - start) for start in range(0, n_samples, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    chunks = [_simulate_chunk(model, merged, size, s) for size, s in zip(sizes, seeds)]
+    fs = np.concatenate(chunks) if chunks else np.zeros(0)
+
+    deterministic = calculate_buoyancy(section_data, ground_info)['fs']
+    return MonteCarloResult(fs, deterministic, merged, model.names)
+
+
+def generate_reliability_report(section_data, ground_info, result=None, **options):
+    """부력 신뢰성 해석 보고서 텍스트"""
+    if result is None:
+        result = run_monte_carlo(section_data, ground_info, **options)
+    lines = []
+
+    def add(text=''):
+        lines.append(text)
+
+    add("═" * 60)
+    add("         부 력 신 뢰 성 해 석 (Monte Carlo)")
+    add("═" * 60)
+    add()
+    add(f"   표본 수 = {result.n_samples:,}")
+    add()
+    add("   ■ 확률변수")
+    labels = {'gwl': '지하수위 (mm)', 'gamma_s': '흙 단위중량 (kN/m³)',
+              'gamma_c': '콘크리트 단위중량 (kN/m³)', 'thickness': '부재 두께 오차 (mm)',
+              'earth_cover': '토피 (mm)'}
+    for name, spec in result.variables.items():
+        spread = f"σ = {spec['std']:g}" if 'std' in spec else f"COV = {spec.get('cov', 0):g}"
+        add(f"     {labels.get(name, name):<24} {spec.get('dist', 'normal'):<9} {spread}")
+    if result.thickness_names:
+        add(f"     (두께 오차 적용 부재: {', '.join(result.thickness_names)})")
+    add()
+    add("   ■ 결과")
+    if result.deterministic_fs is None:
+        add("     확정론적 안전율 = - (부력 없음)")
+    else:
+        add(f"     확정론적 안전율 = {result.deterministic_fs:.3f}")
+    if result.fs_mean is not None:
+        add(f"     안전율 평균 = {result.fs_mean:.3f}, 표준편차 = {result.fs_std:.3f}")
+    add(f"     부력 없음 확률 = {result.p_no_buoyancy:.4%}")
+    for level, value in result.quantiles.items():
+        value_text = f"{value:.3f}" if np.isfinite(value) else "부력 없음"
+        add(f"     {level * 100:g}% 분위 안전율 = {value_text}")
+    add()
+    add(f"     파괴확률 Pf = P(FS < {FAILURE_FS:.2f}) = {result.pf:.3e}")
+    if result.pf_cov is not None:
+        add(f"       표준오차 = {result.std_error:.3e} (변동계수 {result.pf_cov:.1%})")
+    else:
+        add(f"       파괴 표본 없음 (Pf < {1 / result.n_samples:.1e} 추정)")
+    beta = result.reliability_index
+    add(f"     신뢰도지수 β = {beta:.2f}" if math.isfinite(beta) else "     신뢰도지수 β = ∞")
+    add(f"     P(FS < {REQUIRED_FS:.2f}) = {result.p_below_required:.3e}")
+    add()
+    add("   ■ 수렴 (누적 표본 수별 Pf)")
+    for n, pf in result.convergence:
+        add(f"     {n:>12,}  {pf:.3e}")
+    add()
+    add("   ■ 안전율 분포")
+    counts, edges = result.histogram
+    peak = counts.max() if counts.max() > 0 else 1
+    for k in range(0, len(counts), 3):
+        c = counts[k:k + 3].sum()
+        if not c:
+            continue
+        bar = '█' * max(1, int(40 * c / (3 * peak)))
+        upper = f"{edges[min(k + 3, len(edges) - 1)]:.2f}"
+        if k + 3 >= len(counts):
+            upper = "∞"
+        add(f"     {edges[k]:.2f} ~ {upper:>4}  {bar} {c / result.n_samples:.2%}")
+    add()
+    add("═" * 60)
+    return '\n'.join(lines)
@@ -0,0 +1,176 @@
+"""부력 검토 시나리오 (Scenario Matrix) 모듈
+
+시공 단계(토피 없음), 설계 지하수위, 홍수위(지하수위 = 지표면)와
+부상방지저판 설치/미설치 대안을 한 번에 검토하고 지배 시나리오를 찾는다.
+
+구조물 자중 분할(decompose_section)은 부상방지저판을 포함해 한 번만 계산하여
+모든 시나리오가 공유하고, 시나리오마다 달라지는 흙/물 항과 부상방지저판
+포함 여부만 배열 연산으로 다시 계산한다.
+"""
+
+import copy
+import numpy as np
+from buoyancy_check import GAMMA_W, REQUIRED_FS, decompose_section
+from section_layout import get_section_layout
+
+# 하중 상태 (이름, 흙 무게에 쓰는 토피, 지하수위)
+#   earthCover: None = 설계 토피
+#   groundwaterLevel: 설계 지표면에서 깊이 (mm), None = 설계 지하수위
+DEFAULT_STAGES = [
+    {'name': '시공 중 (토피 없음)', 'earthCover': 0, 'groundwaterLevel': None},
+    {'name': '설계 지하수위', 'earthCover': None, 'groundwaterLevel': None},
+    {'name': '홍수위 (지하수위 = 지표면)', 'earthCover': None, 'groundwaterLevel': 0},
+]
+
+ANTI_FLOAT_OPTIONS = [(False, '부상방지저판 없음'), (True, '부상방지저판 설치')]
+
+
+def build_scenarios(stages=None, anti_float_options=None):
+    """하중 상태 × 부상방지저판 대안 시나리오 목록"""
+    stages = stages or DEFAULT_STAGES
+    anti_float_options = anti_float_options or ANTI_FLOAT_OPTIONS
+    scenarios = []
+    for stage in stages:
+        for use, label in anti_float_options:
+            scenario = dict(stage)
+            scenario['antiFloat'] = use
+            scenario['label'] = f"{stage['name']} / {label}"
+            scenarios.append(scenario)
+    return scenarios
+
+
+class ScenarioResult:
+    """시나리오별 부력검토 결과 (시나리오 배열)"""
+
+    def __init__(self, scenarios, **arrays):
+        self.scenarios = scenarios
+        self.__dict__.update(arrays)
+
+    def __len__(self):
+        return len(self.scenarios)
+
+    @property
+    def governing(self):
+        """안전율이 가장 작은 시나리오 번호 (모두 부력이 없으면 None)"""
+        if np.isinf(self.fs).all():
+            return None
+        return int(np.argmin(self.fs))
+
+
+def evaluate_scenarios(section_data, ground_info, scenarios=None, shapes=None):
+    """모든 시나리오 부력검토 (자중 분할 공유)
+
+    Args:
+        section_data: 단면제원 데이터
+        ground_info: 지반정보 데이터 (설계값)
+        scenarios: build_scenarios 형식 목록 (기본: 3개 상태 × 부상방지저판 유/무)
+        shapes: 부상방지저판을 포함한 decompose_section 결과 (없으면 계산)
+
+    Returns:
+        ScenarioResult
+    """
+    scenarios = scenarios or build_scenarios()
+    anti_float = dict(section_data.get('antiFloat', {}) or {})
+    if shapes is None:
+        # 부상방지저판 포함으로 한 번만 분할 (미설치 시나리오는 해당 도형 제외)
+        af_section = copy.copy(section_data)
+        af_section['antiFloat'] = dict(anti_float, use=True)
+        shapes = decompose_section(af_section)
+
+    af_left_ext = float(anti_float.get('leftExtension', 500))
+    af_right_ext = float(anti_float.get('rightExtension', 500))
+    af_thickness = float(anti_float.get('thickness', 300))
+    total_width = get_section_layout(section_data).total_width
+    total_height = (float(section_data.get('LT', 800)) + float(section_data.get('H', 4200))
+                    + float(section_data.get('UT', 600)))
+    structure_weight = sum(s['weight'] for s in shapes if s['group'] != 'antiFloat')
+    af_weight = sum(s['weight'] for s in shapes if s['group'] == 'antiFloat')
+
+    design_cover = float(ground_info.get('earthCoverDepth', 2000))
+    design_gwl = float(ground_info.get('groundwaterLevel', 3000))
+    gamma_s = float(ground_info.get('soilUnitWeight', 18.0))
+
+    def column(key, default):
+        return np.array([default if sc.get(key) is None else float(sc[key]) for sc in scenarios])
+
+    use_af = np.array([bool(sc.get('antiFloat')) for sc in scenarios])
+    earth_cover = column('earthCover', design_cover)
+    gwl = column('groundwaterLevel', design_gwl)
+
+    # 흙/물 항만 시나리오별 계산 (지하수위 표고는 설계 지표면 기준으로 고정)
+    total_weight = structure_weight + np.where(use_af, af_weight, 0.0)
+    soil_weight = gamma_s * total_width * earth_cover / 1e6
+    bottom_width = total_width + np.where(use_af, af_left_ext + af_right_ext, 0.0)
+    bottom_depth = design_cover + total_height + np.where(use_af, af_thickness, 0.0)
+    hw = np.maximum(bottom_depth - gwl, 0.0)
+    buoyancy = GAMMA_W * (hw / 1000) * (bottom_width / 1000)
+    total_resist = total_weight + soil_weight
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fs = np.where(buoyancy > 0, total_resist / np.where(buoyancy > 0, buoyancy, 1.0), np.inf)
+
+    return ScenarioResult(
+        scenarios,
+        anti_float=use_af, earth_cover=earth_cover, gwl=gwl,
+        total_weight=total_weight, soil_weight=soil_weight,
+        bottom_width=bottom_width, bottom_depth=bottom_depth, hw=hw,
+        buoyancy=buoyancy, total_resist=total_resist, fs=fs, ok=fs >= REQUIRED_FS,
+    )
+
+
+def generate_scenario_report(section_data, ground_info, result=None):
+    """시나리오별 부력검토 종합 보고서 텍스트"""
+    if result is None:
+        result = evaluate_scenarios(section_data, ground_info)
+    lines = []
+
+    def add(text=''):
+        lines.append(text)
+
+    add("═" * 60)
+    add("         부 력 검 토  -  시 나 리 오 종 합")
+    add("═" * 60)
+    add()
+    add(f"   필요 안전율 = {REQUIRED_FS:.2f}")
+    add(f"   설계 토피 = {float(ground_info.get('earthCoverDepth', 2000)):,.0f} mm,"
+        f" 설계 지하수위 = GL-{float(ground_info.get('groundwaterLevel', 3000)):,.0f} mm")
+    add()
+
+    for k, scenario in enumerate(result.scenarios):
+        add(f"   [{k+1}] {scenario['label']}")
+        add(f"     토피 = {result.earth_cover[k]:,.0f} mm, 지하수위 = GL-{result.gwl[k]:,.0f} mm,"
+            f" 수두 hw = {result.hw[k]:,.0f} mm")
+        add(f"     Wc = {result.total_weight[k]:,.2f}, Ws = {result.soil_weight[k]:,.2f},"
+            f" R = {result.total_resist[k]:,.2f} kN/m")
+        if result.buoyancy[k] > 0:
+            status = "O.K." if result.ok[k] else "N.G."
+            add(f"     U = {result.buoyancy[k]:,.2f} kN/m,"
+                f" FS = {result.fs[k]:.3f}  →  {status}")
+        else:
+            add("     U = 0 (부력 없음)  →  O.K.")
+        add()
+
+    add("─" * 60)
+    add("   ■ 종합")
+    add(f"     {'시나리오':<36}{'FS':>8}  판정")
+    for k, scenario in enumerate(result.scenarios):
+        fs_text = f"{result.fs[k]:.3f}" if np.isfinite(result.fs[k]) else "-"
+        mark = " ◀ 지배" if k == result.governing else ""
+        add(f"     {scenario['label']:<36}{fs_text:>8}  {'O.K.' if result.ok[k] else 'N.G.'}{mark}")
+    add()
+    governing = result.governing
+    if governing is None:
+        add("     모든 시나리오에서 부력이 작용하지 않음")
+    else:
+        add(f"     지배 시나리오: {result.scenarios[governing]['label']}"
+            f" (FS = {result.fs[governing]:.3f})")
+    # 부상방지저판 필요 여부 (상태별로 미설치 대안이 만족하는지)
+    without = [k for k, sc in enumerate(result.scenarios) if not sc.get('antiFloat')]
+    if without:
+        needed = [result.scenarios[k]['name'] for k in without if not result.ok[k]]
+        if needed:
+            add(f"     부상방지저판 없이 불만족: {', '.join(needed)}")
+        else:
+            add("     부상방지저판 없이 모든 상태 만족")
+    add()
+    add("═" * 60)
+    return '\n'.join(lines)
@@ -0,0 +1,485 @@
+"""계산서 출력 (Calculation Report) 모듈
+
+프로젝트 전체의 부력검토 계산서를 HTML과 쪽 나눔된 PDF로 출력한다.
+계산서는 설계 조건 → 측점별 장(단면 제원, 분할 도형 자중표, 분할 도형 그림,
+부력 검토) → 안전율 요약 순서이며, 장 단위로 만들어 바로 파일에 쓴다.
+
+- 측점 장은 프로세스 풀에서 동시에 만들고, 순서대로 받아 쓴다
+  (대기 중인 장은 작업자 수의 2배까지만 둠)
+- 측점은 프로젝트 파일에서 하나씩 읽고, 안전율 요약 행은 임시 파일에 모아 두므로
+  측점 수와 관계없이 메모리 사용량이 일정하다
+
+사용 예
+    python calculation_report.py project.escp --html report.html --pdf report.pdf
+"""
+
+import argparse
+import html
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from buoyancy_check import GAMMA_C, GAMMA_W, REQUIRED_FS
+from result_cache import cached_buoyancy
+from quantity_takeoff import station_section
+
+FIGURE_WIDTH = 900       # HTML 분할 도형 SVG 폭 (px)
+
+
+def _num(value, digits=0):
+    if value is None:
+        return '-'
+    return f"{float(value):,.{digits}f}"
+
+
+def _table(headers, rows, align=None, widths=None):
+    """표 블록 (align: 열별 'l'/'r', widths: 열 너비 비율)"""
+    return {'type': 'table', 'headers': headers, 'rows': rows,
+            'align': align or 'l' * len(headers), 'widths': widths or [1] * len(headers)}
+
+
+# ========================================
+# 계산서 내용 (블록 목록)
+# ========================================
+
+def project_chapter(project_data, title):
+    """표지 + 설계 조건 장"""
+    info = project_data.get('projectInfo') or {}
+    conditions = project_data.get('designConditions') or {}
+    materials = project_data.get('materials') or {}
+    ground = project_data.get('groundInfo') or {}
+
+    blocks = [{'type': 'title', 'text': title},
+              {'type': 'text', 'text': f"작성일: {time.strftime('%Y-%m-%d')}"}]
+    rows = [[label, str(info.get(key) or '-')] for key, label in
+            (('businessName', '사업명'), ('client', '발주처'), ('constructor', '시공사'),
+             ('siteName', '현장명'))]
+    blocks.append({'type': 'heading', 'text': '설계 조건'})
+    blocks.append({'type': 'subheading', 'text': '일반 사항'})
+    blocks.append(_table(['항목', '내용'], rows + [
+        ['설계기준', str(conditions.get('standard') or '-')],
+        ['설계수명', str(conditions.get('designLife') or '-')],
+        ['환경조건', str(conditions.get('environment') or '-')],
+    ], widths=[1, 3]))
+    blocks.append({'type': 'subheading', 'text': '재료 및 지반'})
+    blocks.append(_table(['항목', '값', '단위'], [
+        ['콘크리트 설계기준강도 (fck)', _num(materials.get('fck'), 1), 'MPa'],
+        ['철근 항복강도 (fy)', _num(materials.get('fy'), 1), 'MPa'],
+        ['콘크리트 단위중량 (γc)', _num(GAMMA_C, 2), 'kN/m³'],
+        ['물의 단위중량 (γw)', _num(GAMMA_W, 2), 'kN/m³'],
+        ['흙의 단위중량 (γs)', _num(ground.get('soilUnitWeight'), 2), 'kN/m³'],
+        ['토피 (Dc)', _num(ground.get('earthCoverDepth')), 'mm'],
+        ['지하수위 (GWL, 지표면 기준)', _num(ground.get('groundwaterLevel')), 'mm'],
+        ['필요 안전율', _num(REQUIRED_FS, 2), ''],
+    ], align='lrl', widths=[3, 1, 1]))
+    return blocks
+
+
+def station_chapter(index, name, section_data, ground_info, figures=True):
+    """측점 한 장 → (블록 목록, 안전율 요약 행)"""
+    result = cached_buoyancy(section_data, ground_info)
+    anti_float = section_data.get('antiFloat') or {}
+    B = section_data.get('B') or []
+
+    blocks = [{'type': 'heading', 'text': f"{index}. {name}", 'anchor': f"station-{index}"}]
+    blocks.append({'type': 'subheading', 'text': f"{index}.1 단면 제원"})
+    dims = [
+        ['암거 련수', str(section_data.get('culvert_count', len(B))), '련'],
+        ['내공높이 (H)', _num(section_data.get('H')), 'mm'],
+        ['내공폭 (B)', ' + '.join(_num(b) for b in B) or '-', 'mm'],
+        ['상부/하부 슬래브 (UT/LT)', f"{_num(section_data.get('UT'))} / {_num(section_data.get('LT'))}", 'mm'],
+        ['좌측/우측 벽체 (WL/WR)', f"{_num(section_data.get('WL'))} / {_num(section_data.get('WR'))}", 'mm'],
+        ['총 폭 × 총 높이', f"{_num(result['total_width'])} × {_num(result['total_height'])}", 'mm'],
+        ['부상방지저판', f"두께 {_num(anti_float.get('thickness', 300))}, 확장 "
+                     f"{_num(anti_float.get('leftExtension', 500))} / {_num(anti_float.get('rightExtension', 500))}"
+         if anti_float.get('use') else '미적용', 'mm' if anti_float.get('use') else ''],
+        ['토피 / 지하수위', f"{_num(ground_info.get('earthCoverDepth'))} / "
+                        f"{_num(ground_info.get('groundwaterLevel'))}", 'mm'],
+    ]
+    blocks.append(_table(['항목', '값', '단위'], dims, align='lrl', widths=[2, 3, 1]))
+
+    blocks.append({'type': 'subheading', 'text': f"{index}.2 단면 분할 및 자중 (단위 m 당)"})
+    rows = [[str(s['no']), s['kind'], s['name'], _num(s['area']), _num(s['weight'], 2)]
+            for s in result['shapes']]
+    rows.append(['', '', '합계 (Wc)', '', _num(result['total_weight'], 2)])
+    blocks.append(_table(['No.', '형태', '부재', '면적 (mm²)', '자중 (kN/m)'], rows,
+                         align='lllrr', widths=[1, 1.5, 3, 2, 2]))
+    if figures:
+        from headless_render import render_drawing
+        blocks.append({'type': 'figure', 'drawing': render_drawing('shapes', section_data, theme='light'),
+                       'caption': f"그림 {index}. 단면 분할 ({name})"})
+
+    blocks.append({'type': 'subheading', 'text': f"{index}.3 부력 검토"})
+    fs = result['fs']
+    verdict = 'O.K.' if result['ok'] else 'N.G.'
+    blocks.append(_table(['항목', '값', '단위'], [
+        ['구조물 자중 (Wc)', _num(result['total_weight'], 2), 'kN/m'],
+        ['상재토 무게 (Ws)', _num(result['soil_weight'], 2), 'kN/m'],
+        ['저항력 (R = Wc + Ws)', _num(result['total_resist'], 2), 'kN/m'],
+        ['수두 높이 (hw)', _num(result['hw']), 'mm'],
+        ['부력 (U = γw × hw × B)', _num(result['buoyancy'], 2), 'kN/m'],
+        ['안전율 (FS = R / U)', _num(fs, 2) if fs is not None else '부력 없음', ''],
+        ['판정', f"FS {'≥' if result['ok'] else '<'} {REQUIRED_FS:.2f} → {verdict}"
+         if fs is not None else verdict, ''],
+    ], align='lrl', widths=[3, 2, 1]))
+
+    summary = [index, name, result['total_weight'], result['soil_weight'], result['buoyancy'],
+               result['total_resist'], fs, result['ok']]
+    return blocks, summary
+
+
+def iter_station_chapters(project_data, stations=None, workers=None, figures=True):
+    """측점 장을 순서대로 생성 (작업자 수 > 1이면 동시에 계산)
+
+    Args:
+        stations: 측점 목록/반복자 (없으면 project_data['stations'], 그것도 없으면 기본 단면 하나)
+    """
+    section_data = project_data.get('sectionData') or {}
+    ground_info = project_data.get('groundInfo') or {}
+    if stations is None:
+        stations = project_data.get('stations') or [{'name': '기본 단면'}]
+    tasks = ((k, station.get('name') or f"측점 {k}", station_section(section_data, station), ground_info)
+             for k, station in enumerate(stations, 1))
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for task in tasks:
+            yield station_chapter(*task, figures)
+        return
+
+    # 순서를 지키면서 앞선 장을 기다리는 동안 뒤의 장을 미리 계산 (대기 수 제한)
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context('spawn')) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(station_chapter, *task, figures))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def summary_chapter(rows):
+    """안전율 요약 장 (rows는 반복자여도 됨)"""
+    return [{'type': 'heading', 'text': '안전율 요약', 'anchor': 'summary'},
+            _table(['No.', '측점', 'Wc (kN/m)', 'Ws (kN/m)', 'U (kN/m)', 'R (kN/m)', 'FS', '판정'],
+                   (_summary_cells(row) for row in rows), align='llrrrrrl',
+                   widths=[0.7, 2.5, 1.2, 1.2, 1.2, 1.2, 0.8, 0.8])]
+
+
+def _summary_cells(row):
+    index, name, wc, ws, u, r, fs, ok = row
+    return [str(index), name, _num(wc, 2), _num(ws, 2), _num(u, 2), _num(r, 2),
+            _num(fs, 2) if fs is not None else '-', 'O.K.' if ok else 'N.G.']
+
+
+# ========================================
+# HTML 출력
+# ========================================
+
+_CSS = """
+body { font-family: 'Malgun Gothic', 'Noto Sans KR', sans-serif; font-size: 10pt; margin: 2em; color: #000; }
+h1 { font-size: 20pt; text-align: center; margin: 3em 0 1em; }
+h2 { font-size: 14pt; border-bottom: 2px solid #000; padding-bottom: 0.2em; margin-top: 2em; }
+h3 { font-size: 11pt; margin: 1.2em 0 0.4em; }
+table { border-collapse: collapse; width: 100%; margin-bottom: 0.8em; }
+th, td { border: 1px solid #888; padding: 2px 6px; }
+th { background: #eee; }
+td.r { text-align: right; }
+figure { text-align: center; margin: 0.5em 0 1em; }
+figure svg { max-width: 100%; height: auto; max-height: 110mm; }
+@media print { h2 { page-break-before: always; } thead { display: table-header-group; } }
+"""
+
+
+class HtmlReportWriter:
+    """HTML 계산서 (블록을 받는 즉시 파일에 씀)"""
+
+    def __init__(self, file_path, title):
+        self.file = open(file_path, 'w', encoding='utf-8')
+        self.file.write(f'<!DOCTYPE html>\n<html lang="ko">\n<head>\n<meta charset="utf-8">\n'
+                        f'<title>{html.escape(title)}</title>\n<style>{_CSS}</style>\n</head>\n<body>\n')
+
+    def write_blocks(self, blocks):
+        write = self.file.write
+        for block in blocks:
+            kind = block['type']
+            if kind == 'title':
+                write(f"<h1>{html.escape(block['text'])}</h1>\n")
+            elif kind == 'heading':
+                anchor = f' id="{block["anchor"]}"' if block.get('anchor') else ''
+                write(f"<h2{anchor}>{html.escape(block['text'])}</h2>\n")
+            elif kind == 'subheading':
+                write(f"<h3>{html.escape(block['text'])}</h3>\n")
+            elif kind == 'text':
+                write(f"<p>{html.escape(block['text'])}</p>\n")
+            elif kind == 'figure':
+                write(f"<figure>{block['drawing'].to_svg(FIGURE_WIDTH)}<figcaption>{html.escape(block['caption'])}</figcaption></figure>\n")
+            elif kind == 'table':
+                align = block['align']
+                write('<table>\n<thead><tr>')
+                write(''.join(f"<th>{html.escape(h)}</th>" for h in block['headers']))
+                write('</tr></thead>\n<tbody>\n')
+                cells = ['<td class="r">' if a == 'r' else '<td>' for a in align]
+                for row in block['rows']:
+                    write('<tr>' + ''.join(f"{cells[c]}{html.escape(text)}</td>"
+                                           for c, text in enumerate(row)) + '</tr>\n')
+                write('</tbody>\n</table>\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.write('</body>\n</html>\n')
+        self.file.close()
+
+
+# ========================================
+# PDF 출력 (쪽 나눔)
+# ========================================
+
+class PdfReportWriter:
+    """A4 PDF 계산서 (블록을 받는 즉시 쪽에 배치, 장마다 새 쪽)"""
+
+    MARGIN_MM = 18
+
+    def __init__(self, file_path, title):
+        from headless_render import ensure_qt_gui
+        ensure_qt_gui()
+        from PyQt5.QtGui import QPdfWriter, QPainter, QPageSize, QPageLayout, QFont
+        from PyQt5.QtCore import QMarginsF
+
+        self.title = title
+        self.writer = QPdfWriter(file_path)
+        self.writer.setTitle(title)
+        self.writer.setResolution(300)
+        self.writer.setPageSize(QPageSize(QPageSize.A4))
+        self.writer.setPageMargins(QMarginsF(*[self.MARGIN_MM] * 4), QPageLayout.Millimeter)
+        self.painter = QPainter(self.writer)
+        layout = self.writer.pageLayout()
+        rect = layout.paintRectPixels(self.writer.resolution())
+        self.width = rect.width()
+        self.height = rect.height()
+        self.footer_height = self._mm(8)
+        self.fonts = {
+            'title': QFont('Malgun Gothic', 20, QFont.Bold),
+            'heading': QFont('Malgun Gothic', 14, QFont.Bold),
+            'subheading': QFont('Malgun Gothic', 11, QFont.Bold),
+            'body': QFont('Malgun Gothic', 9),
+            'bold': QFont('Malgun Gothic', 9, QFont.Bold),
+            'footer': QFont('Malgun Gothic', 8),
+        }
+        self.page = 1
+        self.y = 0
+        self._page_has_content = False
+
+    def _mm(self, mm):
+        return mm * self.writer.resolution() / 25.4
+
+    def _line_height(self, font):
+        self.painter.setFont(self.fonts[font])
+        return self.painter.fontMetrics().height()
+
+    def _finish_page(self):
+        from PyQt5.QtCore import Qt, QRectF
+        self.painter.setFont(self.fonts['footer'])
+        self.painter.setPen(Qt.darkGray)
+        rect = QRectF(0, self.height - self.footer_height, self.width, self.footer_height)
+        self.painter.drawText(rect, Qt.AlignLeft | Qt.AlignBottom, self.title)
+        self.painter.drawText(rect, Qt.AlignRight | Qt.AlignBottom, f"- {self.page} -")
+        self.painter.setPen(Qt.black)
+
+    def new_page(self):
+        self._finish_page()
+        self.writer.newPage()
+        self.page += 1
+        self.y = 0
+        self._page_has_content = False
+
+    def _reserve(self, height):
+        """남은 높이가 부족하면 새 쪽"""
+        if self._page_has_content and self.y + height > self.height - self.footer_height:
+            self.new_page()
+        self._page_has_content = True
+
+    def _text(self, font, text, height_lines=1.0, align=None, space_before=0.0, space_after=0.3):
+        from PyQt5.QtCore import Qt, QRectF
+        line = self._line_height(font)
+        flags = (align or Qt.AlignLeft) | Qt.TextWordWrap
+        bounds = self.painter.boundingRect(QRectF(0, 0, self.width, 1e6), flags, text)
+        self._reserve(line * space_before + max(bounds.height(), line * height_lines))
+        self.y += line * space_before
+        self.painter.drawText(QRectF(0, self.y, self.width, bounds.height()), flags, text)
+        self.y += bounds.height() + line * space_after
+
+    def _table(self, block):
+        from PyQt5.QtCore import Qt, QRectF, QLineF
+        total = sum(block['widths'])
+        xs = [0.0]
+        for w in block['widths']:
+            xs.append(xs[-1] + self.width * w / total)
+        row_height = self._line_height('body') * 1.35
+        pad = self._mm(1)
+
+        def draw_row(cells, font, fill=None):
+            self.painter.setFont(self.fonts[font])
+            if fill is not None:
+                self.painter.fillRect(QRectF(0, self.y, self.width, row_height), fill)
+            for c, text in enumerate(cells):
+                flags = (Qt.AlignRight if block['align'][c] == 'r' else Qt.AlignLeft) | Qt.AlignVCenter
+                self.painter.drawText(QRectF(xs[c] + pad, self.y, xs[c + 1] - xs[c] - 2 * pad, row_height),
+                                      flags, text)
+            self.painter.drawLine(QLineF(0, self.y + row_height, self.width, self.y + row_height))
+            self.y += row_height
+
+        def draw_header():
+            from PyQt5.QtGui import QColor
+            self.painter.drawLine(QLineF(0, self.y, self.width, self.y))
+            draw_row(block['headers'], 'bold', QColor(235, 235, 235))
+
+        self._reserve(row_height * 2)
+        draw_header()
+        for cells in block['rows']:
+            if self.y + row_height > self.height - self.footer_height:
+                self.new_page()
+                self._page_has_content = True
+                draw_header()
+            draw_row(cells, 'body')
+        self.y += row_height * 0.6
+
+    def _figure(self, block):
+        # QSvgRenderer는 글자를 외곽선으로 그려 PDF가 커지므로 직접 그림
+        from PyQt5.QtCore import QRectF, Qt
+        drawing = block['drawing']
+        width = self.width * 0.8
+        height = width * drawing.aspect()
+        max_height = self._mm(110)
+        if height > max_height:
+            height, width = max_height, max_height / drawing.aspect()
+        caption = self._line_height('body') * 1.5
+        self._reserve(height + caption)
+        drawing.paint(self.painter, QRectF((self.width - width) / 2, self.y, width, height))
+        self.y += height
+        self.painter.setFont(self.fonts['body'])
+        self.painter.setPen(Qt.black)
+        self.painter.drawText(QRectF(0, self.y, self.width, caption), Qt.AlignCenter, block['caption'])
+        self.y += caption
+
+    def write_blocks(self, blocks):
+        from PyQt5.QtCore import Qt
+        for block in blocks:
+            kind = block['type']
+            if kind == 'title':
+                self.y = self.height * 0.3
+                self._text('title', block['text'], align=Qt.AlignHCenter, space_after=1.0)
+            elif kind == 'heading':
+                if self._page_has_content:
+                    self.new_page()
+                self._text('heading', block['text'], space_after=0.5)
+            elif kind == 'subheading':
+                self._text('subheading', block['text'], height_lines=4, space_before=0.3)
+            elif kind == 'text':
+                self._text('body', block['text'], align=Qt.AlignHCenter if self.page == 1 else None)
+            elif kind == 'table':
+                self._table(block)
+            elif kind == 'figure':
+                self._figure(block)
+
+    def close(self):
+        self._finish_page()
+        self.painter.end()
+
+
+# ========================================
+# 계산서 생성
+# ========================================
+
+def generate_report(project_data, html_path=None, pdf_path=None, stations=None, station_count=None,
+                    title='부력 검토 계산서', workers=None, figures=True, progress=None):
+    """계산서 출력 (HTML/PDF 중 지정한 것, 둘 다 한 번의 계산으로)
+
+    Args:
+        project_data: 프로젝트 데이터 (측점 제외 가능)
+        stations: 측점 반복자 (없으면 project_data['stations'])
+        station_count: progress의 전체 수 (모르면 None)
+        progress: progress(완료 장 수, 전체 장 수 또는 None) 콜백
+
+    Returns:
+        dict: chapters, failed (N.G. 측점 수), elapsed
+    """
+    if not html_path and not pdf_path:
+        raise ValueError("출력 파일을 지정하세요")
+    start = time.perf_counter()
+    writers = []
+    if html_path:
+        writers.append(HtmlReportWriter(html_path, title))
+    if pdf_path:
+        writers.append(PdfReportWriter(pdf_path, title))
+
+    def emit(blocks):
+        for writer in writers:
+            writer.write_blocks(blocks)
+
+    chapters = failed = 0
+    # 안전율 요약 행은 임시 파일에 모아 마지막 장에서 다시 읽음
+    with tempfile.TemporaryFile('w+', encoding='utf-8') as spool:
+        try:
+            emit(project_chapter(project_data, title))
+            for blocks, summary in iter_station_chapters(project_data, stations, workers, figures):
+                emit(blocks)
+                spool.write(json.dumps(summary, ensure_ascii=False) + '\n')
+                chapters += 1
+                failed += not summary[-1]
+                if progress:
+                    progress(chapters, station_count)
+            blocks = summary_chapter(())
+            blocks.insert(1, {'type': 'text', 'text': f"측점 {chapters}개, N.G. {failed}개 "
+                                                      f"(필요 안전율 {REQUIRED_FS:.2f})"})
+            # 요약 표는 행을 읽는 대로 쓰므로 출력 파일이 여럿이면 한 번씩 다시 읽음
+            for writer in writers:
+                spool.seek(0)
+                blocks[-1]['rows'] = (_summary_cells(json.loads(line)) for line in spool)
+                writer.write_blocks(blocks)
+        finally:
+            for writer in writers:
+                writer.close()
+    return {'chapters': chapters, 'failed': failed, 'elapsed': time.perf_counter() - start}
+
+
+def generate_project_report(project_path, html_path=None, pdf_path=None, **kwargs):
+    """프로젝트 파일 → 계산서 (바이너리 파일은 측점을 하나씩 읽음)"""
+    from project_container import read_project_file
+    data, container = read_project_file(project_path)
+    if container is not None and container.station_count:
+        kwargs.setdefault('stations', container.iter_stations())
+        kwargs.setdefault('station_count', container.station_count)
+    elif data.get('stations'):
+        kwargs.setdefault('station_count', len(data['stations']))
+    kwargs.setdefault('title', f"부력 검토 계산서 - {os.path.splitext(os.path.basename(project_path))[0]}")
+    return generate_report(data, html_path, pdf_path, **kwargs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='부력검토 계산서 출력 (HTML / PDF)')
+    parser.add_argument('project', help='프로젝트 파일 (.json / .escp)')
+    parser.add_argument('--html', default=None, help='HTML 출력 경로')
+    parser.add_argument('--pdf', default=None, help='PDF 출력 경로')
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본 CPU 수)')
+    parser.add_argument('--no-figures', action='store_true', help='분할 도형 그림 생략')
+    args = parser.parse_args(argv)
+    if not args.html and not args.pdf:
+        parser.error('--html 또는 --pdf 를 지정하세요')
+
+    stats = generate_project_report(
+        args.project, args.html, args.pdf, workers=args.workers, figures=not args.no_figures,
+        progress=lambda i, n: print(f"\r측점 {i}/{n or '?'}", end='', file=sys.stderr, flush=True))
+    print(file=sys.stderr)
+    print(f"측점 {stats['chapters']}개 (N.G. {stats['failed']}개), {stats['elapsed']:.1f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
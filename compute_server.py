@@ -0,0 +1,437 @@
+"""계산 서버 (Compute Server) 모듈
+
+웹 화면(esc_culvert_web)의 정적 파일을 제공하고, 데스크톱 프로그램과 같은
+Python 계산 모듈(부력검토, 암거 DXF, 분할 도형, 단면 특성, 시나리오,
+신뢰성 해석, 수량산출)을 JSON API로 제공하는 로컬 HTTP 서버.
+브라우저와 데스크톱이 같은 계산 코드와 같은 결과 캐시를 사용한다.
+
+    python compute_server.py                    # http://127.0.0.1:8765/
+    python compute_server.py --port 9000 --workers 4
+
+API (모두 POST, 본문 JSON)
+    /api/buoyancy            {sectionData, groundInfo} → {result, report}
+    /api/buoyancy-report     {sectionData, groundInfo} → {report}
+    /api/decomposition       {sectionData} → {shapes}
+    /api/dxf                 {sectionData, groundInfo} → DXF 파일 (application/dxf)
+    /api/section-properties  {sectionData} → {area, centroid, Ix, Iy, Ixy, consistent, report}
+    /api/scenarios           {sectionData, groundInfo} → {governing, report}
+    /api/reliability         {sectionData, groundInfo, samples, seed} → {pf, beta, report}
+    /api/quantity            {sectionData, stations} → {total, report}
+    /api/batch               {requests: [{endpoint, payload}, ...]} → {results: [...]}
+    GET /api/health, GET /api/stats
+
+계산은 작업자 프로세스 풀에서 실행하므로 이벤트 루프가 막히지 않는다.
+같은 입력의 요청이 계산 중에 또 들어오면 새로 계산하지 않고 진행 중인
+계산 결과를 함께 받는다 (요청 합치기). 최근 응답은 메모리에도 보관한다.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import mimetypes
+import multiprocessing
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import unquote, urlsplit
+
+from result_cache import (cache_key, cached_buoyancy, cached_buoyancy_report,
+                          cached_decomposition, cached_culvert_dxf_bytes)
+
+WEB_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'esc_culvert_web')
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+MAX_BODY = 16 * 1024 * 1024           # 요청 본문 최대 크기
+MEMORY_CACHE_ENTRIES = 256            # 메모리에 보관할 최근 응답 수
+MAX_RELIABILITY_SAMPLES = 2_000_000   # 신뢰성 해석 표본 수 상한
+JSON_TYPE = 'application/json; charset=utf-8'
+
+_STATUS_TEXT = {200: 'OK', 204: 'No Content', 400: 'Bad Request', 404: 'Not Found',
+                405: 'Method Not Allowed', 413: 'Payload Too Large',
+                500: 'Internal Server Error'}
+
+
+class RequestError(Exception):
+    """잘못된 요청 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# ========================================
+# 계산 함수 (작업자 프로세스에서 실행)
+# ========================================
+
+def _section(payload):
+    section_data = payload.get('sectionData')
+    if not isinstance(section_data, dict) or not section_data.get('B'):
+        raise ValueError("sectionData가 없거나 올바르지 않습니다")
+    return section_data
+
+
+def _ground(payload):
+    ground_info = payload.get('groundInfo') or {}
+    if not isinstance(ground_info, dict):
+        raise ValueError("groundInfo가 올바르지 않습니다")
+    return ground_info
+
+
+def _engine_buoyancy(payload):
+    section_data, ground_info = _section(payload), _ground(payload)
+    return {'result': cached_buoyancy(section_data, ground_info),
+            'report': cached_buoyancy_report(section_data, ground_info)}
+
+
+def _engine_buoyancy_report(payload):
+    return {'report': cached_buoyancy_report(_section(payload), _ground(payload))}
+
+
+def _engine_decomposition(payload):
+    return {'shapes': cached_decomposition(_section(payload))}
+
+
+def _engine_dxf(payload):
+    return cached_culvert_dxf_bytes(_section(payload), _ground(payload))
+
+
+def _engine_section_properties(payload):
+    from section_geometry import compute_section_properties, generate_section_properties_report
+    section_data = _section(payload)
+    props = compute_section_properties(section_data, shapes=cached_decomposition(section_data))
+    return {'area': props.area, 'centroid': list(props.centroid),
+            'Ix': props.Ix, 'Iy': props.Iy, 'Ixy': props.Ixy,
+            'bodyArea': props.body_area, 'antiFloatArea': props.anti_float_area,
+            'consistent': props.consistent,
+            'report': generate_section_properties_report(section_data, props)}
+
+
+def _engine_scenarios(payload):
+    from buoyancy_scenarios import evaluate_scenarios, generate_scenario_report
+    section_data, ground_info = _section(payload), _ground(payload)
+    result = evaluate_scenarios(section_data, ground_info,
+                                shapes=cached_decomposition(section_data))
+    governing = result.governing
+    return {'governing': None if governing is None else result.scenarios[governing]['label'],
+            'report': generate_scenario_report(section_data, ground_info, result)}
+
+
+def _engine_reliability(payload):
+    from buoyancy_reliability import run_monte_carlo, generate_reliability_report
+    section_data, ground_info = _section(payload), _ground(payload)
+    samples = int(payload.get('samples', 100_000))
+    if not 0 < samples <= MAX_RELIABILITY_SAMPLES:
+        raise ValueError(f"samples는 1 ~ {MAX_RELIABILITY_SAMPLES:,} 범위여야 합니다")
+    # 요청 합치기/캐시가 의미 있도록 시드 고정 (같은 입력 → 같은 결과)
+    result = run_monte_carlo(section_data, ground_info, n_samples=samples,
+                             variables=payload.get('variables'), seed=int(payload.get('seed', 0)))
+    return {'pf': result.pf, 'beta': result.reliability_index,
+            'report': generate_reliability_report(section_data, ground_info, result)}
+
+
+def _engine_quantity(payload):
+    from quantity_takeoff import ITEM_KEYS, quantity_takeoff, generate_quantity_report
+    _section(payload)
+    takeoff = quantity_takeoff(payload)
+    total = takeoff.per_station.sum(axis=0)
+    return {'total': {key: float(v) for key, v in zip(ITEM_KEYS, total)},
+            'report': generate_quantity_report(payload, takeoff)}
+
+
+# 엔드포인트 이름 → (계산 함수, 응답 형식)
+ENGINES = {
+    'buoyancy': (_engine_buoyancy, 'json'),
+    'buoyancy-report': (_engine_buoyancy_report, 'json'),
+    'decomposition': (_engine_decomposition, 'json'),
+    'dxf': (_engine_dxf, 'dxf'),
+    'section-properties': (_engine_section_properties, 'json'),
+    'scenarios': (_engine_scenarios, 'json'),
+    'reliability': (_engine_reliability, 'json'),
+    'quantity': (_engine_quantity, 'json'),
+}
+
+
+def compute(endpoint, payload):
+    """엔드포인트 계산 → (상태 코드, Content-Type, 본문 bytes)
+
+    작업자 프로세스에서 호출되므로 응답 직렬화까지 여기서 끝낸다.
+    """
+    func, kind = ENGINES[endpoint]
+    try:
+        result = func(payload)
+    except (ValueError, TypeError, KeyError) as e:
+        return 400, JSON_TYPE, _json_bytes({'error': f"입력 오류: {e}"})
+    except Exception as e:
+        return 500, JSON_TYPE, _json_bytes({'error': f"계산 오류: {type(e).__name__}: {e}"})
+    if kind == 'dxf':
+        return 200, 'application/dxf', result
+    return 200, JSON_TYPE, _json_bytes(result)
+
+
+def _finite(value):
+    """JSON 표준에 없는 inf/nan(부력이 없을 때의 안전율 등)은 null로"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    if hasattr(value, 'tolist'):           # numpy 값/배열
+        return _finite(value.tolist())
+    return value
+
+
+def _json_bytes(data):
+    return json.dumps(_finite(data), ensure_ascii=False, allow_nan=False).encode('utf-8')
+
+
+# ========================================
+# 서버
+# ========================================
+
+class ComputeServer:
+    """정적 파일 + 계산 API 서버 (asyncio)"""
+
+    def __init__(self, web_root=WEB_ROOT, workers=None, use_threads=False):
+        self.web_root = os.path.realpath(web_root)
+        self.workers = workers or os.cpu_count() or 1
+        self.use_threads = use_threads
+        self.pool = None
+        self._inflight = {}                # 캐시 키 → 진행 중인 계산 Future
+        self._memory = OrderedDict()       # 캐시 키 → 응답 (최근 사용 순)
+        self.stats = {'requests': 0, 'computed': 0, 'coalesced': 0, 'memory_hits': 0,
+                      'errors': 0, 'compute_time': 0.0}
+        self.started = time.time()
+
+    # ── 계산 (요청 합치기 + 작업자 풀) ──
+
+    def start_pool(self):
+        if self.pool is None:
+            if self.use_threads:
+                self.pool = ThreadPoolExecutor(max_workers=self.workers)
+            else:
+                # fork는 이벤트 루프/수치 라이브러리 스레드 상태를 복제하므로 spawn 사용 (Windows와 동일)
+                self.pool = ProcessPoolExecutor(max_workers=self.workers,
+                                                mp_context=multiprocessing.get_context('spawn'))
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+    async def run_engine(self, endpoint, payload):
+        """계산 결과 (같은 입력의 계산이 진행 중이면 그 결과를 함께 받음)"""
+        if endpoint not in ENGINES:
+            raise RequestError(404, f"알 수 없는 API: {endpoint}")
+        if not isinstance(payload, dict):
+            raise RequestError(400, "요청 본문은 JSON 객체여야 합니다")
+        key = cache_key('server.' + endpoint, payload)
+
+        response = self._memory.get(key)
+        if response is not None:
+            self._memory.move_to_end(key)
+            self.stats['memory_hits'] += 1
+            return response
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats['coalesced'] += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[key] = future
+        start = time.perf_counter()
+        try:
+            self.start_pool()
+            response = await loop.run_in_executor(self.pool, compute, endpoint, payload)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            # 작업자 프로세스가 비정상 종료되면 다음 요청에서 풀을 새로 만듦
+            if isinstance(e, BrokenExecutor):
+                self.pool = None
+            response = (500, JSON_TYPE, _json_bytes({'error': f"작업자 오류: {type(e).__name__}: {e}"}))
+        finally:
+            del self._inflight[key]
+            self.stats['compute_time'] += time.perf_counter() - start
+        self.stats['computed'] += 1
+        future.set_result(response)
+        if response[0] == 200:
+            self._memory[key] = response
+            if len(self._memory) > MEMORY_CACHE_ENTRIES:
+                self._memory.popitem(last=False)
+        return response
+
+    async def run_batch(self, payload):
+        """여러 계산을 동시에 실행 → JSON 결과 목록 (DXF는 제외)"""
+        requests = payload.get('requests') if isinstance(payload, dict) else None
+        if not isinstance(requests, list):
+            raise RequestError(400, "requests 목록이 필요합니다")
+        for item in requests:
+            if not isinstance(item, dict) or ENGINES.get(item.get('endpoint'), (None, 'dxf'))[1] != 'json':
+                raise RequestError(400, f"일괄 계산할 수 없는 항목: {item!r:.80}")
+        responses = await asyncio.gather(*(self.run_engine(item['endpoint'], item.get('payload') or {})
+                                           for item in requests))
+        results = []
+        for status, _, body in responses:
+            data = json.loads(body)
+            results.append(data if status == 200 else {'error': data.get('error'), 'status': status})
+        return 200, JSON_TYPE, _json_bytes({'results': results})
+
+    # ── HTTP ──
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request = await self._read_request(reader, writer)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, content_type, data = await self._dispatch(method, path, body)
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                await self._write_response(writer, status, content_type, data, keep_alive,
+                                           head_only=(method == 'HEAD'))
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader, writer):
+        """요청 하나 읽기 → (메서드, 경로, 헤더, 본문) / 연결 종료 시 None"""
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError:
+            await self._write_error(writer, 413, "헤더가 너무 깁니다")
+            return None
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, _ = lines[0].split(' ', 2)
+        except ValueError:
+            await self._write_error(writer, 400, "잘못된 요청")
+            return None
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length', 0) or 0)
+        if length > MAX_BODY:
+            await self._write_error(writer, 413, "요청 본문이 너무 큽니다")
+            return None
+        body = await reader.readexactly(length) if length else b''
+        return method.upper(), unquote(urlsplit(target).path), headers, body
+
+    async def _dispatch(self, method, path, body):
+        self.stats['requests'] += 1
+        try:
+            if method == 'OPTIONS':
+                return 204, None, b''
+            if path.startswith('/api/'):
+                return await self._api(method, path[len('/api/'):], body)
+            if method not in ('GET', 'HEAD'):
+                raise RequestError(405, "허용되지 않는 메서드")
+            return self._static(path)
+        except RequestError as e:
+            self.stats['errors'] += 1
+            return e.status, JSON_TYPE, _json_bytes({'error': str(e)})
+
+    async def _api(self, method, endpoint, body):
+        if method == 'GET' and endpoint == 'health':
+            return 200, JSON_TYPE, _json_bytes({'status': 'ok', 'engines': sorted(ENGINES)})
+        if method == 'GET' and endpoint == 'stats':
+            return 200, JSON_TYPE, _json_bytes(dict(self.stats, inflight=len(self._inflight),
+                                                    memory_entries=len(self._memory),
+                                                    workers=self.workers,
+                                                    uptime=time.time() - self.started))
+        if method != 'POST':
+            raise RequestError(405, "계산 API는 POST로 요청하세요")
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError as e:
+            raise RequestError(400, f"JSON 형식 오류: {e}")
+        if endpoint == 'batch':
+            return await self.run_batch(payload)
+        status, content_type, data = await self.run_engine(endpoint, payload)
+        if status != 200:
+            self.stats['errors'] += 1
+        return status, content_type, data
+
+    def _static(self, path):
+        """웹 화면 정적 파일 (WEB_ROOT 밖은 제공하지 않음)"""
+        relative = path.lstrip('/') or 'index.html'
+        full = os.path.realpath(os.path.join(self.web_root, relative))
+        if os.path.commonpath([full, self.web_root]) != self.web_root or not os.path.isfile(full):
+            raise RequestError(404, f"파일 없음: {path}")
+        with open(full, 'rb') as f:
+            data = f.read()
+        content_type = mimetypes.guess_type(full)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type in ('application/javascript', 'application/json'):
+            content_type += '; charset=utf-8'
+        return 200, content_type, data
+
+    async def _write_response(self, writer, status, content_type, data, keep_alive=True, head_only=False):
+        headers = [f"HTTP/1.1 {status} {_STATUS_TEXT.get(status, '')}",
+                   f"Content-Length: {len(data)}",
+                   "Cache-Control: no-cache",
+                   "Access-Control-Allow-Origin: *",
+                   "Access-Control-Allow-Methods: GET, POST, OPTIONS",
+                   "Access-Control-Allow-Headers: Content-Type",
+                   f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        if content_type:
+            headers.append(f"Content-Type: {content_type}")
+        writer.write(('\r\n'.join(headers) + '\r\n\r\n').encode('latin-1'))
+        if not head_only:
+            writer.write(data)
+        await writer.drain()
+
+    async def _write_error(self, writer, status, message):
+        self.stats['errors'] += 1
+        await self._write_response(writer, status, JSON_TYPE, _json_bytes({'error': message}),
+                                   keep_alive=False)
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, ready=None):
+        """서버 실행 (취소될 때까지). ready: 시작 후 호출 (실제 포트)"""
+        self.start_pool()
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=64 * 1024)
+        try:
+            actual_port = server.sockets[0].getsockname()[1]
+            if ready:
+                ready(actual_port)
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='암거 계산 서버 (웹 화면 + 계산 API)')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='수신 주소 (기본 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='포트 (0이면 자동)')
+    parser.add_argument('--workers', type=int, default=None, help='작업자 수 (기본 CPU 수)')
+    parser.add_argument('--threads', action='store_true', help='프로세스 대신 스레드 작업자 사용')
+    parser.add_argument('--web-root', default=WEB_ROOT, help='정적 파일 폴더')
+    args = parser.parse_args(argv)
+
+    server = ComputeServer(args.web_root, args.workers, args.threads)
+    def ready(port):
+        print(f"계산 서버 실행 중: http://{args.host}:{port}/ "
+              f"(작업자 {server.workers}개, 종료: Ctrl+C)", flush=True)
+
+    try:
+        asyncio.run(server.serve(args.host, args.port, ready))
+    except KeyboardInterrupt:
+        print("계산 서버 종료")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,290 @@
+"""외부 DXF 배경도면 불러오기 모듈
+
+측량 현황도 등 대용량 DXF를 ezdxf의 iterdxf(스트리밍 리더)로 읽어
+경량 도형 목록과 공간 인덱스로 보관하고, 뷰포트에 보이는 도형만
+QGraphicsItem으로 만들어 암거 단면 뒤에 배경으로 표시한다.
+"""
+
+import itertools
+import math
+import ezdxf
+from ezdxf.addons import iterdxf
+from ezdxf.lldxf.const import DXFStructureError
+from PyQt5 import sip
+from PyQt5.QtWidgets import (QGraphicsLineItem, QGraphicsEllipseItem, QGraphicsPathItem,
+                             QGraphicsSimpleTextItem)
+from PyQt5.QtGui import QColor, QFont, QPainterPath
+from PyQt5.QtCore import QObject, QThread, QTimer, QRectF, pyqtSignal
+from spatial_index import GridIndex, bbox_of_points, bbox_union
+from utils import create_cosmetic_pen
+
+# 배경도면으로 표시하는 엔티티 종류
+BACKGROUND_TYPES = ('LINE', 'LWPOLYLINE', 'POLYLINE', 'CIRCLE', 'ARC', 'TEXT', 'MTEXT')
+
+BACKGROUND_COLOR = QColor(90, 90, 90)   # 배경도면 색상 (회색)
+PROGRESS_STEP = 5000                    # 진행률 알림 간격 (엔티티 수)
+
+
+class BackgroundDrawing:
+    """불러온 배경도면 데이터
+
+    primitives[i]는 도형 튜플, bboxes[i]는 해당 도형의 DXF 좌표 bbox이며
+    index는 i를 키로 하는 GridIndex 이다.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.primitives = []
+        self.bboxes = []
+        self.extents = None
+        self.index = None
+        self.skipped = 0
+
+    def __len__(self):
+        return len(self.primitives)
+
+    def add(self, prim, bbox):
+        self.primitives.append(prim)
+        self.bboxes.append(bbox)
+        self.extents = bbox_union(self.extents, bbox)
+
+    def build_index(self):
+        """공간 인덱스 생성 (모든 도형 추가 후 1회)"""
+        self.index = GridIndex.for_extents(self.extents, len(self.primitives))
+        for key, bbox in enumerate(self.bboxes):
+            self.index.insert(key, bbox)
+
+    def center(self):
+        if self.extents is None:
+            return (0.0, 0.0)
+        return ((self.extents[0] + self.extents[2]) / 2, (self.extents[1] + self.extents[3]) / 2)
+
+
+def _entity_to_primitive(entity):
+    """DXF 엔티티 → (도형 튜플, bbox). 지원하지 않으면 None"""
+    t = entity.dxftype()
+    if t == 'LINE':
+        s, e = entity.dxf.start, entity.dxf.end
+        pts = [(s.x, s.y), (e.x, e.y)]
+        return ('line', pts), bbox_of_points(pts)
+    if t == 'LWPOLYLINE':
+        pts = [(p[0], p[1]) for p in entity.get_points('xy')]
+        if len(pts) < 2:
+            return None
+        return ('poly', pts, bool(entity.closed)), bbox_of_points(pts)
+    if t == 'POLYLINE':
+        if not entity.is_2d_polyline:
+            return None
+        pts = [(v.dxf.location.x, v.dxf.location.y) for v in entity.vertices]
+        if len(pts) < 2:
+            return None
+        return ('poly', pts, bool(entity.is_closed)), bbox_of_points(pts)
+    if t in ('CIRCLE', 'ARC'):
+        c, r = entity.dxf.center, entity.dxf.radius
+        bbox = (c.x - r, c.y - r, c.x + r, c.y + r)
+        if t == 'CIRCLE':
+            return ('circle', c.x, c.y, r), bbox
+        return ('arc', c.x, c.y, r, entity.dxf.start_angle, entity.dxf.end_angle), bbox
+    if t == 'TEXT':
+        ins, h = entity.dxf.insert, entity.dxf.height
+        text = entity.dxf.text
+        bbox = (ins.x, ins.y, ins.x + max(len(text), 1) * h, ins.y + h)
+        return ('text', ins.x, ins.y, h, entity.dxf.rotation, text), bbox
+    if t == 'MTEXT':
+        ins, h = entity.dxf.insert, entity.dxf.char_height
+        text = entity.plain_text().split('\n')[0]
+        bbox = (ins.x, ins.y - h, ins.x + max(len(text), 1) * h, ins.y)
+        return ('text', ins.x, ins.y, h, entity.dxf.get('rotation', 0), text), bbox
+    return None
+
+
+def _iter_modelspace(filename):
+    """모델공간 엔티티 스트리밍 (iterdxf 실패 시 일반 리더로 대체)
+
+    iterdxf가 도중에 실패하면 이미 넘긴 엔티티 수만큼 건너뛰고 이어서 넘긴다
+    (두 리더 모두 파일의 모델공간 순서).
+    """
+    yielded = 0
+    try:
+        for entity in iterdxf.modelspace(filename, types=BACKGROUND_TYPES):
+            yielded += 1
+            yield entity
+    except DXFStructureError:
+        # iterdxf가 처리하지 못하는 구조(R12 등)는 전체 로드로 대체
+        doc = ezdxf.readfile(filename)
+        entities = doc.modelspace().query(' '.join(BACKGROUND_TYPES))
+        yield from itertools.islice(entities, yielded, None)
+
+
+def load_background_dxf(filename, progress=None):
+    """DXF 파일을 스트리밍으로 읽어 BackgroundDrawing 생성
+
+    Args:
+        filename: DXF 파일 경로
+        progress: 진행률 콜백 (읽은 엔티티 수)
+
+    Returns:
+        BackgroundDrawing
+    """
+    drawing = BackgroundDrawing(filename)
+    count = 0
+    for entity in _iter_modelspace(filename):
+        count += 1
+        converted = _entity_to_primitive(entity)
+        if converted is None:
+            drawing.skipped += 1
+        else:
+            drawing.add(*converted)
+        if progress and count % PROGRESS_STEP == 0:
+            progress(count)
+    drawing.build_index()
+    return drawing
+
+
+class DxfLoadThread(QThread):
+    """배경도면 백그라운드 로딩 스레드 (GUI 멈춤 방지)"""
+    progress = pyqtSignal(int)
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, filename, parent=None):
+        super().__init__(parent)
+        self.filename = filename
+
+    def run(self):
+        try:
+            drawing = load_background_dxf(self.filename, progress=self.progress.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.loaded.emit(drawing)
+
+
+class BackgroundDxfLayer(QObject):
+    """뷰포트 기반 배경도면 레이어
+
+    뷰가 이동/확대될 때마다 보이는 범위의 도형만 QGraphicsItem으로 만들고,
+    벗어난 도형은 씬에서 제거한다. 화면상 1픽셀보다 작은 도형은 생략한다.
+    """
+
+    Z_VALUE = -100
+    MAX_ITEMS = 20000
+    REFRESH_DELAY_MS = 30
+
+    def __init__(self, view):
+        super().__init__(view)
+        self.view = view
+        self.drawing = None
+        self.base_point = (0.0, 0.0)
+        self._items = {}
+        self._pen = create_cosmetic_pen(BACKGROUND_COLOR, 1)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.REFRESH_DELAY_MS)
+        self._timer.timeout.connect(self.refresh)
+        view.viewport_changed.connect(self.schedule_refresh)
+
+    def set_drawing(self, drawing, base_point=None):
+        """배경도면 설정 (base_point: 암거 원점에 맞출 DXF 좌표)"""
+        self.clear()
+        self.drawing = drawing
+        self.base_point = base_point if base_point is not None else drawing.center()
+        self.refresh()
+
+    def clear(self):
+        """배경도면 제거"""
+        self._remove_items(list(self._items))
+        self.drawing = None
+
+    def item_count(self):
+        return len(self._items)
+
+    def scene_extents(self):
+        """배경도면 전체 범위 (씬 좌표 QRectF, 없으면 None)"""
+        if self.drawing is None or self.drawing.extents is None:
+            return None
+        bx, by = self.base_point
+        x0, y0, x1, y1 = self.drawing.extents
+        return QRectF(x0 - bx, -(y1 - by), x1 - x0, y1 - y0)
+
+    def schedule_refresh(self):
+        if self.drawing is not None:
+            self._timer.start()
+
+    def refresh(self):
+        """현재 뷰포트에 보이는 도형으로 씬 갱신"""
+        if self.drawing is None or self.drawing.index is None:
+            return
+        view = self.view
+        rect = view.mapToScene(view.viewport().rect()).boundingRect()
+        bx, by = self.base_point
+        query = (rect.left() + bx, -rect.bottom() + by, rect.right() + bx, -rect.top() + by)
+
+        pixel = rect.width() / max(view.viewport().width(), 1)
+        bboxes = self.drawing.bboxes
+        visible = [k for k in self.drawing.index.query(query)
+                   if max(bboxes[k][2] - bboxes[k][0], bboxes[k][3] - bboxes[k][1]) >= pixel]
+        if len(visible) > self.MAX_ITEMS:
+            visible.sort(key=lambda k: -max(bboxes[k][2] - bboxes[k][0], bboxes[k][3] - bboxes[k][1]))
+            visible = visible[:self.MAX_ITEMS]
+        visible = set(visible)
+
+        # scene.clear() 등으로 이미 삭제된 아이템 정리
+        dead = [k for k, item in self._items.items() if sip.isdeleted(item)]
+        for k in dead:
+            del self._items[k]
+
+        self._remove_items([k for k in self._items if k not in visible])
+
+        scene = view.scene()
+        for k in visible:
+            if k not in self._items:
+                item = self._create_item(self.drawing.primitives[k])
+                item.setZValue(self.Z_VALUE)
+                scene.addItem(item)
+                self._items[k] = item
+
+    def _remove_items(self, keys):
+        for k in keys:
+            item = self._items.pop(k)
+            if not sip.isdeleted(item) and item.scene() is not None:
+                item.scene().removeItem(item)
+
+    def _create_item(self, prim):
+        bx, by = self.base_point
+        kind = prim[0]
+        if kind == 'line':
+            (x1, y1), (x2, y2) = prim[1]
+            item = QGraphicsLineItem(x1 - bx, -(y1 - by), x2 - bx, -(y2 - by))
+        elif kind == 'poly':
+            pts, closed = prim[1], prim[2]
+            path = QPainterPath()
+            path.moveTo(pts[0][0] - bx, -(pts[0][1] - by))
+            for x, y in pts[1:]:
+                path.lineTo(x - bx, -(y - by))
+            if closed:
+                path.closeSubpath()
+            item = QGraphicsPathItem(path)
+        elif kind == 'circle':
+            _, cx, cy, r = prim
+            item = QGraphicsEllipseItem(cx - bx - r, -(cy - by) - r, 2 * r, 2 * r)
+        elif kind == 'arc':
+            _, cx, cy, r, sa, ea = prim
+            span = (ea - sa) % 360 or 360
+            path = QPainterPath()
+            path.moveTo(cx - bx + r * math.cos(math.radians(sa)),
+                        -(cy - by) - r * math.sin(math.radians(sa)))
+            path.arcTo(cx - bx - r, -(cy - by) - r, 2 * r, 2 * r, sa, span)
+            item = QGraphicsPathItem(path)
+        else:
+            _, x, y, h, rot, text = prim
+            item = QGraphicsSimpleTextItem(text)
+            font = QFont("Arial")
+            font.setPixelSize(max(int(h), 1))
+            item.setFont(font)
+            item.setBrush(BACKGROUND_COLOR)
+            item.setPos(x - bx, -(y - by) - item.boundingRect().height())
+            item.setRotation(-rot)
+            return item
+        item.setPen(self._pen)
+        return item
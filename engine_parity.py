@@ -0,0 +1,584 @@
+"""Python/JavaScript 엔진 비교 (Engine Parity) 모듈
+
+부력검토(buoyancy_check.py ↔ esc_culvert_web/js/forms/buoyancyCheck.js)와
+단면 DXF(utils.create_culvert_dxf ↔ esc_culvert_web/js/utils/dxfExport.js)는
+Python과 JavaScript에 각각 구현되어 있다. 임의의 유효한 단면을 여러 개 만들어
+두 구현을 모두 실행하고 분할 도형(이름, 면적, 무게), 자중/상재토/부력/안전율,
+DXF 도형(색상별 선분, 치수)을 허용오차 안에서 비교하며, 처리 속도도 측정한다.
+
+JavaScript는 Node.js(esc_culvert_web/tools/parityDriver.js)로 실행한다.
+
+이미 알려진 차이(engine_parity_baseline.json)는 사례별 차이 유형과 개수로 저장해
+두고, 새로 생긴 차이 유형이나 늘어난 차이만 실패로 본다. 생성된 입력 전체의
+해시가 기준값과 같으면 사례 단위로 비교하고, 다르면 (사례 수/시드가 다르거나
+random_case가 바뀌어 개수 비교가 의미 없으므로) 기준값에 없던 유형만 찾는다.
+
+사용 예
+    python engine_parity.py                      # 2000개 단면, 알려진 차이 제외
+    python engine_parity.py --cases 10000 --seed 7 --show 5
+    python engine_parity.py --ignore dims,lines  # DXF 치수/선분 차이 무시
+    python engine_parity.py --save-baseline      # 현재 차이를 알려진 차이로 저장
+    python engine_parity.py --no-baseline        # 모든 차이를 실패로
+    python engine_parity.py --node C:/nodejs/node.exe
+새 차이가 있으면 종료 코드 1을 반환한다.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from buoyancy_check import calculate_buoyancy, generate_buoyancy_report
+from utils import create_culvert_dxf
+
+WEB_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'esc_culvert_web')
+DRIVER = os.path.join(WEB_ROOT, 'tools', 'parityDriver.js')
+DEFAULT_CASES = 2000
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'engine_parity_baseline.json')
+
+# --ignore 별칭 (그 외 값은 차이 유형 이름의 일부로 비교)
+IGNORE_ALIASES = {
+    'dims': 'DXF 치수',
+    'lines': 'DXF 선분',
+    'dxf': 'DXF ',
+    'buoyancy': '부력검토 ',
+    'girders': '종거더',
+    'columns': '기둥',
+}
+
+# 허용오차 (JavaScript 보고서는 반올림된 값을 출력하므로 출력 자릿수의 절반 + 여유)
+AREA_TOLERANCE = 0.051       # mm² (정수 또는 소수 1~2자리 출력)
+FORCE_TOLERANCE = 0.0051     # kN/m (소수 2자리 출력)
+FS_TOLERANCE = 0.0051
+COORD_DIGITS = 3             # DXF 좌표 비교 자릿수 (mm)
+
+
+# ========================================
+# 임의 단면 생성
+# ========================================
+
+def _step(rng, lo, hi, step=50):
+    return rng.randrange(lo, hi + 1, step)
+
+
+def _haunch(rng, max_w, max_h):
+    """헌치 (가끔 0)"""
+    def corner():
+        if rng.random() < 0.15:
+            return {'width': 0, 'height': 0}
+        return {'width': _step(rng, 0, max_w), 'height': _step(rng, 0, max_h)}
+    return {'upper': corner(), 'lower': corner()}
+
+
+def random_case(rng):
+    """유효한 임의 단면 (단면제원, 지반정보)"""
+    n = rng.randint(1, 6)
+    H = _step(rng, 2000, 6000)
+    B = [_step(rng, 2000, 6000) for _ in range(n)]
+    max_w = min(B) // 3 // 50 * 50
+    max_h = H // 4 // 50 * 50
+    middle_walls = [{'type': '기둥' if rng.random() < 0.3 else '연속벽',
+                     'thickness': _step(rng, 300, 800)} for _ in range(n - 1)]
+    section_data = {
+        'culvert_count': n, 'H': H, 'H4': 0, 'B': B,
+        'UT': _step(rng, 300, 1000), 'LT': _step(rng, 300, 1000),
+        'WL': _step(rng, 300, 1000), 'WR': _step(rng, 300, 1000),
+        'middle_walls': middle_walls,
+        'haunch': {'leftWall': _haunch(rng, max_w, max_h), 'rightWall': _haunch(rng, max_w, max_h),
+                   'middleWalls': [_haunch(rng, max_w, max_h) for _ in range(n - 1)]},
+        'columnGirder': {'columnCTC': _step(rng, 2000, 5000, 100), 'columnWidth': _step(rng, 300, 800),
+                         'upperAdditionalHeight': _step(rng, 0, 400),
+                         'lowerAdditionalHeight': _step(rng, 0, 400)},
+        'antiFloat': {'use': rng.random() < 0.4, 'leftExtension': _step(rng, 0, 1500),
+                      'rightExtension': _step(rng, 0, 1500), 'thickness': _step(rng, 200, 600)},
+    }
+    ground_info = {'earthCoverDepth': _step(rng, 0, 6000), 'groundwaterLevel': _step(rng, 0, 10000),
+                   'frictionAngle': 30, 'soilUnitWeight': rng.choice([16.0, 17.0, 18.0, 19.0, 20.0])}
+    return section_data, ground_info
+
+
+def random_cases(count, seed=0):
+    rng = random.Random(seed)
+    return [random_case(rng) for _ in range(count)]
+
+
+# ========================================
+# 실행
+# ========================================
+
+def find_node(node=None):
+    """Node.js 실행 파일 경로 (없으면 None)"""
+    return node or os.environ.get('NODE') or shutil.which('node')
+
+
+def run_python(cases):
+    """Python 엔진 실행 → (부력 결과 목록, DXF 문서 목록, {엔진: 초})"""
+    start = time.perf_counter()
+    for section_data, ground_info in cases:
+        generate_buoyancy_report(section_data, ground_info)
+    report_time = time.perf_counter() - start
+    results = [calculate_buoyancy(section_data, ground_info) for section_data, ground_info in cases]
+
+    start = time.perf_counter()
+    docs = [create_culvert_dxf(section_data, ground_info) for section_data, ground_info in cases]
+    dxf_time = time.perf_counter() - start
+    return results, docs, {'buoyancy': report_time, 'dxf': dxf_time}
+
+
+def run_javascript(cases, node=None):
+    """JavaScript 엔진 실행 (Node) → (보고서 목록, DXF 텍스트 목록, {엔진: 초})"""
+    node = find_node(node)
+    if node is None:
+        raise RuntimeError("Node.js를 찾을 수 없습니다 (--node 또는 NODE 환경변수로 지정)")
+    payload = {'cases': [{'sectionData': sd, 'groundInfo': gi} for sd, gi in cases],
+               'engines': ['buoyancy', 'dxf']}
+    fd, path = tempfile.mkstemp(suffix='.json', prefix='parity_')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False)
+        proc = subprocess.run([node, DRIVER, path], capture_output=True, timeout=3600)
+    finally:
+        os.remove(path)
+    if proc.returncode != 0:
+        raise RuntimeError(f"JavaScript 실행 실패:\n{proc.stderr.decode('utf-8', 'replace')}")
+    output = json.loads(proc.stdout.decode('utf-8'))
+    return output['reports'], output['dxf'], output['timing']
+
+
+# ========================================
+# JavaScript 결과 해석
+# ========================================
+
+_NUMBER = r'(-?[\d,]+(?:\.\d+)?)'
+_SHAPE_HEADER = re.compile(r'^\s*\[(사각형|삼각형) No\.(\d+)\] (.+)$')
+_AREA = re.compile(_NUMBER + r' mm²')
+_WEIGHT = re.compile(r'= ' + _NUMBER + r' kN/m')
+
+
+def _num(text):
+    return float(text.replace(',', ''))
+
+
+def parse_js_report(text):
+    """JavaScript 부력검토 보고서 → {'shapes': [(종류, 이름, 면적, 무게)], 'total_weight', ...}"""
+    lines = text.split('\n')
+    shapes = []
+    values = {'fs': None}
+    k = 0
+    while k < len(lines):
+        line = lines[k]
+        header = _SHAPE_HEADER.match(line)
+        if header:
+            block = []
+            k += 1
+            while k < len(lines) and lines[k].strip():
+                block.append(lines[k])
+                k += 1
+            areas = [m for b in block for m in _AREA.findall(b)]
+            weights = [m for b in block for m in _WEIGHT.findall(b)]
+            shapes.append((header.group(1), header.group(3).strip(),
+                           _num(areas[-1]) if areas else None,
+                           _num(weights[-1]) if weights else None))
+            continue
+        if '구조물 자중 합계 (Wc)' in line:
+            values['total_weight'] = _num(_WEIGHT.findall(line)[-1])
+        elif line.strip().startswith('무게 (Ws)'):
+            values['soil_weight'] = _num(_WEIGHT.findall(line)[-1])
+        elif line.strip().startswith('부력 (U)   ='):
+            values['buoyancy'] = _num(_WEIGHT.findall(line)[-1])
+        elif '저항력 (R)' in line:
+            # 저항력 (R) = Wc + Ws / = Wc값 + Ws값 / = R값 kN/m
+            while k + 1 < len(lines) and 'kN/m' not in lines[k]:
+                k += 1
+            values['total_resist'] = _num(_WEIGHT.findall(lines[k])[-1])
+        elif re.match(r'^\s*FS = ', line):
+            values['fs'] = _num(re.search(r'FS = ' + _NUMBER, line).group(1))
+        k += 1
+    values['shapes'] = shapes
+    return values
+
+
+def _dxf_pairs(text):
+    lines = text.split('\n')
+    for k in range(0, len(lines) - 1, 2):
+        yield lines[k].strip(), lines[k + 1].strip()
+
+
+def parse_js_dxf(text):
+    """JavaScript DXF 텍스트 → (선분 목록 [(색상, 점들, 닫힘)], 치수 목록 [(방향, 값)])"""
+    layer_colors = {}
+    objects = []
+    current = None
+    for code, value in _dxf_pairs(text):
+        if code == '0':
+            current = {'type': value, 'points': []}
+            objects.append(current)
+        elif current is None:
+            continue
+        elif code in ('10', '11'):
+            current['points'].append([float(value), None])
+        elif code in ('20', '21'):
+            current['points'][-1][1] = float(value)
+        else:
+            current.setdefault(code, value)
+
+    paths, dims = [], []
+    for obj in objects:
+        if obj['type'] == 'LAYER' and '2' in obj:
+            layer_colors[obj['2']] = int(obj.get('62', 7))
+    for obj in objects:
+        color = int(obj['62']) if '62' in obj else layer_colors.get(obj.get('8'), 7)
+        if obj['type'] in ('LINE', 'LWPOLYLINE') and obj.get('8') != 'DIMENSION':
+            # 치수는 선 대신 치수값으로 비교 (Python은 DIMENSION 도형)
+            points = [tuple(p) for p in obj['points']]
+            paths.append((color, points, int(obj.get('70', 0)) & 1 == 1))
+        elif obj['type'] == 'TEXT' and obj.get('8') == 'DIMENSION':
+            orientation = 'V' if abs(float(obj.get('50', 0)) - 90) < 1e-6 else 'H'
+            dims.append((orientation, round(_num(obj['1']), 1)))
+    return paths, dims
+
+
+def python_dxf_entities(doc):
+    """ezdxf 문서 → (선분 목록, 치수 목록) — parse_js_dxf와 같은 형식"""
+    paths, dims = [], []
+    for e in doc.modelspace():
+        kind = e.dxftype()
+        if kind == 'LINE':
+            paths.append((e.dxf.color, [tuple(e.dxf.start)[:2], tuple(e.dxf.end)[:2]], False))
+        elif kind == 'LWPOLYLINE':
+            paths.append((e.dxf.color, [tuple(p[:2]) for p in e.get_points('xy')], e.closed))
+        elif kind == 'DIMENSION':
+            p2, p3 = e.dxf.defpoint2, e.dxf.defpoint3
+            angle = e.dxf.get('angle', 0)
+            orientation = 'V' if abs(abs(angle) - 90) < 1e-6 else 'H'
+            text = e.dxf.get('text', '<>')
+            if text in ('<>', ''):
+                value = abs(p3[1] - p2[1]) if orientation == 'V' else abs(p3[0] - p2[0])
+            else:
+                value = _num(text)
+            dims.append((orientation, round(value, 1)))
+    return paths, dims
+
+
+def merged_segments(paths):
+    """색상별 선분 집합 (같은 직선 위에서 겹치거나 이어진 선분은 하나로 합침)
+
+    선을 LINE으로 그리든 LWPOLYLINE으로 그리든, 몇 조각으로 나누든 같은 결과가 된다.
+    """
+    groups = defaultdict(list)    # (색상, 방향, 직선 위치) → [(t1, t2)]
+    for color, points, closed in paths:
+        pts = list(points) + ([points[0]] if closed and points else [])
+        for (x1, y1), (x2, y2) in zip(pts, pts[1:]):
+            dx, dy = x2 - x1, y2 - y1
+            length = math.hypot(dx, dy)
+            if length < 1e-9:
+                continue
+            ux, uy = dx / length, dy / length
+            if ux < -1e-12 or (abs(ux) <= 1e-12 and uy < 0):
+                ux, uy = -ux, -uy
+            offset = x1 * uy - y1 * ux          # 원점에서 직선까지 거리 (부호 포함)
+            t1, t2 = sorted((x1 * ux + y1 * uy, x2 * ux + y2 * uy))
+            key = (color, round(ux, 6), round(uy, 6), round(offset, COORD_DIGITS))
+            groups[key].append((t1, t2))
+
+    result = Counter()
+    eps = 10 ** -COORD_DIGITS
+    for (color, ux, uy, offset), intervals in groups.items():
+        intervals.sort()
+        merged = [list(intervals[0])]
+        for t1, t2 in intervals[1:]:
+            if t1 <= merged[-1][1] + eps:
+                merged[-1][1] = max(merged[-1][1], t2)
+            else:
+                merged.append([t1, t2])
+        for t1, t2 in merged:
+            result[(color, ux, uy, offset, round(t1, COORD_DIGITS), round(t2, COORD_DIGITS))] += 1
+    return result
+
+
+# ========================================
+# 비교
+# ========================================
+
+def compare_buoyancy(py, js):
+    """Python 결과(calculate_buoyancy)와 JavaScript 보고서 해석 결과 비교 → 차이 목록"""
+    diffs = []
+    py_shapes = py['shapes']
+    if len(py_shapes) != len(js['shapes']):
+        diffs.append(f"도형 수: Python {len(py_shapes)} / JS {len(js['shapes'])}")
+    for s, (kind, name, area, weight) in zip(py_shapes, js['shapes']):
+        label = f"No.{s['no']} {s['name']}"
+        if (s['kind'], s['name']) != (kind, name):
+            diffs.append(f"{label}: JS 도형 '{kind} {name}'")
+            continue
+        if area is None or abs(s['area'] - area) > AREA_TOLERANCE + 1e-9 * abs(area):
+            diffs.append(f"{label} 면적: Python {s['area']:,.2f} / JS {area}")
+        if weight is None or abs(s['weight'] - weight) > FORCE_TOLERANCE:
+            diffs.append(f"{label} 무게: Python {s['weight']:,.4f} / JS {weight}")
+    for key, name in (('total_weight', 'Wc'), ('soil_weight', 'Ws'), ('buoyancy', 'U'),
+                      ('total_resist', 'R')):
+        value = js.get(key)
+        if value is None or abs(py[key] - value) > FORCE_TOLERANCE:
+            diffs.append(f"{name}: Python {py[key]:,.4f} / JS {value}")
+    py_fs, js_fs = py['fs'], js['fs']
+    if (py_fs is None) != (js_fs is None):
+        diffs.append(f"FS: Python {py_fs} / JS {js_fs}")
+    elif py_fs is not None and abs(py_fs - js_fs) > FS_TOLERANCE:
+        diffs.append(f"FS: Python {py_fs:.4f} / JS {js_fs}")
+    return diffs
+
+
+def compare_dxf(py_doc, js_text):
+    """Python DXF 문서와 JavaScript DXF 텍스트 비교 → 차이 목록"""
+    diffs = []
+    py_paths, py_dims = python_dxf_entities(py_doc)
+    js_paths, js_dims = parse_js_dxf(js_text)
+    py_segments, js_segments = merged_segments(py_paths), merged_segments(js_paths)
+    only_py, only_js = py_segments - js_segments, js_segments - py_segments
+    for (color, ux, uy, offset, t1, t2), count in sorted(only_py.items())[:5]:
+        diffs.append(f"선분(색상 {color}) Python에만: 방향({ux:g},{uy:g}) 위치 {offset:g} 구간 {t1:g}~{t2:g}")
+    for (color, ux, uy, offset, t1, t2), count in sorted(only_js.items())[:5]:
+        diffs.append(f"선분(색상 {color}) JS에만: 방향({ux:g},{uy:g}) 위치 {offset:g} 구간 {t1:g}~{t2:g}")
+    extra = sum(only_py.values()) + sum(only_js.values()) - min(5, len(only_py)) - min(5, len(only_js))
+    if extra > 0:
+        diffs.append(f"... 선분 차이 {extra}개 더")
+    py_dim_count, js_dim_count = Counter(py_dims), Counter(js_dims)
+    for (orientation, value), count in sorted((py_dim_count - js_dim_count).items()):
+        diffs.append(f"치수 Python에만: {orientation} {value:g} ×{count}")
+    for (orientation, value), count in sorted((js_dim_count - py_dim_count).items()):
+        diffs.append(f"치수 JS에만: {orientation} {value:g} ×{count}")
+    return diffs
+
+
+class ParityResult:
+    """비교 결과"""
+
+    def __init__(self, cases, buoyancy_diffs, dxf_diffs, python_time, js_time):
+        self.cases = cases
+        self.buoyancy_diffs = buoyancy_diffs     # {사례 번호: [차이, ...]}
+        self.dxf_diffs = dxf_diffs
+        self.python_time = python_time           # {엔진: 초}
+        self.js_time = js_time
+
+    @property
+    def equivalent(self):
+        return not self.buoyancy_diffs and not self.dxf_diffs
+
+
+def run_parity(count=DEFAULT_CASES, seed=0, node=None, cases=None):
+    """임의 단면으로 두 구현 비교 → ParityResult"""
+    cases = cases or random_cases(count, seed)
+    py_results, py_docs, python_time = run_python(cases)
+    js_reports, js_dxf, js_time = run_javascript(cases, node)
+
+    buoyancy_diffs, dxf_diffs = {}, {}
+    for k, case in enumerate(cases):
+        diffs = compare_buoyancy(py_results[k], parse_js_report(js_reports[k]))
+        if diffs:
+            buoyancy_diffs[k] = diffs
+        diffs = compare_dxf(py_docs[k], js_dxf[k])
+        if diffs:
+            dxf_diffs[k] = diffs
+    return ParityResult(cases, buoyancy_diffs, dxf_diffs, python_time, js_time)
+
+
+def diff_kind(title, text):
+    """차이 유형 이름 (도형 번호/수치를 지운 항목 이름, '... 더' 줄은 None)"""
+    if text.startswith('...'):
+        return None
+    head = text.split(':')[0]
+    head = re.sub(r'No\.\d+ ', '', head)
+    return f"{title} {re.sub(r'(?<=[가-힣])[0-9]+', '#', head)}"
+
+
+def case_kinds(result):
+    """사례별 차이 유형과 개수 {사례 번호: Counter(유형)}"""
+    kinds = defaultdict(Counter)
+    for title, diffs in (('부력검토', result.buoyancy_diffs), ('DXF', result.dxf_diffs)):
+        for k, texts in diffs.items():
+            kinds[k].update(kind for kind in (diff_kind(title, t) for t in texts) if kind)
+    return dict(kinds)
+
+
+def diff_kinds(result):
+    """차이 유형별 사례 수"""
+    kinds = Counter()
+    for found in case_kinds(result).values():
+        kinds.update(found)
+    return kinds
+
+
+def ignore_kinds(result, patterns):
+    """유형 이름에 patterns(별칭 또는 일부 문자열) 중 하나가 들어간 차이를 뺀 결과"""
+    needles = [IGNORE_ALIASES.get(p, p) for p in patterns if p]
+    if not needles:
+        return result
+
+    def keep(title, diffs):
+        kept = {}
+        for k, texts in diffs.items():
+            texts = [t for t in texts
+                     if not any(n in (diff_kind(title, t) or '') for n in needles)]
+            if any(diff_kind(title, t) for t in texts):
+                kept[k] = texts
+        return kept
+
+    return ParityResult(result.cases, keep('부력검토', result.buoyancy_diffs),
+                        keep('DXF', result.dxf_diffs), result.python_time, result.js_time)
+
+
+# ========================================
+# 알려진 차이 (기준값)
+# ========================================
+
+def inputs_hash(cases):
+    """생성된 입력 전체의 해시 (random_case가 바뀌면 달라짐)"""
+    text = json.dumps(cases, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def save_known_diffs(result, seed, path=BASELINE_PATH):
+    """현재 차이를 알려진 차이로 저장 (유형 이름 목록 + 사례별 {유형 번호: 개수})"""
+    found = case_kinds(result)
+    names = sorted(set().union(*found.values())) if found else []
+    number = {name: i for i, name in enumerate(names)}
+    data = {
+        'cases': len(result.cases), 'seed': seed, 'inputs': inputs_hash(result.cases),
+        'kinds': names,
+        'counts': dict(diff_kinds(result)),
+        'case_kinds': {str(k): {str(number[n]): c for n, c in sorted(kinds.items())}
+                       for k, kinds in sorted(found.items())},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+    return path
+
+
+def load_known_diffs(path=BASELINE_PATH):
+    """알려진 차이 (파일이 없으면 None)"""
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def same_inputs(result, known):
+    """기준값과 같은 입력으로 실행했는지 (사례 단위 비교 가능 여부)"""
+    return known.get('inputs') == inputs_hash(result.cases)
+
+
+def new_drift(result, known):
+    """알려진 차이보다 새로 생기거나 늘어난 차이 → [(유형, 설명), ...]
+
+    입력이 기준값과 같으면 사례마다 유형별 차이 개수가 늘었는지 보고,
+    다르면 기준값에 없던 유형만 찾는다.
+    """
+    drift = []
+    names = known['kinds']
+    if same_inputs(result, known):
+        known_cases = {int(k): Counter({names[int(i)]: c for i, c in kinds.items()})
+                       for k, kinds in known['case_kinds'].items()}
+        by_kind = defaultdict(list)
+        for k, kinds in case_kinds(result).items():
+            for kind in kinds - known_cases.get(k, Counter()):
+                by_kind[kind].append(k)
+        for kind, cases in sorted(by_kind.items()):
+            shown = ', '.join(str(k) for k in sorted(cases)[:10])
+            drift.append((kind, f"사례 {len(cases):,}개에서 새로 생기거나 늘어남 "
+                                f"(사례 {shown}{' ...' if len(cases) > 10 else ''})"))
+        return drift
+
+    for kind, count in sorted(diff_kinds(result).items()):
+        if kind not in known['counts']:
+            drift.append((kind, f"알려지지 않은 유형 ({count:,}개 사례)"))
+    return drift
+
+
+def format_parity(result, show=3):
+    """비교 결과 텍스트 (차이가 있으면 처음 show개 사례의 입력과 차이)"""
+    n = len(result.cases)
+    lines = [f"단면 {n:,}개 비교"]
+    lines.append(f"  부력검토 차이: {len(result.buoyancy_diffs):,}개 사례")
+    lines.append(f"  DXF 차이    : {len(result.dxf_diffs):,}개 사례")
+    lines.append("")
+    lines.append(f"  {'엔진':<10}{'Python (개/s)':>16}{'JavaScript (개/s)':>20}")
+    for engine in ('buoyancy', 'dxf'):
+        py_t, js_t = result.python_time.get(engine), result.js_time.get(engine)
+        py_rate = f"{n / py_t:,.0f}" if py_t else '-'
+        js_rate = f"{n / js_t:,.0f}" if js_t else '-'
+        lines.append(f"  {engine:<10}{py_rate:>16}{js_rate:>20}")
+    lines.append("  (buoyancy: 보고서 생성, dxf: 도면 생성 — JS는 DXF 텍스트, Python은 ezdxf 문서)")
+
+    kinds = diff_kinds(result)
+    if kinds:
+        lines.append("")
+        lines.append("  차이 유형별 사례 수")
+        for kind, count in kinds.most_common(15):
+            lines.append(f"    {count:>6,}  {kind}")
+
+    for title, diffs in (('부력검토', result.buoyancy_diffs), ('DXF', result.dxf_diffs)):
+        for k in sorted(diffs)[:show]:
+            section_data, ground_info = result.cases[k]
+            lines.append("")
+            lines.append(f"■ {title} 차이 — 사례 {k}")
+            lines.append(f"  sectionData = {json.dumps(section_data, ensure_ascii=False)}")
+            lines.append(f"  groundInfo  = {json.dumps(ground_info, ensure_ascii=False)}")
+            for text in diffs[k][:12]:
+                lines.append(f"    {text}")
+        if len(diffs) > show:
+            lines.append(f"  ... {title} 차이 사례 {len(diffs) - show:,}개 더")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Python/JavaScript 부력검토·DXF 구현 비교')
+    parser.add_argument('--cases', type=int, default=DEFAULT_CASES, help='임의 단면 수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    parser.add_argument('--node', default=None, help='Node.js 실행 파일 경로')
+    parser.add_argument('--show', type=int, default=3, help='종류별로 자세히 보여줄 차이 사례 수')
+    parser.add_argument('--ignore', default='',
+                        help='무시할 차이 유형 (쉼표 구분, 별칭: ' + ', '.join(IGNORE_ALIASES) + ')')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='알려진 차이 파일 경로')
+    parser.add_argument('--no-baseline', action='store_true', help='알려진 차이도 실패로 처리')
+    parser.add_argument('--save-baseline', action='store_true', help='현재 차이를 알려진 차이로 저장')
+    args = parser.parse_args(argv)
+
+    try:
+        result = run_parity(args.cases, args.seed, args.node)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 2
+    result = ignore_kinds(result, [p.strip() for p in args.ignore.split(',')])
+    print(format_parity(result, args.show))
+
+    if args.save_baseline:
+        path = save_known_diffs(result, args.seed, args.baseline)
+        print(f"\n알려진 차이 저장: {path} ({len(diff_kinds(result))}개 유형)")
+        return 0
+    known = None if args.no_baseline else load_known_diffs(args.baseline)
+    if known is None:
+        return 0 if result.equivalent else 1
+
+    drift = new_drift(result, known)
+    print("")
+    if not same_inputs(result, known):
+        print("입력이 알려진 차이 기준값과 달라 (사례 수/시드/생성기 변경) 새 유형만 비교합니다")
+    if not drift:
+        print(f"새 차이 없음 (알려진 차이 {len(known['kinds'])}개 유형: {args.baseline})")
+        return 0
+    print(f"새 차이 {len(drift)}개 유형 (알려진 차이: {args.baseline})")
+    for kind, text in drift:
+        print(f"    {kind}: {text}")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,11 +1,34 @@
-from PyQt5.QtWidgets import QGraphicsView, QGraphicsScene
-from PyQt5.QtGui import QPainter, QPalette
-from PyQt5.QtCore import Qt, QRectF
+from PyQt5 import sip
+from PyQt5.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsPolygonItem, QGraphicsLineItem, QGraphicsEllipseItem
+from PyQt5.QtGui import QPainter, QPalette, QColor, QPolygonF
+from PyQt5.QtCore import Qt, QRectF, QPointF, pyqtSignal
+from utils import create_cosmetic_pen
 
 
 class ZoomPanGraphicsView(QGraphicsView):
+    # 확대/이동 등으로 보이는 영역이 바뀔 때
+    viewport_changed = pyqtSignal()
+    # 커서 아래 부재가 바뀔 때 (태그, 부재가 없으면 빈 문자열)
+    member_hovered = pyqtSignal(str)
+    # 부재 더블클릭 시 (태그, 단면제원 데이터 경로)
+    member_activated = pyqtSignal(str, object)
+    # 거리 측정 완료 시 (mm)
+    distance_measured = pyqtSignal(float)
+
+    SNAP_PIXELS = 10   # 끝점 스냅 허용 거리 (화면 픽셀)
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        # 배경도면 레이어 (dxf_import.BackgroundDxfLayer)
+        self.background_layer = None
+        # 부재 선택 인덱스 (section_picking.SectionPickIndex)
+        self.pick_index = None
+        self._hover_region = None
+        self._highlight_item = None
+        self._measure_mode = False
+        self._measure_start = None
+        self._measure_items = []
+        self.setMouseTracking(True)
         self.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
         self.setDragMode(QGraphicsView.ScrollHandDrag)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
@@ -28,6 +51,15 @@ class ZoomPanGraphicsView(QGraphicsView):
             self.scale(zoom_factor, zoom_factor)
         else:
             self.scale(1 / zoom_factor, 1 / zoom_factor)
+        self.viewport_changed.emit()
+
+    def scrollContentsBy(self, dx, dy):
+        super().scrollContentsBy(dx, dy)
+        self.viewport_changed.emit()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.viewport_changed.emit()
 
     def fit_to_scene(self):
         """씬 내용에 맞게 뷰를 조정하고 패닝 영역 확장"""
@@ -41,10 +73,116 @@ class ZoomPanGraphicsView(QGraphicsView):
             items_rect.width() + margin * 2,
             items_rect.height() + margin * 2
         )
+        # 배경도면이 있으면 배경 전체까지 패닝 가능하도록 확장
+        if self.background_layer is not None:
+            background_rect = self.background_layer.scene_extents()
+            if background_rect is not None:
+                expanded_rect = expanded_rect.united(background_rect)
         self._scene.setSceneRect(expanded_rect)
 
         # 뷰를 아이템에 맞게 조정
         self.fitInView(items_rect, Qt.KeepAspectRatio)
+        self.viewport_changed.emit()
+
+    # ========================================
+    # 부재 선택 / 끝점 스냅
+    # ========================================
+
+    def set_pick_index(self, pick_index):
+        """현재 도면의 부재 선택 인덱스 설정 (None이면 선택 기능 끔)"""
+        self.pick_index = pick_index
+        self._hover_region = None
+        self._remove_item(self._highlight_item)
+        self._highlight_item = None
+        self._measure_start = None
+        self._measure_items = []
+
+    def set_measure_mode(self, enabled):
+        """거리 측정 모드 (측정 중에는 드래그 패닝 해제)"""
+        self._measure_mode = enabled
+        self._measure_start = None
+        self._clear_measure_items()
+        self.setDragMode(QGraphicsView.NoDrag if enabled else QGraphicsView.ScrollHandDrag)
+
+    def _event_to_dxf(self, event):
+        p = self.mapToScene(event.pos())
+        return p.x(), -p.y()
+
+    def _remove_item(self, item):
+        if item is not None and not sip.isdeleted(item) and item.scene() is not None:
+            item.scene().removeItem(item)
+
+    def _update_highlight(self, region):
+        self._remove_item(self._highlight_item)
+        self._highlight_item = None
+        if region is not None:
+            polygon = QPolygonF([QPointF(x, -y) for x, y in region.polygon])
+            item = QGraphicsPolygonItem(polygon)
+            item.setPen(create_cosmetic_pen(QColor(255, 255, 0), 2))
+            item.setBrush(QColor(255, 255, 0, 60))
+            item.setZValue(100)
+            self._scene.addItem(item)
+            self._highlight_item = item
+
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        if event.buttons() != Qt.NoButton or self.pick_index is None:
+            return
+        x, y = self._event_to_dxf(event)
+        region = self.pick_index.pick(x, y)
+        if region is not self._hover_region:
+            self._hover_region = region
+            self._update_highlight(region)
+            self.member_hovered.emit(region.tag if region else '')
+
+    def mouseDoubleClickEvent(self, event):
+        if self.pick_index is not None and not self._measure_mode:
+            x, y = self._event_to_dxf(event)
+            region = self.pick_index.pick(x, y)
+            if region is not None and region.target is not None:
+                self.member_activated.emit(region.tag, region.target)
+                return
+        super().mouseDoubleClickEvent(event)
+
+    def mousePressEvent(self, event):
+        if self._measure_mode and event.button() == Qt.LeftButton:
+            self._add_measure_point(*self._event_to_dxf(event))
+            return
+        super().mousePressEvent(event)
+
+    def _add_measure_point(self, x, y):
+        """측정점 추가 (끝점 스냅 적용), 두 번째 점에서 거리 확정"""
+        if self.pick_index is not None:
+            tolerance = self.SNAP_PIXELS / max(self.transform().m11(), 1e-12)
+            snapped = self.pick_index.snap(x, y, tolerance)
+            if snapped is not None:
+                x, y = snapped
+
+        pen = create_cosmetic_pen(QColor(0, 255, 255), 1)
+        if self._measure_start is None:
+            self._clear_measure_items()
+            self._measure_start = (x, y)
+        else:
+            x0, y0 = self._measure_start
+            line = QGraphicsLineItem(x0, -y0, x, -y)
+            line.setPen(pen)
+            line.setZValue(100)
+            self._scene.addItem(line)
+            self._measure_items.append(line)
+            self._measure_start = None
+            self.distance_measured.emit(((x - x0) ** 2 + (y - y0) ** 2) ** 0.5)
+
+        r = 3 / max(self.transform().m11(), 1e-12)
+        marker = QGraphicsEllipseItem(x - r, -y - r, 2 * r, 2 * r)
+        marker.setPen(pen)
+        marker.setZValue(100)
+        self._scene.addItem(marker)
+        self._measure_items.append(marker)
+
+    def _clear_measure_items(self):
+        for item in self._measure_items:
+            self._remove_item(item)
+        self._measure_items = []
 
 
 def create_graphics_view():
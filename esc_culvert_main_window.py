@@ -1,22 +1,56 @@
 import json
 import os
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
-                              QSplitter, QFileDialog, QMessageBox)
-from PyQt5.QtCore import Qt
+                              QSplitter, QFileDialog, QMessageBox, QApplication, QProgressDialog)
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from esc_culvert_menu_bar import create_menu_bar
 from esc_culvert_toolbars import create_toolbars
 from esc_culvert_tree_widget import CustomTreeWidget
 from esc_culvert_table_widget import ESCCulvertTableWidget
 from esc_culvert_graphics_view import create_graphics_view
-from utils import create_sample_dxf, display_dxf, create_culvert_dxf
-from buoyancy_check import generate_buoyancy_report, BuoyancyCheckDialog, create_buoyancy_shapes_dxf
+from utils import create_sample_dxf, display_dxf, create_culvert_dxf, get_app_data_dir
+from buoyancy_check import BuoyancyCheckDialog, create_buoyancy_shapes_dxf
+from dxf_import import BackgroundDxfLayer
+from section_picking import SectionPickIndex
+from services import DxfService
+from autosave import AutosaveJournal, atomic_write_json, load_autosave
+from project_paths import diff_paths
+from section_history import EditHistory, thaw
+from project_container import ProjectContainer, read_project_file, write_project_container
+from project_library_dialog import ProjectLibraryDialog
+from project_diff import ProjectDiffDialog, compare_projects
+from result_cache import cached_buoyancy_report, cached_culvert_dxf_bytes
+from load_cases import analyze_section
+from rebar_check import check_section_reinforcement, generate_rebar_report
+from buoyancy_reliability import generate_reliability_report
+from buoyancy_scenarios import generate_scenario_report
+from quantity_takeoff import generate_quantity_report, quantity_takeoff
+from section_geometry import generate_section_properties_report
+from instrumentation import TimingOverlay, export_chrome_trace, set_enabled, span, timed
+from action_profiler import ActionProfiler, profiled_action
+from memory_diagnostics import MemoryMonitor, generate_memory_report, sampled_action
+from calculation_report import generate_report
 
 class MainWindow(QMainWindow):
+    # 자동저장 기록 스레드의 오류를 GUI 스레드로 전달
+    autosave_failed = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("암거설계프로그램")
         self.setGeometry(100, 100, 1200, 800)
         self._current_file_path = None
+        # 바이너리 프로젝트 파일 (측점 데이터 지연 로딩)
+        self._project_container = None
+        # JSON 프로젝트 파일의 측점 목록 (바이너리 파일은 컨테이너에서 읽음)
+        self._project_stations = None
+        # 다음 작업 프로파일 (단면 그리기/부력검토/DXF 내보내기)
+        self.action_profiler = ActionProfiler(snapshot=self._collect_project_data,
+                                              on_captured=self._on_profile_captured,
+                                              on_failed=self._on_profile_failed)
+        # 작업별 메모리 기록 (보기 메뉴에서 켬)
+        self.memory_monitor = MemoryMonitor(self, lambda: self.graphics_view.scene(),
+                                            on_growth=self._on_memory_growth)
 
         self.create_menu_bar()
         self.create_toolbars()
@@ -27,6 +61,10 @@ class MainWindow(QMainWindow):
         # 프로그램 시작 시 첫 번째 아이템 선택
         self.select_default_tree_item()
 
+        self.setup_history()
+        self.setup_autosave()
+        self._reset_edit_tracking()
+
     def create_menu_bar(self):
         menu_items = create_menu_bar(self)
         self.menuBar = menu_items[0]
@@ -35,6 +73,10 @@ class MainWindow(QMainWindow):
         self.detail_menu = menu_items[3]
         self.view_menu = menu_items[4]
         self.show_tree_action = menu_items[5]
+        self.measure_action = menu_items[6]
+        self.undo_action = menu_items[7]
+        self.redo_action = menu_items[8]
+        self.timing_action = menu_items[9]
 
     def create_toolbars(self):
         self.basic_toolbar, _, _ = create_toolbars(self)
@@ -63,11 +105,18 @@ class MainWindow(QMainWindow):
 
         # 그래픽 뷰 생성 및 추가
         self.graphics_view = create_graphics_view()
+        self.graphics_view.background_layer = BackgroundDxfLayer(self.graphics_view)
+        self.graphics_view.member_hovered.connect(self.on_member_hovered)
+        self.graphics_view.member_activated.connect(self.on_member_activated)
+        self.graphics_view.distance_measured.connect(self.on_distance_measured)
         right_layout.addWidget(self.graphics_view, 2)
+        self.timing_overlay = TimingOverlay(self.graphics_view)
 
         # 테이블 위젯 생성 및 추가
         self.table_widget = ESCCulvertTableWidget()
         self.table_widget.culvert_data_changed.connect(self.draw_culvert_section)
+        self.table_widget.culvert_data_changed.connect(self.schedule_edit_record)
+        self.table_widget.material_data_changed.connect(self.schedule_edit_record)
         right_layout.addWidget(self.table_widget, 1)
 
         # 스플리터 비율 설정
@@ -79,6 +128,7 @@ class MainWindow(QMainWindow):
         # CustomTreeWidget의 closed 시그널 연결
         self.custom_tree_widget.closed.connect(self.handle_tree_widget_closed)
 
+    @sampled_action('tree_item_clicked')
     def on_tree_item_clicked(self, item):
         menu_name = item.text(0)
         full_path = self.get_full_item_path(item)
@@ -94,9 +144,10 @@ class MainWindow(QMainWindow):
 
         self.statusBar().showMessage(f'{menu_name}이(가) 선택되었습니다')
 
-        # 부력검토 메뉴 처리
-        if menu_name == '부력검토':
-            self.show_buoyancy_check()
+        # 부력검토/배근검토/수량산출 등 결과 대화상자 메뉴 처리
+        action = self._tree_action(menu_name)
+        if action is not None:
+            action()
             return
 
         # 테이블 위젯 업데이트
@@ -105,6 +156,19 @@ class MainWindow(QMainWindow):
         # DXF 표시 업데이트
         self.update_dxf_view(item)
 
+    def _tree_action(self, menu_name):
+        """결과 대화상자를 여는 트리 메뉴의 실행 함수 (입력 폼 메뉴는 None)"""
+        actions = {
+            '부력검토': self.show_buoyancy_check,
+            '부력 시나리오': self.show_buoyancy_scenarios,
+            '부력 신뢰성': self.show_buoyancy_reliability,
+            '단면 특성': self.show_section_properties,
+            '수량산출': self.show_quantity_takeoff,
+            '휨철근': lambda: self.show_rebar_check('flexure'),
+            '전단철근': lambda: self.show_rebar_check('shear'),
+        }
+        return actions.get(menu_name)
+
     def get_full_item_path(self, item):
         path = []
         while item is not None:
@@ -156,19 +220,27 @@ class MainWindow(QMainWindow):
             doc = create_sample_dxf(parent_name, child_name)
             scene = self.graphics_view.scene()
             display_dxf(doc, scene)
+            self.graphics_view.set_pick_index(None)
             # 뷰를 씬 내용에 맞게 조정
             self.graphics_view.fit_to_scene()
 
+    @sampled_action('draw_culvert_section')
+    @profiled_action('draw_culvert_section')
+    @timed('action.draw_culvert_section')
     def draw_culvert_section(self):
         """단면제원 데이터로 암거 단면 그리기"""
         culvert_data = self.table_widget.get_culvert_section_data()
         if culvert_data:
             ground_info = self.table_widget.get_ground_info()
-            doc = create_culvert_dxf(culvert_data, ground_info)
+            pick_index = SectionPickIndex()
+            doc = create_culvert_dxf(culvert_data, ground_info, pick_index=pick_index)
             scene = self.graphics_view.scene()
             display_dxf(doc, scene)
+            self.graphics_view.set_pick_index(pick_index)
             self.graphics_view.fit_to_scene()
 
+    @sampled_action('show_buoyancy_check')
+    @profiled_action('show_buoyancy_check')
     def show_buoyancy_check(self):
         """부력검토 실행: 분할 도형 그리기 + 결과 팝업 표시"""
         self.table_widget._save_section_data_to_cache()
@@ -179,17 +251,140 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, '부력검토', '단면제원 데이터가 없습니다.')
             return
 
-        # 그림 영역에 분할 도형 표시
-        doc = create_buoyancy_shapes_dxf(section_data)
-        scene = self.graphics_view.scene()
-        display_dxf(doc, scene)
-        self.graphics_view.fit_to_scene()
+        with span('action.show_buoyancy_check'):
+            # 그림 영역에 분할 도형 표시
+            pick_index = SectionPickIndex()
+            doc = create_buoyancy_shapes_dxf(section_data, pick_index=pick_index)
+            scene = self.graphics_view.scene()
+            display_dxf(doc, scene)
+            self.graphics_view.set_pick_index(pick_index)
+            self.graphics_view.fit_to_scene()
 
-        # 계산서 팝업
-        report = generate_buoyancy_report(section_data, ground_info)
+            # 계산서 팝업
+            report = cached_buoyancy_report(section_data, ground_info)
         dialog = BuoyancyCheckDialog(report, self)
+        with self.action_profiler.paused():
+            dialog.exec_()
+
+    def show_buoyancy_scenarios(self):
+        """시공 단계/홍수위/부상방지저판 대안 부력검토 종합 결과 표시"""
+        self.table_widget._save_section_data_to_cache()
+        section_data = self.table_widget.get_culvert_section_data()
+        ground_info = self.table_widget.get_ground_info()
+
+        if not section_data:
+            QMessageBox.warning(self, '부력 시나리오', '단면제원 데이터가 없습니다.')
+            return
+
+        report = generate_scenario_report(section_data, ground_info)
+        dialog = BuoyancyCheckDialog(report, self, title="부력 시나리오 검토 결과")
         dialog.exec_()
 
+    def show_buoyancy_reliability(self):
+        """Monte Carlo 부력 신뢰성 해석 결과 표시"""
+        self.table_widget._save_section_data_to_cache()
+        section_data = self.table_widget.get_culvert_section_data()
+        ground_info = self.table_widget.get_ground_info()
+
+        if not section_data:
+            QMessageBox.warning(self, '부력 신뢰성', '단면제원 데이터가 없습니다.')
+            return
+
+        self.statusBar().showMessage('부력 신뢰성 해석 중...')
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            report = generate_reliability_report(section_data, ground_info, seed=0)
+        finally:
+            QApplication.restoreOverrideCursor()
+        self.statusBar().showMessage('부력 신뢰성 해석 완료')
+        dialog = BuoyancyCheckDialog(report, self, title="부력 신뢰성 해석 결과")
+        dialog.exec_()
+
+    def show_rebar_check(self, kind):
+        """골조해석 + 하중조합 후 휨철근/전단철근 검토 결과 표시"""
+        self.table_widget._save_section_data_to_cache()
+        section_data = self.table_widget.get_culvert_section_data()
+        ground_info = self.table_widget.get_ground_info()
+        materials = self.table_widget.get_material_properties()
+
+        if not section_data:
+            QMessageBox.warning(self, '배근검토', '단면제원 데이터가 없습니다.')
+            return
+
+        try:
+            analysis = analyze_section(section_data, ground_info, materials['fck'])
+            check = check_section_reinforcement(analysis, materials['fck'], materials['fy'])
+            report = generate_rebar_report(analysis, check, kind)
+        except Exception as e:
+            QMessageBox.critical(self, '배근검토', f'배근 검토에 실패했습니다.\n{e}')
+            return
+
+        title = "휨철근 검토 결과" if kind == 'flexure' else "전단철근 검토 결과"
+        dialog = BuoyancyCheckDialog(report, self, title=title)
+        dialog.exec_()
+
+    def show_section_properties(self):
+        """단면적/도심/단면2차모멘트 표시 (분할 도형 교차검증 포함)"""
+        self.table_widget._save_section_data_to_cache()
+        section_data = self.table_widget.get_culvert_section_data()
+        if not section_data:
+            QMessageBox.warning(self, '단면 특성', '단면제원 데이터가 없습니다.')
+            return
+
+        report = generate_section_properties_report(section_data)
+        dialog = BuoyancyCheckDialog(report, self, title="단면 특성")
+        dialog.exec_()
+
+    def show_quantity_takeoff(self):
+        """콘크리트/거푸집 수량산출 결과 표시 (측점이 있으면 측점별)"""
+        data = self._collect_project_data()
+        if not data.get('sectionData'):
+            QMessageBox.warning(self, '수량산출', '단면제원 데이터가 없습니다.')
+            return
+        stations = self._project_station_list()
+        if stations:
+            data['stations'] = stations
+
+        takeoff = quantity_takeoff(data)
+        report = generate_quantity_report(data, takeoff)
+        dialog = BuoyancyCheckDialog(report, self, title="수량산출 결과", stations=takeoff.station_names)
+        dialog.exec_()
+
+    # ========================================
+    # 부재 선택 / 거리 측정
+    # ========================================
+
+    def on_member_hovered(self, tag):
+        """커서 아래 부재 이름 표시"""
+        if tag:
+            self.statusBar().showMessage(tag)
+        else:
+            self.statusBar().clearMessage()
+
+    def on_member_activated(self, tag, target):
+        """부재 더블클릭 → 단면제원 입력 항목으로 이동"""
+        if not self.table_widget.is_section_form_visible():
+            self._select_tree_item('단면제원')
+        if self.table_widget.focus_section_field(target):
+            self.statusBar().showMessage(f'{tag} 입력 항목으로 이동했습니다')
+
+    def _select_tree_item(self, name):
+        """이름으로 트리 아이템 선택 (폼/도면 갱신 포함)"""
+        tree = self.custom_tree_widget.tree_widget
+        items = tree.findItems(name, Qt.MatchExactly | Qt.MatchRecursive)
+        if items:
+            tree.setCurrentItem(items[0])
+            self.on_tree_item_clicked(items[0])
+
+    def toggle_measure_mode(self, checked):
+        """거리 측정 모드 전환"""
+        self.graphics_view.set_measure_mode(checked)
+        if checked:
+            self.statusBar().showMessage('거리 측정: 두 점을 클릭하세요 (끝점 스냅)')
+
+    def on_distance_measured(self, distance):
+        self.statusBar().showMessage(f'측정 거리 = {distance:,.1f} mm')
+
     # ========================================
     # 파일 저장/불러오기/DXF 내보내기
     # ========================================
@@ -272,57 +467,141 @@ class MainWindow(QMainWindow):
             }
 
         # 현재 보고 있는 폼 다시 그리기
-        current_item = self.custom_tree_widget.tree_widget.currentItem()
-        if current_item:
-            self.on_tree_item_clicked(current_item)
+        self._refresh_current_view()
+
+    def _refresh_current_view(self):
+        """적용한 데이터로 현재 입력 폼과 그림 갱신
+
+        표시 중인 위젯 값은 캐시에 저장하지 않고 (적용한 데이터를 덮어쓰므로),
+        결과 대화상자를 여는 메뉴는 다시 실행하지 않고 단면만 그린다.
+        """
+        self.table_widget.reload_content()
+        item = self.custom_tree_widget.tree_widget.currentItem()
+        if item is not None and self._tree_action(item.text(0)) is None:
+            self.update_dxf_view(item)
+        else:
+            self.draw_culvert_section()
 
     def save_project(self):
-        """프로젝트를 JSON 파일로 저장"""
+        """프로젝트를 JSON 또는 바이너리(.escp) 파일로 저장"""
         file_path, _ = QFileDialog.getSaveFileName(
             self, '프로젝트 저장',
             self._current_file_path or 'esc_culvert_project.json',
-            'JSON 파일 (*.json);;모든 파일 (*)'
+            'JSON 파일 (*.json);;암거 프로젝트 파일 (*.escp);;모든 파일 (*)'
         )
         if not file_path:
             return
 
         try:
             data = self._collect_project_data()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 불러온 파일의 측점 데이터 유지 (같은 파일에 덮어쓰므로 먼저 메모리로 읽음)
+            stations = self._project_station_list()
+            if stations:
+                data['stations'] = stations
+
+            if file_path.lower().endswith('.escp'):
+                write_project_container(file_path, data)
+                # 파일이 바뀌었으므로 청크 인덱스를 다시 읽음
+                self._project_container = ProjectContainer(file_path)
+                self._project_stations = None
+            else:
+                atomic_write_json(file_path, data, indent=2)
+                self._project_container = None
+                self._project_stations = stations
             self._current_file_path = file_path
+            self._record_autosave()
             self.statusBar().showMessage(f'저장 완료: {os.path.basename(file_path)}')
         except Exception as e:
             QMessageBox.critical(self, '저장 오류', f'파일 저장에 실패했습니다.\n{e}')
 
     def load_project(self):
-        """JSON 파일에서 프로젝트 불러오기"""
+        """JSON 또는 바이너리(.escp) 파일에서 프로젝트 불러오기"""
         file_path, _ = QFileDialog.getOpenFileName(
             self, '프로젝트 불러오기',
             '',
-            'JSON 파일 (*.json);;모든 파일 (*)'
+            '프로젝트 파일 (*.json *.escp);;JSON 파일 (*.json);;암거 프로젝트 파일 (*.escp);;모든 파일 (*)'
         )
         if not file_path:
             return
+        self._load_project_file(file_path)
 
+    def _load_project_file(self, file_path):
+        """프로젝트 파일 읽어서 적용"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data, container = read_project_file(file_path)
             self._apply_project_data(data)
+            self._project_container = container
+            self._project_stations = None if container is not None else data.get('stations') or None
             self._current_file_path = file_path
+            self._reset_edit_tracking()
             self.statusBar().showMessage(f'불러오기 완료: {os.path.basename(file_path)}')
         except json.JSONDecodeError:
             QMessageBox.critical(self, '불러오기 오류', '유효하지 않은 JSON 파일입니다.')
         except Exception as e:
             QMessageBox.critical(self, '불러오기 오류', f'파일을 불러오는데 실패했습니다.\n{e}')
 
+    def _project_station_source(self):
+        """현재 프로젝트의 측점 (순회 가능 객체, 개수) - 없으면 (None, None)
+
+        바이너리 파일은 측점을 하나씩 읽고, JSON 파일은 메모리 목록을 사용한다.
+        """
+        container = self._project_container
+        if container is not None and container.station_count:
+            return container.iter_stations(), container.station_count
+        if self._project_stations:
+            return iter(self._project_stations), len(self._project_stations)
+        return None, None
+
+    def _project_station_list(self):
+        """현재 프로젝트의 측점 목록 (없으면 None)"""
+        stations, _ = self._project_station_source()
+        return list(stations) if stations is not None else None
+
+    def open_project_library(self):
+        """프로젝트 라이브러리 검색 대화상자"""
+        dialog = ProjectLibraryDialog(parent=self)
+        dialog.project_selected.connect(self._load_project_file)
+        dialog.exec_()
+
+    def compare_project(self):
+        """다른 프로젝트 파일(이전)과 현재 프로젝트 비교"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, '비교할 프로젝트 (이전)',
+            os.path.dirname(self._current_file_path or ''),
+            '프로젝트 파일 (*.json *.escp);;모든 파일 (*)'
+        )
+        if not file_path:
+            return
+
+        data = self._collect_project_data()
+        stations = self._project_station_list()
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            old_data, old_container = read_project_file(file_path)
+            old_stations = (list(old_container.iter_stations())
+                            if old_container is not None and old_container.station_count else None)
+            diff = compare_projects(old_data, data, old_stations, stations,
+                                    old_name=os.path.basename(file_path),
+                                    new_name=os.path.basename(self._current_file_path or '현재 프로젝트'))
+        except Exception as e:
+            QMessageBox.critical(self, '프로젝트 비교', f'프로젝트 비교에 실패했습니다.\n{e}')
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        self.statusBar().showMessage(
+            f'비교 완료: 변경 측점 {len(diff.changed_stations())}개, 재계산 {diff.computed}건')
+        dialog = ProjectDiffDialog(diff, self)
+        dialog.exec_()
+
+    @profiled_action('export_dxf')
     def export_dxf(self):
         """현재 단면을 DXF 파일로 내보내기"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, 'DXF 파일로 내보내기',
-            'esc_culvert_section.dxf',
-            'DXF 파일 (*.dxf);;모든 파일 (*)'
-        )
+        with self.action_profiler.paused():
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, 'DXF 파일로 내보내기',
+                'esc_culvert_section.dxf',
+                'DXF 파일 (*.dxf);;모든 파일 (*)'
+            )
         if not file_path:
             return
 
@@ -333,8 +612,222 @@ class MainWindow(QMainWindow):
                 return
 
             ground_info = self.table_widget.get_ground_info()
-            doc = create_culvert_dxf(culvert_data, ground_info)
-            doc.saveas(file_path)
+            with span('action.export_dxf'):
+                data = cached_culvert_dxf_bytes(culvert_data, ground_info)
+                with open(file_path, 'wb') as f:
+                    f.write(data)
             self.statusBar().showMessage(f'DXF 내보내기 완료: {os.path.basename(file_path)}')
         except Exception as e:
             QMessageBox.critical(self, '내보내기 오류', f'DXF 파일 내보내기에 실패했습니다.\n{e}')
+
+    def export_calculation_report(self):
+        """부력검토 계산서를 PDF 또는 HTML로 출력 (측점이 있으면 측점별 장)"""
+        data = self._collect_project_data()
+        if not data.get('sectionData'):
+            QMessageBox.warning(self, '계산서 출력', '단면제원 데이터가 없습니다.')
+            return
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, '계산서 출력', 'buoyancy_report.pdf',
+            'PDF 파일 (*.pdf);;HTML 파일 (*.html);;모든 파일 (*)'
+        )
+        if not file_path:
+            return
+
+        # 바이너리 파일의 측점은 하나씩 읽어서 사용
+        stations, count = self._project_station_source()
+
+        progress = QProgressDialog('계산서 작성 중...', None, 0, count or 0, self)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(500)
+
+        def on_progress(done, total):
+            progress.setValue(done)
+            QApplication.processEvents()
+
+        is_html = file_path.lower().endswith(('.html', '.htm'))
+        try:
+            stats = generate_report(data, html_path=file_path if is_html else None,
+                                    pdf_path=None if is_html else file_path,
+                                    stations=stations, station_count=count, progress=on_progress)
+        except Exception as e:
+            QMessageBox.critical(self, '계산서 출력 오류', f'계산서 출력에 실패했습니다.\n{e}')
+            return
+        finally:
+            progress.close()
+        self.statusBar().showMessage(
+            f"계산서 출력 완료: {os.path.basename(file_path)} (측점 {stats['chapters']}개, "
+            f"N.G. {stats['failed']}개, {stats['elapsed']:.1f}s)")
+
+    # ========================================
+    # 성능 계측
+    # ========================================
+
+    def toggle_timing_overlay(self, checked):
+        """단계별 소요 시간 표시 (켜는 동안만 계측)"""
+        set_enabled(checked)
+        self.timing_overlay.set_active(checked)
+
+    def export_timing_trace(self):
+        """계측 기록을 trace 파일로 저장 (chrome://tracing / Perfetto)"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, '성능 기록 내보내기', 'esc_culvert_trace.json',
+            'Trace 파일 (*.json);;모든 파일 (*)'
+        )
+        if not file_path:
+            return
+        try:
+            count = export_chrome_trace(file_path)
+            self.statusBar().showMessage(f'성능 기록 {count:,}개 저장: {os.path.basename(file_path)}')
+        except OSError as e:
+            QMessageBox.critical(self, '내보내기 오류', f'성능 기록 저장에 실패했습니다.\n{e}')
+
+    def arm_action_profiler(self):
+        """다음 작업(단면 그리기/부력검토/DXF 내보내기) 한 번을 프로파일"""
+        self.action_profiler.arm()
+        self.statusBar().showMessage('다음 작업(단면 그리기, 부력검토, DXF 내보내기)을 프로파일합니다')
+
+    def _on_profile_captured(self, path):
+        self.statusBar().showMessage(f'프로파일 저장: {path}')
+
+    def _on_profile_failed(self, error):
+        self.statusBar().showMessage('프로파일 저장 실패')
+        QMessageBox.warning(self, '프로파일 저장 오류', f'프로파일 묶음 파일 저장에 실패했습니다.\n{error}')
+
+    def toggle_memory_monitor(self, checked):
+        """작업별 메모리 기록 켜기/끄기"""
+        if checked:
+            self.memory_monitor.clear()
+        self.memory_monitor.set_enabled(checked)
+        self.statusBar().showMessage('메모리 진단 기록 중' if checked else '메모리 진단 기록 중지')
+
+    def show_memory_report(self):
+        dialog = BuoyancyCheckDialog(generate_memory_report(self.memory_monitor), self, title="메모리 진단")
+        dialog.exec_()
+
+    def _on_memory_growth(self, flagged):
+        names = ', '.join(name for _, name, _, _ in flagged)
+        self.statusBar().showMessage(f'메모리 진단: 계속 증가하는 항목 - {names}')
+
+    def open_background_dxf(self):
+        """외부 DXF를 배경도면으로 열기"""
+        DxfService.open_background_dxf(self)
+
+    def close_background_dxf(self):
+        """배경도면 닫기"""
+        DxfService.close_background_dxf(self)
+
+    # ========================================
+    # 편집 기록 (실행 취소/다시 실행, 자동 저장)
+    # ========================================
+
+    EDIT_RECORD_DELAY_MS = 300
+
+    def setup_history(self):
+        """실행 취소 기록 및 편집 기록 타이머"""
+        self.history = EditHistory()
+        self._edit_timer = QTimer(self)
+        self._edit_timer.setSingleShot(True)
+        self._edit_timer.timeout.connect(self._record_edit)
+
+    def setup_autosave(self):
+        """자동저장 시작 (이전 비정상 종료 시 복구 여부 확인)"""
+        autosave_dir = get_app_data_dir('autosave')
+        self.autosave_failed.connect(self._on_autosave_failed)
+        self.autosave = AutosaveJournal(autosave_dir, on_error=self.autosave_failed.emit)
+        self._autosave_error_shown = False
+
+        try:
+            recovered = load_autosave(autosave_dir)
+        except Exception as e:
+            self.statusBar().showMessage('자동저장 복구 실패')
+            QMessageBox.warning(self, '자동저장 복구', f'자동저장 데이터를 읽지 못했습니다.\n{e}')
+            recovered = None
+
+        if recovered and recovered.get('project'):
+            reply = QMessageBox.question(
+                self, '자동저장 복구',
+                '이전에 저장되지 않은 작업이 있습니다. 복구하시겠습니까?',
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
+            )
+            if reply == QMessageBox.Yes:
+                self._apply_project_data(recovered['project'])
+                self._current_file_path = recovered.get('filePath')
+                self.statusBar().showMessage('자동저장 데이터를 복구했습니다.')
+
+    def _on_autosave_failed(self, message):
+        """자동저장 쓰기 오류 (상태바에 표시, 대화상자는 처음 한 번만)"""
+        self.statusBar().showMessage(message)
+        if not self._autosave_error_shown:
+            self._autosave_error_shown = True
+            QMessageBox.warning(self, '자동저장 오류',
+                                f'자동저장 파일을 쓰지 못했습니다. 작업은 계속되며 다음 변경 때 다시 시도합니다.\n{message}')
+
+    def _reset_edit_tracking(self):
+        """현재 상태를 기준으로 실행 취소 기록과 자동저장을 다시 시작"""
+        self._edit_timer.stop()
+        self.history.reset(self._collect_project_data())
+        self._update_history_actions()
+        self._reset_autosave()
+
+    def schedule_edit_record(self):
+        """입력 변경 후 잠시 뒤 편집 기록 (연속 입력은 한 번으로 묶음)"""
+        self._edit_timer.start(self.EDIT_RECORD_DELAY_MS)
+
+    def _record_edit(self):
+        """바뀐 경로를 실행 취소 기록과 자동저장 저널에 기록"""
+        self._edit_timer.stop()
+        if self.history.record(self._collect_project_data()):
+            self._update_history_actions()
+        self._record_autosave()
+
+    def undo_edit(self):
+        """실행 취소"""
+        if self._edit_timer.isActive():
+            self._record_edit()
+        state = self.history.undo()
+        if state is not None:
+            self._restore_history_state(state)
+
+    def redo_edit(self):
+        """다시 실행"""
+        if self._edit_timer.isActive():
+            self._record_edit()
+        state = self.history.redo()
+        if state is not None:
+            self._restore_history_state(state)
+
+    def _restore_history_state(self, state):
+        """기록된 상태를 위젯에 적용하고 단면 다시 그리기 (배치 캐시 사용)"""
+        self._apply_project_data(thaw(state))
+        # 적용 중 발생한 변경 시그널은 새 편집으로 기록하지 않음
+        self._edit_timer.stop()
+        self.history.rebase(self._collect_project_data())
+        self._update_history_actions()
+        self._record_autosave()
+
+    def _update_history_actions(self):
+        self.undo_action.setEnabled(self.history.can_undo())
+        self.redo_action.setEnabled(self.history.can_redo())
+
+    def _autosave_state(self):
+        """자동저장 상태 스냅샷 (위젯 데이터와 공유하지 않도록 JSON 복사)"""
+        state = {'filePath': self._current_file_path, 'project': self._collect_project_data()}
+        return json.loads(json.dumps(state))
+
+    def _reset_autosave(self):
+        """현재 상태로 자동저장 체크포인트 다시 시작"""
+        self._autosave_snapshot = self._autosave_state()
+        self.autosave.start(json.loads(json.dumps(self._autosave_snapshot)))
+
+    def _record_autosave(self):
+        """이전 스냅샷과 비교해 바뀐 값만 저널에 기록"""
+        state = self._autosave_state()
+        changes = diff_paths(self._autosave_snapshot, state)
+        self._autosave_snapshot = state
+        self.autosave.record(changes)
+
+    def closeEvent(self, event):
+        """정상 종료 시 자동저장 파일 삭제"""
+        self._edit_timer.stop()
+        self.autosave.close(discard=True)
+        super().closeEvent(event)
@@ -18,15 +18,49 @@ def create_menu_bar(window):
     load_action.triggered.connect(window.load_project)
     file_io_menu.addAction(load_action)
 
+    library_action = QAction('프로젝트 라이브러리...', window)
+    library_action.triggered.connect(window.open_project_library)
+    file_io_menu.addAction(library_action)
+
+    compare_action = QAction('프로젝트 비교...', window)
+    compare_action.triggered.connect(window.compare_project)
+    file_io_menu.addAction(compare_action)
+
     file_io_menu.addSeparator()
 
     export_dxf_action = QAction('DXF 파일로 내보내기', window)
-    export_dxf_action.triggered.connect(window.export_dxf)
+    # triggered(checked) 인자는 넘기지 않음 (export_dxf는 프로파일 데코레이터로 감싸져 있음)
+    export_dxf_action.triggered.connect(lambda: window.export_dxf())
     file_io_menu.addAction(export_dxf_action)
 
+    report_action = QAction('계산서 출력 (PDF/HTML)...', window)
+    report_action.triggered.connect(window.export_calculation_report)
+    file_io_menu.addAction(report_action)
+
+    file_io_menu.addSeparator()
+
+    open_background_action = QAction('배경 DXF 열기...', window)
+    open_background_action.triggered.connect(window.open_background_dxf)
+    file_io_menu.addAction(open_background_action)
+
+    close_background_action = QAction('배경 DXF 닫기', window)
+    close_background_action.triggered.connect(window.close_background_dxf)
+    file_io_menu.addAction(close_background_action)
+
     # 기존 메뉴들
     file_menu = menubar.addMenu('기본 설정')
     edit_menu = menubar.addMenu('단면 입력')
+
+    undo_action = QAction('실행 취소', window)
+    undo_action.setShortcut(QKeySequence.Undo)
+    undo_action.triggered.connect(window.undo_edit)
+    edit_menu.addAction(undo_action)
+
+    redo_action = QAction('다시 실행', window)
+    redo_action.setShortcut(QKeySequence.Redo)
+    redo_action.triggered.connect(window.redo_edit)
+    edit_menu.addAction(redo_action)
+
     detail_menu = menubar.addMenu('상세입력')
 
     # 보기 메뉴 추가
@@ -41,4 +75,36 @@ def create_menu_bar(window):
     # 보기 메뉴에 트리메뉴 보기 액션 추가
     view_menu.addAction(show_tree_action)
 
-    return menubar, file_menu, edit_menu, detail_menu, view_menu, show_tree_action
+    # 거리 측정 (끝점 스냅)
+    measure_action = QAction('거리 측정', window)
+    measure_action.setCheckable(True)
+    measure_action.triggered.connect(window.toggle_measure_mode)
+    view_menu.addAction(measure_action)
+
+    view_menu.addSeparator()
+
+    # 성능 계측 (단계별 소요 시간 표시)
+    timing_action = QAction('단계별 소요 시간 표시', window)
+    timing_action.setCheckable(True)
+    timing_action.triggered.connect(window.toggle_timing_overlay)
+    view_menu.addAction(timing_action)
+
+    export_trace_action = QAction('성능 기록 내보내기...', window)
+    export_trace_action.triggered.connect(window.export_timing_trace)
+    view_menu.addAction(export_trace_action)
+
+    profile_action = QAction('다음 작업 프로파일', window)
+    profile_action.triggered.connect(window.arm_action_profiler)
+    view_menu.addAction(profile_action)
+
+    memory_action = QAction('메모리 진단 기록', window)
+    memory_action.setCheckable(True)
+    memory_action.triggered.connect(window.toggle_memory_monitor)
+    view_menu.addAction(memory_action)
+
+    memory_report_action = QAction('메모리 진단 결과...', window)
+    memory_report_action.triggered.connect(window.show_memory_report)
+    view_menu.addAction(memory_report_action)
+
+    return (menubar, file_menu, edit_menu, detail_menu, view_menu, show_tree_action, measure_action,
+            undo_action, redo_action, timing_action)
@@ -3,10 +3,13 @@ from PyQt5.QtWidgets import (QTableWidget, QTableWidgetItem, QWidget, QVBoxLayou
     QPushButton, QCheckBox, QTabWidget, QFrame, QGridLayout, QSpinBox)
 from PyQt5.QtCore import Qt, QEvent, pyqtSignal
 from PyQt5.QtGui import QColor, QFont, QKeyEvent
+from instrumentation import timed
 
 class ESCCulvertTableWidget(QWidget):
     # 단면제원 데이터 변경 시그널
     culvert_data_changed = pyqtSignal()
+    # 재료특성 변경 시그널 (도면에 영향 없음, 자동저장용)
+    material_data_changed = pyqtSignal()
 
     def __init__(self):
         super().__init__()
@@ -135,12 +138,20 @@ class ESCCulvertTableWidget(QWidget):
         data = self.get_culvert_section_data()
         self._cached_culvert_data = data
 
-    def update_content(self, item_text):
+    @timed('table.update_content')
+    def update_content(self, item_text, save_cache=True):
+        """선택한 메뉴의 입력 폼 표시
+
+        save_cache=False면 기존 단면제원 위젯 값을 캐시에 저장하지 않는다
+        (불러오기/실행 취소로 캐시를 새 데이터로 바꾼 뒤 폼을 다시 만들 때).
+        """
         self.header_label.setText(item_text)
+        self._content_text = item_text
 
         # 기존 단면제원 위젯 제거 (제거 전 캐시 저장)
         if hasattr(self, 'section_widget') and self.section_widget:
-            self._save_section_data_to_cache()
+            if save_cache:
+                self._save_section_data_to_cache()
             self.section_widget.setParent(None)
             self.section_widget.deleteLater()
             self.section_widget = None
@@ -172,6 +183,17 @@ class ESCCulvertTableWidget(QWidget):
         self.table.resizeColumnsToContents()
         self.table.resizeRowsToContents()
 
+    def reload_content(self):
+        """현재 폼을 데이터(캐시) 값으로 다시 만들기 (변경 시그널 없음)"""
+        item_text = getattr(self, '_content_text', None)
+        if item_text is None:
+            return
+        self.blockSignals(True)
+        try:
+            self.update_content(item_text, save_cache=False)
+        finally:
+            self.blockSignals(False)
+
     def setup_project_info(self):
         self.table.setRowCount(4)
         items = [
@@ -285,6 +307,82 @@ class ESCCulvertTableWidget(QWidget):
         # 레이아웃에 추가
         self.layout().addWidget(self.section_widget)
 
+    def is_section_form_visible(self):
+        """단면제원 입력 폼이 표시 중인지"""
+        try:
+            return bool(getattr(self, 'section_widget', None)) and self.culvert_count_spin.value() > 0
+        except RuntimeError:
+            return False
+
+    def focus_section_field(self, path):
+        """단면제원 데이터 경로(path)에 해당하는 입력 칸으로 이동
+
+        path 예) ('UT',), ('B', 1), ('middle_walls', 0, 'thickness'),
+                 ('haunch', 'middleWalls', 1, 'upper'), ('antiFloat', 'thickness')
+        """
+        if not path or not self.is_section_form_visible():
+            return False
+
+        key = path[0]
+        if key == 'haunch':
+            wall_key = 'middleWall' if path[1] == 'middleWalls' else path[1]
+            index = path[2] if wall_key == 'middleWall' else None
+            pos = path[-1]
+            self.section_tab_widget.setCurrentIndex(1)
+            for spin in self.haunch_tab.findChildren(QSpinBox):
+                if (spin.property('wall_key') == wall_key and spin.property('wall_index') == index
+                        and spin.property('h_pos') == pos and spin.property('h_dim') == 'width'):
+                    spin.setFocus()
+                    spin.selectAll()
+                    return True
+            return False
+
+        if key == 'columnGirder':
+            spins = {
+                'columnCTC': self.cg_ctc_spin,
+                'columnWidth': self.cg_width_spin,
+                'upperAdditionalHeight': self.cg_upper_spin,
+                'lowerAdditionalHeight': self.cg_lower_spin
+            }
+            self.section_tab_widget.setCurrentIndex(2)
+            spins[path[1]].setFocus()
+            spins[path[1]].selectAll()
+            return True
+
+        if key == 'antiFloat':
+            col = ['leftExtension', 'rightExtension', 'thickness'].index(path[1])
+            self.section_tab_widget.setCurrentIndex(3)
+            spin = self.anti_float_table.cellWidget(0, col)
+            spin.setFocus()
+            spin.selectAll()
+            return True
+
+        # 단면제원 표 (데이터 행 = 2행)
+        culvert_count = self.culvert_count_spin.value()
+        slab_start_col = 2 + culvert_count
+        middle_start_col = slab_start_col + 3
+        columns = {
+            'H': 0, 'H4': 1,
+            'UT': slab_start_col, 'LT': slab_start_col + 1, 'WL': slab_start_col + 2,
+            'WR': middle_start_col + (culvert_count - 1) * 2
+        }
+        if key == 'B':
+            col = 2 + path[1]
+        elif key == 'middle_walls':
+            col = middle_start_col + path[1] * 2 + (1 if path[-1] == 'thickness' else 0)
+        elif key in columns:
+            col = columns[key]
+        else:
+            return False
+
+        self.section_tab_widget.setCurrentIndex(0)
+        self.section_table.setFocus()
+        self.section_table.setCurrentCell(2, col)
+        item = self.section_table.item(2, col)
+        if item is not None:
+            self.section_table.editItem(item)
+        return True
+
     def on_culvert_count_changed(self, value):
         """암거련수 변경 시 테이블 재생성"""
         # 기존 단면제원 탭 제거 및 재생성
@@ -299,9 +397,7 @@ class ESCCulvertTableWidget(QWidget):
 
         # 헌치 중간벽 배열 크기 조정
         middle_wall_count = value - 1
-        while len(self.haunch_data['middleWalls']) < middle_wall_count:
-            self.haunch_data['middleWalls'].append(
-                {'upper': {'width': 300, 'height': 300}, 'lower': {'width': 300, 'height': 300}})
+        self._ensure_haunch_middle_walls(middle_wall_count)
         self.haunch_data['middleWalls'] = self.haunch_data['middleWalls'][:middle_wall_count]
 
         self.section_tab_widget.setCurrentIndex(0)
@@ -461,6 +557,12 @@ class ESCCulvertTableWidget(QWidget):
         """중간벽체 타입 변경 시 (연속벽/기둥) 도면 갱신"""
         self.culvert_data_changed.emit()
 
+    def _ensure_haunch_middle_walls(self, middle_wall_count):
+        """헌치 중간벽 배열 크기 보장 (부족하면 기본값 추가)"""
+        while len(self.haunch_data['middleWalls']) < middle_wall_count:
+            self.haunch_data['middleWalls'].append(
+                {'upper': {'width': 300, 'height': 300}, 'lower': {'width': 300, 'height': 300}})
+
     def create_haunch_tab(self, culvert_count):
         """내부헌치 탭 내용 생성"""
         tab = QWidget()
@@ -469,11 +571,7 @@ class ESCCulvertTableWidget(QWidget):
         layout.setSpacing(10)
 
         middle_wall_count = culvert_count - 1
-
-        # 헌치 중간벽 배열 크기 보장
-        while len(self.haunch_data['middleWalls']) < middle_wall_count:
-            self.haunch_data['middleWalls'].append(
-                {'upper': {'width': 300, 'height': 300}, 'lower': {'width': 300, 'height': 300}})
+        self._ensure_haunch_middle_walls(middle_wall_count)
 
         # 벽체별 헌치 카드 생성
         walls = [('좌측벽체', 'leftWall', self.haunch_data['leftWall'], None)]
@@ -844,6 +942,7 @@ class ESCCulvertTableWidget(QWidget):
         elif sender == self.table.cellWidget(1, 1):
             self.rebar_yield_strength = value
             print(f"Updated rebar yield strength: {self.rebar_yield_strength} MPa")
+        self.material_data_changed.emit()
 
     def get_material_properties(self):
         return {
@@ -854,6 +953,7 @@ class ESCCulvertTableWidget(QWidget):
     def get_section_properties(self):
         return self.section_data
 
+    @timed('table.get_culvert_section_data')
     def get_culvert_section_data(self):
         """단면제원 데이터를 가져옴 (위젯이 삭제된 경우 캐시 반환)"""
         try:
@@ -916,6 +1016,8 @@ class ESCCulvertTableWidget(QWidget):
 
     def _get_cached_data(self):
         """캐시된 단면 데이터에 최신 헌치/기둥종거더/부상방지저판 반영"""
+        # 폼을 열기 전에도 헌치 중간벽 수를 련수에 맞춤 (폼을 열 때 바뀐 것으로 기록되지 않도록)
+        self._ensure_haunch_middle_walls(self._cached_culvert_data.get('culvert_count', 3) - 1)
         self._cached_culvert_data['haunch'] = self.haunch_data
         self._cached_culvert_data['columnGirder'] = self.column_girder_data
         self._cached_culvert_data['antiFloat'] = self.anti_float_data
@@ -9,7 +9,7 @@ class ESCCulvertTreeWidget(QTreeWidget):
         self.create_tree_items()
 
     def create_tree_items(self):
-        items = ['프로젝트 정보', '설계조건', '단면입력', '하중입력', '안정검토', '배근 입력', '출력']
+        items = ['프로젝트 정보', '설계조건', '단면입력', '하중입력', '안정검토', '배근입력', '출력']
 
         for item_text in items:
             item = QTreeWidgetItem(self)
@@ -18,11 +18,13 @@ class ESCCulvertTreeWidget(QTreeWidget):
             if item_text == '설계조건':
                 subitems = ['기본환경', '재료특성', '지반정보', '기타환경']
             elif item_text == '단면입력':
-                subitems = ['단면제원', '분점 정의', '하중 정의']
+                subitems = ['단면제원', '분점 정의', '하중 정의', '단면 특성']
             elif item_text == '안정검토':
-                subitems = ['부력검토']
+                subitems = ['부력검토', '부력 시나리오', '부력 신뢰성']
             elif item_text == '배근입력':
                 subitems = ['휨철근', '전단철근']
+            elif item_text == '출력':
+                subitems = ['수량산출']
             else:
                 subitems = []
 
@@ -2309,6 +2309,37 @@
         return val.toLocaleString(undefined, { minimumFractionDigits: 3, maximumFractionDigits: 3 });
     }
 
+    // ========================================
+    // COMPUTE CLIENT - Python 계산 서버 호출 (서버가 없으면 null)
+    // ========================================
+    const COMPUTE_TIMEOUT_MS = 10000;
+    let computeServerAvailable = null;
+
+    async function serverCompute(endpoint, payload) {
+        const served = window.location.protocol === 'http:' || window.location.protocol === 'https:';
+        if (computeServerAvailable === false || !served) return null;
+        const controller = new AbortController();
+        const timer = setTimeout(() => controller.abort(), COMPUTE_TIMEOUT_MS);
+        try {
+            const response = await fetch('/api/' + endpoint, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify(payload),
+                signal: controller.signal
+            });
+            if (response.status === 404) { computeServerAvailable = false; return null; }
+            computeServerAvailable = true;
+            const data = await response.json();
+            if (!response.ok) { console.warn('계산 서버 오류 (' + endpoint + '):', data.error); return null; }
+            return data;
+        } catch (e) {
+            console.warn('계산 서버 연결 실패 (' + endpoint + '):', e);
+            return null;
+        } finally {
+            clearTimeout(timer);
+        }
+    }
+
     function generateBuoyancyReport(sectionData, groundInfo) {
         const culvertCount = parseInt(sectionData.culvert_count || 3);
         const H = parseFloat(sectionData.H || 4200);
@@ -2651,6 +2682,11 @@
         body.appendChild(pre);
         modal.appendChild(body);
 
+        // 계산 서버가 있으면 데스크톱 프로그램과 같은 Python 계산 결과로 교체
+        serverCompute('buoyancy-report', { sectionData, groundInfo }).then((data) => {
+            if (data && data.report) pre.textContent = data.report;
+        });
+
         const footer = document.createElement('div');
         footer.className = 'modal-footer';
         const closeBtn = document.createElement('button');
@@ -3,6 +3,7 @@
 import state from '../state.js';
 import { getRenderer } from '../viewer/svgRenderer.js';
 import { getZoomPan } from '../viewer/zoomPan.js';
+import { serverCompute } from '../utils/computeClient.js';
 
 const GAMMA_C = 24.5;  // 콘크리트 단위중량 (kN/m³)
 const GAMMA_W = 9.81;  // 물의 단위중량 (kN/m³)
@@ -411,6 +412,11 @@ export function showBuoyancyCheckModal() {
     body.appendChild(pre);
     modal.appendChild(body);
 
+    // 계산 서버가 있으면 데스크톱 프로그램과 같은 Python 계산 결과로 교체
+    serverCompute('buoyancy-report', { sectionData, groundInfo }).then((data) => {
+        if (data && data.report) pre.textContent = data.report;
+    });
+
     // 푸터 버튼
     const footer = document.createElement('div');
     footer.className = 'modal-footer';
@@ -0,0 +1,49 @@
+// computeClient.js - Python 계산 서버(compute_server.py) 호출
+//
+// 페이지가 계산 서버에서 제공될 때(http://127.0.0.1:8765/)만 사용한다.
+// 서버가 없거나 응답하지 않으면 null을 돌려주므로 호출하는 쪽은
+// 기존 JavaScript 계산 결과를 그대로 사용하면 된다.
+
+const TIMEOUT_MS = 10000;
+
+let serverAvailable = null;   // null: 아직 확인 안 함
+
+function isServedByServer() {
+    return window.location.protocol === 'http:' || window.location.protocol === 'https:';
+}
+
+/**
+ * 계산 API 호출 → 결과 JSON (실패 시 null)
+ */
+export async function serverCompute(endpoint, payload) {
+    if (serverAvailable === false || !isServedByServer()) return null;
+    const controller = new AbortController();
+    const timer = setTimeout(() => controller.abort(), TIMEOUT_MS);
+    try {
+        const response = await fetch(`/api/${endpoint}`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(payload),
+            signal: controller.signal
+        });
+        if (response.status === 404) {
+            // 계산 서버가 아닌 일반 웹 서버
+            serverAvailable = false;
+            return null;
+        }
+        serverAvailable = true;
+        const data = await response.json();
+        if (!response.ok) {
+            console.warn(`계산 서버 오류 (${endpoint}):`, data.error);
+            return null;
+        }
+        return data;
+    } catch (e) {
+        console.warn(`계산 서버 연결 실패 (${endpoint}):`, e);
+        return null;
+    } finally {
+        clearTimeout(timer);
+    }
+}
+
+export default { serverCompute };
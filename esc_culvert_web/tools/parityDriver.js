@@ -0,0 +1,69 @@
+// parityDriver.js - Python/JavaScript 엔진 비교용 Node 실행기
+//
+// engine_parity.py가 호출한다. 브라우저용 ES 모듈(buoyancyCheck.js, dxfExport.js)을
+// 수정하지 않고 읽어서, import/export 구문만 걷어낸 뒤 state 객체를 대신 넣어 실행한다.
+//
+//   node parityDriver.js cases.json  →  stdout: {reports, dxf, timing}
+//
+// cases.json = {cases: [{sectionData, groundInfo}, ...], engines: ['buoyancy', 'dxf']}
+
+'use strict';
+
+const fs = require('fs');
+const path = require('path');
+const { performance } = require('perf_hooks');
+
+const JS_ROOT = path.join(__dirname, '..', 'js');
+
+// 현재 계산 중인 사례 (state.getSectionData / getGroundInfo가 돌려줌)
+let current = { sectionData: {}, groundInfo: {} };
+const stateStub = {
+    getSectionData: () => current.sectionData,
+    getGroundInfo: () => current.groundInfo
+};
+
+/**
+ * ES 모듈 소스를 함수로 감싸 내부 함수들을 꺼냄
+ */
+function loadModule(relPath, names) {
+    let source = fs.readFileSync(path.join(JS_ROOT, relPath), 'utf-8');
+    source = source
+        .replace(/^import .*$/gm, '')
+        .replace(/^export default .*$/gm, '')
+        .replace(/^export (function|const|let|class|async function) /gm, '$1 ');
+    const factory = new Function('state', 'alert', `${source}\nreturn { ${names.join(', ')} };`);
+    return factory(stateStub, (message) => { throw new Error(message); });
+}
+
+function timeLoop(cases, fn) {
+    const results = [];
+    const start = performance.now();
+    for (const c of cases) {
+        current = c;
+        results.push(fn(c));
+    }
+    return { results, seconds: (performance.now() - start) / 1000 };
+}
+
+function main() {
+    const input = JSON.parse(fs.readFileSync(process.argv[2], 'utf-8'));
+    const cases = input.cases;
+    const engines = input.engines || ['buoyancy', 'dxf'];
+    const output = { timing: {}, node: process.version };
+
+    if (engines.includes('buoyancy')) {
+        const { generateBuoyancyReport } = loadModule('forms/buoyancyCheck.js', ['generateBuoyancyReport']);
+        const run = timeLoop(cases, (c) => generateBuoyancyReport(c.sectionData, c.groundInfo));
+        output.reports = run.results;
+        output.timing.buoyancy = run.seconds;
+    }
+    if (engines.includes('dxf')) {
+        const { generateDXF } = loadModule('utils/dxfExport.js', ['generateDXF']);
+        const run = timeLoop(cases, (c) => generateDXF(c.sectionData));
+        output.dxf = run.results;
+        output.timing.dxf = run.seconds;
+    }
+    process.stdout.write(JSON.stringify(output));
+}
+
+main();
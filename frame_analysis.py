@@ -0,0 +1,467 @@
+"""골조 해석 (Frame Analysis) 모듈
+
+암거 단면을 2차원 골조(벽체/슬래브 도심선)로 모델링하여 단위폭(1 m)당
+단면력을 계산한다.
+
+모델
+    절점      : 벽체 도심선과 슬래브 도심선의 교점 + 분점/헌치 분할점
+    부재      : 상부슬래브·하부슬래브 경간, 벽체 (분점 사이를 요소로 분할)
+    강역      : 절점 ~ 부재면 구간은 강성을 크게 하여 강역으로 처리
+    헌치      : 부재면 ~ 헌치끝 구간은 두께가 선형으로 변하므로 2개 요소로 나눠 반영
+    기둥      : 중간벽 형식이 '기둥'이면 강성에 기둥폭/CTC 비율을 곱함
+    지점      : 하부슬래브 요소에 분포 지반반력 스프링 (Winkler, 연직 ks, 수평 ks/3)
+
+단위: 길이 m, 힘 kN, 모멘트 kN·m (단면 입력 mm → m 변환)
+
+부호 (분점 단면력)
+    N : 인장 +
+    V : dM/ds = V (s = 부재 시점 → 종점, 슬래브 좌→우, 벽체 하→상)
+    M : 내측면 인장 + (중간벽은 우측면 인장 +)
+
+같은 단면(형상)에 대해 강성행렬은 한 번만 분해해 두고, 여러 하중경우를
+한 번의 다중 우변 해석(batched solve)으로 푼다.
+"""
+
+import json
+from collections import OrderedDict
+import numpy as np
+from section_layout import get_section_layout
+
+try:
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.linalg import splu
+except ImportError:
+    coo_matrix = None
+    splu = None
+
+RIGID_FACTOR = 100.0          # 강역 강성 배율
+DEFAULT_SUBGRADE_MODULUS = 50000.0   # 지반반력계수 ks (kN/m³)
+
+_MODEL_CACHE_SIZE = 16
+_model_cache = OrderedDict()
+
+
+def concrete_elastic_modulus(fck):
+    """콘크리트 탄성계수 Ec (MPa) = 8,500 ∛(fck + Δf)"""
+    fck = float(fck)
+    if fck <= 40:
+        delta_f = 4.0
+    elif fck >= 60:
+        delta_f = 6.0
+    else:
+        delta_f = 4.0 + (fck - 40) / 10.0
+    return 8500.0 * (fck + delta_f) ** (1.0 / 3.0)
+
+
+class SectionPoint:
+    """분점 (단면력 출력 위치)"""
+
+    def __init__(self, member, label, s, x, y, thickness):
+        self.member = member          # 부재 번호 (FrameModel.members)
+        self.label = label            # 예) '상부슬래브 B1 좌측 부재면'
+        self.s = s                    # 부재 시점으로부터 거리 (m)
+        self.x = x                    # 전체 좌표 (m)
+        self.y = y
+        self.thickness = thickness    # 부재 두께 (mm, 헌치 제외)
+
+
+class FrameModel:
+    """암거 단면 2차원 골조 모델"""
+
+    def __init__(self, section_data, fck=30.0, subgrade_modulus=DEFAULT_SUBGRADE_MODULUS):
+        layout = get_section_layout(section_data)
+        self.layout = layout
+        self.fck = float(fck)
+        self.E = concrete_elastic_modulus(fck) * 1000.0   # kN/m²
+        self.subgrade_modulus = float(subgrade_modulus)
+
+        column_girder = section_data.get('columnGirder', {}) or {}
+        ctc = float(column_girder.get('columnCTC', 3000))
+        col_width = float(column_girder.get('columnWidth', 500))
+        column_ratio = min(col_width / ctc, 1.0) if ctc > 0 else 1.0
+
+        n = layout.culvert_count
+        mm = 0.001
+        # 도심선 좌표 (m)
+        x_wall = [(layout.wall_left[j] + layout.wall_right[j]) / 2 * mm for j in range(n + 1)]
+        y_bot = layout.LT / 2 * mm
+        y_top = (layout.top + layout.UT / 2) * mm
+        self.x_wall = x_wall
+        self.y_bot = y_bot
+        self.y_top = y_top
+
+        self._node_index = {}
+        self.node_xy = []
+        elements = []       # (ni, nj, 두께 m, 강성배율, 기둥 환산비율, 부재번호)
+        self.members = []   # {'name', 'kind', 'index', 'face_sign', 'length', 'thickness'}
+        self.points = []
+        point_elements = []
+
+        def node(x, y):
+            key = (round(x, 9), round(y, 9))
+            idx = self._node_index.get(key)
+            if idx is None:
+                idx = len(self.node_xy)
+                self._node_index[key] = idx
+                self.node_xy.append((x, y))
+            return idx
+
+        def add_member(name, kind, index, p1, p2, thickness, face_sign, start, end, scale=1.0):
+            """부재 추가
+
+            start/end: (강역 길이 m, 헌치 길이 m, 헌치 추가두께 m) - 시점/종점 측
+            """
+            member_no = len(self.members)
+            length = float(np.hypot(p2[0] - p1[0], p2[1] - p1[1]))
+            self.members.append({'name': name, 'kind': kind, 'index': index,
+                                 'face_sign': face_sign, 'length': length,
+                                 'thickness': thickness / mm})
+            t = thickness
+            rigid_i, haunch_i, extra_i = start
+            rigid_j, haunch_j, extra_j = end
+
+            # 요소 분할 위치 (s, 분점 이름)
+            stations = [(0.0, None)]
+
+            def add_station(s, label):
+                s = min(max(s, 0.0), length)
+                if s - stations[-1][0] > 1e-9:
+                    stations.append((s, label))
+                elif label and not stations[-1][1]:
+                    stations[-1] = (stations[-1][0], label)
+
+            start_label, end_label = (('좌측', '우측') if kind != 'wall' else ('하단', '상단'))
+            face_i = rigid_i
+            hend_i = rigid_i + haunch_i
+            face_j = length - rigid_j
+            hend_j = length - rigid_j - haunch_j
+            mid = (face_i + face_j) / 2
+            add_station(face_i, f"{start_label} 부재면")
+            if haunch_i > 0:
+                add_station((face_i + hend_i) / 2, None)
+                add_station(hend_i, f"{start_label} 헌치끝")
+            add_station(mid, "중앙")
+            if haunch_j > 0:
+                add_station(hend_j, f"{end_label} 헌치끝")
+                add_station((hend_j + face_j) / 2, None)
+            add_station(face_j, f"{end_label} 부재면")
+            add_station(length, None)
+
+            def thickness_at(s1, s2):
+                sm = (s1 + s2) / 2
+                if sm < face_i or sm > face_j:
+                    return t, RIGID_FACTOR
+                extra = 0.0
+                if haunch_i > 0 and sm < hend_i:
+                    extra += extra_i * (hend_i - sm) / haunch_i
+                if haunch_j > 0 and sm > hend_j:
+                    extra += extra_j * (sm - hend_j) / haunch_j
+                return t + extra, 1.0
+
+            ux = (p2[0] - p1[0]) / length
+            uy = (p2[1] - p1[1]) / length
+            prev = node(*p1)
+            for k in range(1, len(stations)):
+                s1, s2 = stations[k - 1][0], stations[k][0]
+                if k == len(stations) - 1:
+                    nxt = node(*p2)
+                else:
+                    nxt = node(p1[0] + ux * s2, p1[1] + uy * s2)
+                depth, factor = thickness_at(s1, s2)
+                elements.append((prev, nxt, depth, factor, scale, member_no))
+                label = stations[k][1]
+                if label:
+                    self.points.append(SectionPoint(
+                        member_no, f"{name} {label}", s2,
+                        p1[0] + ux * s2, p1[1] + uy * s2, thickness / mm))
+                    point_elements.append(len(elements) - 1)
+                prev = nxt
+
+        # ── 상부/하부 슬래브 (경간별) ──
+        for kind, y, t, sign, (hi, hj) in (('top', y_top, layout.UT * mm, 1.0, ('ul', 'ur')),
+                                            ('bottom', y_bot, layout.LT * mm, -1.0, ('ll', 'lr'))):
+            slab_name = '상부슬래브' if kind == 'top' else '하부슬래브'
+            for i in range(n):
+                h = layout.haunches[i]
+                half_i = layout.wall_thickness[i] / 2 * mm
+                half_j = layout.wall_thickness[i + 1] / 2 * mm
+                add_member(f"{slab_name} B{i+1}", kind, i, (x_wall[i], y), (x_wall[i + 1], y), t, sign,
+                           (half_i, float(h[hi]['width']) * mm, float(h[hi]['height']) * mm),
+                           (half_j, float(h[hj]['width']) * mm, float(h[hj]['height']) * mm))
+
+        # ── 벽체 ──
+        for j in range(n + 1):
+            if j == 0:
+                name, sign = '좌측벽체', 1.0
+            elif j == n:
+                name, sign = '우측벽체', -1.0
+            else:
+                name, sign = f"중간벽체{j}", 1.0
+            # 벽체 양쪽 칸의 헌치 (높이 = 벽체 방향 길이, 폭 = 추가 두께)
+            sides = []
+            if j > 0:
+                sides.append((layout.haunches[j - 1]['lr'], layout.haunches[j - 1]['ur']))
+            if j < n:
+                sides.append((layout.haunches[j]['ll'], layout.haunches[j]['ul']))
+            lower_len = max(float(lo['height']) for lo, _ in sides) * mm
+            upper_len = max(float(up['height']) for _, up in sides) * mm
+            lower_extra = sum(float(lo['width']) for lo, _ in sides if float(lo['height']) > 0) * mm
+            upper_extra = sum(float(up['width']) for _, up in sides if float(up['height']) > 0) * mm
+            scale = 1.0
+            if 0 < j < n and layout.middle_walls[j - 1].get('type', '연속벽') == '기둥':
+                scale = column_ratio
+            add_member(name, 'wall', j, (x_wall[j], y_bot), (x_wall[j], y_top),
+                       layout.wall_thickness[j] * mm, sign,
+                       (layout.LT / 2 * mm, lower_len, lower_extra),
+                       (layout.UT / 2 * mm, upper_len, upper_extra), scale=scale)
+
+        self.node_xy = np.array(self.node_xy, dtype=float)
+        el = np.array([e[:2] for e in elements], dtype=int)
+        self.elem_nodes = el
+        self.elem_member = np.array([e[5] for e in elements], dtype=int)
+        depth = np.array([e[2] for e in elements], dtype=float)
+        factor = np.array([e[3] * e[4] for e in elements], dtype=float)
+        self.elem_depth = depth                                        # 요소 두께 (m, 헌치 포함)
+        self.elem_rigid = np.array([e[3] > 1.0 for e in elements])     # 강역 요소
+        self.elem_scale = np.array([e[4] for e in elements], dtype=float)   # 기둥 환산비율
+        self.elem_EA = self.E * depth * factor
+        self.elem_EI = self.E * depth ** 3 / 12.0 * factor
+
+        xy1 = self.node_xy[el[:, 0]]
+        xy2 = self.node_xy[el[:, 1]]
+        self.elem_xy = np.hstack([xy1, xy2])
+        d = xy2 - xy1
+        self.elem_length = np.hypot(d[:, 0], d[:, 1])
+        self.elem_cos = d[:, 0] / self.elem_length
+        self.elem_sin = d[:, 1] / self.elem_length
+        self.elem_dofs = np.hstack([el[:, :1] * 3 + np.arange(3), el[:, 1:] * 3 + np.arange(3)])
+        self.n_dof = len(self.node_xy) * 3
+
+        self.point_elements = np.array(point_elements, dtype=int)
+        self.point_face_sign = np.array([self.members[p.member]['face_sign'] for p in self.points])
+
+        self._transform = self._transformation_matrices()
+        self._k_support = self._support_stiffness()
+        self._k_local = self._local_stiffness() + self._k_support
+        self._factor = None
+
+    def node_at(self, x, y):
+        """좌표 (m)의 절점 번호 (없으면 None)"""
+        return self._node_index.get((round(x, 9), round(y, 9)))
+
+    def member_elements(self, kind):
+        """부재 종류('top', 'bottom', 'wall')에 속하는 요소 마스크"""
+        members = [m for m, member in enumerate(self.members) if member['kind'] == kind]
+        return np.isin(self.elem_member, members)
+
+    # ── 요소 행렬 (전체 요소 일괄 계산) ──
+
+    def _transformation_matrices(self):
+        c, s = self.elem_cos, self.elem_sin
+        T = np.zeros((len(c), 6, 6))
+        for o in (0, 3):
+            T[:, o, o] = c
+            T[:, o, o + 1] = s
+            T[:, o + 1, o] = -s
+            T[:, o + 1, o + 1] = c
+            T[:, o + 2, o + 2] = 1.0
+        return T
+
+    def _local_stiffness(self):
+        L = self.elem_length
+        EA = self.elem_EA / L
+        EI = self.elem_EI
+        k = np.zeros((len(L), 6, 6))
+        k[:, 0, 0] = k[:, 3, 3] = EA
+        k[:, 0, 3] = k[:, 3, 0] = -EA
+        a = 12 * EI / L ** 3
+        b = 6 * EI / L ** 2
+        c = 4 * EI / L
+        d = 2 * EI / L
+        k[:, 1, 1] = k[:, 4, 4] = a
+        k[:, 1, 4] = k[:, 4, 1] = -a
+        k[:, 1, 2] = k[:, 2, 1] = k[:, 1, 5] = k[:, 5, 1] = b
+        k[:, 2, 4] = k[:, 4, 2] = k[:, 4, 5] = k[:, 5, 4] = -b
+        k[:, 2, 2] = k[:, 5, 5] = c
+        k[:, 2, 5] = k[:, 5, 2] = d
+        return k
+
+    def _support_stiffness(self):
+        """하부슬래브 요소 분포 지반반력 스프링 강성 (국부좌표, 적합 강성행렬)
+
+        절점에 집중시키면 절점마다 전단력이 반력만큼 불연속이 되어 분점 전단력이
+        좌우 어느 요소에서 읽느냐에 따라 달라지므로, 요소를 따라 분포시킨다.
+        """
+        L = self.elem_length
+        kv = np.where(self.member_elements('bottom'), self.subgrade_modulus, 0.0)
+        kh = kv / 3.0
+        k = np.zeros((len(L), 6, 6))
+        # 축방향 (선형 형상함수)
+        k[:, 0, 0] = k[:, 3, 3] = kh * L / 3
+        k[:, 0, 3] = k[:, 3, 0] = kh * L / 6
+        # 직각방향 (Hermite 형상함수)
+        c = kv * L / 420
+        k[:, 1, 1] = k[:, 4, 4] = 156 * c
+        k[:, 1, 4] = k[:, 4, 1] = 54 * c
+        k[:, 1, 2] = k[:, 2, 1] = 22 * L * c
+        k[:, 4, 5] = k[:, 5, 4] = -22 * L * c
+        k[:, 1, 5] = k[:, 5, 1] = -13 * L * c
+        k[:, 2, 4] = k[:, 4, 2] = 13 * L * c
+        k[:, 2, 2] = k[:, 5, 5] = 4 * L ** 2 * c
+        k[:, 2, 5] = k[:, 5, 2] = -3 * L ** 2 * c
+        return k
+
+    def stiffness_triplets(self):
+        """전체 강성행렬 COO 성분 (rows, cols, values)"""
+        k_global = np.einsum('eji,ejk,ekl->eil', self._transform, self._k_local, self._transform)
+        rows = np.repeat(self.elem_dofs, 6, axis=1).ravel()
+        cols = np.tile(self.elem_dofs, (1, 6)).ravel()
+        return rows, cols, k_global.ravel()
+
+    def factorize(self):
+        """강성행렬 분해 (형상당 1회, 이후 재사용)"""
+        if self._factor is not None:
+            return self._factor
+        rows, cols, values = self.stiffness_triplets()
+        if splu is not None:
+            K = coo_matrix((values, (rows, cols)), shape=(self.n_dof, self.n_dof)).tocsc()
+            lu = splu(K)
+            self._factor = lu.solve
+        else:
+            # SciPy가 없으면 촐레스키 분해 L만 보관하고 전진/후진 대입으로 해석
+            # (밀집 행렬이므로 다경간 모델에서는 SciPy 희소 분해보다 느리다)
+            K = np.zeros((self.n_dof, self.n_dof))
+            np.add.at(K, (rows, cols), values)
+            L = np.linalg.cholesky(K)
+            self._factor = lambda F: _cholesky_solve(L, F)
+        return self._factor
+
+    # ── 하중 ──
+
+    def equivalent_nodal_loads(self, element_loads):
+        """요소 분포하중 → 요소 고정단 등가절점력 (국부좌표)
+
+        Args:
+            element_loads: (하중경우, 요소, 4) 전체좌표 분포하중 [qx_i, qx_j, qy_i, qy_j] (kN/m)
+
+        Returns:
+            (하중경우, 요소, 6) 국부좌표 등가절점력
+        """
+        q = np.asarray(element_loads, dtype=float)
+        c, s, L = self.elem_cos, self.elem_sin, self.elem_length
+        a_i = q[..., 0] * c + q[..., 2] * s      # 축방향
+        a_j = q[..., 1] * c + q[..., 3] * s
+        p_i = -q[..., 0] * s + q[..., 2] * c     # 직각방향
+        p_j = -q[..., 1] * s + q[..., 3] * c
+        f = np.empty(q.shape[:-1] + (6,))
+        f[..., 0] = L * (2 * a_i + a_j) / 6
+        f[..., 3] = L * (a_i + 2 * a_j) / 6
+        f[..., 1] = L * (7 * p_i + 3 * p_j) / 20
+        f[..., 4] = L * (3 * p_i + 7 * p_j) / 20
+        f[..., 2] = L ** 2 * (3 * p_i + 2 * p_j) / 60
+        f[..., 5] = -L ** 2 * (2 * p_i + 3 * p_j) / 60
+        return f
+
+    def solve(self, element_loads, nodal_loads=None):
+        """모든 하중경우를 한 번에 해석
+
+        Args:
+            element_loads: (하중경우, 요소, 4) 전체좌표 분포하중 (equivalent_nodal_loads 참고)
+            nodal_loads: (하중경우, 자유도) 절점하중 (선택)
+
+        Returns:
+            FrameResult
+        """
+        element_loads = np.asarray(element_loads, dtype=float)
+        if element_loads.ndim == 2:
+            element_loads = element_loads[np.newaxis]
+        n_cases = element_loads.shape[0]
+
+        f_local = self.equivalent_nodal_loads(element_loads)
+        f_global = np.einsum('eji,cej->cei', self._transform, f_local)
+        F = np.zeros((n_cases, self.n_dof))
+        np.add.at(F, (np.arange(n_cases)[:, None, None], self.elem_dofs[None]), f_global)
+        if nodal_loads is not None:
+            F += np.asarray(nodal_loads, dtype=float)
+
+        D = self.factorize()(F.T).T      # (하중경우, 자유도)
+
+        d_elem = D[:, self.elem_dofs]     # (하중경우, 요소, 6)
+        d_local = np.einsum('eij,cej->cei', self._transform, d_elem)
+        end_forces = np.einsum('eij,cej->cei', self._k_local, d_local) - f_local
+        return FrameResult(self, D, end_forces)
+
+
+def _triangular_solve(L, B, lower=True, block=64):
+    """삼각행렬 L의 블록 대입 해석 (L X = B 또는 L.T X = B)"""
+    A = L if lower else L.T
+    n = A.shape[0]
+    X = np.empty_like(B)
+    order = range(0, n, block) if lower else reversed(range(0, n, block))
+    for start in order:
+        stop = min(start + block, n)
+        rhs = B[start:stop].copy()
+        if lower and start > 0:
+            rhs -= A[start:stop, :start] @ X[:start]
+        elif not lower and stop < n:
+            rhs -= A[start:stop, stop:] @ X[stop:]
+        X[start:stop] = np.linalg.solve(A[start:stop, start:stop], rhs)
+    return X
+
+
+def _cholesky_solve(L, F):
+    """K = L Lᵀ 로 K X = F 해석 (삼각 대입 2회)"""
+    return _triangular_solve(L, _triangular_solve(L, F, lower=True), lower=False)
+
+
+class FrameResult:
+    """골조 해석 결과 (하중경우 × 분점 배열)"""
+
+    def __init__(self, model, displacements, end_forces):
+        self.model = model
+        self.displacements = displacements     # (하중경우, 자유도)
+        self.end_forces = end_forces           # (하중경우, 요소, 6) 국부좌표 요소 단부력
+
+        # 분점은 해당 위치에서 끝나는 요소의 종점 단부력
+        f = end_forces[:, model.point_elements, :]
+        self.N = f[..., 3]                          # (하중경우, 분점)
+        self.V = -f[..., 4]
+        self.M = f[..., 5] * model.point_face_sign
+
+    @property
+    def points(self):
+        return self.model.points
+
+    def support_reactions(self):
+        """하중경우별 지반반력 합계 (수평, 연직) kN/m"""
+        model = self.model
+        mask = model.member_elements('bottom')
+        T = model._transform[mask]
+        d_local = np.einsum('eij,cej->cei', T, self.displacements[:, model.elem_dofs[mask]])
+        r_local = -np.einsum('eij,cej->cei', model._k_support[mask], d_local)
+        r = np.einsum('eji,cej->cei', T, r_local)     # 전체좌표 (하중경우, 요소, 6)
+        return np.stack([r[..., 0].sum(axis=1) + r[..., 3].sum(axis=1),
+                         r[..., 1].sum(axis=1) + r[..., 4].sum(axis=1)], axis=1)
+
+
+def _model_key(section_data, fck, subgrade_modulus):
+    return json.dumps([
+        section_data.get('culvert_count'), section_data.get('H'), section_data.get('B'),
+        section_data.get('UT'), section_data.get('LT'), section_data.get('WL'),
+        section_data.get('WR'), section_data.get('middle_walls'), section_data.get('haunch'),
+        section_data.get('columnGirder'), fck, subgrade_modulus
+    ], sort_keys=True, default=str)
+
+
+def get_frame_model(section_data, fck=30.0, subgrade_modulus=DEFAULT_SUBGRADE_MODULUS):
+    """단면 형상별 골조 모델 (같은 형상이면 분해된 강성행렬까지 재사용)"""
+    key = _model_key(section_data, fck, subgrade_modulus)
+    model = _model_cache.get(key)
+    if model is None:
+        model = FrameModel(section_data, fck, subgrade_modulus)
+        _model_cache[key] = model
+        if len(_model_cache) > _MODEL_CACHE_SIZE:
+            _model_cache.popitem(last=False)
+    else:
+        _model_cache.move_to_end(key)
+    return model
@@ -0,0 +1,582 @@
+"""도면 이미지 출력 (Headless Render) 모듈
+
+암거 단면(create_culvert_dxf) 또는 부력검토 분할 도형(create_buoyancy_shapes_dxf)
+DXF를 창 없이 SVG로 직접 변환하고, PNG는 SVG를 Qt offscreen으로 그려 만든다.
+여러 프로젝트를 프로세스 풀에서 동시에 출력하므로 보고서 부록 그림과
+프로젝트 라이브러리 미리보기(썸네일)를 한 번에 만들 수 있다.
+
+사용 예
+    python headless_render.py 프로젝트폴더 --out figures --kind section shapes --format svg png
+    python headless_render.py a.json b.escp --out figures --light --width 1600 --stations
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+from xml.sax.saxutils import escape
+
+import ezdxf
+from utils import (create_culvert_dxf, get_app_data_dir, find_intersection, find_midpoint,
+                   polar, calculate_angle)
+from buoyancy_check import create_buoyancy_shapes_dxf
+
+KINDS = ('section', 'shapes')          # 암거 단면 / 부력검토 분할 도형
+FORMATS = ('svg', 'png')
+DEFAULT_WIDTH = 1200                   # 출력 폭 (px)
+THUMBNAIL_WIDTH = 256
+LINE_PX = 1.0                          # 선 두께 (px, 화면의 cosmetic pen처럼 도면 크기와 무관)
+MARGIN = 0.04                          # 도면 범위 대비 여백
+
+# 배경 / 흰색(7번) 선 색상
+THEMES = {
+    'dark': {'background': '#000000', 'white': '#ffffff', 'colors': {}},
+    'light': {'background': '#ffffff', 'white': '#000000', 'colors': {2: '#a08000'}},   # 노랑은 흰 배경에서 어둡게
+}
+
+
+def build_dxf(kind, section_data, ground_info=None):
+    """출력할 DXF 문서 생성"""
+    if kind == 'section':
+        return create_culvert_dxf(section_data, ground_info)
+    if kind == 'shapes':
+        return create_buoyancy_shapes_dxf(section_data)
+    raise ValueError(f"알 수 없는 도면 종류: {kind}")
+
+
+# ========================================
+# DXF → SVG
+# ========================================
+
+def _color(doc, entity, theme, color=None):
+    """DXF 색상 번호 → CSS 색상 (BYLAYER는 레이어 색상)"""
+    index = entity.dxf.color if color is None else color
+    if index in (0, 256):
+        try:
+            index = doc.layers.get(entity.dxf.layer).color
+        except ezdxf.DXFTableEntryError:
+            index = 7
+    if index == 7:
+        return THEMES[theme]['white']
+    if index in THEMES[theme]['colors']:
+        return THEMES[theme]['colors'][index]
+    try:
+        r, g, b = ezdxf.colors.aci2rgb(index)
+    except (IndexError, ValueError):
+        return THEMES[theme]['white']
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def _xy(point):
+    return float(point[0]), float(point[1])
+
+
+class Drawing:
+    """도면 요소 수집 + 도면 범위 계산 (y축은 화면처럼 뒤집음)
+
+    SVG 문자열로 변환하거나(to_svg) QPainter에 직접 그린다(paint).
+    """
+
+    def __init__(self, theme='dark'):
+        self.theme = theme
+        self.items = []          # (종류, 인자)
+        self.xs = []
+        self.ys = []
+
+    def _extend(self, points):
+        for x, y in points:
+            self.xs.append(x)
+            self.ys.append(-y)
+
+    def line(self, p1, p2, color, dashed=False):
+        self._extend([p1, p2])
+        self.items.append(('line', (p1, p2, color, dashed)))
+
+    def polyline(self, points, color, closed=False, fill=None):
+        self._extend(points)
+        self.items.append(('poly', (points, color, closed, fill)))
+
+    def circle(self, center, radius, color):
+        cx, cy = center
+        self._extend([(cx - radius, cy - radius), (cx + radius, cy + radius)])
+        self.items.append(('circle', (center, radius, color)))
+
+    def arc(self, center, radius, start_angle, end_angle, color):
+        span = (end_angle - start_angle) % 360 or 360
+        steps = max(8, int(span / 5))
+        points = [polar(center, math.radians(start_angle + span * k / steps), radius)
+                  for k in range(steps + 1)]
+        self.polyline(points, color)
+
+    def text(self, insert, height, rotation, value, color, anchor='start'):
+        # 범위 계산용 대략의 글자 폭
+        width = len(value) * height * 0.6
+        x, y = insert
+        self._extend([(x, y), polar(insert, math.radians(rotation), width),
+                      polar(insert, math.radians(rotation + 90), height)])
+        self.items.append(('text', (insert, height, rotation, value, color, anchor)))
+
+    def extents(self):
+        if not self.xs:
+            return 0.0, 0.0, 1.0, 1.0
+        return min(self.xs), min(self.ys), max(self.xs), max(self.ys)
+
+    def frame(self):
+        """여백을 포함한 표시 범위 (x, y, 폭, 높이) - y는 뒤집힌 좌표"""
+        x1, y1, x2, y2 = self.extents()
+        w, h = max(x2 - x1, 1.0), max(y2 - y1, 1.0)
+        margin = max(w, h) * MARGIN
+        return x1 - margin, y1 - margin, w + 2 * margin, h + 2 * margin
+
+    def aspect(self):
+        """높이 / 폭"""
+        _, _, w, h = self.frame()
+        return h / w
+
+    def to_svg(self, width=DEFAULT_WIDTH):
+        x1, y1, w, h = self.frame()
+        height = max(1, round(width * h / w))
+        # 좌표는 출력 px 단위 (선 두께, 글자 크기가 도면 크기와 무관)
+        scale = width / w
+        theme = self.theme
+
+        def pt(x, y):
+            return f"{(x - x1) * scale:.2f}", f"{(-y - y1) * scale:.2f}"
+
+        out = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+               f'viewBox="0 0 {width} {height}">',
+               f'<rect width="{width}" height="{height}" fill="{THEMES[theme]["background"]}"/>',
+               f'<g fill="none" stroke-width="{LINE_PX:g}" stroke-linecap="round" '
+               f'stroke-linejoin="round" font-family="Arial, Malgun Gothic, sans-serif">']
+        for kind, args in self.items:
+            if kind == 'line':
+                p1, p2, color, dashed = args
+                (ax, ay), (bx, by) = pt(*p1), pt(*p2)
+                extra = ' stroke-dasharray="6,4"' if dashed else ''
+                out.append(f'<line x1="{ax}" y1="{ay}" x2="{bx}" y2="{by}" stroke="{color}"{extra}/>')
+            elif kind == 'poly':
+                points, color, closed, fill = args
+                tag = 'polygon' if closed else 'polyline'
+                pts = ' '.join(','.join(pt(*p)) for p in points)
+                fill_attr = f' fill="{fill}"' if fill else ''
+                out.append(f'<{tag} points="{pts}" stroke="{color}"{fill_attr}/>')
+            elif kind == 'circle':
+                center, radius, color = args
+                cx, cy = pt(*center)
+                out.append(f'<circle cx="{cx}" cy="{cy}" r="{radius * scale:.2f}" stroke="{color}"/>')
+            elif kind == 'text':
+                insert, size, rotation, value, color, anchor = args
+                tx, ty = pt(*insert)
+                transform = f' transform="rotate({-rotation:.4g} {tx} {ty})"' if rotation else ''
+                out.append(f'<text x="{tx}" y="{ty}" font-size="{size * scale:.2f}" fill="{color}" '
+                           f'stroke="none" text-anchor="{anchor}"{transform}>{escape(value)}</text>')
+        out.append('</g>')
+        out.append('</svg>')
+        return '\n'.join(out)
+
+    def paint(self, painter, rect):
+        """QPainter의 rect 영역에 비율을 유지하여 그림 (PDF에서도 글자가 글자로 남음)"""
+        from PyQt5.QtGui import QColor, QPen, QBrush, QPolygonF, QFont
+        from PyQt5.QtCore import QPointF, QLineF, Qt
+
+        x1, y1, w, h = self.frame()
+        scale = min(rect.width() / w, rect.height() / h)
+        ox = rect.x() + (rect.width() - w * scale) / 2
+        oy = rect.y() + (rect.height() - h * scale) / 2
+
+        def pt(x, y):
+            return QPointF(ox + (x - x1) * scale, oy + (-y - y1) * scale)
+
+        def pen(color, dashed=False):
+            p = QPen(QColor(color))
+            p.setCosmetic(True)
+            p.setWidthF(LINE_PX)
+            if dashed:
+                p.setDashPattern([6, 4])
+            return p
+
+        painter.save()
+        painter.setRenderHint(painter.Antialiasing)
+        painter.fillRect(rect, QColor(THEMES[self.theme]['background']))
+        font = QFont('Arial')
+        for kind, args in self.items:
+            if kind == 'line':
+                p1, p2, color, dashed = args
+                painter.setPen(pen(color, dashed))
+                painter.drawLine(QLineF(pt(*p1), pt(*p2)))
+            elif kind == 'poly':
+                points, color, closed, fill = args
+                painter.setPen(pen(color))
+                polygon = QPolygonF([pt(*p) for p in points])
+                if closed:
+                    painter.setBrush(QBrush(QColor(fill)) if fill else Qt.NoBrush)
+                    painter.drawPolygon(polygon)
+                else:
+                    painter.drawPolyline(polygon)
+            elif kind == 'circle':
+                center, radius, color = args
+                painter.setPen(pen(color))
+                painter.setBrush(Qt.NoBrush)
+                painter.drawEllipse(pt(*center), radius * scale, radius * scale)
+            elif kind == 'text':
+                insert, size, rotation, value, color, anchor = args
+                font.setPixelSize(max(1, round(size * scale)))
+                painter.setFont(font)
+                painter.setPen(QColor(color))
+                painter.save()
+                painter.translate(pt(*insert))
+                if rotation:
+                    painter.rotate(-rotation)
+                dx = -painter.fontMetrics().horizontalAdvance(value) / 2 if anchor == 'middle' else 0
+                painter.drawText(QPointF(dx, 0), value)
+                painter.restore()
+        painter.restore()
+
+
+def _add_dimension(writer, doc, entity, theme):
+    """선형 치수 (화면의 draw_dimension과 같은 배치: 보조선, 치수선, 화살표, 문자)"""
+    style = doc.dimstyles.get(entity.dxf.dimstyle)
+    scale = style.dxf.dimscale
+    text_size = style.dxf.dimtxt * scale
+    arrow = style.dxf.dimasz * scale
+    exo = style.dxf.dimexo * scale
+    exe = getattr(style.dxf, 'dimexe', 1.25) * scale
+    gap = style.dxf.get('dimgap', 0.625) * scale
+    line_color = _color(doc, entity, theme, style.dxf.get('dimclrd', 1) or 1)
+    text_color = _color(doc, entity, theme, style.dxf.get('dimclrt', 7) or 7)
+
+    start, end, defpoint = entity.dxf.defpoint2, entity.dxf.defpoint3, entity.dxf.defpoint
+    angle = math.radians(entity.dxf.get('angle', 0))
+    dim1 = find_intersection(start, angle + math.pi / 2, defpoint, angle)
+    dim2 = find_intersection(end, angle + math.pi / 2, defpoint, angle)
+    if dim1 is None or dim2 is None:
+        return
+    start, end, dim1, dim2 = _xy(start), _xy(end), _xy(dim1), _xy(dim2)
+
+    for origin, dim_point in ((start, dim1), (end, dim2)):
+        direction = calculate_angle(origin, dim_point)
+        writer.line(polar(origin, direction, exo), polar(dim_point, direction, exe), line_color)
+    writer.line(dim1, dim2, line_color)
+    if arrow > 0:
+        for tip, direction in ((dim1, angle), (dim2, angle + math.pi)):
+            writer.polyline([tip, polar(tip, direction + math.pi + 0.15, arrow),
+                             polar(tip, direction + math.pi - 0.15, arrow)],
+                            line_color, closed=True, fill=line_color)
+
+    value = entity.dxf.get('text', '<>')
+    if value in ('<>', ''):
+        measured = abs((end[0] - start[0]) * math.cos(angle) + (end[1] - start[1]) * math.sin(angle))
+        value = f"{measured:.0f}"
+    text_point = polar(find_midpoint(dim1, dim2), angle + math.pi / 2, gap)
+    writer.text(text_point, text_size, math.degrees(angle), value, text_color, anchor='middle')
+
+
+def dxf_to_drawing(doc, theme='dark'):
+    """DXF 문서 → Drawing (LINE, LWPOLYLINE, CIRCLE, ARC, TEXT, DIMENSION)"""
+    writer = Drawing(theme)
+    for entity in doc.modelspace():
+        kind = entity.dxftype()
+        if kind == 'LINE':
+            writer.line(_xy(entity.dxf.start), _xy(entity.dxf.end), _color(doc, entity, theme),
+                        dashed=entity.dxf.get('linetype', '') == 'DASHED')
+        elif kind == 'LWPOLYLINE':
+            # 화면 표시(QGraphicsPolygonItem)처럼 항상 닫힌 도형으로 그림
+            writer.polyline([_xy(p) for p in entity.get_points('xy')], _color(doc, entity, theme),
+                            closed=True)
+        elif kind == 'CIRCLE':
+            writer.circle(_xy(entity.dxf.center), entity.dxf.radius, _color(doc, entity, theme))
+        elif kind == 'ARC':
+            writer.arc(_xy(entity.dxf.center), entity.dxf.radius, entity.dxf.start_angle,
+                       entity.dxf.end_angle, _color(doc, entity, theme))
+        elif kind == 'TEXT':
+            writer.text(_xy(entity.dxf.insert), entity.dxf.height, entity.dxf.get('rotation', 0),
+                        entity.dxf.text, _color(doc, entity, theme))
+        elif kind == 'DIMENSION':
+            _add_dimension(writer, doc, entity, theme)
+    return writer
+
+
+def dxf_to_svg(doc, width=DEFAULT_WIDTH, theme='dark'):
+    """DXF 문서 → SVG 문자열"""
+    return dxf_to_drawing(doc, theme).to_svg(width)
+
+
+def render_drawing(kind, section_data, ground_info=None, theme='dark'):
+    """단면 데이터 → Drawing"""
+    return dxf_to_drawing(build_dxf(kind, section_data, ground_info), theme)
+
+
+def render_svg(kind, section_data, ground_info=None, width=DEFAULT_WIDTH, theme='dark'):
+    """단면 데이터 → SVG 문자열"""
+    return render_drawing(kind, section_data, ground_info, theme).to_svg(width)
+
+
+# ========================================
+# SVG → PNG (Qt offscreen)
+# ========================================
+
+def ensure_qt_gui():
+    """그리기에 필요한 QGuiApplication (없으면 offscreen으로 생성)"""
+    from PyQt5.QtGui import QGuiApplication
+    app = QGuiApplication.instance()
+    if app is None:
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        app = QGuiApplication([])
+        globals()['_qt_app'] = app       # 프로세스가 끝날 때까지 유지
+    return app
+
+
+def svg_to_png(svg_text, file_path, width=None):
+    """SVG 문자열을 PNG 파일로 저장 (크기는 SVG의 width/height, width를 주면 비율 유지)"""
+    ensure_qt_gui()
+    from PyQt5.QtSvg import QSvgRenderer
+    from PyQt5.QtGui import QImage, QPainter
+    from PyQt5.QtCore import QByteArray
+
+    renderer = QSvgRenderer(QByteArray(svg_text.encode('utf-8')))
+    if not renderer.isValid():
+        raise ValueError("SVG를 읽을 수 없습니다")
+    size = renderer.defaultSize()
+    if width:
+        size.setHeight(max(1, round(size.height() * width / max(size.width(), 1))))
+        size.setWidth(width)
+    image = QImage(size, QImage.Format_ARGB32)
+    image.fill(0)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setRenderHint(QPainter.TextAntialiasing)
+    renderer.render(painter)
+    painter.end()
+    if not image.save(file_path, 'PNG'):
+        raise OSError(f"PNG 저장 실패: {file_path}")
+    return file_path
+
+
+def render_png(kind, section_data, file_path, ground_info=None, width=DEFAULT_WIDTH, theme='dark'):
+    """단면 데이터 → PNG 파일"""
+    return svg_to_png(render_svg(kind, section_data, ground_info, width, theme), file_path)
+
+
+# ========================================
+# 프로젝트 일괄 출력
+# ========================================
+
+def _project_drawings(project_path, stations):
+    """프로젝트 파일 → (이름 접미사, 단면제원, 지반정보) 순서대로 생성"""
+    from project_container import read_project_file
+    data, container = read_project_file(project_path)
+    section_data = data.get('sectionData') or {}
+    ground_info = data.get('groundInfo') or {}
+    yield '', section_data, ground_info
+    if stations:
+        from quantity_takeoff import station_section
+        station_list = container.iter_stations() if container is not None \
+            else data.get('stations') or []
+        for k, station in enumerate(station_list, 1):
+            yield f"_st{k:04d}", station_section(section_data, station), ground_info
+
+
+def output_stems(project_paths):
+    """프로젝트별 출력 파일 이름 앞부분 {경로: 이름}
+
+    보통은 파일 이름(확장자 제외)이고, 다른 폴더의 같은 이름이나 p.json/p.escp처럼
+    겹치는 이름에는 경로 해시 8자리를 붙인다.
+    """
+    stems = {path: os.path.splitext(os.path.basename(path))[0] for path in project_paths}
+    counts = Counter(stems.values())
+    for path, stem in stems.items():
+        if counts[stem] > 1:
+            digest = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:8]
+            stems[path] = f"{stem}_{digest}"
+    return stems
+
+
+def render_project(project_path, out_dir, kinds=('section',), formats=FORMATS,
+                   width=DEFAULT_WIDTH, theme='dark', stations=False, stem=None):
+    """프로젝트 하나의 그림 파일 출력 → 저장한 파일 경로 목록
+
+    stem: 출력 파일 이름 앞부분 (없으면 프로젝트 파일 이름)
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    stem = stem or os.path.splitext(os.path.basename(project_path))[0]
+    outputs = []
+    for suffix, section_data, ground_info in _project_drawings(project_path, stations):
+        if not section_data.get('B'):
+            continue
+        for kind in kinds:
+            svg = render_svg(kind, section_data, ground_info, width, theme)
+            base = os.path.join(out_dir, f"{stem}{suffix}_{kind}")
+            if 'svg' in formats:
+                with open(base + '.svg', 'w', encoding='utf-8') as f:
+                    f.write(svg)
+                outputs.append(base + '.svg')
+            if 'png' in formats:
+                outputs.append(svg_to_png(svg, base + '.png'))
+    return outputs
+
+
+def _render_task(project_path, stem, out_dir, kinds, formats, width, theme, stations):
+    """작업자 프로세스용 (예외는 메시지로 돌려줌)"""
+    try:
+        return project_path, render_project(project_path, out_dir, kinds, formats, width,
+                                            theme, stations, stem), None
+    except Exception as e:
+        return project_path, [], f"{type(e).__name__}: {e}"
+
+
+def render_batch(project_paths, out_dir, kinds=('section',), formats=FORMATS, width=DEFAULT_WIDTH,
+                 theme='dark', stations=False, workers=None, progress=None):
+    """여러 프로젝트를 동시에 출력
+
+    출력 파일 이름은 output_stems로 미리 정하고, 그래도 두 프로젝트가 같은
+    파일을 썼으면 해당 프로젝트를 오류로 돌려준다.
+
+    Returns:
+        {프로젝트 경로: (출력 파일 목록, 오류 메시지 또는 None)}
+    """
+    # 같은 파일이 두 번 들어오면 한 번만 출력 (폴더와 파일을 함께 지정한 경우 등)
+    project_paths = list({os.path.abspath(p): p for p in project_paths}.values())
+    stems = output_stems(project_paths)
+    workers = workers or os.cpu_count() or 1
+    args = (out_dir, tuple(kinds), tuple(formats), width, theme, stations)
+    results = {}
+    if workers <= 1 or len(project_paths) <= 1:
+        for k, path in enumerate(project_paths, 1):
+            _, outputs, error = _render_task(path, stems[path], *args)
+            results[path] = (outputs, error)
+            if progress:
+                progress(k, len(project_paths))
+        return _check_collisions(results)
+
+    # Qt/수치 라이브러리 상태를 복제하지 않도록 spawn 사용 (Windows와 동일)
+    with ProcessPoolExecutor(max_workers=min(workers, len(project_paths)),
+                             mp_context=multiprocessing.get_context('spawn')) as pool:
+        futures = [pool.submit(_render_task, path, stems[path], *args) for path in project_paths]
+        for k, future in enumerate(as_completed(futures), 1):
+            path, outputs, error = future.result()
+            results[path] = (outputs, error)
+            if progress:
+                progress(k, len(project_paths))
+    return _check_collisions(results)
+
+
+def _check_collisions(results):
+    """여러 프로젝트가 같은 출력 파일을 쓴 경우 해당 프로젝트를 오류로 표시"""
+    writers = Counter(os.path.abspath(out) for outputs, _ in results.values() for out in outputs)
+    for path, (outputs, error) in results.items():
+        clashes = [out for out in outputs if writers[os.path.abspath(out)] > 1]
+        if clashes and error is None:
+            results[path] = ([out for out in outputs if out not in clashes],
+                             f"출력 파일 이름 충돌: {', '.join(os.path.basename(c) for c in clashes[:3])}")
+    return results
+
+
+# ── 프로젝트 라이브러리 미리보기 ──
+
+def thumbnail_dir():
+    return get_app_data_dir('thumbnails')
+
+
+def thumbnail_path(content_hash):
+    """파일 내용 해시별 미리보기 PNG 경로 (내용이 같으면 다시 만들지 않음)"""
+    return os.path.join(thumbnail_dir(), f"{content_hash[:32]}.png")
+
+
+def _thumbnail_task(project_path, target):
+    try:
+        from project_container import read_project_file
+        data, _ = read_project_file(project_path)
+        svg = render_svg('section', data.get('sectionData') or {}, data.get('groundInfo') or {},
+                         THUMBNAIL_WIDTH, 'light')
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        tmp = f"{target}.{os.getpid()}.tmp.png"
+        svg_to_png(svg, tmp)
+        os.replace(tmp, target)
+        return project_path, None
+    except Exception as e:
+        return project_path, f"{type(e).__name__}: {e}"
+
+
+def render_thumbnails(items, workers=None, progress=None):
+    """미리보기가 없는 프로젝트만 동시에 생성
+
+    Args:
+        items: [(프로젝트 경로, 내용 해시), ...]
+
+    Returns:
+        (생성 수, {프로젝트 경로: 오류 메시지})
+    """
+    todo = [(path, thumbnail_path(sha)) for path, sha in items
+            if sha and not os.path.exists(thumbnail_path(sha))]
+    errors = {}
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(todo) <= 1:
+        done = (_thumbnail_task(path, target) for path, target in todo)
+        for k, (path, error) in enumerate(done, 1):
+            if error:
+                errors[path] = error
+            if progress:
+                progress(k, len(todo))
+        return len(todo) - len(errors), errors
+    with ProcessPoolExecutor(max_workers=min(workers, len(todo)),
+                             mp_context=multiprocessing.get_context('spawn')) as pool:
+        futures = [pool.submit(_thumbnail_task, path, target) for path, target in todo]
+        for k, future in enumerate(as_completed(futures), 1):
+            path, error = future.result()
+            if error:
+                errors[path] = error
+            if progress:
+                progress(k, len(todo))
+    return len(todo) - len(errors), errors
+
+
+def _collect_projects(inputs):
+    from project_library import PROJECT_EXTENSIONS
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _, files in os.walk(item):
+                paths.extend(os.path.join(root, name) for name in sorted(files)
+                             if name.lower().endswith(PROJECT_EXTENSIONS))
+        else:
+            paths.append(item)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='암거 단면/분할 도형 그림 일괄 출력 (SVG/PNG)')
+    parser.add_argument('inputs', nargs='+', help='프로젝트 파일 또는 폴더')
+    parser.add_argument('--out', default='figures', help='출력 폴더')
+    parser.add_argument('--kind', nargs='+', choices=KINDS, default=['section'], help='도면 종류')
+    parser.add_argument('--format', nargs='+', choices=FORMATS, default=list(FORMATS), help='출력 형식')
+    parser.add_argument('--width', type=int, default=DEFAULT_WIDTH, help='그림 폭 (px)')
+    parser.add_argument('--light', action='store_true', help='흰 배경 (보고서용)')
+    parser.add_argument('--stations', action='store_true', help='측점별 단면도 출력')
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본 CPU 수)')
+    args = parser.parse_args(argv)
+
+    paths = _collect_projects(args.inputs)
+    if not paths:
+        print("프로젝트 파일이 없습니다", file=sys.stderr)
+        return 2
+    start = time.perf_counter()
+    results = render_batch(paths, args.out, args.kind, args.format, args.width,
+                           'light' if args.light else 'dark', args.stations, args.workers,
+                           progress=lambda i, n: print(f"\r출력 {i}/{n}", end='', file=sys.stderr,
+                                                       flush=True))
+    print(file=sys.stderr)
+    files = sum(len(outputs) for outputs, _ in results.values())
+    failed = {path: error for path, (_, error) in results.items() if error}
+    for path, error in failed.items():
+        print(f"실패: {path}: {error}")
+    print(f"프로젝트 {len(results)}개, 파일 {files}개 출력 ({time.perf_counter() - start:.1f}s) → {args.out}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""성능 계측 (Instrumentation) 모듈
+
+표 읽기, 도형 생성, 치수 그리기, 화면 표시 같은 주요 단계를 이름 있는
+시간 구간(span)으로 기록한다. 기본은 꺼져 있으며, 꺼져 있을 때 span()은
+미리 만든 빈 컨텍스트를 돌려주고 timed 데코레이터는 플래그 확인 한 번만
+하므로 비용이 거의 없다.
+
+기록한 구간은 Chrome Trace Event 형식(JSON)으로 내보내
+chrome://tracing 또는 Perfetto(ui.perfetto.dev)에서 볼 수 있다.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtCore import Qt, QTimer
+
+MAX_EVENTS = 100_000     # 보관할 최대 구간 수 (오래된 것부터 버림)
+
+_enabled = False
+_events = deque(maxlen=MAX_EVENTS)     # (이름, 시작 ns, 길이 ns, 스레드 id)
+_stats = {}                            # 이름 → [횟수, 합계 ns, 최근 ns, 최대 ns]
+_lock = threading.Lock()
+_origin_ns = time.perf_counter_ns()
+
+
+def is_enabled():
+    return _enabled
+
+
+def set_enabled(enabled):
+    """계측 켜기/끄기"""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def clear():
+    """기록 삭제"""
+    with _lock:
+        _events.clear()
+        _stats.clear()
+
+
+def _record(name, start, duration):
+    _events.append((name, start, duration, threading.get_ident()))
+    with _lock:
+        stat = _stats.get(name)
+        if stat is None:
+            _stats[name] = [1, duration, duration, duration]
+        else:
+            stat[0] += 1
+            stat[1] += duration
+            stat[2] = duration
+            if duration > stat[3]:
+                stat[3] = duration
+
+
+class _Span:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        _record(self.name, self.start, time.perf_counter_ns() - self.start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name):
+    """시간 구간 컨텍스트 (계측이 꺼져 있으면 아무것도 하지 않음)
+
+    예: with span('scene.display_dxf'): ...
+    """
+    return _Span(name) if _enabled else _NULL_SPAN
+
+
+def timed(name):
+    """함수 전체를 시간 구간으로 기록하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(name, start, time.perf_counter_ns() - start)
+        return wrapper
+    return decorator
+
+
+def stage_stats():
+    """단계별 통계 [(이름, 횟수, 평균 ms, 최근 ms, 최대 ms), ...] (이름순)"""
+    with _lock:
+        items = sorted(_stats.items())
+    return [(name, count, total / count / 1e6, last / 1e6, peak / 1e6)
+            for name, (count, total, last, peak) in items]
+
+
+def chrome_trace():
+    """Chrome Trace Event 형식 데이터 (완료 이벤트 'X', 시간 단위 µs)"""
+    pid = os.getpid()
+    events = [{'name': name, 'cat': name.split('.', 1)[0], 'ph': 'X',
+               'ts': (start - _origin_ns) / 1000, 'dur': duration / 1000,
+               'pid': pid, 'tid': tid}
+              for name, start, duration, tid in list(_events)]
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+def export_chrome_trace(file_path):
+    """기록한 구간을 trace 파일(JSON)로 저장. 저장한 구간 수 반환"""
+    data = chrome_trace()
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    return len(data['traceEvents'])
+
+
+class TimingOverlay(QLabel):
+    """그림 영역 위에 단계별 소요 시간과 씬 아이템 개수를 표시하는 반투명 패널"""
+
+    REFRESH_MS = 500
+
+    def __init__(self, view):
+        super().__init__(view.viewport())
+        self.view = view
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setTextFormat(Qt.PlainText)
+        self.setStyleSheet("background-color: rgba(0, 0, 0, 160); color: #e0e0e0;"
+                           " font-family: Consolas, monospace; font-size: 9pt; padding: 6px;")
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.hide()
+
+    def set_active(self, active):
+        """표시 + 주기적 갱신 시작/중지"""
+        if active:
+            self.refresh()
+            self.show()
+            self.raise_()
+            self.timer.start(self.REFRESH_MS)
+        else:
+            self.timer.stop()
+            self.hide()
+
+    def refresh(self):
+        scene = self.view.scene()
+        lines = [f"{'단계':<36}{'최근':>9}{'평균':>9}{'최대':>9}{'횟수':>6}"]
+        for name, count, avg, last, peak in stage_stats():
+            lines.append(f"{name:<36}{last:>7.1f}ms{avg:>7.1f}ms{peak:>7.1f}ms{count:>6}")
+        if len(lines) == 1:
+            lines.append("(기록 없음)")
+        lines.append(f"씬 아이템 {len(scene.items()) if scene else 0:,}개")
+        self.setText('\n'.join(lines))
+        self.adjustSize()
+        self.move(8, 8)
@@ -0,0 +1,261 @@
+"""하중경우 / 하중조합 (Load Cases) 모듈
+
+지반정보(토피, 지하수위, 내부마찰각, 흙 단위중량)와 단면 치수로 골조 해석용
+기본 하중경우를 만들고, 하중계수 행렬과의 행렬곱 한 번으로 모든 하중조합의
+단면력을 구한다.
+
+기본 하중경우 (단위폭 1 m 당, 골조 요소 분포하중 배열)
+    DC : 구조물 자중
+    EV : 연직토압 (지하수위 아래는 수중단위중량)
+    EH : 수평토압 (정지토압 K0 = 1 - sin φ)
+    ES : 상재하중 (연직 q, 수평 K0·q)
+    WP : 외측 수압 (벽체 수평 + 상부슬래브 연직)
+    UP : 부력 (하부슬래브 양압력)
+
+도심선 밖으로 나간 부분(외벽 바깥 절반, 슬래브 바깥 절반)의 하중은
+모서리 절점의 집중하중으로 더한다.
+"""
+
+import math
+import numpy as np
+from buoyancy_check import GAMMA_C, GAMMA_W
+from frame_analysis import get_frame_model
+
+DEFAULT_SURCHARGE = 10.0   # 상재하중 (kN/m²)
+
+LOAD_CASES = [
+    ('DC', '구조물 자중'),
+    ('EV', '연직토압'),
+    ('EH', '수평토압'),
+    ('ES', '상재하중'),
+    ('WP', '수압'),
+    ('UP', '부력'),
+]
+
+# 극한한계상태 하중계수 후보 (최대, 최소) - 조합은 후보의 모든 경우
+STRENGTH_FACTORS = {
+    'DC': (1.25, 0.90),
+    'EV': (1.35, 0.90),
+    'EH': (1.35, 0.90),
+    'ES': (1.50, 0.75, 0.0),
+    'WP': (1.00,),
+    'UP': (1.00, 0.0),
+}
+
+
+class LoadCases:
+    """기본 하중경우 (요소 분포하중 + 절점하중 배열)"""
+
+    def __init__(self, names, labels, element_loads, nodal_loads):
+        self.names = names                    # ['DC', 'EV', ...]
+        self.labels = labels                  # ['구조물 자중', ...]
+        self.element_loads = element_loads    # (하중경우, 요소, 4) [qx_i, qx_j, qy_i, qy_j]
+        self.nodal_loads = nodal_loads        # (하중경우, 자유도)
+
+    def index(self, name):
+        return self.names.index(name)
+
+
+class LoadCombinations:
+    """하중조합 (하중계수 행렬)"""
+
+    def __init__(self, names, factors, case_names):
+        self.names = names                    # ['LC1', ...]
+        self.factors = factors                # (조합, 하중경우)
+        self.case_names = case_names
+
+    def __len__(self):
+        return len(self.names)
+
+    def describe(self, k):
+        """조합 k의 설명 (예: '1.25DC + 1.35EV + ...')"""
+        terms = [f"{f:g}{name}" for f, name in zip(self.factors[k], self.case_names) if f]
+        return ' + '.join(terms) if terms else '-'
+
+    def combine(self, case_values):
+        """하중경우별 값 (하중경우, ...) → 조합별 값 (조합, ...) 행렬곱"""
+        return np.tensordot(self.factors, case_values, axes=(1, 0))
+
+
+def _soil_stresses(y, ground_info, y_ground):
+    """높이 y (m, 구조물 하단 기준)의 연직 유효응력과 수압 (kN/m²)"""
+    gamma_s = float(ground_info.get('soilUnitWeight', 18.0))
+    dw = float(ground_info.get('groundwaterLevel', 3000)) / 1000
+    depth = np.maximum(y_ground - np.asarray(y, dtype=float), 0.0)
+    dry = np.minimum(depth, dw)
+    wet = np.maximum(depth - dw, 0.0)
+    sigma_v = gamma_s * dry + (gamma_s - GAMMA_W) * wet
+    water = GAMMA_W * wet
+    return sigma_v, water
+
+
+def generate_load_cases(model, section_data, ground_info, surcharge=DEFAULT_SURCHARGE):
+    """골조 모델의 기본 하중경우 생성
+
+    Args:
+        model: frame_analysis.FrameModel
+        section_data: 단면제원 데이터
+        ground_info: 지반정보 데이터
+        surcharge: 지표 상재하중 (kN/m²)
+
+    Returns:
+        LoadCases
+    """
+    layout = model.layout
+    mm = 0.001
+    names = [name for name, _ in LOAD_CASES]
+    labels = [label for _, label in LOAD_CASES]
+    n_elem = len(model.elem_nodes)
+    q = np.zeros((len(names), n_elem, 4))
+    P = np.zeros((len(names), model.n_dof))
+    DC, EV, EH, ES, WP, UP = range(len(names))
+
+    anti_float = section_data.get('antiFloat', {}) or {}
+    af_thickness = float(anti_float.get('thickness', 300)) if anti_float.get('use', False) else 0.0
+    left_ext = float(anti_float.get('leftExtension', 500)) * mm if af_thickness else 0.0
+    right_ext = float(anti_float.get('rightExtension', 500)) * mm if af_thickness else 0.0
+
+    earth_cover = float(ground_info.get('earthCoverDepth', 2000)) * mm
+    phi = math.radians(float(ground_info.get('frictionAngle', 30)))
+    K0 = 1.0 - math.sin(phi)
+    top_surface = layout.total_height * mm
+    y_ground = top_surface + earth_cover
+    bottom_surface = -af_thickness * mm
+
+    top = model.member_elements('top')
+    bottom = model.member_elements('bottom')
+    wall = model.member_elements('wall')
+    y_i = model.elem_xy[:, 1]
+    y_j = model.elem_xy[:, 3]
+
+    x_left, x_right = model.x_wall[0], model.x_wall[-1]
+    overhang_left = layout.WL / 2 * mm
+    overhang_right = layout.WR / 2 * mm
+    corners = {
+        ('top', 'left'): model.node_at(x_left, model.y_top),
+        ('top', 'right'): model.node_at(x_right, model.y_top),
+        ('bottom', 'left'): model.node_at(x_left, model.y_bot),
+        ('bottom', 'right'): model.node_at(x_right, model.y_bot),
+    }
+
+    def add_vertical(case, mask, value, overhang=True, level='top'):
+        """슬래브 요소에 등분포 연직하중 (아래 방향 -) + 바깥 절반 집중하중"""
+        q[case, mask, 2] += value
+        q[case, mask, 3] += value
+        if overhang:
+            P[case, corners[(level, 'left')] * 3 + 1] += value * overhang_left
+            P[case, corners[(level, 'right')] * 3 + 1] += value * overhang_right
+
+    def add_lateral(case, pressure_at):
+        """외벽 양쪽에 수평 분포압력 (좌측벽 +x, 우측벽 -x) + 상/하단 바깥 구간 집중하중"""
+        left = wall & np.isin(model.elem_member, [m for m, mb in enumerate(model.members)
+                                                   if mb['kind'] == 'wall' and mb['index'] == 0])
+        right = wall & np.isin(model.elem_member, [m for m, mb in enumerate(model.members)
+                                                    if mb['kind'] == 'wall'
+                                                    and mb['index'] == layout.culvert_count])
+        p_i, p_j = pressure_at(y_i), pressure_at(y_j)
+        for mask, sign, side in ((left, 1.0, 'left'), (right, -1.0, 'right')):
+            q[case, mask, 0] += sign * p_i[mask]
+            q[case, mask, 1] += sign * p_j[mask]
+            # 도심선 위/아래 바깥 구간 (사다리꼴 합력)
+            for level, y1, y2 in (('top', model.y_top, top_surface),
+                                  ('bottom', bottom_surface, model.y_bot)):
+                force = (pressure_at(y1) + pressure_at(y2)) / 2 * abs(y2 - y1)
+                P[case, corners[(level, side)] * 3] += sign * float(force)
+
+    # ── DC: 구조물 자중 ──
+    # 벽체 강역은 슬래브와 겹치고, 헌치는 슬래브 요소에서 이미 반영되므로 벽체는 기본 두께만 사용
+    member_thickness = np.array([mb['thickness'] for mb in model.members])[model.elem_member] * mm
+    depth = np.where(wall, member_thickness, model.elem_depth)
+    self_weight = -GAMMA_C * depth * model.elem_scale
+    self_weight = np.where(wall & model.elem_rigid, 0.0, self_weight)
+    q[DC, :, 2] = self_weight
+    q[DC, :, 3] = self_weight
+    for level, t in (('top', layout.UT * mm), ('bottom', layout.LT * mm)):
+        P[DC, corners[(level, 'left')] * 3 + 1] -= GAMMA_C * t * overhang_left
+        P[DC, corners[(level, 'right')] * 3 + 1] -= GAMMA_C * t * overhang_right
+    if af_thickness > 0:
+        # 부상방지저판: 하부슬래브 폭 부분은 분포, 확장부는 모서리 집중하중
+        af_weight = GAMMA_C * af_thickness * mm
+        add_vertical(DC, bottom, -af_weight, level='bottom')
+        P[DC, corners[('bottom', 'left')] * 3 + 1] -= af_weight * left_ext
+        P[DC, corners[('bottom', 'right')] * 3 + 1] -= af_weight * right_ext
+
+    # ── EV: 연직토압 ──
+    sigma_top, water_top = _soil_stresses(top_surface, ground_info, y_ground)
+    add_vertical(EV, top, -float(sigma_top))
+
+    # ── EH: 수평토압 (정지토압) ──
+    add_lateral(EH, lambda y: K0 * _soil_stresses(y, ground_info, y_ground)[0])
+
+    # ── ES: 상재하중 ──
+    if surcharge:
+        add_vertical(ES, top, -surcharge)
+        add_lateral(ES, lambda y: K0 * surcharge * np.ones_like(np.asarray(y, dtype=float)))
+
+    # ── WP: 수압 (벽체 + 상부슬래브) ──
+    add_lateral(WP, lambda y: _soil_stresses(y, ground_info, y_ground)[1])
+    if water_top > 0:
+        add_vertical(WP, top, -float(water_top))
+
+    # ── UP: 부력 (하부슬래브 양압력) ──
+    _, water_bottom = _soil_stresses(bottom_surface, ground_info, y_ground)
+    if water_bottom > 0:
+        add_vertical(UP, bottom, float(water_bottom), level='bottom')
+        # 부상방지저판 확장부에 작용하는 양압력
+        P[UP, corners[('bottom', 'left')] * 3 + 1] += float(water_bottom) * left_ext
+        P[UP, corners[('bottom', 'right')] * 3 + 1] += float(water_bottom) * right_ext
+
+    return LoadCases(names, labels, q, P)
+
+
+def generate_load_combinations(case_names, factor_table=None, include_service=True):
+    """하중계수 후보의 모든 조합으로 하중조합 생성 (계수 행렬 한 번에 구성)
+
+    Args:
+        case_names: 하중경우 이름 목록
+        factor_table: {하중경우: (계수 후보, ...)} (기본 STRENGTH_FACTORS)
+        include_service: 사용하중 조합(모든 계수 1.0) 추가 여부
+
+    Returns:
+        LoadCombinations
+    """
+    factor_table = factor_table or STRENGTH_FACTORS
+    options = [np.asarray(factor_table.get(name, (1.0,)), dtype=float) for name in case_names]
+    grids = np.meshgrid(*options, indexing='ij')
+    factors = np.stack([g.ravel() for g in grids], axis=1)
+    # 중복 제거 (후보가 같은 값인 경우)
+    factors = np.unique(factors, axis=0)[::-1]
+    names = [f"LC{k+1}" for k in range(len(factors))]
+    if include_service:
+        factors = np.vstack([np.ones((1, len(case_names))), factors])
+        names = ['SERVICE'] + names
+    return LoadCombinations(names, factors, list(case_names))
+
+
+class SectionAnalysis:
+    """단면 해석 결과 (하중경우 + 하중조합 단면력)"""
+
+    def __init__(self, model, cases, combinations, case_result):
+        self.model = model
+        self.cases = cases
+        self.combinations = combinations
+        self.case_result = case_result
+        # (조합, 분점) 단면력
+        self.N = combinations.combine(case_result.N)
+        self.V = combinations.combine(case_result.V)
+        self.M = combinations.combine(case_result.M)
+
+    @property
+    def points(self):
+        return self.model.points
+
+
+def analyze_section(section_data, ground_info, fck=30.0, surcharge=DEFAULT_SURCHARGE,
+                    factor_table=None):
+    """단면 골조해석 + 하중조합 (조합별 분점 단면력)"""
+    model = get_frame_model(section_data, fck)
+    cases = generate_load_cases(model, section_data, ground_info, surcharge)
+    combinations = generate_load_combinations(cases.names, factor_table)
+    case_result = model.solve(cases.element_loads, cases.nodal_loads)
+    return SectionAnalysis(model, cases, combinations, case_result)
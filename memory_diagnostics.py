@@ -0,0 +1,302 @@
+"""메모리 진단 (Memory Diagnostics) 모듈
+
+작업(단면 그리기, 트리 메뉴 선택, 부력검토)마다 씬 아이템 수, 살아 있는
+위젯/QObject 수, Python 객체 수와 힙 사용량, 프로세스 메모리를 기록하고,
+최근 기록에서 계속 늘어나기만 하는 항목을 누수 의심으로 표시한다.
+
+장시간 사용을 흉내 내는 소크 테스트도 포함한다 (창을 띄우지 않음).
+    python memory_diagnostics.py --edits 2000
+임시 폴더를 사용자 폴더로 써서 실제 자동저장/캐시에는 영향을 주지 않으며,
+메모리가 기준 범위를 넘어 늘어나면 종료 코드 1을 반환한다.
+"""
+
+import argparse
+import functools
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QObject, QEvent
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# 항목 (키, 이름, 누수 의심 최소 증가량)
+METRICS = [
+    ('scene_items', '씬 아이템', 50),
+    ('widgets', '위젯', 20),
+    ('qobjects', 'QObject (창 하위)', 50),
+    ('py_objects', 'Python 객체', 5000),
+    ('py_heap', 'Python 힙 (byte)', 5 * 1024 * 1024),
+    ('rss', '프로세스 메모리 (byte)', 20 * 1024 * 1024),
+]
+GROWTH_WINDOW = 10      # 연속 증가를 확인할 최근 기록 수
+MAX_SAMPLES = 5000
+
+
+def process_memory():
+    """프로세스 상주 메모리 (byte, 알 수 없으면 None)"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def take_sample(window=None, scene=None):
+    """현재 메모리 상태 {항목 키: 값}"""
+    sample = {
+        'scene_items': len(scene.items()) if scene is not None else None,
+        'widgets': len(QApplication.allWidgets()) if QApplication.instance() else None,
+        'qobjects': len(window.findChildren(QObject)) if window is not None else None,
+        'py_objects': len(gc.get_objects()),
+        'py_heap': tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None,
+        'rss': process_memory(),
+    }
+    return sample
+
+
+def detect_growth(samples, window=GROWTH_WINDOW):
+    """최근 window개 기록에서 한 번도 줄지 않고 최소 증가량 이상 늘어난 항목
+
+    Returns:
+        [(항목 키, 이름, 처음 값, 마지막 값), ...]
+    """
+    if len(samples) < window:
+        return []
+    recent = [s for _, _, s in samples[-window:]]
+    flagged = []
+    for key, name, min_increase in METRICS:
+        values = [s.get(key) for s in recent]
+        if any(v is None for v in values):
+            continue
+        monotonic = all(b >= a for a, b in zip(values, values[1:]))
+        if monotonic and values[-1] - values[0] >= min_increase:
+            flagged.append((key, name, values[0], values[-1]))
+    return flagged
+
+
+class MemoryMonitor:
+    """작업별 메모리 기록 (켜져 있을 때만 기록)"""
+
+    def __init__(self, window=None, scene_getter=None, on_growth=None):
+        self.window = window
+        self.scene_getter = scene_getter
+        self.on_growth = on_growth     # 새로 계속 증가 항목이 생기면 호출 (항목 목록)
+        self.enabled = False
+        self.samples = []          # (시각, 작업 이름, 기록)
+        self.flagged = []
+
+    def set_enabled(self, enabled, trace_python_heap=True):
+        """기록 시작/중지 (시작할 때 tracemalloc도 켬)"""
+        self.enabled = enabled
+        if enabled and trace_python_heap and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        elif not enabled and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def clear(self):
+        self.samples.clear()
+        self.flagged = []
+
+    def record(self, action):
+        """작업 후 기록하고 연속 증가 항목 갱신"""
+        if not self.enabled:
+            return []
+        scene = self.scene_getter() if self.scene_getter else None
+        self.samples.append((time.time(), action, take_sample(self.window, scene)))
+        if len(self.samples) > MAX_SAMPLES:
+            del self.samples[0]
+        was_flagged = bool(self.flagged)
+        self.flagged = detect_growth(self.samples)
+        if self.flagged and not was_flagged and self.on_growth:
+            self.on_growth(self.flagged)
+        return self.flagged
+
+
+def sampled_action(name):
+    """MainWindow 메서드 실행 후 메모리를 기록하는 데코레이터 (memory_monitor가 켜져 있을 때)"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                monitor = getattr(self, 'memory_monitor', None)
+                if monitor is not None and monitor.enabled:
+                    monitor.record(name)
+        return wrapper
+    return decorator
+
+
+def _format_value(key, value):
+    if value is None:
+        return '-'
+    if key in ('py_heap', 'rss'):
+        return f"{value / 1024 / 1024:,.1f}MB"
+    return f"{value:,}"
+
+
+def generate_memory_report(monitor):
+    """메모리 진단 보고서 텍스트"""
+    lines = []
+
+    def add(text=''):
+        lines.append(text)
+
+    add("═" * 60)
+    add("         메 모 리 진 단")
+    add("═" * 60)
+    add()
+    if not monitor.samples:
+        add("   기록 없음 (보기 > 메모리 진단 기록을 켜고 작업을 실행하세요)")
+        add()
+        add("═" * 60)
+        return '\n'.join(lines)
+
+    first = monitor.samples[0][2]
+    last = monitor.samples[-1][2]
+    add(f"   기록 {len(monitor.samples):,}개")
+    add()
+    add(f"   {'항목':<22}{'처음':>14}{'현재':>14}{'증감':>14}")
+    for key, name, _ in METRICS:
+        a, b = first.get(key), last.get(key)
+        delta = _format_value(key, b - a) if a is not None and b is not None else '-'
+        add(f"   {name:<22}{_format_value(key, a):>14}{_format_value(key, b):>14}{delta:>14}")
+    add()
+    if monitor.flagged:
+        add(f"   ■ 최근 {GROWTH_WINDOW}회 작업 동안 계속 증가 (누수 의심)")
+        for key, name, a, b in monitor.flagged:
+            add(f"     {name}: {_format_value(key, a)} → {_format_value(key, b)}")
+    else:
+        add("   ■ 계속 증가하는 항목 없음")
+    add()
+    add("   ■ 최근 작업")
+    for t, action, sample in monitor.samples[-20:]:
+        add(f"     {time.strftime('%H:%M:%S', time.localtime(t))} {action:<22}"
+            f" 아이템 {_format_value('scene_items', sample['scene_items']):>6}"
+            f" 위젯 {_format_value('widgets', sample['widgets']):>6}"
+            f" 힙 {_format_value('py_heap', sample['py_heap']):>9}")
+    add()
+    add("═" * 60)
+    return '\n'.join(lines)
+
+
+# ========================================
+# 소크 테스트 (헤드리스 반복 편집)
+# ========================================
+
+# 단면제원 표 2행에서 편집할 열과 값 범위 (1련 기준: H, H4, B1, UT, LT, WL, WR)
+_EDIT_COLUMNS = [(0, 3000, 5000), (2, 3000, 5000), (3, 400, 900), (4, 500, 1000),
+                 (5, 400, 800), (6, 400, 800)]
+_TREE_ITEMS = ['재료특성', '지반정보', '단면제원', '부력 시나리오', '단면 특성', '단면제원']
+
+
+def _flush_events(app):
+    app.processEvents()
+    QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    app.processEvents()
+
+
+def run_soak_test(edits=2000, sample_every=50, seed=0, progress=None):
+    """편집/메뉴 이동/실행 취소를 반복하며 메모리 기록
+
+    Returns:
+        (MemoryMonitor, 경고 목록)
+    """
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QApplication.instance() or QApplication([])
+
+    # 결과 대화상자는 띄우지 않음 (내용만 생성하고, 닫은 것처럼 삭제)
+    import buoyancy_check
+    buoyancy_check.BuoyancyCheckDialog.exec_ = lambda dialog: dialog.deleteLater() or 0
+    from esc_culvert_main_window import MainWindow
+
+    rng = random.Random(seed)
+    window = MainWindow()
+    monitor = MemoryMonitor(window, window.graphics_view.scene)
+    monitor.set_enabled(True)
+    window._select_tree_item('단면제원')
+    _flush_events(app)
+
+    for k in range(edits):
+        choice = rng.random()
+        if choice < 0.8:
+            col, lo, hi = rng.choice(_EDIT_COLUMNS)
+            table = window.table_widget.section_table
+            item = table.item(2, col)
+            if item is not None:
+                item.setText(str(rng.randrange(lo, hi, 50)))
+            window._record_edit()
+        elif choice < 0.9:
+            window._select_tree_item(rng.choice(_TREE_ITEMS))
+            window._select_tree_item('단면제원')
+        elif rng.random() < 0.5:
+            window.undo_edit()
+        else:
+            window.redo_edit()
+        _flush_events(app)
+        if (k + 1) % sample_every == 0:
+            gc.collect()
+            monitor.record(f"soak {k + 1}")
+            if progress:
+                progress(k + 1, edits)
+
+    window.close()
+    _flush_events(app)
+    return monitor, check_bounded(monitor)
+
+
+def check_bounded(monitor, warmup=3):
+    """예열 이후 기록 대비 마지막 기록이 최소 증가량의 2배 이상 늘었으면 경고"""
+    warnings = []
+    if len(monitor.samples) <= warmup:
+        return warnings
+    base = monitor.samples[warmup - 1][2]
+    last = monitor.samples[-1][2]
+    for key, name, min_increase in METRICS:
+        a, b = base.get(key), last.get(key)
+        if a is None or b is None:
+            continue
+        if b - a > 2 * min_increase:
+            warnings.append(f"{name}: {_format_value(key, a)} → {_format_value(key, b)}")
+    for key, name, a, b in monitor.flagged:
+        warnings.append(f"{name} 계속 증가: {_format_value(key, a)} → {_format_value(key, b)}")
+    return warnings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='메모리 소크 테스트 (헤드리스 반복 편집)')
+    parser.add_argument('--edits', type=int, default=2000, help='편집 횟수')
+    parser.add_argument('--sample-every', type=int, default=50, help='기록 간격 (편집 수)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    # 사용자 폴더 대신 임시 폴더 사용 (자동저장/캐시 격리)
+    home = tempfile.mkdtemp(prefix='esc_soak_')
+    os.environ['HOME'] = home
+    os.environ['USERPROFILE'] = home
+
+    monitor, warnings = run_soak_test(args.edits, args.sample_every, args.seed, progress=lambda i, n: print(
+        f"\r편집 {i:,}/{n:,}", end='', file=sys.stderr, flush=True))
+    print(file=sys.stderr)
+    print(generate_memory_report(monitor))
+    if warnings:
+        print("메모리 증가 감지:")
+        for text in warnings:
+            print(f"  {text}")
+        return 1
+    print("메모리 사용량 범위 내")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""바이너리 프로젝트 파일 (.escp) 모듈
+
+측점(station)이 많은 프로젝트를 위한 압축 컨테이너 형식이다.
+JSON 프로젝트 형식(_collect_project_data)은 그대로 두고 가져오기/내보내기에 사용한다.
+
+파일 구조
+    헤더  (16 byte)  : MAGIC(4) + 버전(uint16) + 예약(uint16) + 인덱스 위치(uint64)
+    청크  (n개)      : zlib 압축 JSON
+    인덱스           : zlib 압축 JSON [{'name', 'offset', 'size', 'crc'}, ...]
+
+청크 이름
+    'project'        : 측점을 제외한 프로젝트 데이터 (재료, 지반정보, 단면제원 등)
+    'station/<번호>'  : 프로젝트 데이터 'stations' 목록의 각 측점
+
+파일을 열 때는 헤더와 인덱스만 읽고 측점 청크는 필요할 때 읽는다.
+"""
+
+import json
+import os
+import struct
+import zlib
+from collections import OrderedDict
+
+MAGIC = b'ESCP'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHHQ')
+PROJECT_CHUNK = 'project'
+STATION_CHUNK = 'station/{}'
+COMPRESS_LEVEL = 6
+
+
+class ProjectFormatError(Exception):
+    """프로젝트 파일 형식 오류"""
+
+
+def is_project_container(file_path):
+    """바이너리 프로젝트 파일인지 (확장자와 무관하게 MAGIC 확인)"""
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _encode_chunk(data):
+    raw = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return zlib.compress(raw, COMPRESS_LEVEL)
+
+
+def _decode_chunk(blob):
+    return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+
+def write_project_container(file_path, project_data):
+    """프로젝트 데이터를 바이너리 파일로 저장 (임시 파일 + rename)
+
+    project_data['stations']가 있으면 측점마다 별도 청크로 저장한다.
+    """
+    project = {k: v for k, v in project_data.items() if k != 'stations'}
+    stations = project_data.get('stations', [])
+
+    tmp_path = file_path + '.tmp'
+    index = []
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, 0))
+
+        def write_chunk(name, data):
+            blob = _encode_chunk(data)
+            index.append({'name': name, 'offset': f.tell(), 'size': len(blob),
+                          'crc': zlib.crc32(blob)})
+            f.write(blob)
+
+        write_chunk(PROJECT_CHUNK, project)
+        for i, station in enumerate(stations):
+            write_chunk(STATION_CHUNK.format(i), station)
+
+        index_offset = f.tell()
+        f.write(_encode_chunk(index))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, index_offset))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, file_path)
+
+
+class ProjectContainer:
+    """바이너리 프로젝트 파일 읽기 (측점 청크 지연 로딩)"""
+
+    STATION_CACHE_SIZE = 16
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        with open(file_path, 'rb') as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ProjectFormatError('파일이 손상되었습니다. (헤더 없음)')
+            magic, version, _, index_offset = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ProjectFormatError('암거 프로젝트 파일이 아닙니다.')
+            if version > FORMAT_VERSION:
+                raise ProjectFormatError(f'지원하지 않는 파일 버전입니다. (v{version})')
+            f.seek(index_offset)
+            try:
+                entries = _decode_chunk(f.read())
+            except (zlib.error, ValueError) as e:
+                raise ProjectFormatError(f'파일 인덱스를 읽을 수 없습니다. ({e})')
+
+        self.version = version
+        self.index = {entry['name']: entry for entry in entries}
+        self.station_count = sum(1 for name in self.index if name.startswith('station/'))
+        self._project = None
+        self._station_cache = OrderedDict()
+
+    def _read_chunk(self, name):
+        entry = self.index.get(name)
+        if entry is None:
+            raise KeyError(name)
+        with open(self.file_path, 'rb') as f:
+            f.seek(entry['offset'])
+            blob = f.read(entry['size'])
+        if zlib.crc32(blob) != entry['crc']:
+            raise ProjectFormatError(f'손상된 데이터 블록입니다. ({name})')
+        return _decode_chunk(blob)
+
+    @property
+    def project(self):
+        """측점을 제외한 프로젝트 데이터"""
+        if self._project is None:
+            self._project = self._read_chunk(PROJECT_CHUNK)
+        return self._project
+
+    def load_station(self, i):
+        """측점 i 데이터 (필요할 때 읽고 최근 항목은 캐시)"""
+        station = self._station_cache.get(i)
+        if station is None:
+            station = self._read_chunk(STATION_CHUNK.format(i))
+            self._station_cache[i] = station
+            if len(self._station_cache) > self.STATION_CACHE_SIZE:
+                self._station_cache.popitem(last=False)
+        else:
+            self._station_cache.move_to_end(i)
+        return station
+
+    def iter_stations(self):
+        """측점 순서대로 읽기 (캐시에 쌓지 않음)"""
+        for i in range(self.station_count):
+            yield self._read_chunk(STATION_CHUNK.format(i))
+
+    def to_project_data(self):
+        """전체 프로젝트 데이터 (JSON 내보내기용)"""
+        data = dict(self.project)
+        if self.station_count:
+            data['stations'] = list(self.iter_stations())
+        return data
+
+
+def read_project_file(file_path):
+    """프로젝트 파일 읽기 (JSON / 바이너리 자동 판별) → (데이터, 컨테이너 또는 None)"""
+    if is_project_container(file_path):
+        container = ProjectContainer(file_path)
+        return container.project, container
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f), None
@@ -0,0 +1,725 @@
+"""프로젝트 비교 (Diff) 모듈
+
+두 프로젝트 파일(.json / .escp)의 단면제원, 지반정보, 재료 값을 경로 단위로
+비교하고, 입력이 바뀐 측점의 결과만 다시 계산한다.
+
+결과 항목과 입력의 관계
+    부력 안전율       : 단면제원 + 지반정보
+    배근 이용률       : 단면제원 + 지반정보 + 재료
+    수량 (콘크리트/거푸집) : 단면제원 + 측점 구간 길이
+입력이 같은 측점은 계산하지 않고, 같은 입력은 한 번만 계산한다
+(계산 결과는 result_cache 디스크 캐시를 거친다).
+
+단면 겹쳐보기는 새 단면을 그리고 이전 단면의 부재 영역을 점선으로 겹친 뒤,
+바뀐 값의 경로에 해당하는 부재(section_picking target)를 강조한다.
+
+명령행 사용법
+    python project_diff.py 이전.json 현재.escp [--all] [-o 보고서.txt]
+"""
+
+import argparse
+import sys
+from PyQt5.QtWidgets import (QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                              QTableWidget, QTableWidgetItem, QHeaderView, QSplitter,
+                              QCheckBox, QAbstractItemView, QGraphicsPolygonItem)
+from PyQt5.QtCore import Qt, QPointF
+from PyQt5.QtGui import QColor, QPolygonF, QBrush
+from project_container import read_project_file
+from quantity_takeoff import unit_quantities, station_section, station_length
+from result_cache import canonical_json, cached_buoyancy, get_result_cache
+from load_cases import analyze_section
+from rebar_check import check_section_reinforcement
+from section_picking import SectionPickIndex
+from utils import create_culvert_dxf, display_dxf, add_culvert_pick_regions, create_cosmetic_pen
+from esc_culvert_graphics_view import create_graphics_view
+from buoyancy_check import BuoyancyCheckDialog
+
+# 비교 대상 (프로젝트 데이터 키, 이름)
+DIFF_PARTS = [
+    ('sectionData', '단면제원'),
+    ('groundInfo', '지반정보'),
+    ('materials', '재료'),
+]
+PART_LABELS = dict(DIFF_PARTS)
+
+# 측점이 없는 프로젝트의 기본 측점 (quantity_takeoff와 같음)
+DEFAULT_STATION = {'name': '기본 단면', 'length': 1.0}
+DEFAULT_MATERIALS = {'fck': 30.0, 'fy': 400.0}
+
+# 결과 항목 (키, 이름, 표시 형식)
+RESULT_ITEMS = [
+    ('fs', '부력 안전율', '{:.3f}'),
+    ('flexure', '휨 이용률', '{:.3f}'),
+    ('shear', '전단 이용률', '{:.3f}'),
+    ('concrete', '콘크리트 (m³)', '{:,.2f}'),
+    ('form', '거푸집 (m²)', '{:,.2f}'),
+]
+
+# 다른 부재의 형상을 함께 바꾸는 값 (단면제원 경로 → 영향받는 부재 target 앞부분)
+# () 는 모든 부재
+_DEPENDENT_MEMBERS = {
+    ('culvert_count',): ((),),
+    ('H',): (('WL',), ('WR',), ('B',), ('middle_walls',)),
+    ('columnGirder', 'columnCTC'): (('middle_walls',),),
+    ('columnGirder', 'columnWidth'): (('middle_walls',),),
+    ('antiFloat', 'use'): (('antiFloat',),),
+    ('antiFloat', 'thickness'): (('antiFloat',),),
+}
+
+ADDED, REMOVED, MODIFIED = '추가', '삭제', '변경'
+UNCHANGED = '같음'
+
+
+# ========================================
+# 구조 비교
+# ========================================
+
+class FieldChange:
+    """값 변경 한 건 (경로는 프로젝트 데이터 기준)"""
+
+    def __init__(self, path, old, new, kind=MODIFIED):
+        self.path = path
+        self.old = old
+        self.new = new
+        self.kind = kind
+
+
+def _same_value(a, b):
+    """말단 값 비교 (750 과 750.0 은 같은 값, True 와 1 은 다른 값)"""
+    numbers = (int, float)
+    if (isinstance(a, numbers) and isinstance(b, numbers)
+            and not isinstance(a, bool) and not isinstance(b, bool)):
+        return a == b
+    return type(a) is type(b) and a == b
+
+
+def diff_values(old, new, prefix=()):
+    """두 값의 변경 목록 [FieldChange, ...]
+
+    project_paths.diff_paths와 달리 dict 키나 list 길이가 달라도 컨테이너를
+    통째로 기록하지 않고, 추가/삭제된 항목만 따로 기록한다.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = []
+        for key in old:
+            if key in new:
+                changes.extend(diff_values(old[key], new[key], prefix + (key,)))
+            else:
+                changes.append(FieldChange(prefix + (key,), old[key], None, REMOVED))
+        for key in new:
+            if key not in old:
+                changes.append(FieldChange(prefix + (key,), None, new[key], ADDED))
+        return changes
+    if isinstance(old, list) and isinstance(new, list):
+        changes = []
+        for i, (a, b) in enumerate(zip(old, new)):
+            changes.extend(diff_values(a, b, prefix + (i,)))
+        for i in range(len(new), len(old)):
+            changes.append(FieldChange(prefix + (i,), old[i], None, REMOVED))
+        for i in range(len(old), len(new)):
+            changes.append(FieldChange(prefix + (i,), None, new[i], ADDED))
+        return changes
+    if _same_value(old, new):
+        return []
+    return [FieldChange(prefix, old, new)]
+
+
+def format_path(path):
+    """경로 표시 문자열 예) 단면제원 haunch.middleWalls[1].upper.width"""
+    text = ''
+    for key in path[1:]:
+        text += f"[{key}]" if isinstance(key, int) else (f".{key}" if text else str(key))
+    label = PART_LABELS.get(path[0], str(path[0])) if path else ''
+    return f"{label} {text}".strip()
+
+
+def format_value(value):
+    """변경 값 표시 문자열"""
+    if value is None:
+        return '-'
+    if isinstance(value, float):
+        return f"{value:g}"
+    if isinstance(value, (dict, list)):
+        return canonical_json(value)
+    return str(value)
+
+
+def _project_parts(project_data):
+    """비교 대상 값 {키: 값} (재료 기본값 포함)"""
+    materials = dict(DEFAULT_MATERIALS)
+    materials.update(project_data.get('materials') or {})
+    return {
+        'sectionData': project_data.get('sectionData') or {},
+        'groundInfo': project_data.get('groundInfo') or {},
+        'materials': materials,
+    }
+
+
+def match_stations(old_stations, new_stations):
+    """이전/현재 측점 짝짓기 [(이름, 이전 측점 또는 None, 현재 측점 또는 None), ...]
+
+    이름이 같은 측점끼리 짝짓고 (이름이 없으면 순서), 현재 순서 뒤에
+    삭제된 측점을 붙인다. 측점이 없는 쪽은 기본 측점 하나로 본다.
+    """
+    old_stations = old_stations or [DEFAULT_STATION]
+    new_stations = new_stations or [DEFAULT_STATION]
+
+    def keyed(stations):
+        return {(st.get('name') or f"측점 {i+1}"): st for i, st in enumerate(stations)}
+
+    old_map = keyed(old_stations)
+    pairs = []
+    for name, st in keyed(new_stations).items():
+        pairs.append((name, old_map.pop(name, None), st))
+    for name, st in old_map.items():
+        pairs.append((name, st, None))
+    return pairs
+
+
+# ========================================
+# 결과 재계산
+# ========================================
+
+# 디스크 캐시 버전에 포함할 계산 모듈 (소스가 바뀌면 저장된 결과 무효화)
+_REBAR_MODULES = ('frame_analysis.py', 'load_cases.py', 'rebar_check.py')
+_QUANTITY_MODULES = ('quantity_takeoff.py',)
+
+
+def cached_rebar_utilization(section_data, ground_info, materials, cache=None):
+    """최대 휨/전단 이용률 {'flexure', 'shear'} (골조해석 + 배근검토)"""
+    cache = cache or get_result_cache()
+
+    def compute():
+        fck, fy = float(materials['fck']), float(materials['fy'])
+        analysis = analyze_section(section_data, ground_info, fck)
+        check = check_section_reinforcement(analysis, fck, fy)
+        return {'flexure': float(check.flexure_utilization.max()),
+                'shear': float(check.shear_utilization.max())}
+
+    return cache.get_or_compute_json('rebar_utilization', (section_data, ground_info, materials), compute,
+                                     _REBAR_MODULES)
+
+
+def cached_unit_quantities(section_data, cache=None):
+    """단위길이(1 m)당 수량 (quantity_takeoff.unit_quantities 결과)"""
+    cache = cache or get_result_cache()
+    return cache.get_or_compute_json('unit_quantities', (section_data,),
+                                     lambda: unit_quantities(section_data), _QUANTITY_MODULES)
+
+
+class _ResultComputer:
+    """측점 결과 계산기 (같은 입력은 한 번만 계산)"""
+
+    def __init__(self, cache=None):
+        self.cache = cache or get_result_cache()
+        self._memo = {}
+        self.computed = 0
+
+    def _get(self, kind, inputs, compute):
+        key = (kind, canonical_json(inputs))
+        if key not in self._memo:
+            self._memo[key] = compute()
+            self.computed += 1
+        return self._memo[key]
+
+    def results(self, items, sd, gi, materials, length):
+        """요청한 결과 항목만 {키: 값}"""
+        out = {}
+        if 'fs' in items:
+            buoyancy = self._get('buoyancy', (sd, gi), lambda: cached_buoyancy(sd, gi, self.cache))
+            out['fs'] = buoyancy['fs']
+        if 'flexure' in items or 'shear' in items:
+            rebar = self._get('rebar', (sd, gi, materials),
+                              lambda: cached_rebar_utilization(sd, gi, materials, self.cache))
+            out['flexure'] = rebar['flexure']
+            out['shear'] = rebar['shear']
+        if 'concrete' in items or 'form' in items:
+            q = self._get('quantity', (sd,), lambda: cached_unit_quantities(sd, self.cache))
+            out['concrete'] = q['concrete_total'] * length
+            out['form'] = q['form_total'] * length
+        return out
+
+
+def affected_results(section_changed, ground_changed, materials_changed, length_changed):
+    """바뀐 입력에 영향받는 결과 항목 키 집합"""
+    items = set()
+    if section_changed or ground_changed:
+        items.add('fs')
+    if section_changed or ground_changed or materials_changed:
+        items.update(('flexure', 'shear'))
+    if section_changed or length_changed:
+        items.update(('concrete', 'form'))
+    return items
+
+
+class StationDiff:
+    """측점 한 개의 비교 결과"""
+
+    def __init__(self, name, status, old_section, new_section, old_length, new_length,
+                 section_changes, own_changes, items, old_results, new_results):
+        self.name = name
+        self.status = status                    # 추가 / 삭제 / 변경 / 같음
+        self.old_section = old_section          # 측점 단면제원 (삭제된 측점은 이전만)
+        self.new_section = new_section
+        self.old_length = old_length
+        self.new_length = new_length
+        self.section_changes = section_changes  # 측점 단면제원 FieldChange 목록
+        self.own_changes = own_changes          # 그중 공통 변경이 아닌 것 (측점 값 변경)
+        self.items = items                      # 다시 계산한 결과 항목 키
+        self.old_results = old_results
+        self.new_results = new_results
+
+    def changed_section_paths(self):
+        """단면제원 안의 바뀐 경로 목록 ('sectionData' 제외)"""
+        return [change.path[1:] for change in self.section_changes]
+
+    def delta(self, key):
+        """결과 변화량 (이전/현재 중 하나가 없으면 없는 쪽을 0으로)"""
+        if key not in self.items:
+            return 0.0
+        old = self.old_results.get(key)
+        new = self.new_results.get(key)
+        if old is None and new is None:
+            return 0.0
+        if key in ('concrete', 'form'):
+            return (new or 0.0) - (old or 0.0)
+        if old is None or new is None:
+            return None
+        return new - old
+
+
+class ProjectDiff:
+    """프로젝트 비교 결과"""
+
+    def __init__(self, changes, stations, computed, old_ground_info, new_ground_info,
+                 old_name='이전', new_name='현재'):
+        self.changes = changes          # 프로젝트 공통 값 FieldChange 목록
+        self.stations = stations        # StationDiff 목록
+        self.computed = computed        # 실제 계산한 결과 수 (중복 제외)
+        self.old_ground_info = old_ground_info
+        self.new_ground_info = new_ground_info
+        self.old_name = old_name
+        self.new_name = new_name
+
+    def changed_parts(self):
+        """값이 바뀐 비교 대상 키 집합"""
+        return {change.path[0] for change in self.changes}
+
+    def changed_stations(self):
+        return [st for st in self.stations if st.status != UNCHANGED]
+
+    def quantity_delta(self):
+        """전체 수량 변화량 {'concrete', 'form'}"""
+        return {key: sum(st.delta(key) for st in self.stations) for key in ('concrete', 'form')}
+
+
+def compare_projects(old_data, new_data, old_stations=None, new_stations=None, cache=None,
+                     old_name='이전', new_name='현재'):
+    """두 프로젝트 데이터 비교
+
+    Args:
+        old_data, new_data: 프로젝트 데이터
+        old_stations, new_stations: 측점 목록 (없으면 각 데이터의 'stations')
+        cache: ResultCache (없으면 공용 캐시)
+
+    Returns:
+        ProjectDiff
+    """
+    old_parts = _project_parts(old_data)
+    new_parts = _project_parts(new_data)
+    changes = []
+    for key, _ in DIFF_PARTS:
+        changes.extend(diff_values(old_parts[key], new_parts[key], (key,)))
+    changed = {change.path[0] for change in changes}
+    common = {(change.path, canonical_json([change.old, change.new])) for change in changes}
+    ground_changed = 'groundInfo' in changed
+    materials_changed = 'materials' in changed
+
+    if old_stations is None:
+        old_stations = old_data.get('stations')
+    if new_stations is None:
+        new_stations = new_data.get('stations')
+
+    computer = _ResultComputer(cache)
+    old_gi, new_gi = old_parts['groundInfo'], new_parts['groundInfo']
+    old_mat, new_mat = old_parts['materials'], new_parts['materials']
+    all_items = set(key for key, _, _ in RESULT_ITEMS)
+    station_diffs = []
+    for name, old_st, new_st in match_stations(old_stations, new_stations):
+        old_sd = station_section(old_parts['sectionData'], old_st) if old_st is not None else None
+        new_sd = station_section(new_parts['sectionData'], new_st) if new_st is not None else None
+        old_len = station_length(old_st) if old_st is not None else None
+        new_len = station_length(new_st) if new_st is not None else None
+
+        if old_st is None or new_st is None:
+            status = ADDED if old_st is None else REMOVED
+            section_changes = own_changes = []
+            items = all_items
+        else:
+            section_changes = diff_values(old_sd, new_sd, ('sectionData',))
+            own_changes = [c for c in section_changes
+                           if (c.path, canonical_json([c.old, c.new])) not in common]
+            items = affected_results(bool(section_changes), ground_changed,
+                                     materials_changed, old_len != new_len)
+            status = MODIFIED if items else UNCHANGED
+
+        old_results = (computer.results(items, old_sd, old_gi, old_mat, old_len)
+                       if old_st is not None and items else {})
+        new_results = (computer.results(items, new_sd, new_gi, new_mat, new_len)
+                       if new_st is not None and items else {})
+        station_diffs.append(StationDiff(name, status, old_sd, new_sd, old_len, new_len,
+                                         section_changes, own_changes, items,
+                                         old_results, new_results))
+
+    return ProjectDiff(changes, station_diffs, computer.computed, old_gi, new_gi,
+                       old_name, new_name)
+
+
+def _load_side(path):
+    """프로젝트 파일 → (데이터, 측점 목록)"""
+    data, container = read_project_file(path)
+    if container is not None and container.station_count:
+        return data, list(container.iter_stations())
+    return data, data.get('stations')
+
+
+def compare_project_files(old_path, new_path, cache=None):
+    """두 프로젝트 파일 비교 (ProjectDiff)"""
+    old_data, old_stations = _load_side(old_path)
+    new_data, new_stations = _load_side(new_path)
+    return compare_projects(old_data, new_data, old_stations, new_stations, cache,
+                            old_name=old_path, new_name=new_path)
+
+
+# ========================================
+# 보고서
+# ========================================
+
+def _format_result(key, value):
+    if value is None:
+        return '-'
+    fmt = next(f for k, _, f in RESULT_ITEMS if k == key)
+    return fmt.format(value)
+
+
+def _format_delta(key, value):
+    if value is None:
+        return '-'
+    fmt = next(f for k, _, f in RESULT_ITEMS if k == key)
+    return ('+' if value > 0 else '') + fmt.format(value)
+
+
+def generate_diff_report(diff, include_unchanged=False):
+    """프로젝트 비교 보고서 텍스트"""
+    lines = []
+
+    def add(text=''):
+        lines.append(text)
+
+    add("═" * 60)
+    add("         프 로 젝 트   비 교")
+    add("═" * 60)
+    add()
+    add(f"   이전 : {diff.old_name}")
+    add(f"   현재 : {diff.new_name}")
+    changed_stations = diff.changed_stations()
+    add(f"   측점 {len(diff.stations)}개 중 변경 {len(changed_stations)}개, "
+        f"재계산 {diff.computed}건")
+    add()
+
+    add("1. 공통 입력 변경")
+    add("─" * 60)
+    if not diff.changes:
+        add("   변경 없음")
+    for change in diff.changes:
+        add(f"   [{change.kind}] {format_path(change.path)}: "
+            f"{format_value(change.old)} → {format_value(change.new)}")
+    add()
+
+    add("2. 수량 변화")
+    add("─" * 60)
+    totals = diff.quantity_delta()
+    for key in ('concrete', 'form'):
+        label = next(name for k, name, _ in RESULT_ITEMS if k == key)
+        add(f"   {label:<16} {_format_delta(key, totals[key])}")
+    add()
+
+    add("3. 측점별 변경")
+    add("─" * 60)
+    for st in diff.stations:
+        if st.status == UNCHANGED and not include_unchanged:
+            continue
+        add(f"■ {st.name}  [{st.status}]")
+        if st.old_length is not None and st.new_length is not None and st.old_length != st.new_length:
+            add(f"   구간 길이: {st.old_length:g} → {st.new_length:g} m")
+        for change in st.own_changes:
+            add(f"   {format_path(change.path)}: {format_value(change.old)} → {format_value(change.new)}")
+        for key, label, _ in RESULT_ITEMS:
+            if key not in st.items:
+                continue
+            old = _format_result(key, st.old_results.get(key))
+            new = _format_result(key, st.new_results.get(key))
+            delta = st.delta(key)
+            add(f"   {label:<14} {old:>12} → {new:>12}" + (f"  ({_format_delta(key, delta)})" if delta is not None else ''))
+        add()
+    return '\n'.join(lines)
+
+
+# ========================================
+# 단면 겹쳐보기
+# ========================================
+
+def _member_root(path):
+    """부재 단위 경로 (중간벽체 종류/두께, 내공 B 항목은 같은 부재)"""
+    if path and path[0] in ('middle_walls', 'B'):
+        return tuple(path[:2])
+    return tuple(path)
+
+
+def member_changed(target, changed_paths):
+    """부재 target이 바뀐 경로에 해당하는지"""
+    if target is None:
+        return False
+    root = _member_root(target)
+    for path in changed_paths:
+        for prefix, members in _DEPENDENT_MEMBERS.items():
+            if tuple(path[:len(prefix)]) == prefix:
+                if any(root[:len(m)] == m for m in members):
+                    return True
+        changed = _member_root(path)
+        n = min(len(root), len(changed))
+        if root[:n] == changed[:n]:
+            return True
+    return False
+
+
+OLD_COLOR = QColor(160, 160, 160)
+CHANGED_COLOR = QColor(255, 140, 0)
+REMOVED_COLOR = QColor(255, 60, 60)
+
+
+def _polygon_item(region, pen, brush=None):
+    item = QGraphicsPolygonItem(QPolygonF([QPointF(x, -y) for x, y in region.polygon]))
+    item.setPen(pen)
+    item.setBrush(brush if brush is not None else QBrush(Qt.NoBrush))
+    item.setZValue(50)
+    return item
+
+
+def show_diff_overlay(view, old_section, new_section, ground_info=None, changed_paths=()):
+    """새 단면 위에 이전 단면 부재를 점선으로 겹치고 바뀐 부재 강조
+
+    Args:
+        view: ZoomPanGraphicsView
+        old_section, new_section: 단면제원 (한쪽이 None이면 있는 쪽만 그림)
+        changed_paths: 단면제원 안의 바뀐 경로 목록
+
+    Returns:
+        강조한 부재 태그 목록
+    """
+    scene = view.scene()
+    shown = new_section if new_section is not None else old_section
+    pick_index = SectionPickIndex()
+    display_dxf(create_culvert_dxf(shown, ground_info, pick_index=pick_index), scene)
+    view.set_pick_index(pick_index)
+
+    tags = []
+    if old_section is None or new_section is None:
+        # 추가/삭제된 측점은 단면 전체가 변경
+        color = CHANGED_COLOR if old_section is None else REMOVED_COLOR
+        for region in pick_index.regions:
+            if region.target is not None and region.target[0] != 'B':
+                fill = QColor(color)
+                fill.setAlpha(50)
+                scene.addItem(_polygon_item(region, create_cosmetic_pen(color, 2), fill))
+                tags.append(region.tag)
+        view.fit_to_scene()
+        return tags
+
+    old_index = SectionPickIndex()
+    add_culvert_pick_regions(old_index, old_section)
+    for region in old_index.regions:
+        changed = member_changed(region.target, changed_paths)
+        pen = create_cosmetic_pen(REMOVED_COLOR if changed else OLD_COLOR, 1)
+        pen.setStyle(Qt.DashLine)
+        scene.addItem(_polygon_item(region, pen))
+
+    for region in pick_index.regions:
+        if member_changed(region.target, changed_paths):
+            fill = QColor(CHANGED_COLOR)
+            fill.setAlpha(60)
+            scene.addItem(_polygon_item(region, create_cosmetic_pen(CHANGED_COLOR, 2), fill))
+            tags.append(region.tag)
+    view.fit_to_scene()
+    return tags
+
+
+# ========================================
+# 비교 대화상자
+# ========================================
+
+class ProjectDiffDialog(QDialog):
+    """프로젝트 비교 결과 (공통 변경 / 측점별 결과 / 단면 겹쳐보기)"""
+
+    STATUS_COLORS = {ADDED: QColor(0, 140, 0), REMOVED: QColor(200, 0, 0), MODIFIED: QColor(200, 110, 0)}
+
+    def __init__(self, diff, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("프로젝트 비교")
+        self.resize(1300, 800)
+        self.diff = diff
+        self._rows = []
+
+        layout = QVBoxLayout(self)
+        header = QLabel(f"이전: {diff.old_name}\n현재: {diff.new_name}")
+        header.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        layout.addWidget(header)
+
+        splitter = QSplitter(Qt.Horizontal)
+        left = QSplitter(Qt.Vertical)
+
+        # 공통 입력 변경
+        self.change_table = QTableWidget(0, 4)
+        self.change_table.setHorizontalHeaderLabels(['구분', '항목', '이전', '현재'])
+        self._setup_table(self.change_table, stretch=1)
+        for change in diff.changes:
+            self._append_row(self.change_table,
+                             [change.kind, format_path(change.path),
+                              format_value(change.old), format_value(change.new)])
+        left.addWidget(self.change_table)
+
+        # 측점별 결과
+        station_widget = QWidget()
+        station_layout = QVBoxLayout(station_widget)
+        station_layout.setContentsMargins(0, 0, 0, 0)
+        self.changed_only_check = QCheckBox("변경된 측점만")
+        self.changed_only_check.setChecked(True)
+        self.changed_only_check.toggled.connect(self.fill_stations)
+        station_layout.addWidget(self.changed_only_check)
+        labels = ['측점', '상태', '변경 값'] + [name for _, name, _ in RESULT_ITEMS]
+        self.station_table = QTableWidget(0, len(labels))
+        self.station_table.setHorizontalHeaderLabels(labels)
+        self._setup_table(self.station_table, stretch=2)
+        self.station_table.currentCellChanged.connect(lambda row, *_: self.show_station(row))
+        station_layout.addWidget(self.station_table)
+        left.addWidget(station_widget)
+        left.setSizes([200, 500])
+        splitter.addWidget(left)
+
+        # 단면 겹쳐보기
+        view_widget = QWidget()
+        view_layout = QVBoxLayout(view_widget)
+        view_layout.setContentsMargins(0, 0, 0, 0)
+        self.view = create_graphics_view()
+        self.view.member_hovered.connect(lambda tag: self.member_label.setText(tag))
+        view_layout.addWidget(self.view, 1)
+        self.member_label = QLabel("")
+        view_layout.addWidget(self.member_label)
+        splitter.addWidget(view_widget)
+        splitter.setSizes([700, 600])
+        layout.addWidget(splitter, 1)
+
+        totals = diff.quantity_delta()
+        summary = (f"측점 {len(diff.stations)}개 중 변경 {len(diff.changed_stations())}개, "
+                   f"재계산 {diff.computed}건 / 콘크리트 {_format_delta('concrete', totals['concrete'])} m³, "
+                   f"거푸집 {_format_delta('form', totals['form'])} m²")
+        bottom = QHBoxLayout()
+        bottom.addWidget(QLabel(summary), 1)
+        report_btn = QPushButton("비교 보고서...")
+        report_btn.clicked.connect(self.show_report)
+        close_btn = QPushButton("닫기")
+        close_btn.clicked.connect(self.accept)
+        bottom.addWidget(report_btn)
+        bottom.addWidget(close_btn)
+        layout.addLayout(bottom)
+
+        self.fill_stations()
+
+    @staticmethod
+    def _setup_table(table, stretch):
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SingleSelection)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        table.horizontalHeader().setSectionResizeMode(stretch, QHeaderView.Stretch)
+
+    @staticmethod
+    def _append_row(table, values, color=None, numeric_from=None):
+        row = table.rowCount()
+        table.insertRow(row)
+        for col, value in enumerate(values):
+            item = QTableWidgetItem(value)
+            if color is not None and col == 1:
+                item.setForeground(color)
+            if numeric_from is not None and col >= numeric_from:
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            table.setItem(row, col, item)
+
+    def fill_stations(self):
+        """측점 결과 표 채우기"""
+        changed_only = self.changed_only_check.isChecked()
+        self._rows = [st for st in self.diff.stations if not changed_only or st.status != UNCHANGED]
+        table = self.station_table
+        table.setUpdatesEnabled(False)
+        table.setRowCount(0)
+        for st in self._rows:
+            values = [st.name, st.status, ', '.join(format_path(c.path) for c in st.own_changes)]
+            for key, _, _ in RESULT_ITEMS:
+                if key not in st.items:
+                    values.append('')
+                elif st.status == ADDED:
+                    values.append(_format_result(key, st.new_results.get(key)))
+                elif st.status == REMOVED:
+                    values.append(_format_result(key, st.old_results.get(key)))
+                else:
+                    values.append(f"{_format_result(key, st.new_results.get(key))} "
+                                  f"({_format_delta(key, st.delta(key))})")
+            self._append_row(table, values, self.STATUS_COLORS.get(st.status), numeric_from=3)
+        table.setUpdatesEnabled(True)
+        if self._rows:
+            table.selectRow(0)
+            self.show_station(0)
+
+    def show_station(self, row):
+        """선택한 측점의 이전/현재 단면 겹쳐보기"""
+        if not 0 <= row < len(self._rows):
+            return
+        st = self._rows[row]
+        ground_info = self.diff.old_ground_info if st.status == REMOVED else self.diff.new_ground_info
+        tags = show_diff_overlay(self.view, st.old_section, st.new_section, ground_info,
+                                 st.changed_section_paths())
+        self.member_label.setText(f"변경 부재: {', '.join(tags)}" if tags else "")
+
+    def show_report(self):
+        report = generate_diff_report(self.diff)
+        names = [st.name for st in self.diff.changed_stations()]
+        dialog = BuoyancyCheckDialog(report, self, title="프로젝트 비교 보고서", stations=names)
+        dialog.exec_()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='암거 프로젝트 비교 (입력 변경 / 결과 변화)')
+    parser.add_argument('old', help='이전 프로젝트 파일')
+    parser.add_argument('new', help='현재 프로젝트 파일')
+    parser.add_argument('--all', action='store_true', help='변경 없는 측점도 표시')
+    parser.add_argument('-o', '--output', default=None, help='보고서 저장 경로 (없으면 화면 출력)')
+    args = parser.parse_args(argv)
+
+    try:
+        diff = compare_project_files(args.old, args.new)
+    except Exception as e:
+        print(f"비교 실패: {e}", file=sys.stderr)
+        return 1
+    report = generate_diff_report(diff, include_unchanged=args.all)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report + '\n')
+        print(f"{args.output}: 측점 변경 {len(diff.changed_stations())}개", file=sys.stderr)
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,271 @@
+"""프로젝트 라이브러리 (Project Library) 모듈
+
+저장된 프로젝트 파일(.json / .escp) 폴더를 검색하여 주요 단면/지반/부력검토
+값을 SQLite 데이터베이스에 색인하고, 조건 검색을 제공한다.
+재검색 시 수정시각/크기가 바뀐 파일만 다시 읽고, 내용(SHA-256)이 같으면
+파싱하지 않는다. 단면 미리보기(썸네일)는 내용 해시별로 한 번만 만든다.
+
+검색 대화상자는 project_library_dialog 모듈에 있고, 이 모듈은 Qt 위젯을 import하지
+않는다. 부력검토/미리보기 모듈은 색인할 때만 불러오므로 query는 SQLite만 사용한다.
+
+명령행 사용법
+    python project_library.py scan <폴더> [--db 경로] [--thumbnails]
+    python project_library.py query "culvert_count=3" "H>=4000" "fs<1.3" [--db 경로]
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+import time
+from app_paths import get_app_data_dir
+from project_container import read_project_file
+
+PROJECT_EXTENSIONS = ('.json', '.escp')
+
+# 검색 가능한 필드 (열 이름, 설명)
+FIELDS = [
+    ('culvert_count', '련수'),
+    ('H', '내공높이'),
+    ('B_total', '총폭'),
+    ('B_max', '최대 내공폭'),
+    ('UT', '상부슬래브'),
+    ('LT', '하부슬래브'),
+    ('WL', '좌측벽'),
+    ('WR', '우측벽'),
+    ('has_column', '기둥 사용'),
+    ('anti_float', '부상방지저판'),
+    ('earth_cover', '토피'),
+    ('gwl', '지하수위'),
+    ('soil_unit_weight', '흙 단위중량'),
+    ('fck', 'fck'),
+    ('fy', 'fy'),
+    ('total_weight', '자중'),
+    ('buoyancy', '부력'),
+    ('fs', '안전율'),
+]
+FIELD_NAMES = [name for name, _ in FIELDS]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    path TEXT PRIMARY KEY,
+    mtime REAL, size INTEGER, sha256 TEXT, indexed_at REAL, error TEXT,
+    culvert_count INTEGER, H REAL, B_total REAL, B_max REAL,
+    UT REAL, LT REAL, WL REAL, WR REAL, has_column INTEGER, anti_float INTEGER,
+    earth_cover REAL, gwl REAL, soil_unit_weight REAL, fck REAL, fy REAL,
+    total_weight REAL, buoyancy REAL, fs REAL
+);
+CREATE INDEX IF NOT EXISTS idx_projects_count_h ON projects (culvert_count, H);
+CREATE INDEX IF NOT EXISTS idx_projects_fs ON projects (fs);
+"""
+
+_CONDITION_RE = re.compile(r'^\s*(\w+)\s*(>=|<=|!=|=|>|<)\s*(.+?)\s*$')
+
+
+def default_db_path():
+    """기본 라이브러리 데이터베이스 경로"""
+    return get_app_data_dir('library.sqlite')
+
+
+def open_library(db_path=None):
+    """라이브러리 데이터베이스 열기 (없으면 생성)"""
+    db_path = db_path or default_db_path()
+    folder = os.path.dirname(db_path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def extract_fields(project_data):
+    """프로젝트 데이터에서 색인 필드 추출"""
+    sd = project_data.get('sectionData', {}) or {}
+    gi = project_data.get('groundInfo', {}) or {}
+    mat = project_data.get('materials', {}) or {}
+
+    B = [float(b) for b in sd.get('B', [])]
+    fields = {
+        'culvert_count': int(sd.get('culvert_count', len(B))),
+        'H': sd.get('H'), 'B_total': None, 'B_max': max(B) if B else None,
+        'UT': sd.get('UT'), 'LT': sd.get('LT'), 'WL': sd.get('WL'), 'WR': sd.get('WR'),
+        'has_column': int(any(mw.get('type') == '기둥' for mw in sd.get('middle_walls', []))),
+        'anti_float': int(bool((sd.get('antiFloat') or {}).get('use', False))),
+        'earth_cover': gi.get('earthCoverDepth'), 'gwl': gi.get('groundwaterLevel'),
+        'soil_unit_weight': gi.get('soilUnitWeight'),
+        'fck': mat.get('fck'), 'fy': mat.get('fy'),
+        'total_weight': None, 'buoyancy': None, 'fs': None,
+    }
+    if sd:
+        from result_cache import cached_buoyancy
+        result = cached_buoyancy(sd, gi)
+        fields['B_total'] = result['total_width']
+        fields['total_weight'] = result['total_weight']
+        fields['buoyancy'] = result['buoyancy']
+        fields['fs'] = result['fs']
+    return fields
+
+
+def _file_sha256(file_path):
+    h = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _iter_project_files(directory):
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.lower().endswith(PROJECT_EXTENSIONS):
+                yield os.path.abspath(os.path.join(root, name))
+
+
+def scan_directory(conn, directory, progress=None):
+    """폴더를 검색하여 변경된 프로젝트 파일만 다시 색인
+
+    Args:
+        conn: open_library 연결
+        directory: 프로젝트 폴더 (하위 폴더 포함)
+        progress: progress(처리 수, 전체 수) 콜백 (선택)
+
+    Returns:
+        dict: scanned, parsed, unchanged, removed, failed 개수
+    """
+    known = {row[0]: row[1:] for row in conn.execute(
+        'SELECT path, mtime, size, sha256 FROM projects')}
+    prefix = os.path.join(os.path.abspath(directory), '')
+    files = list(_iter_project_files(directory))
+    stats = {'scanned': len(files), 'parsed': 0, 'unchanged': 0, 'removed': 0, 'failed': 0}
+    columns = ['path', 'mtime', 'size', 'sha256', 'indexed_at', 'error'] + FIELD_NAMES
+    insert_sql = (f"INSERT OR REPLACE INTO projects ({', '.join(columns)}) "
+                  f"VALUES ({', '.join('?' * len(columns))})")
+
+    for count, path in enumerate(files, 1):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        old = known.get(path)
+        if old and old[0] == st.st_mtime and old[1] == st.st_size:
+            stats['unchanged'] += 1
+        else:
+            sha = _file_sha256(path)
+            if old and old[2] == sha:
+                # 내용은 같고 수정시각만 바뀐 경우
+                conn.execute('UPDATE projects SET mtime = ?, size = ? WHERE path = ?',
+                             (st.st_mtime, st.st_size, path))
+                stats['unchanged'] += 1
+            else:
+                error = None
+                try:
+                    data, _ = read_project_file(path)
+                    fields = extract_fields(data)
+                except Exception as e:
+                    error = str(e) or type(e).__name__
+                    fields = {}
+                    stats['failed'] += 1
+                else:
+                    stats['parsed'] += 1
+                conn.execute(insert_sql, [path, st.st_mtime, st.st_size, sha, time.time(), error]
+                             + [fields.get(name) for name in FIELD_NAMES])
+        if progress:
+            progress(count, len(files))
+
+    # 삭제된 파일 제거 (검색한 폴더 아래만)
+    current = set(files)
+    for path in known:
+        if path.startswith(prefix) and path not in current:
+            conn.execute('DELETE FROM projects WHERE path = ?', (path,))
+            stats['removed'] += 1
+    conn.commit()
+    return stats
+
+
+def update_thumbnails(conn, workers=None, progress=None):
+    """미리보기가 없는 색인 프로젝트의 단면 썸네일 생성 → (생성 수, 실패 수)"""
+    from headless_render import render_thumbnails
+    items = conn.execute('SELECT path, sha256 FROM projects WHERE error IS NULL').fetchall()
+    created, errors = render_thumbnails(items, workers=workers, progress=progress)
+    return created, len(errors)
+
+
+def parse_conditions(conditions):
+    """검색 조건 문자열 목록 → [(필드, 연산자, 값), ...]
+
+    예) ["culvert_count=3", "H>=4000", "fs<1.3"] 또는 "culvert_count=3, H>=4000"
+    """
+    if isinstance(conditions, str):
+        conditions = [c for c in re.split(r'[,;]', conditions) if c.strip()]
+    parsed = []
+    for text in conditions:
+        match = _CONDITION_RE.match(text)
+        if not match:
+            raise ValueError(f"검색 조건 형식이 올바르지 않습니다: {text}")
+        field, op, value = match.groups()
+        if field not in FIELD_NAMES:
+            raise ValueError(f"알 수 없는 필드입니다: {field}")
+        try:
+            value = float(value)
+        except ValueError:
+            raise ValueError(f"검색 값은 숫자여야 합니다: {text}")
+        parsed.append((field, op, value))
+    return parsed
+
+
+def query_projects(conn, conditions=(), limit=None):
+    """조건에 맞는 프로젝트 목록 (dict 목록, 경로순)"""
+    where = ['error IS NULL']
+    params = []
+    for field, op, value in parse_conditions(conditions):
+        where.append(f'{field} {op} ?')
+        params.append(value)
+    sql = (f"SELECT path, sha256, {', '.join(FIELD_NAMES)} FROM projects "
+           f"WHERE {' AND '.join(where)} ORDER BY path")
+    if limit:
+        sql += f' LIMIT {int(limit)}'
+    columns = ['path', 'sha256'] + FIELD_NAMES
+    return [dict(zip(columns, row)) for row in conn.execute(sql, params)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='암거 프로젝트 라이브러리 색인/검색')
+    parser.add_argument('--db', default=None, help='데이터베이스 경로')
+    sub = parser.add_subparsers(dest='command', required=True)
+    scan_parser = sub.add_parser('scan', help='폴더 색인 (변경된 파일만)')
+    scan_parser.add_argument('directory')
+    scan_parser.add_argument('--thumbnails', action='store_true', help='단면 미리보기 생성')
+    scan_parser.add_argument('--workers', type=int, default=None, help='미리보기 프로세스 수')
+    query_parser = sub.add_parser('query', help='조건 검색 (예: "H>=4000" "fs<1.3")')
+    query_parser.add_argument('conditions', nargs='*')
+    query_parser.add_argument('--limit', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    conn = open_library(args.db)
+    try:
+        if args.command == 'scan':
+            stats = scan_directory(conn, args.directory)
+            print(f"파일 {stats['scanned']}개: 갱신 {stats['parsed']}, 변경없음 {stats['unchanged']}, "
+                  f"삭제 {stats['removed']}, 오류 {stats['failed']}")
+            if args.thumbnails:
+                created, failed = update_thumbnails(conn, workers=args.workers)
+                print(f"미리보기 {created}개 생성, 실패 {failed}")
+        else:
+            try:
+                rows = query_projects(conn, args.conditions, limit=args.limit)
+            except ValueError as e:
+                print(e, file=sys.stderr)
+                return 2
+            for row in rows:
+                fs = '-' if row['fs'] is None else f"{row['fs']:.2f}"
+                print(f"{row['path']}\t{row['culvert_count']}련\tH={row['H']}\tFS={fs}")
+            print(f"{len(rows)}개", file=sys.stderr)
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
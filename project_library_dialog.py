@@ -0,0 +1,162 @@
+"""프로젝트 라이브러리 검색 대화상자 모듈
+
+project_library의 색인/검색을 GUI에서 사용한다. 색인은 백그라운드 스레드에서
+수행하고, 검색 결과에 단면 미리보기(썸네일)를 표시한다.
+"""
+
+import os
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                              QPushButton, QTableWidget, QTableWidgetItem, QFileDialog,
+                              QHeaderView, QMessageBox, QAbstractItemView)
+from PyQt5.QtCore import QThread, pyqtSignal, QSize
+from PyQt5.QtGui import QIcon
+from headless_render import thumbnail_path
+from project_library import (FIELDS, FIELD_NAMES, default_db_path, open_library, query_projects,
+                             scan_directory, update_thumbnails)
+
+
+class LibraryScanThread(QThread):
+    """라이브러리 백그라운드 색인 스레드"""
+    progress = pyqtSignal(int, int)
+    finished_scan = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, db_path, directory, thumbnails=True, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+        self.directory = directory
+        self.thumbnails = thumbnails
+
+    def run(self):
+        try:
+            conn = open_library(self.db_path)
+            try:
+                stats = scan_directory(conn, self.directory, progress=self.progress.emit)
+                if self.thumbnails:
+                    stats['thumbnails'], _ = update_thumbnails(conn, progress=self.progress.emit)
+            finally:
+                conn.close()
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished_scan.emit(stats)
+
+
+class ProjectLibraryDialog(QDialog):
+    """프로젝트 라이브러리 검색 대화상자"""
+    project_selected = pyqtSignal(str)
+
+    RESULT_LIMIT = 1000
+
+    def __init__(self, db_path=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("프로젝트 라이브러리")
+        self.resize(1000, 600)
+        self.db_path = db_path or default_db_path()
+        self._scan_thread = None
+
+        layout = QVBoxLayout(self)
+
+        # 폴더 색인
+        scan_layout = QHBoxLayout()
+        self.folder_edit = QLineEdit()
+        self.folder_edit.setPlaceholderText("프로젝트 폴더")
+        browse_btn = QPushButton("찾아보기...")
+        browse_btn.clicked.connect(self.browse_folder)
+        self.scan_btn = QPushButton("색인")
+        self.scan_btn.clicked.connect(self.start_scan)
+        scan_layout.addWidget(QLabel("폴더:"))
+        scan_layout.addWidget(self.folder_edit, 1)
+        scan_layout.addWidget(browse_btn)
+        scan_layout.addWidget(self.scan_btn)
+        layout.addLayout(scan_layout)
+
+        # 검색 조건
+        query_layout = QHBoxLayout()
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText("예) culvert_count=3, H>=4000, fs<1.3")
+        self.query_edit.returnPressed.connect(self.run_query)
+        search_btn = QPushButton("검색")
+        search_btn.clicked.connect(self.run_query)
+        query_layout.addWidget(QLabel("조건:"))
+        query_layout.addWidget(self.query_edit, 1)
+        query_layout.addWidget(search_btn)
+        layout.addLayout(query_layout)
+
+        # 결과 테이블
+        self.result_table = QTableWidget(0, len(FIELDS) + 1)
+        self.result_table.setHorizontalHeaderLabels(['파일'] + [label for _, label in FIELDS])
+        self.result_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.result_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.result_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.result_table.setIconSize(QSize(64, 48))
+        self.result_table.verticalHeader().setDefaultSectionSize(52)
+        self.result_table.cellDoubleClicked.connect(self.open_selected)
+        layout.addWidget(self.result_table)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        self.run_query()
+
+    def browse_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, '프로젝트 폴더 선택', self.folder_edit.text())
+        if folder:
+            self.folder_edit.setText(folder)
+
+    def start_scan(self):
+        folder = self.folder_edit.text().strip()
+        if not folder or not os.path.isdir(folder):
+            QMessageBox.warning(self, '색인', '프로젝트 폴더를 선택하세요.')
+            return
+        self.scan_btn.setEnabled(False)
+        self._scan_thread = LibraryScanThread(self.db_path, folder, parent=self)
+        self._scan_thread.progress.connect(
+            lambda done, total: self.status_label.setText(f"색인 중... {done}/{total}"))
+        self._scan_thread.finished_scan.connect(self._on_scan_finished)
+        self._scan_thread.failed.connect(self._on_scan_failed)
+        self._scan_thread.start()
+
+    def _on_scan_finished(self, stats):
+        self.scan_btn.setEnabled(True)
+        self.run_query()
+        self.status_label.setText(
+            f"색인 완료: 파일 {stats['scanned']}개 (갱신 {stats['parsed']}, 변경없음 {stats['unchanged']}, "
+            f"삭제 {stats['removed']}, 오류 {stats['failed']}, 미리보기 {stats.get('thumbnails', 0)}) "
+            f"- {self.status_label.text()}")
+
+    def _on_scan_failed(self, message):
+        self.scan_btn.setEnabled(True)
+        QMessageBox.critical(self, '색인 오류', f'프로젝트 폴더 색인에 실패했습니다.\n{message}')
+
+    def run_query(self):
+        try:
+            conn = open_library(self.db_path)
+            try:
+                rows = query_projects(conn, self.query_edit.text(), limit=self.RESULT_LIMIT + 1)
+            finally:
+                conn.close()
+        except ValueError as e:
+            self.status_label.setText(str(e))
+            return
+
+        truncated = len(rows) > self.RESULT_LIMIT
+        rows = rows[:self.RESULT_LIMIT]
+        self.result_table.setRowCount(len(rows))
+        for r, row in enumerate(rows):
+            path_item = QTableWidgetItem(row['path'])
+            thumbnail = thumbnail_path(row['sha256']) if row['sha256'] else None
+            if thumbnail and os.path.exists(thumbnail):
+                path_item.setIcon(QIcon(thumbnail))
+            self.result_table.setItem(r, 0, path_item)
+            for c, name in enumerate(FIELD_NAMES, 1):
+                value = row[name]
+                text = '' if value is None else (f"{value:,.2f}" if isinstance(value, float) else str(value))
+                self.result_table.setItem(r, c, QTableWidgetItem(text))
+        more = f" (처음 {self.RESULT_LIMIT}개만 표시)" if truncated else ""
+        self.status_label.setText(f"검색 결과: {len(rows)}개{more}")
+
+    def open_selected(self, row, _column=0):
+        item = self.result_table.item(row, 0)
+        if item:
+            self.project_selected.emit(item.text())
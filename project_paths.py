@@ -0,0 +1,67 @@
+"""프로젝트 데이터 경로 유틸리티
+
+프로젝트/단면 데이터(dict, list 중첩)의 특정 값을 경로 튜플로 가리킨다.
+예) ('sectionData', 'haunch', 'middleWalls', 1, 'upper', 'width')
+자동저장 변경기록, 실행취소, 프로젝트 비교에서 공통으로 사용한다.
+"""
+
+import copy
+from collections.abc import Mapping
+
+
+def get_path(data, path, default=None):
+    """경로의 값 (없으면 default)"""
+    node = data
+    for key in path:
+        try:
+            node = node[key]
+        except (KeyError, IndexError, TypeError):
+            return default
+    return node
+
+
+def set_path(data, path, value):
+    """경로에 값 설정 (data를 직접 수정, 중간 dict는 필요 시 생성)"""
+    if not path:
+        raise ValueError("빈 경로에는 값을 설정할 수 없습니다.")
+    node = data
+    for key in path[:-1]:
+        if isinstance(node, list):
+            node = node[key]
+        else:
+            node = node.setdefault(key, {})
+    node[path[-1]] = value
+
+
+def diff_paths(old, new, prefix=()):
+    """두 데이터의 변경 목록 [(경로, 새 값), ...]
+
+    같은 구조 안에서 바뀐 말단 값만 기록한다. dict 키 구성이나 list 길이가
+    달라지면 해당 컨테이너 전체를 한 항목으로 기록한다 (최상위 dict 제외).
+    old는 읽기 전용 구조(MappingProxy, tuple)여도 된다.
+    """
+    if isinstance(old, Mapping) and isinstance(new, dict):
+        if prefix and old.keys() != new.keys():
+            return [(prefix, copy.deepcopy(new))]
+        changes = []
+        for key in new:
+            if key in old:
+                changes.extend(diff_paths(old[key], new[key], prefix + (key,)))
+            else:
+                changes.append((prefix + (key,), copy.deepcopy(new[key])))
+        return changes
+    if isinstance(old, (list, tuple)) and isinstance(new, list) and len(old) == len(new):
+        changes = []
+        for i, (a, b) in enumerate(zip(old, new)):
+            changes.extend(diff_paths(a, b, prefix + (i,)))
+        return changes
+    if old != new or type(old) is not type(new):
+        return [(prefix, copy.deepcopy(new))]
+    return []
+
+
+def apply_changes(data, changes):
+    """변경 목록을 data에 순서대로 적용 (data 직접 수정)"""
+    for path, value in changes:
+        set_path(data, tuple(path), copy.deepcopy(value))
+    return data
@@ -0,0 +1,219 @@
+"""수량산출 (Quantity Takeoff) 모듈
+
+부력검토의 단면 분할(decompose_section) 면적으로 콘크리트량을, 단면 배치
+(section_layout)로 거푸집 면적을 단위길이(1 m)당 구하고, 측점별 구간 길이를
+곱해 프로젝트 전체 수량표를 만든다.
+
+측점 데이터 (프로젝트 데이터 'stations' 목록의 각 항목)
+    name        : 측점 이름 (예: 'STA. 0+020')
+    length      : 구간 길이 (m)  - 없으면 end - start
+    start, end  : 시점/종점 추가거리 (m)
+    sectionData : 프로젝트 단면제원과 다른 값만 (선택)
+
+같은 단면의 측점은 단위길이 수량을 한 번만 계산하고, 측점별 수량은
+(측점, 항목) 배열의 곱 한 번으로 구한다.
+"""
+
+import math
+import numpy as np
+from buoyancy_check import decompose_section
+from section_layout import get_section_layout
+from result_cache import canonical_json
+
+# 수량 항목 (키, 이름, 단위) - 단위길이 수량은 단위 /m
+QUANTITY_ITEMS = [
+    ('concrete_body', '콘크리트 (본체)', 'm³'),
+    ('concrete_anti_float', '콘크리트 (부상방지저판)', 'm³'),
+    ('concrete_total', '콘크리트 계', 'm³'),
+    ('form_outer_wall', '거푸집 (외측벽 외면)', 'm²'),
+    ('form_inner_wall', '거푸집 (내공 벽면)', 'm²'),
+    ('form_top_slab', '거푸집 (상부슬래브 하면)', 'm²'),
+    ('form_haunch', '거푸집 (헌치 경사면)', 'm²'),
+    ('form_column', '거푸집 (기둥/종거더)', 'm²'),
+    ('form_anti_float', '거푸집 (부상방지저판 측면)', 'm²'),
+    ('form_total', '거푸집 계', 'm²'),
+    ('anti_float_area', '부상방지저판 바닥면적', 'm²'),
+]
+ITEM_KEYS = [key for key, _, _ in QUANTITY_ITEMS]
+
+
+def unit_quantities(section_data, shapes=None):
+    """단위길이(1 m)당 수량 {항목 키: 값}
+
+    Args:
+        section_data: 단면제원 데이터
+        shapes: decompose_section 결과 (없으면 계산)
+    """
+    if shapes is None:
+        shapes = decompose_section(section_data)
+    layout = get_section_layout(section_data)
+    mm = 0.001
+    q = dict.fromkeys(ITEM_KEYS, 0.0)
+
+    # ── 콘크리트: 분할 도형 면적 (기둥은 CTC 환산 면적) ──
+    for shape in shapes:
+        key = 'concrete_anti_float' if shape['group'] == 'antiFloat' else 'concrete_body'
+        q[key] += shape['area'] / 1e6
+    q['concrete_total'] = q['concrete_body'] + q['concrete_anti_float']
+
+    # ── 거푸집: 외측벽 외면 (양쪽) ──
+    q['form_outer_wall'] = 2 * layout.total_height * mm
+
+    column_girder = section_data.get('columnGirder', {}) or {}
+    ctc = float(column_girder.get('columnCTC', 3000))
+    col_width = float(column_girder.get('columnWidth', 500))
+    upper_add = float(column_girder.get('upperAdditionalHeight', 200))
+    lower_add = float(column_girder.get('lowerAdditionalHeight', 200))
+
+    def is_column(wall_no):
+        """벽체 번호(0 = 좌측벽)가 기둥형 중간벽인지"""
+        if wall_no in (0, layout.culvert_count):
+            return False
+        mw = layout.middle_walls[wall_no - 1] if wall_no - 1 < len(layout.middle_walls) else {}
+        return mw.get('type', '연속벽') == '기둥'
+
+    # ── 내공: 벽면 / 상부슬래브 하면 / 헌치 경사면 (하부슬래브 상면은 제외) ──
+    for i in range(layout.culvert_count):
+        h = layout.haunches[i]
+        corner = {c: (float(h[c].get('width', 0)), float(h[c].get('height', 0)))
+                  for c in ('ul', 'll', 'ur', 'lr')}
+        for upper, lower, wall_no in (('ul', 'll', i), ('ur', 'lr', i + 1)):
+            if is_column(wall_no):
+                # 기둥 사이 구간은 종거더 측면만 내공면
+                q['form_column'] += (upper_add + lower_add) * mm
+            else:
+                q['form_inner_wall'] += (layout.H - corner[upper][1] - corner[lower][1]) * mm
+        q['form_top_slab'] += (layout.B[i] - corner['ul'][0] - corner['ur'][0]) * mm
+        for w, hh in corner.values():
+            if w > 0 and hh > 0:
+                q['form_haunch'] += math.hypot(w, hh) * mm
+
+    # ── 기둥형 중간벽: 기둥 둘레 (CTC 환산) + 상부 종거더 하면 ──
+    for j in range(1, layout.culvert_count):
+        if not is_column(j) or ctc <= 0:
+            continue
+        t = layout.wall_thickness[j]
+        upper_h = float(layout.haunches[j - 1]['ur'].get('height', 0)) + upper_add
+        lower_h = float(layout.haunches[j - 1]['lr'].get('height', 0)) + lower_add
+        clear_h = layout.H - upper_h - lower_h
+        if clear_h > 0:
+            q['form_column'] += 2 * (t + col_width) * clear_h * mm * mm * 1000 / ctc
+            q['form_column'] += t * mm * max(1.0 - col_width / ctc, 0.0)
+
+    # ── 부상방지저판: 양 측면 + 바닥면적 ──
+    anti_float = section_data.get('antiFloat', {}) or {}
+    if anti_float.get('use', False):
+        af_thickness = float(anti_float.get('thickness', 300))
+        af_width = (float(anti_float.get('leftExtension', 500)) + layout.total_width
+                    + float(anti_float.get('rightExtension', 500)))
+        q['form_anti_float'] = 2 * af_thickness * mm
+        q['anti_float_area'] = af_width * mm
+
+    q['form_total'] = sum(q[k] for k in ITEM_KEYS if k.startswith('form_') and k != 'form_total')
+    return q
+
+
+def station_section(section_data, station):
+    """측점 단면제원 (프로젝트 단면 + 측점에서 바꾼 값)"""
+    overrides = station.get('sectionData') or {}
+    if not overrides:
+        return section_data
+    merged = dict(section_data)
+    merged.update(overrides)
+    return merged
+
+
+def station_length(station):
+    """측점 구간 길이 (m)"""
+    if station.get('length') is not None:
+        return float(station['length'])
+    if station.get('start') is not None and station.get('end') is not None:
+        return float(station['end']) - float(station['start'])
+    return 0.0
+
+
+class QuantityTakeoff:
+    """수량표 (측점 × 항목 배열)"""
+
+    def __init__(self, station_names, lengths, unit, per_station):
+        self.items = QUANTITY_ITEMS
+        self.station_names = station_names
+        self.lengths = lengths            # (측점,) m
+        self.unit = unit                  # (측점, 항목) 단위길이 수량
+        self.per_station = per_station    # (측점, 항목) 측점 구간 수량
+        self.totals = per_station.sum(axis=0)
+
+    def item(self, key):
+        """항목 키의 측점별 수량"""
+        return self.per_station[:, ITEM_KEYS.index(key)]
+
+
+def quantity_takeoff(project_data, stations=None):
+    """프로젝트 전체 수량산출 (모든 측점 일괄)
+
+    Args:
+        project_data: 프로젝트 데이터 ('sectionData', 'stations')
+        stations: 측점 목록 (없으면 project_data['stations'],
+                  그것도 없으면 프로젝트 단면 1 m)
+
+    Returns:
+        QuantityTakeoff
+    """
+    section_data = project_data.get('sectionData', {}) or {}
+    if stations is None:
+        stations = project_data.get('stations') or [{'name': '기본 단면', 'length': 1.0}]
+
+    # 같은 단면은 한 번만 계산
+    keys = {}
+    station_index = np.empty(len(stations), dtype=int)
+    unit_rows = []
+    for s, station in enumerate(stations):
+        sd = station_section(section_data, station)
+        key = canonical_json(sd)
+        if key not in keys:
+            keys[key] = len(unit_rows)
+            q = unit_quantities(sd)
+            unit_rows.append([q[k] for k in ITEM_KEYS])
+        station_index[s] = keys[key]
+
+    unit = np.array(unit_rows).reshape(-1, len(ITEM_KEYS))[station_index]
+    lengths = np.array([station_length(st) for st in stations])
+    per_station = unit * lengths[:, np.newaxis]
+    names = [st.get('name') or f"측점 {s+1}" for s, st in enumerate(stations)]
+    return QuantityTakeoff(names, lengths, unit, per_station)
+
+
+def generate_quantity_report(project_data, takeoff=None):
+    """수량산출서 텍스트"""
+    if takeoff is None:
+        takeoff = quantity_takeoff(project_data)
+    lines = []
+
+    def add(text=''):
+        lines.append(text)
+
+    add("═" * 60)
+    add("         수 량 산 출")
+    add("═" * 60)
+    add()
+    add(f"   측점 {len(takeoff.station_names)}개, 총 연장 = {takeoff.lengths.sum():,.2f} m")
+    add()
+    add("   ■ 단위길이(1 m)당 수량")
+    # 단면이 같은 측점이 대부분이므로 첫 측점 기준으로 표시하고, 다른 단면은 측점표에서 확인
+    for k, (_, name, unit) in enumerate(takeoff.items):
+        add(f"     {name:<24}{takeoff.unit[0, k]:>12,.3f} {unit}/m")
+    add()
+    add("   ■ 측점별 수량")
+    concrete = ITEM_KEYS.index('concrete_total')
+    form = ITEM_KEYS.index('form_total')
+    add(f"     {'측점':<16}{'연장(m)':>10}{'콘크리트(m³)':>14}{'거푸집(m²)':>14}")
+    for s, name in enumerate(takeoff.station_names):
+        add(f"     {name:<16}{takeoff.lengths[s]:>10,.2f}"
+            f"{takeoff.per_station[s, concrete]:>14,.2f}{takeoff.per_station[s, form]:>14,.2f}")
+    add()
+    add("   ■ 총 수량")
+    for k, (_, name, unit) in enumerate(takeoff.items):
+        add(f"     {name:<24}{takeoff.totals[k]:>12,.2f} {unit}")
+    add()
+    add("═" * 60)
+    return '\n'.join(lines)
@@ -0,0 +1,165 @@
+"""배근 검토 (휨철근 / 전단철근) 모듈
+
+골조 해석의 모든 하중조합 × 분점 단면력을 배열로 받아 필요철근량, 설계강도,
+이용률(사용률)을 한 번에 계산하고, 분점별 지배 하중조합을 찾는다.
+하중조합에 대한 Python 반복문 없이 NumPy 배열 연산으로 처리한다.
+
+단위폭 b = 1,000 mm 기준 (강도설계법)
+    휨  : φMn = φf · As · fy · (d - a/2),  a = As·fy / (0.85·fck·b)
+    전단 : φVc = φv · (1/6) · λ · √fck · b · d  (축력 영향 무시)
+모멘트 부호는 frame_analysis와 같다 (내측면 인장 +).
+"""
+
+import math
+import numpy as np
+
+PHI_FLEXURE = 0.85
+PHI_SHEAR = 0.75
+DEFAULT_COVER = 80.0               # 피복 (철근 중심까지, mm)
+DEFAULT_REBAR = (22, 200)          # 기본 배근 (직경 mm, 간격 mm) - 배근입력 값이 없을 때
+
+
+def rebar_area(diameter, spacing):
+    """단위폭(1 m)당 철근량 (mm²/m)"""
+    return math.pi * diameter ** 2 / 4 * 1000.0 / spacing
+
+
+class RebarCheck:
+    """배근 검토 결과 (분점 배열)
+
+    (조합, 분점) 배열과 분점별 지배값/지배조합 번호를 가진다.
+    면(face)은 0 = 내측, 1 = 외측.
+    """
+
+    def __init__(self, **arrays):
+        self.__dict__.update(arrays)
+
+
+def check_reinforcement(M, V, thickness, fck, fy, cover=DEFAULT_COVER,
+                        as_provided=None, lam=1.0):
+    """휨/전단 배근 검토 (모든 조합, 모든 분점 일괄)
+
+    Args:
+        M: (조합, 분점) 계수 휨모멘트 (kN·m/m, 내측면 인장 +)
+        V: (조합, 분점) 계수 전단력 (kN/m)
+        thickness: (분점,) 부재 두께 (mm)
+        fck, fy: 재료강도 (MPa)
+        cover: 철근 중심까지 피복 (mm)
+        as_provided: (2, 분점) 면별 배근량 (mm²/m) [내측, 외측] (없으면 DEFAULT_REBAR)
+        lam: 경량콘크리트 계수 λ
+
+    Returns:
+        RebarCheck
+    """
+    M = np.atleast_2d(np.asarray(M, dtype=float))
+    V = np.atleast_2d(np.asarray(V, dtype=float))
+    h = np.asarray(thickness, dtype=float)
+    b = 1000.0
+    d = h - cover
+    n_points = M.shape[1]
+    if as_provided is None:
+        as_provided = np.full((2, n_points), rebar_area(*DEFAULT_REBAR))
+    As = np.asarray(as_provided, dtype=float)
+
+    # ── 휨 ──
+    # 면별 계수 모멘트 (조합, 면, 분점): 내측 = M⁺, 외측 = M⁻
+    Mu_face = np.stack([np.maximum(M, 0.0), np.maximum(-M, 0.0)], axis=1) * 1e6   # N·mm
+    gov_flexure = Mu_face.argmax(axis=0)                                          # (면, 분점)
+    Mu_gov = np.take_along_axis(Mu_face, gov_flexure[np.newaxis], axis=0)[0]
+
+    # 필요철근량: ρ = 0.85fck/fy · (1 - √(1 - 2Rn / 0.85fck))
+    Rn = Mu_gov / (PHI_FLEXURE * b * d ** 2)
+    term = 1.0 - 2.0 * Rn / (0.85 * fck)
+    over_reinforced = term < 0          # 단면 부족 (두께 증가 필요)
+    rho = 0.85 * fck / fy * (1.0 - np.sqrt(np.maximum(term, 0.0)))
+    as_required = rho * b * d
+    as_min = max(0.25 * math.sqrt(fck) / fy, 1.4 / fy) * b * d
+    # 최소철근: 필요량의 4/3 이상이면 최소철근 규정 만족으로 봄
+    as_required = np.where(Mu_gov > 0, np.maximum(as_required, np.minimum(as_min, 4.0 / 3.0 * as_required)), 0.0)
+
+    a = As * fy / (0.85 * fck * b)
+    phi_Mn = PHI_FLEXURE * As * fy * (d - a / 2)                                 # (면, 분점) N·mm
+    flexure_ratio = Mu_face / phi_Mn                                             # (조합, 면, 분점)
+
+    # ── 전단 ──
+    Vu = np.abs(V) * 1e3                                                         # N
+    gov_shear = Vu.argmax(axis=0)
+    Vu_gov = Vu[gov_shear, np.arange(n_points)]
+    Vc = lam * math.sqrt(fck) / 6.0 * b * d
+    phi_Vc = PHI_SHEAR * Vc
+    shear_ratio = Vu / phi_Vc
+    # 필요 전단철근 Av/s (mm²/m), 콘크리트만으로 부족한 분점
+    av_s_required = np.maximum(Vu_gov / PHI_SHEAR - Vc, 0.0) / (fy * d) * 1000.0
+
+    return RebarCheck(
+        d=d,
+        as_provided=As,
+        Mu=Mu_gov / 1e6,                         # (면, 분점) kN·m/m
+        flexure_combination=gov_flexure,         # (면, 분점)
+        as_required=as_required,                 # (면, 분점) mm²/m
+        as_min=as_min,                           # (분점,) mm²/m
+        phi_Mn=phi_Mn / 1e6,                     # (면, 분점) kN·m/m
+        flexure_ratio=flexure_ratio,             # (조합, 면, 분점)
+        flexure_utilization=Mu_gov / phi_Mn,     # (면, 분점)
+        over_reinforced=over_reinforced,         # (면, 분점)
+        Vu=Vu_gov / 1e3,                         # (분점,) kN/m
+        shear_combination=gov_shear,             # (분점,)
+        phi_Vc=phi_Vc / 1e3,                     # (분점,) kN/m
+        shear_ratio=shear_ratio,                 # (조합, 분점)
+        shear_utilization=Vu_gov / phi_Vc,       # (분점,)
+        av_s_required=av_s_required,             # (분점,) mm²/m
+    )
+
+
+def check_section_reinforcement(analysis, fck, fy, cover=DEFAULT_COVER, as_provided=None):
+    """load_cases.SectionAnalysis 결과로 배근 검토"""
+    thickness = np.array([p.thickness for p in analysis.points])
+    return check_reinforcement(analysis.M, analysis.V, thickness, fck, fy, cover, as_provided)
+
+
+def generate_rebar_report(analysis, check, kind='flexure'):
+    """휨철근('flexure') / 전단철근('shear') 검토 보고서 텍스트"""
+    combos = analysis.combinations
+    lines = []
+
+    def add(text=''):
+        lines.append(text)
+
+    title = "휨 철 근 검 토" if kind == 'flexure' else "전 단 철 근 검 토"
+    add("═" * 60)
+    add(f"         {title}")
+    add("═" * 60)
+    add()
+    add(f"   하중조합 {len(combos)}개, 분점 {len(analysis.points)}개 (단위폭 1 m)")
+    add(f"   φf = {PHI_FLEXURE}, φv = {PHI_SHEAR}, 피복(철근 중심) = {DEFAULT_COVER:g} mm")
+    if kind == 'flexure':
+        dia, spacing = DEFAULT_REBAR
+        add(f"   배근 (배근입력 미입력 시 기본값) = D{dia}@{spacing} ({rebar_area(dia, spacing):,.0f} mm²/m)")
+    add()
+
+    for i, point in enumerate(analysis.points):
+        add(f"   [{i+1}] {point.label}  (h = {point.thickness:,.0f} mm, d = {check.d[i]:,.0f} mm)")
+        if kind == 'flexure':
+            for face, face_name in ((0, '내측'), (1, '외측')):
+                mu = check.Mu[face, i]
+                if mu <= 0:
+                    continue
+                k = check.flexure_combination[face, i]
+                ratio = check.flexure_utilization[face, i]
+                status = "O.K." if ratio <= 1.0 and not check.over_reinforced[face, i] else "N.G."
+                add(f"     {face_name}: Mu = {mu:,.2f} kN·m ({combos.names[k]}: {combos.describe(k)})")
+                add(f"           As,req = {check.as_required[face, i]:,.0f} mm²/m,"
+                    f" φMn = {check.phi_Mn[face, i]:,.2f} kN·m, Mu/φMn = {ratio:.3f}  →  {status}")
+        else:
+            k = check.shear_combination[i]
+            ratio = check.shear_utilization[i]
+            add(f"     Vu = {check.Vu[i]:,.2f} kN ({combos.names[k]}: {combos.describe(k)})")
+            if check.av_s_required[i] > 0:
+                add(f"     φVc = {check.phi_Vc[i]:,.2f} kN < Vu  →  전단철근 필요"
+                    f" Av/s = {check.av_s_required[i]:,.0f} mm²/m")
+            else:
+                add(f"     φVc = {check.phi_Vc[i]:,.2f} kN, Vu/φVc = {ratio:.3f}  →  O.K.")
+        add()
+
+    add("═" * 60)
+    return '\n'.join(lines)
@@ -0,0 +1,471 @@
+"""보고서 뷰어 (Report Viewer) 모듈
+
+긴 계산 보고서 텍스트를 줄 위치 색인과 블록(절/도형/측점) 목록으로 만들고,
+화면에 보이는 줄만 그린다. QTextEdit처럼 전체 문서를 배치하지 않으므로
+수 MB 보고서도 바로 열리고 스크롤이 일정하게 빠르다.
+
+- ReportIndex : 줄 시작 위치 배열, 블록 목록, 검색 (줄 번호 배열로 반환)
+- ReportView  : 보이는 줄만 그리는 스크롤 영역 (줄 단위 선택/복사, 검색어 강조)
+- ReportViewer: 목차 + 측점 이동 + 검색 + ReportView
+"""
+
+import re
+import numpy as np
+from PyQt5.QtWidgets import (QAbstractScrollArea, QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
+                              QPushButton, QLabel, QListView, QSplitter, QCompleter, QApplication)
+from PyQt5.QtGui import QPainter, QFont, QFontMetrics, QColor, QKeySequence
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer, pyqtSignal
+
+# 블록 머리줄 (종류, 단계, 정규식) - 제목은 첫 번째 그룹
+_BLOCK_PATTERNS = [
+    ('section', 0, r'(\d+\.[ \t]+\S.*)'),                          # 1. 설계 조건
+    ('section', 0, r'[ \t]{0,3}(\[\d+\][ \t]+\S.*)'),           # [1] 시나리오
+    ('heading', 1, r'[ \t]*(■[ \t]*\S.*)'),                          # ■ 종합
+    ('heading', 1, r'[ \t]*(?:──|----)[ \t]*([^─\-\s].*?)[ \t]*(?:──|----)[ \t]*$'),  # ── 헌치 (삼각형) ──
+    ('shape', 2, r'[ \t]*(\[(?:사각형|삼각형)[^\]\n]*No\.\d+\].*)'),    # [사각형 No.1] 상부슬래브
+    ('station', 2, r'[ \t]*((?:STA\.?[ \t]*\d[\d.+\-]*|측점[ \t]*\d+)(?=[ \t]|$).*)'),  # STA. 0+020 ...
+]
+# 줄 시작 위치에서만 맞춰 봄 (\s 대신 [ \t]를 써서 다음 줄로 넘어가지 않게 함)
+_BLOCK_RE = re.compile('|'.join(f'(?P<p{k}>{pattern[2]})' for k, pattern in enumerate(_BLOCK_PATTERNS)),
+                       re.MULTILINE)
+# 머리줄이 될 수 있는 첫 글자 (들여쓰기 다음)
+_BLOCK_FIRST_CHARS = np.array([ord(c) for c in '0123456789[■─-S측'], dtype=np.uint32)
+_MAX_INDENT = 8
+MAX_MATCHES = 100000
+
+
+class ReportBlock:
+    """보고서 블록 (머리줄 번호부터 다음 블록 전까지)"""
+    __slots__ = ('kind', 'level', 'title', 'line')
+
+    def __init__(self, kind, level, title, line):
+        self.kind = kind
+        self.level = level
+        self.title = title
+        self.line = line
+
+
+class ReportIndex:
+    """보고서 텍스트 색인 (줄 시작 위치 + 블록 목록)
+
+    Args:
+        text: 보고서 텍스트
+        stations: 측점 이름 목록 (주면 보고서에 나오는 순서대로 측점 블록으로 등록)
+    """
+
+    def __init__(self, text, stations=None):
+        self.text = text
+        # 줄 시작 위치 (UTF-32로 보면 문자 위치와 배열 위치가 같음)
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        self.starts = np.concatenate(([0], np.flatnonzero(codes == 10) + 1)).astype(np.int64)
+        self.line_count = len(self.starts)
+        self._codes = codes
+        self._stations = stations
+        self._blocks = None
+        self._lower = None
+        self._max_line_indices = None
+
+    @property
+    def blocks(self):
+        """블록 목록 (처음 사용할 때 만듦)"""
+        if self._blocks is None:
+            self._blocks = self._find_blocks(self._codes, self._stations)
+            self._codes = None
+        return self._blocks
+
+    def line(self, i):
+        start = self.starts[i]
+        end = self.starts[i + 1] - 1 if i + 1 < self.line_count else len(self.text)
+        return self.text[start:end]
+
+    def line_of(self, offsets):
+        """문자 위치 → 줄 번호"""
+        return np.searchsorted(self.starts, offsets, side='right') - 1
+
+    def longest_lines(self, count=20):
+        """글자 수가 가장 많은 줄 번호 (가로 스크롤 폭 계산용)"""
+        if self._max_line_indices is None:
+            lengths = np.diff(np.append(self.starts, len(self.text) + 1))
+            count = min(count, self.line_count)
+            self._max_line_indices = np.argpartition(lengths, -count)[-count:]
+        return self._max_line_indices
+
+    def _find_blocks(self, codes, stations):
+        # 들여쓰기 다음 첫 글자로 후보 줄만 골라 정규식 적용
+        codes = np.append(codes, np.uint32(10))
+        first = self.starts.copy()
+        for _ in range(_MAX_INDENT):
+            first += np.isin(codes[first], (32, 9))
+        candidates = self.starts[np.isin(codes[first], _BLOCK_FIRST_CHARS)].tolist()
+
+        found = []
+        match_at = _BLOCK_RE.match
+        for start in candidates:
+            match = match_at(self.text, start)
+            if match is None:
+                continue
+            kind, level, _ = _BLOCK_PATTERNS[int(match.lastgroup[1:])]
+            if stations and kind == 'station':
+                continue
+            found.append((start, kind, level, match.group().strip()))
+        if stations:
+            # 측점은 보고서에 나오는 순서이므로 앞에서부터 차례로 찾음
+            # (줄 첫 단어로 나오는 곳만 인정)
+            pos = 0
+            for name in stations:
+                while True:
+                    pos = self.text.find(name, pos)
+                    if pos < 0:
+                        break
+                    line = int(self.line_of(pos))
+                    if not self.text[self.starts[line]:pos].strip():
+                        break
+                    pos += len(name)
+                if pos < 0:
+                    break
+                found.append((int(self.starts[line]), 'station', 2, self.line(line).strip()))
+                pos += len(name)
+        found.sort(key=lambda item: item[0])
+        if found and found[0][1] == 'station':
+            # 측점별로 이어지는 보고서는 측점을 맨 위 단계로
+            found = [(start, kind, 0 if kind == 'station' else level + 1, title)
+                     for start, kind, level, title in found]
+        lines = self.line_of(np.array([item[0] for item in found], dtype=np.int64)).tolist() if found else []
+        return [ReportBlock(kind, level, title, line)
+                for (_, kind, level, title), line in zip(found, lines)]
+
+    def stations(self):
+        return [block for block in self.blocks if block.kind == 'station']
+
+    def block_at(self, line):
+        """줄이 속한 블록 번호 (없으면 -1)"""
+        lo, hi = 0, len(self.blocks)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.blocks[mid].line <= line:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo - 1
+
+    def search(self, query):
+        """검색어가 있는 줄 번호 배열 (대소문자 무시, 최대 MAX_MATCHES개 위치)"""
+        if not query:
+            return np.empty(0, dtype=np.int64)
+        if self._lower is None:
+            # 대부분 문자는 소문자 변환 후에도 길이가 같으므로 위치를 그대로 사용
+            lower = self.text.lower()
+            self._lower = lower if len(lower) == len(self.text) else self.text
+        text = self._lower
+        query = query.lower() if text is not self.text else query
+        offsets = []
+        pos = text.find(query)
+        while pos >= 0 and len(offsets) < MAX_MATCHES:
+            offsets.append(pos)
+            pos = text.find(query, pos + len(query))
+        return np.unique(self.line_of(np.array(offsets, dtype=np.int64)))
+
+
+# ========================================
+# 화면
+# ========================================
+
+class ReportView(QAbstractScrollArea):
+    """보이는 줄만 그리는 읽기 전용 보고서 화면"""
+    # 맨 위에 보이는 줄이 바뀔 때 (줄 번호)
+    top_line_changed = pyqtSignal(int)
+
+    PADDING = 10
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        font = QFont("Consolas", 10)
+        font.setStyleHint(QFont.Monospace)
+        self.setFont(font)
+        self.setStyleSheet("QAbstractScrollArea { background-color: #fafafa; border: 1px solid #ddd; }")
+        self.viewport().setCursor(Qt.IBeamCursor)
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.index = ReportIndex('')
+        self.query = ''
+        self.current_line = -1          # 현재 검색 결과 줄
+        self._selection = None          # (기준 줄, 끝 줄)
+        self._content_width = 0
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        self.horizontalScrollBar().valueChanged.connect(self.viewport().update)
+
+    def set_index(self, index):
+        self.index = index
+        self._selection = None
+        self.current_line = -1
+        fm = QFontMetrics(self.font())
+        width = max((fm.horizontalAdvance(index.line(int(i))) for i in index.longest_lines()), default=0)
+        self._content_width = width + 2 * self.PADDING
+        self._update_scrollbars()
+        self.verticalScrollBar().setValue(0)
+        self.viewport().update()
+
+    def line_height(self):
+        return QFontMetrics(self.font()).lineSpacing()
+
+    def visible_lines(self):
+        return max(1, self.viewport().height() // self.line_height())
+
+    def top_line(self):
+        return self.verticalScrollBar().value()
+
+    def _update_scrollbars(self):
+        visible = self.visible_lines()
+        vbar = self.verticalScrollBar()
+        vbar.setRange(0, max(0, self.index.line_count - visible))
+        vbar.setPageStep(visible)
+        hbar = self.horizontalScrollBar()
+        hbar.setRange(0, max(0, self._content_width - self.viewport().width()))
+        hbar.setPageStep(self.viewport().width())
+        hbar.setSingleStep(QFontMetrics(self.font()).averageCharWidth() * 4)
+
+    def _on_scrolled(self, value):
+        self.viewport().update()
+        self.top_line_changed.emit(value)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scrollbars()
+
+    def scroll_to_line(self, line, context=3):
+        """줄이 위에서 context줄 아래에 오도록 이동"""
+        self.verticalScrollBar().setValue(max(0, line - context))
+
+    def set_highlight(self, query, current_line=-1):
+        self.query = query
+        self.current_line = current_line
+        self.viewport().update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        fm = painter.fontMetrics()
+        height = fm.lineSpacing()
+        ascent = fm.ascent()
+        left = self.PADDING - self.horizontalScrollBar().value()
+        top = self.top_line()
+        last = min(self.index.line_count, top + self.visible_lines() + 1)
+        query = self.query.lower()
+        selection = sorted(self._selection) if self._selection else None
+        width = self.viewport().width()
+
+        for i in range(top, last):
+            y = (i - top) * height
+            text = self.index.line(i)
+            if selection and selection[0] <= i <= selection[1]:
+                painter.fillRect(0, y, width, height, QColor(179, 215, 255))
+            elif i == self.current_line:
+                painter.fillRect(0, y, width, height, QColor(255, 240, 170))
+            if query:
+                lowered = text.lower()
+                pos = lowered.find(query)
+                while pos >= 0:
+                    x = left + fm.horizontalAdvance(text[:pos])
+                    painter.fillRect(x, y, fm.horizontalAdvance(text[pos:pos + len(query)]), height,
+                                     QColor(255, 200, 0, 160))
+                    pos = lowered.find(query, pos + len(query))
+            painter.setPen(Qt.black)
+            painter.drawText(left, y + ascent, text)
+
+    # ── 선택 / 복사 (줄 단위) ──
+
+    def _line_at(self, y):
+        return min(self.index.line_count - 1, self.top_line() + max(0, y) // self.line_height())
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            line = self._line_at(event.pos().y())
+            if event.modifiers() & Qt.ShiftModifier and self._selection:
+                self._selection = (self._selection[0], line)
+            else:
+                self._selection = (line, line)
+            self.viewport().update()
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.LeftButton and self._selection:
+            y = event.pos().y()
+            if y < 0:
+                self.verticalScrollBar().triggerAction(self.verticalScrollBar().SliderSingleStepSub)
+            elif y > self.viewport().height():
+                self.verticalScrollBar().triggerAction(self.verticalScrollBar().SliderSingleStepAdd)
+            self._selection = (self._selection[0], self._line_at(y))
+            self.viewport().update()
+
+    def selected_text(self):
+        if not self._selection:
+            return ''
+        first, last = sorted(self._selection)
+        end = self.index.starts[last + 1] - 1 if last + 1 < self.index.line_count else len(self.index.text)
+        return self.index.text[self.index.starts[first]:end]
+
+    def keyPressEvent(self, event):
+        vbar = self.verticalScrollBar()
+        if event.matches(QKeySequence.Copy):
+            QApplication.clipboard().setText(self.selected_text())
+        elif event.matches(QKeySequence.SelectAll):
+            self._selection = (0, self.index.line_count - 1)
+            self.viewport().update()
+        elif event.key() == Qt.Key_Home and event.modifiers() & Qt.ControlModifier:
+            vbar.setValue(0)
+        elif event.key() == Qt.Key_End and event.modifiers() & Qt.ControlModifier:
+            vbar.setValue(vbar.maximum())
+        elif event.key() == Qt.Key_Up:
+            vbar.triggerAction(vbar.SliderSingleStepSub)
+        elif event.key() == Qt.Key_Down:
+            vbar.triggerAction(vbar.SliderSingleStepAdd)
+        else:
+            super().keyPressEvent(event)
+
+
+class _OutlineModel(QAbstractListModel):
+    """목차 (블록 목록, 보이는 항목만 요청됨)"""
+
+    def __init__(self, blocks, parent=None):
+        super().__init__(parent)
+        self.blocks = blocks
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.blocks)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        block = self.blocks[index.row()]
+        if role == Qt.DisplayRole:
+            return '    ' * block.level + block.title
+        if role == Qt.FontRole and block.level == 0:
+            font = QFont()
+            font.setBold(True)
+            return font
+        return None
+
+
+class ReportViewer(QWidget):
+    """목차 + 측점 이동 + 검색 + 보고서 화면"""
+
+    def __init__(self, text='', stations=None, parent=None):
+        super().__init__(parent)
+        self.index = None
+        self._matches = np.empty(0, dtype=np.int64)
+        self._match_pos = -1
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # 검색 / 측점 이동
+        bar = QHBoxLayout()
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("검색 (Enter: 다음, Shift+Enter: 이전)")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self.run_search)
+        self.search_edit.returnPressed.connect(self._on_return)
+        prev_btn = QPushButton("이전")
+        prev_btn.clicked.connect(lambda: self.step_match(-1))
+        next_btn = QPushButton("다음")
+        next_btn.clicked.connect(lambda: self.step_match(1))
+        self.match_label = QLabel("")
+        self.match_label.setMinimumWidth(90)
+        self.station_edit = QLineEdit()
+        self.station_edit.setPlaceholderText("측점 이동")
+        self.station_edit.setMaximumWidth(200)
+        self.station_edit.returnPressed.connect(lambda: self.jump_to_station(self.station_edit.text()))
+        bar.addWidget(self.search_edit, 1)
+        bar.addWidget(prev_btn)
+        bar.addWidget(next_btn)
+        bar.addWidget(self.match_label)
+        bar.addWidget(self.station_edit)
+        layout.addLayout(bar)
+
+        # 목차 | 본문
+        self.splitter = QSplitter(Qt.Horizontal)
+        self.outline = QListView()
+        self.outline.setUniformItemSizes(True)
+        self.outline.setEditTriggers(QListView.NoEditTriggers)
+        self.outline.clicked.connect(self._on_outline_clicked)
+        self.view = ReportView()
+        self.view.top_line_changed.connect(self._sync_outline)
+        self.splitter.addWidget(self.outline)
+        self.splitter.addWidget(self.view)
+        self.splitter.setStretchFactor(1, 1)
+        self.splitter.setSizes([220, 600])
+        layout.addWidget(self.splitter)
+
+        self.set_text(text, stations)
+
+    def set_text(self, text, stations=None):
+        self.index = ReportIndex(text, stations)
+        self.view.set_index(self.index)
+        self.outline.setModel(_OutlineModel([], self.outline))
+        self.outline.hide()
+        self.station_edit.hide()
+        # 본문을 먼저 보여주고 목차는 다음 이벤트에서 만듦
+        QTimer.singleShot(0, self._build_outline)
+        self.run_search(self.search_edit.text())
+
+    def _build_outline(self):
+        self.outline.setModel(_OutlineModel(self.index.blocks, self.outline))
+        self.outline.setVisible(len(self.index.blocks) > 1)
+        names = [block.title for block in self.index.stations()]
+        self.station_edit.setVisible(bool(names))
+        completer = QCompleter(names, self.station_edit)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchContains)
+        completer.activated.connect(self.jump_to_station)
+        self.station_edit.setCompleter(completer)
+
+    def jump_to_station(self, name):
+        """측점 블록으로 이동 (이름 앞부분 또는 포함 일치)"""
+        name = name.strip().lower()
+        if not name:
+            return False
+        stations = self.index.stations()
+        for match in (lambda title: title.lower().startswith(name), lambda title: name in title.lower()):
+            for block in stations:
+                if match(block.title):
+                    self.view.scroll_to_line(block.line, context=0)
+                    return True
+        return False
+
+    def _on_outline_clicked(self, model_index):
+        self.view.scroll_to_line(self.index.blocks[model_index.row()].line, context=0)
+
+    def _sync_outline(self, top_line):
+        if not self.outline.isVisible():
+            return
+        row = self.index.block_at(top_line)
+        if row >= 0:
+            model_index = self.outline.model().index(row)
+            self.outline.setCurrentIndex(model_index)
+            self.outline.scrollTo(model_index)
+
+    def run_search(self, query):
+        self._matches = self.index.search(query)
+        self._match_pos = -1
+        if len(self._matches):
+            # 현재 화면 위치 이후의 첫 결과로 이동
+            self._match_pos = int(np.searchsorted(self._matches, self.view.top_line()))
+            self._match_pos %= len(self._matches)
+            self._show_match()
+        else:
+            self.view.set_highlight(query)
+            self.match_label.setText("결과 없음" if query else "")
+
+    def step_match(self, step):
+        if not len(self._matches):
+            return
+        self._match_pos = (self._match_pos + step) % len(self._matches)
+        self._show_match()
+
+    def _on_return(self):
+        self.step_match(-1 if QApplication.keyboardModifiers() & Qt.ShiftModifier else 1)
+
+    def _show_match(self):
+        line = int(self._matches[self._match_pos])
+        top = self.view.top_line()
+        if not top <= line < top + self.view.visible_lines():
+            self.view.scroll_to_line(line, context=self.view.visible_lines() // 3)
+        self.view.set_highlight(self.search_edit.text(), line)
+        self.match_label.setText(f"{self._match_pos + 1:,} / {len(self._matches):,}줄")
@@ -0,0 +1,240 @@
+"""계산 결과 디스크 캐시 (Result Cache) 모듈
+
+부력검토 결과/보고서, 분할 도형 데이터, DXF 파일 내용을 입력값의 해시로
+저장해 두고, 같은 입력이면 프로그램을 다시 실행해도 재계산하지 않는다.
+GUI와 일괄 처리(프로젝트 라이브러리 등)가 같은 캐시 폴더를 공유한다.
+
+캐시 키 = SHA-256(종류 + 코드 버전 + 정규화된 입력 JSON)
+코드 버전은 계산 모듈 소스의 해시이므로 계산 코드가 바뀌면 자동으로 무효화된다.
+기본 모듈 외의 코드로 계산하는 종류(골조해석, 수량산출 등)는 해당 모듈을 함께 지정한다.
+전체 크기가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제한다 (LRU).
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+from utils import get_app_data_dir, create_culvert_dxf
+from buoyancy_check import decompose_section, calculate_buoyancy, generate_buoyancy_report
+
+# 결과에 영향을 주는 모듈 (소스가 바뀌면 캐시 무효화)
+_VERSIONED_MODULES = ('buoyancy_check.py', 'utils.py', 'section_layout.py')
+_code_versions = {}
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def code_version(modules=()):
+    """계산 코드 버전 (관련 모듈 소스의 해시)
+
+    modules: 기본 모듈(_VERSIONED_MODULES) 외에 결과에 영향을 주는 모듈 파일 이름
+    """
+    modules = tuple(modules)
+    version = _code_versions.get(modules)
+    if version is None:
+        h = hashlib.sha256()
+        base = os.path.dirname(os.path.abspath(__file__))
+        for name in _VERSIONED_MODULES + modules:
+            with open(os.path.join(base, name), 'rb') as f:
+                h.update(f.read())
+        version = _code_versions[modules] = h.hexdigest()[:16]
+    return version
+
+
+def canonical_json(data):
+    """정규화된 JSON 문자열 (키 정렬, 정수값 실수는 정수로)"""
+    def normalize(value):
+        if isinstance(value, dict):
+            return {str(k): normalize(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [normalize(v) for v in value]
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+    return json.dumps(normalize(data), sort_keys=True, ensure_ascii=False,
+                      separators=(',', ':'), default=str)
+
+
+def cache_key(kind, *inputs, modules=()):
+    """캐시 키 (종류 + 코드 버전 + 입력값)"""
+    h = hashlib.sha256()
+    h.update(kind.encode('utf-8'))
+    h.update(code_version(modules).encode('ascii'))
+    h.update(canonical_json(inputs).encode('utf-8'))
+    return h.hexdigest()
+
+
+class ResultCache:
+    """내용 주소 기반 디스크 캐시 (크기 제한 LRU)"""
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory or get_app_data_dir('cache')
+        self.max_bytes = max_bytes
+        self._total_bytes = None
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def get_bytes(self, key):
+        """저장된 내용 (없으면 None). 읽은 항목은 최근 사용으로 표시"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def put_bytes(self, key, data):
+        """내용 저장 (임시 파일 + rename) 후 크기 한도 초과 시 정리"""
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # 캐시 실패는 계산 결과에 영향 없음
+            print(f"결과 캐시 저장 실패: {e}")
+            return
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += len(data) - old_size
+        self._evict_if_needed()
+
+    def get_json(self, key):
+        data = self.get_bytes(key)
+        if data is None:
+            return None
+        try:
+            return json.loads(data.decode('utf-8'))
+        except ValueError:
+            return None
+
+    def put_json(self, key, value):
+        self.put_bytes(key, json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    def get_or_compute_json(self, kind, inputs, compute, modules=()):
+        """캐시에 있으면 반환, 없으면 compute() 결과를 저장 후 반환
+
+        modules: 기본 모듈 외에 compute()가 사용하는 계산 모듈 (code_version 참고)
+        """
+        key = cache_key(kind, *inputs, modules=modules)
+        value = self.get_json(key)
+        if value is None:
+            value = compute()
+            self.put_json(key, value)
+        return value
+
+    def _entries(self):
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith('.tmp'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def total_bytes(self):
+        """캐시 전체 크기"""
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            return self._total_bytes
+
+    def _evict_if_needed(self):
+        if self.total_bytes() <= self.max_bytes:
+            return
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            # 한도의 90%까지 줄여서 매번 정리하지 않도록 함
+            target = self.max_bytes * 0.9
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+            self._total_bytes = total
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._total_bytes = 0
+
+
+_default_cache = None
+
+
+def get_result_cache():
+    """프로그램 공용 결과 캐시"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResultCache()
+    return _default_cache
+
+
+# ── 계산 결과 캐시 함수 ──
+
+def cached_decomposition(section_data, cache=None):
+    """분할 도형 목록 (decompose_section 결과)"""
+    cache = cache or get_result_cache()
+    return cache.get_or_compute_json(
+        'decomposition', (section_data,), lambda: decompose_section(section_data))
+
+
+def cached_buoyancy(section_data, ground_info, cache=None):
+    """부력검토 수치 결과 (calculate_buoyancy 결과)"""
+    cache = cache or get_result_cache()
+    return cache.get_or_compute_json(
+        'buoyancy', (section_data, ground_info),
+        lambda: calculate_buoyancy(section_data, ground_info,
+                                   shapes=cached_decomposition(section_data, cache)))
+
+
+def cached_buoyancy_report(section_data, ground_info, cache=None):
+    """부력검토 보고서 텍스트"""
+    cache = cache or get_result_cache()
+    return cache.get_or_compute_json(
+        'buoyancy_report', (section_data, ground_info),
+        lambda: generate_buoyancy_report(section_data, ground_info))
+
+
+def dxf_to_bytes(doc):
+    """DXF 문서를 파일 내용(bytes)으로 변환"""
+    stream = io.StringIO()
+    doc.write(stream)
+    return stream.getvalue().encode(doc.output_encoding, errors='dxfreplace')
+
+
+def cached_culvert_dxf_bytes(culvert_data, ground_info=None, cache=None):
+    """암거 단면 DXF 파일 내용 (create_culvert_dxf 결과)
+
+    화면 표시는 DXF를 다시 읽는 것보다 새로 생성하는 편이 빠르므로
+    파일 내보내기와 일괄 처리에 사용한다.
+    """
+    cache = cache or get_result_cache()
+    key = cache_key('culvert_dxf', culvert_data, ground_info)
+    data = cache.get_bytes(key)
+    if data is None:
+        data = dxf_to_bytes(create_culvert_dxf(culvert_data, ground_info))
+        cache.put_bytes(key, data)
+    return data
@@ -0,0 +1,208 @@
+"""단면 형상 (Section Geometry) 모듈
+
+암거 단면을 가중치가 있는 다각형 집합으로 정확히 표현하고,
+신발끈 공식(shoelace)을 모든 다각형에 한 번에 적용하여 단면적, 도심,
+단면2차모멘트를 구한다.
+
+다각형 구성 (DXF 좌표, mm, 원점 = 하부슬래브 하단 좌측)
+    외곽     : 구조물 외곽 사각형 (가중치 +1)
+    내공     : 칸마다 헌치를 잘라낸 다각형 (가중치 -1)
+    기둥 구간 : 기둥형 중간벽의 상/하부 종거더 사이 (가중치 -(1 - 기둥폭/CTC))
+    부상방지저판 : 하부슬래브 아래 사각형 (가중치 +1, 부력검토와 같은 가정)
+
+계산 결과는 decompose_section(부력검토 분할 도형)의 면적 합계와 자동으로
+비교하여 불일치를 알려 준다.
+"""
+
+import numpy as np
+from buoyancy_check import decompose_section
+from section_layout import get_section_layout
+
+AREA_TOLERANCE = 1e-6    # 분할 도형 합계와 비교 허용 상대오차
+
+
+class SectionPolygon:
+    """가중치 다각형 (반시계 방향 꼭짓점 배열)"""
+
+    def __init__(self, name, group, weight, points):
+        self.name = name
+        self.group = group            # 'member' / 'void' / 'column' / 'antiFloat'
+        self.weight = weight
+        self.points = np.asarray(points, dtype=float)
+
+
+def section_polygons(section_data):
+    """단면을 구성하는 가중치 다각형 목록"""
+    layout = get_section_layout(section_data)
+    bottom, top = layout.bottom, layout.top
+    polygons = [SectionPolygon('외곽', 'member', 1.0, [
+        (0, 0), (layout.total_width, 0),
+        (layout.total_width, layout.total_height), (0, layout.total_height)])]
+
+    # 내공 (헌치 모서리 제거)
+    for i in range(layout.culvert_count):
+        left, right = layout.cell(i)
+        h = {c: (float(v.get('width', 0)), float(v.get('height', 0)))
+             for c, v in layout.haunches[i].items()}
+        polygons.append(SectionPolygon(f"내공{i+1}", 'void', -1.0, [
+            (left + h['ll'][0], bottom), (right - h['lr'][0], bottom),
+            (right, bottom + h['lr'][1]), (right, top - h['ur'][1]),
+            (right - h['ur'][0], top), (left + h['ul'][0], top),
+            (left, top - h['ul'][1]), (left, bottom + h['ll'][1])]))
+
+    # 기둥형 중간벽: 종거더 사이에서 기둥이 차지하지 않는 부분
+    column_girder = section_data.get('columnGirder', {}) or {}
+    ctc = float(column_girder.get('columnCTC', 3000))
+    col_width = float(column_girder.get('columnWidth', 500))
+    upper_add = float(column_girder.get('upperAdditionalHeight', 200))
+    lower_add = float(column_girder.get('lowerAdditionalHeight', 200))
+    for i, mw in enumerate(layout.middle_walls[:layout.culvert_count - 1]):
+        if mw.get('type', '연속벽') != '기둥' or ctc <= 0:
+            continue
+        w_left, w_right = layout.middle_wall(i)
+        y1 = bottom + float(layout.haunches[i]['lr'].get('height', 0)) + lower_add
+        y2 = top - float(layout.haunches[i]['ur'].get('height', 0)) - upper_add
+        if y2 > y1:
+            polygons.append(SectionPolygon(f"중간벽체{i+1} 기둥 사이", 'column', -(1.0 - col_width / ctc), [
+                (w_left, y1), (w_right, y1), (w_right, y2), (w_left, y2)]))
+
+    # 부상방지저판
+    anti_float = section_data.get('antiFloat', {}) or {}
+    if anti_float.get('use', False):
+        x1 = -float(anti_float.get('leftExtension', 500))
+        x2 = layout.total_width + float(anti_float.get('rightExtension', 500))
+        y1 = -float(anti_float.get('thickness', 300))
+        polygons.append(SectionPolygon('부상방지저판', 'antiFloat', 1.0, [
+            (x1, y1), (x2, y1), (x2, 0), (x1, 0)]))
+    return polygons
+
+
+def polygon_moments(points):
+    """다각형 배열의 면적 모멘트 (신발끈 공식, 벡터화)
+
+    Args:
+        points: (다각형, 꼭짓점, 2) 배열. 꼭짓점 수가 다르면 마지막 점을 반복해 채움
+
+    Returns:
+        (다각형, 6) 배열 [A, Sx, Sy, Ixx, Iyy, Ixy] (원점 기준, 방향과 무관하게 양수 면적)
+            Sx = ∫y dA, Sy = ∫x dA, Ixx = ∫y² dA, Iyy = ∫x² dA, Ixy = ∫xy dA
+    """
+    x0, y0 = points[..., 0], points[..., 1]
+    x1, y1 = np.roll(x0, -1, axis=1), np.roll(y0, -1, axis=1)
+    c = x0 * y1 - x1 * y0
+    A = c.sum(axis=1) / 2
+    Sy = ((x0 + x1) * c).sum(axis=1) / 6
+    Sx = ((y0 + y1) * c).sum(axis=1) / 6
+    Ixx = ((y0 ** 2 + y0 * y1 + y1 ** 2) * c).sum(axis=1) / 12
+    Iyy = ((x0 ** 2 + x0 * x1 + x1 ** 2) * c).sum(axis=1) / 12
+    Ixy = ((x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0) * c).sum(axis=1) / 24
+    moments = np.stack([A, Sx, Sy, Ixx, Iyy, Ixy], axis=1)
+    # 시계 방향 다각형은 부호 반전
+    return moments * np.where(A < 0, -1.0, 1.0)[:, np.newaxis]
+
+
+def _pad_polygons(polygons):
+    """다각형 꼭짓점을 같은 길이의 배열로 (마지막 점 반복 → 길이 0 변)"""
+    n = max(len(p.points) for p in polygons)
+    padded = np.empty((len(polygons), n, 2))
+    for k, p in enumerate(polygons):
+        padded[k, :len(p.points)] = p.points
+        padded[k, len(p.points):] = p.points[-1]
+    return padded
+
+
+class SectionProperties:
+    """단면 특성 (단위길이 1 m 당, mm 단위)"""
+
+    def __init__(self, polygons, moments, decomposition_areas):
+        weights = np.array([p.weight for p in polygons])
+        groups = np.array([p.group for p in polygons])
+        weighted = moments * weights[:, np.newaxis]
+        A, Sx, Sy, Ixx, Iyy, Ixy = weighted.sum(axis=0)
+
+        self.polygons = polygons
+        self.area = A                                  # mm²
+        self.centroid = (Sy / A, Sx / A)               # (xc, yc) mm
+        xc, yc = self.centroid
+        # 도심축 기준 (평행축 정리)
+        self.Ix = Ixx - A * yc ** 2                    # 수평 도심축 (mm⁴)
+        self.Iy = Iyy - A * xc ** 2                    # 연직 도심축 (mm⁴)
+        self.Ixy = Ixy - A * xc * yc
+        self.anti_float_area = weighted[groups == 'antiFloat', 0].sum()
+        self.body_area = A - self.anti_float_area
+
+        # 분할 도형 합계와 비교
+        self.decomposition_body_area, self.decomposition_anti_float_area = decomposition_areas
+        self.mismatch = []
+        for name, exact, summed in (('본체', self.body_area, self.decomposition_body_area),
+                                    ('부상방지저판', self.anti_float_area,
+                                     self.decomposition_anti_float_area)):
+            if abs(exact - summed) > AREA_TOLERANCE * max(abs(exact), 1.0):
+                self.mismatch.append((name, exact, summed))
+
+    @property
+    def consistent(self):
+        """분할 도형 면적 합계와 일치 여부"""
+        return not self.mismatch
+
+
+def compute_section_properties(section_data, shapes=None):
+    """단면 특성 계산 + 분할 도형 면적 교차검증
+
+    Args:
+        section_data: 단면제원 데이터
+        shapes: decompose_section 결과 (없으면 계산)
+
+    Returns:
+        SectionProperties
+    """
+    polygons = section_polygons(section_data)
+    moments = polygon_moments(_pad_polygons(polygons))
+    if shapes is None:
+        shapes = decompose_section(section_data)
+    body = sum(s['area'] for s in shapes if s['group'] != 'antiFloat')
+    anti_float = sum(s['area'] for s in shapes if s['group'] == 'antiFloat')
+    return SectionProperties(polygons, moments, (body, anti_float))
+
+
+def generate_section_properties_report(section_data, props=None):
+    """단면 특성 보고서 텍스트"""
+    if props is None:
+        props = compute_section_properties(section_data)
+    lines = []
+
+    def add(text=''):
+        lines.append(text)
+
+    xc, yc = props.centroid
+    add("═" * 60)
+    add("         단 면 특 성")
+    add("═" * 60)
+    add()
+    add("   좌표 원점 = 하부슬래브 하단 좌측 (단위길이 1 m 당)")
+    add()
+    add(f"   단면적 A = {props.area:,.0f} mm² = {props.area / 1e6:,.4f} m²")
+    if props.anti_float_area:
+        add(f"     (본체 {props.body_area:,.0f} mm², 부상방지저판 {props.anti_float_area:,.0f} mm²)")
+    add(f"   도심 xc = {xc:,.1f} mm, yc = {yc:,.1f} mm")
+    add(f"   Ix  = {props.Ix:.4e} mm⁴ = {props.Ix / 1e12:,.4f} m⁴")
+    add(f"   Iy  = {props.Iy:.4e} mm⁴ = {props.Iy / 1e12:,.4f} m⁴")
+    add(f"   Ixy = {props.Ixy:.4e} mm⁴")
+    add()
+    add("   ■ 구성 다각형")
+    for p in props.polygons:
+        add(f"     {p.name:<20} 가중치 {p.weight:+.3f}, 꼭짓점 {len(p.points)}개")
+    add()
+    add("   ■ 부력검토 분할 도형과 비교")
+    add(f"     본체: 다각형 {props.body_area:,.1f} / 분할 도형 {props.decomposition_body_area:,.1f} mm²")
+    if props.anti_float_area or props.decomposition_anti_float_area:
+        add(f"     부상방지저판: 다각형 {props.anti_float_area:,.1f}"
+            f" / 분할 도형 {props.decomposition_anti_float_area:,.1f} mm²")
+    if props.consistent:
+        add("     →  일치")
+    else:
+        for name, exact, summed in props.mismatch:
+            add(f"     →  {name} 불일치: 차이 {exact - summed:+,.1f} mm² (헌치/종거더 입력 확인)")
+    add()
+    add("═" * 60)
+    return '\n'.join(lines)
@@ -0,0 +1,109 @@
+"""실행 취소/다시 실행 (Undo/Redo) 모듈
+
+프로젝트 입력 상태를 변경 불가능한(immutable) 구조로 보관한다.
+편집 시에는 바뀐 경로의 컨테이너만 새로 만들고 나머지는 이전 상태와
+공유하므로(structural sharing), 편집 기록에는 (경로, 이전 값, 새 값)만 남는다.
+기록 개수는 MAX_ENTRIES로 제한하여 오래 편집해도 메모리가 늘지 않는다.
+"""
+
+from types import MappingProxyType
+from project_paths import diff_paths, get_path
+
+
+def freeze(data):
+    """dict/list 중첩 데이터를 읽기 전용 구조로 변환 (dict → MappingProxy, list → tuple)"""
+    if isinstance(data, (dict, MappingProxyType)):
+        return MappingProxyType({k: freeze(v) for k, v in data.items()})
+    if isinstance(data, (list, tuple)):
+        return tuple(freeze(v) for v in data)
+    return data
+
+
+def thaw(state):
+    """읽기 전용 구조를 위젯에 넘길 수 있는 dict/list로 복사"""
+    if isinstance(state, MappingProxyType):
+        return {k: thaw(v) for k, v in state.items()}
+    if isinstance(state, tuple):
+        return [thaw(v) for v in state]
+    return state
+
+
+def assoc_path(state, path, value):
+    """경로의 값만 바꾼 새 상태 (경로 위 컨테이너만 복사, 나머지는 공유)"""
+    if not path:
+        return freeze(value)
+    key, rest = path[0], path[1:]
+    if isinstance(state, tuple):
+        items = list(state)
+        items[key] = assoc_path(items[key], rest, value)
+        return tuple(items)
+    items = dict(state) if state is not None else {}
+    items[key] = assoc_path(items.get(key), rest, value)
+    return MappingProxyType(items)
+
+
+class EditHistory:
+    """편집 기록 (실행 취소/다시 실행 스택)"""
+
+    MAX_ENTRIES = 200
+
+    def __init__(self, data=None):
+        self.state = freeze(data or {})
+        self._undo = []
+        self._redo = []
+
+    def reset(self, data):
+        """새 프로젝트 상태로 기록 초기화"""
+        self.state = freeze(data)
+        self._undo.clear()
+        self._redo.clear()
+
+    def rebase(self, data):
+        """기록은 유지하고 현재 상태만 맞춤 (위젯이 값 형식을 바꾼 경우 등)"""
+        for path, value in diff_paths(self.state, data):
+            self.state = assoc_path(self.state, path, value)
+
+    def record(self, data):
+        """현재 입력 데이터와 비교해 바뀐 경로만 기록. 변경이 없으면 False"""
+        changes = []
+        for path, value in diff_paths(self.state, data):
+            old = get_path(self.state, path)
+            if old == value and not isinstance(old, (MappingProxyType, tuple)):
+                # 4000 → 4000.0 처럼 값이 같은 형식 변경은 기록하지 않음
+                continue
+            changes.append((path, old, freeze(value)))
+        if not changes:
+            return False
+        for path, _, value in changes:
+            self.state = assoc_path(self.state, path, value)
+        self._undo.append(changes)
+        if len(self._undo) > self.MAX_ENTRIES:
+            del self._undo[0]
+        self._redo.clear()
+        return True
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def undo(self):
+        """직전 편집 취소 → 바뀐 상태 (없으면 None)"""
+        if not self._undo:
+            return None
+        changes = self._undo.pop()
+        for path, old, _ in reversed(changes):
+            self.state = assoc_path(self.state, path, old)
+        self._redo.append(changes)
+        return self.state
+
+    def redo(self):
+        """취소한 편집 다시 실행 → 바뀐 상태 (없으면 None)"""
+        if not self._redo:
+            return None
+        changes = self._redo.pop()
+        for path, _, new in changes:
+            self.state = assoc_path(self.state, path, new)
+        self._undo.append(changes)
+        return self.state
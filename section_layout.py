@@ -0,0 +1,116 @@
+"""암거 단면 배치 (Section Layout) 모듈
+
+벽체 면/칸 경계의 x좌표를 누적합으로 한 번 계산해 두고, 도면 생성,
+부력검토, 부재 선택 코드가 같은 값을 O(1)로 조회하도록 한다.
+단면 데이터가 같으면(같은 버전) 캐시된 배치를 재사용한다.
+
+벽체 번호: 0 = 좌측벽, 1 ~ n-1 = 중간벽, n = 우측벽 (n = 암거련수)
+칸 번호:   0 ~ n-1 (칸 i는 벽체 i와 벽체 i+1 사이)
+"""
+
+import json
+from collections import OrderedDict
+
+_LAYOUT_CACHE_SIZE = 32
+_layout_cache = OrderedDict()
+
+
+def get_compartment_haunches(haunch_data, culvert_count, i):
+    """칸별 헌치 데이터 가져오기"""
+    if not haunch_data:
+        zero = {'width': 0, 'height': 0}
+        return {'ul': zero, 'll': zero, 'ur': zero, 'lr': zero}
+
+    lw = haunch_data.get('leftWall', {})
+    rw = haunch_data.get('rightWall', {})
+    mw = haunch_data.get('middleWalls', [])
+    last = culvert_count - 1
+    zero = {'width': 0, 'height': 0}
+
+    left_wall = lw if i == 0 else (mw[i - 1] if i - 1 < len(mw) else {})
+    right_wall = rw if i == last else (mw[i] if i < len(mw) else {})
+
+    return {
+        'ul': left_wall.get('upper', zero),
+        'll': left_wall.get('lower', zero),
+        'ur': right_wall.get('upper', zero),
+        'lr': right_wall.get('lower', zero)
+    }
+
+
+class SectionLayout:
+    """단면 배치 좌표 (DXF 좌표, mm)"""
+
+    def __init__(self, section_data):
+        self.B = [float(b) for b in section_data.get('B', [4000])]
+        self.culvert_count = int(section_data.get('culvert_count', len(self.B)))
+        self.H = float(section_data.get('H', 4200))
+        self.UT = float(section_data.get('UT', 600))
+        self.LT = float(section_data.get('LT', 800))
+        self.WL = float(section_data.get('WL', 600))
+        self.WR = float(section_data.get('WR', 600))
+        # 입력 위젯이 원본 dict를 직접 수정하므로 캐시용으로 복사해 둔다
+        self.middle_walls = [dict(mw) for mw in section_data.get('middle_walls', [])]
+        haunch_data = section_data.get('haunch', None)
+
+        n = self.culvert_count
+        thickness = [self.WL]
+        for i in range(n - 1):
+            mw = self.middle_walls[i] if i < len(self.middle_walls) else {}
+            thickness.append(float(mw.get('thickness', 0)))
+        thickness.append(self.WR)
+        self.wall_thickness = thickness
+
+        # 누적합: wall_left[j] / wall_right[j] = 벽체 j의 좌/우측 면
+        self.wall_left = []
+        self.wall_right = []
+        x = 0.0
+        for j in range(n + 1):
+            self.wall_left.append(x)
+            x += thickness[j]
+            self.wall_right.append(x)
+            if j < n:
+                x += self.B[j]
+
+        self.total_width = self.wall_right[n]
+        self.total_height = self.LT + self.H + self.UT
+        self.bottom = self.LT          # 내공 하단
+        self.top = self.LT + self.H    # 내공 상단
+
+        # 칸별 헌치 (ul/ll/ur/lr)
+        self.haunches = []
+        for i in range(n):
+            h = get_compartment_haunches(haunch_data, n, i)
+            self.haunches.append({corner: dict(h[corner]) for corner in ('ul', 'll', 'ur', 'lr')})
+
+    def cell(self, i):
+        """칸 i의 (좌측, 우측) x좌표"""
+        return self.wall_right[i], self.wall_left[i + 1]
+
+    def middle_wall(self, i):
+        """중간벽 i(0부터)의 (좌측면, 우측면) x좌표"""
+        return self.wall_left[i + 1], self.wall_right[i + 1]
+
+
+def _layout_key(section_data):
+    """배치에 영향을 주는 값으로 만든 버전 키"""
+    return json.dumps([
+        section_data.get('culvert_count'), section_data.get('H'),
+        section_data.get('B'), section_data.get('UT'), section_data.get('LT'),
+        section_data.get('WL'), section_data.get('WR'),
+        section_data.get('middle_walls'), section_data.get('haunch')
+    ], sort_keys=True, default=str)
+
+
+def get_section_layout(section_data):
+    """단면 데이터의 배치 (같은 버전이면 캐시 반환)"""
+    key = _layout_key(section_data)
+    layout = _layout_cache.get(key)
+    if layout is None:
+        layout = SectionLayout(section_data)
+        _layout_cache[key] = layout
+        if len(_layout_cache) > _LAYOUT_CACHE_SIZE:
+            _layout_cache.popitem(last=False)
+    else:
+        _layout_cache.move_to_end(key)
+    return layout
@@ -0,0 +1,133 @@
+"""단면 부재 선택 (Picking) 모듈
+
+도면 생성 시 부재 영역(벽체, 슬래브, 헌치, 부력검토 도형 번호 등)을
+의미 태그와 함께 공간 인덱스에 등록해 두고, 커서 위치의 부재 조회,
+입력 항목 이동, 끝점 스냅에 사용한다. 좌표는 모두 DXF 좌표(mm)이다.
+
+target은 단면제원 데이터 안의 경로 튜플이다. 예) ('UT',), ('B', 1),
+('middle_walls', 0, 'thickness'), ('haunch', 'middleWalls', 1, 'upper')
+"""
+
+import math
+from spatial_index import GridIndex, bbox_of_points
+
+
+def point_in_polygon(x, y, polygon):
+    """점이 다각형 내부(경계 포함)에 있는지 (ray casting)"""
+    inside = False
+    n = len(polygon)
+    j = n - 1
+    for i in range(n):
+        xi, yi = polygon[i]
+        xj, yj = polygon[j]
+        if (yi > y) != (yj > y):
+            x_cross = xi + (y - yi) * (xj - xi) / (yj - yi)
+            if x <= x_cross:
+                inside = not inside
+        j = i
+    if inside:
+        return True
+    # 경계선 위의 점 처리 (벽체/슬래브 경계 클릭)
+    for i in range(n):
+        (x1, y1), (x2, y2) = polygon[i - 1], polygon[i]
+        if min(x1, x2) <= x <= max(x1, x2) and min(y1, y2) <= y <= max(y1, y2):
+            if abs((x2 - x1) * (y - y1) - (y2 - y1) * (x - x1)) <= 1e-6 * max(abs(x2 - x1) + abs(y2 - y1), 1):
+                return True
+    return False
+
+
+def polygon_area(polygon):
+    """다각형 면적 (절대값)"""
+    area = 0.0
+    for i in range(len(polygon)):
+        x1, y1 = polygon[i - 1]
+        x2, y2 = polygon[i]
+        area += x1 * y2 - x2 * y1
+    return abs(area) / 2
+
+
+class PickRegion:
+    """선택 가능한 부재 영역"""
+
+    def __init__(self, tag, polygon, target=None):
+        self.tag = tag
+        self.polygon = [(float(x), float(y)) for x, y in polygon]
+        self.target = target
+        self.area = polygon_area(self.polygon)
+        self.bbox = bbox_of_points(self.polygon)
+
+
+class SectionPickIndex:
+    """부재 영역 / 끝점 공간 인덱스"""
+
+    def __init__(self):
+        self.regions = []
+        self.endpoints = []
+        self._region_index = None
+        self._point_index = None
+
+    def add_region(self, tag, polygon, target=None):
+        """다각형 부재 영역 등록"""
+        region = PickRegion(tag, polygon, target)
+        if region.area > 0:
+            self.regions.append(region)
+            self._region_index = None
+        return region
+
+    def add_rect(self, tag, x1, y1, x2, y2, target=None):
+        """사각형 부재 영역 등록"""
+        return self.add_region(tag, [(x1, y1), (x2, y1), (x2, y2), (x1, y2)], target)
+
+    def add_endpoints_from_doc(self, doc):
+        """DXF 모델공간의 선/폴리선 끝점을 스냅 대상으로 등록"""
+        points = set()
+        for entity in doc.modelspace():
+            t = entity.dxftype()
+            if t == 'LINE':
+                points.add((entity.dxf.start.x, entity.dxf.start.y))
+                points.add((entity.dxf.end.x, entity.dxf.end.y))
+            elif t == 'LWPOLYLINE':
+                for p in entity.get_points('xy'):
+                    points.add((p[0], p[1]))
+        self.endpoints.extend(points)
+        self._point_index = None
+
+    def build(self):
+        """공간 인덱스 생성 (도면 생성 완료 후 1회)"""
+        self._region_index = self._build_grid([r.bbox for r in self.regions])
+        self._point_index = self._build_grid([(x, y, x, y) for x, y in self.endpoints])
+
+    @staticmethod
+    def _build_grid(bboxes):
+        extents = None
+        if bboxes:
+            extents = (min(b[0] for b in bboxes), min(b[1] for b in bboxes),
+                       max(b[2] for b in bboxes), max(b[3] for b in bboxes))
+        grid = GridIndex.for_extents(extents, len(bboxes), items_per_cell=4)
+        for key, bbox in enumerate(bboxes):
+            grid.insert(key, bbox)
+        return grid
+
+    def pick(self, x, y):
+        """점(x, y)를 포함하는 가장 작은 부재 영역 (없으면 None)"""
+        if self._region_index is None:
+            self.build()
+        best = None
+        for key in self._region_index.query_point(x, y):
+            region = self.regions[key]
+            if point_in_polygon(x, y, region.polygon):
+                if best is None or region.area < best.area:
+                    best = region
+        return best
+
+    def snap(self, x, y, tolerance):
+        """tolerance 이내에서 가장 가까운 끝점 (없으면 None)"""
+        if self._point_index is None:
+            self.build()
+        best, best_d = None, tolerance
+        for key in self._point_index.query_point(x, y, tolerance):
+            px, py = self.endpoints[key]
+            d = math.hypot(px - x, py - y)
+            if d <= best_d:
+                best, best_d = (px, py), d
+        return best
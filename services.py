@@ -1,18 +1,14 @@
-from PyQt5.QtWidgets import QFileDialog, QMessageBox
+from PyQt5.QtWidgets import QFileDialog, QMessageBox, QInputDialog
 import os
-import yaml
-from src.utils import create_sample_dxf, display_dxf
-from src.models import CustomTableModel
+from utils import create_sample_dxf, display_dxf
+from dxf_import import DxfLoadThread
 
 class DxfService:
     @staticmethod
     def load_dxf(parent, selected_item):
         if selected_item:
-            if selected_item[0] == "부모 항목 2":
-                parent.display_image("resources/pic01.jpg")
-            else:
-                doc = create_sample_dxf(selected_item[0], selected_item[1])
-                display_dxf(doc, parent.view.scene())
+            doc = create_sample_dxf(selected_item[0], selected_item[1])
+            display_dxf(doc, parent.graphics_view.scene())
         else:
             QMessageBox.warning(parent, "선택 오류", "트리 메뉴에서 항목을 선택해주세요.")
 
@@ -20,9 +16,55 @@ class DxfService:
     def save_dxf(parent, selected_item):
         if selected_item:
             doc = create_sample_dxf(selected_item[0], selected_item[1])
-            display_dxf(doc, parent.view.scene())
+            display_dxf(doc, parent.graphics_view.scene())
             filename = f"{selected_item[0]}_{selected_item[1]}.dxf"
             doc.saveas(filename)
             QMessageBox.information(parent, "저장 완료", f"{filename} 파일이 저장되었습니다.")
         else:
-            QMessageBox.warning(parent, "선택 오류", "트리 메뉴에서 항목을 선택해주세요.")
\ No newline at end of file
+            QMessageBox.warning(parent, "선택 오류", "트리 메뉴에서 항목을 선택해주세요.")
+
+    @staticmethod
+    def open_background_dxf(parent):
+        """외부 DXF를 배경도면으로 열기 (백그라운드 스레드에서 로딩)"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            parent, '배경 DXF 열기', '', 'DXF 파일 (*.dxf);;모든 파일 (*)')
+        if not file_path:
+            return
+
+        thread = DxfLoadThread(file_path, parent)
+        name = os.path.basename(file_path)
+        thread.progress.connect(
+            lambda count: parent.statusBar().showMessage(f'배경 DXF 읽는 중: {name} ({count:,}개)'))
+        thread.loaded.connect(lambda drawing: DxfService._on_background_loaded(parent, drawing))
+        thread.failed.connect(
+            lambda msg: QMessageBox.critical(parent, '배경 DXF 오류', f'DXF 파일을 읽지 못했습니다.\n{msg}'))
+        thread.finished.connect(thread.deleteLater)
+        parent.statusBar().showMessage(f'배경 DXF 읽는 중: {name}')
+        thread.start()
+
+    @staticmethod
+    def _on_background_loaded(parent, drawing):
+        """로딩 완료 → 기준점 입력 후 배경 레이어에 설정"""
+        cx, cy = drawing.center()
+        text, ok = QInputDialog.getText(
+            parent, '배경 DXF 기준점',
+            '암거 원점(좌측 하단)에 맞출 DXF 좌표 X,Y',
+            text=f'{cx:.0f},{cy:.0f}')
+        base_point = (cx, cy)
+        if ok:
+            try:
+                x, y = (float(v) for v in text.split(','))
+                base_point = (x, y)
+            except ValueError:
+                QMessageBox.warning(parent, '배경 DXF 기준점', '좌표 형식이 올바르지 않아 도면 중심을 사용합니다.')
+        parent.graphics_view.background_layer.set_drawing(drawing, base_point)
+        parent.graphics_view.fit_to_scene()
+        parent.statusBar().showMessage(
+            f'배경 DXF 불러오기 완료: {os.path.basename(drawing.filename)} '
+            f'({len(drawing):,}개 도형, 미지원 {drawing.skipped:,}개)')
+
+    @staticmethod
+    def close_background_dxf(parent):
+        """배경도면 닫기"""
+        parent.graphics_view.background_layer.clear()
+        parent.statusBar().showMessage('배경 DXF를 닫았습니다')
@@ -0,0 +1,108 @@
+"""공간 인덱스 (Spatial Index) 모듈
+
+균등 격자(uniform grid) 방식으로 사각 범위(bbox)를 버킷에 등록하고,
+뷰포트/커서 주변 범위에 걸치는 항목만 빠르게 찾는다.
+bbox 형식은 모두 (xmin, ymin, xmax, ymax) 이다.
+"""
+
+import math
+
+
+def bbox_of_points(points):
+    """점 목록의 bbox"""
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def bbox_union(a, b):
+    """두 bbox 합집합 (None 허용)"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def bbox_intersects(a, b):
+    """두 bbox 교차 여부"""
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+class GridIndex:
+    """균등 격자 공간 인덱스
+
+    각 항목은 bbox가 걸치는 격자 칸마다 등록된다. 너무 많은 칸에 걸치는
+    큰 항목(예: 전체 도곽선)은 별도 목록에 두고 질의 시 bbox로만 검사한다.
+    """
+
+    MAX_CELLS_PER_ITEM = 64
+
+    def __init__(self, cell_size):
+        self.cell_size = float(cell_size) if cell_size > 0 else 1.0
+        self._cells = {}
+        self._bboxes = {}
+        self._large = set()
+
+    @classmethod
+    def for_extents(cls, extents, count, items_per_cell=8):
+        """전체 범위와 항목 수로 격자 크기를 정해 인덱스 생성"""
+        if extents is None or count <= 0:
+            return cls(1.0)
+        w = max(extents[2] - extents[0], 1e-9)
+        h = max(extents[3] - extents[1], 1e-9)
+        cells = max(count / float(items_per_cell), 1.0)
+        return cls(math.sqrt(w * h / cells))
+
+    def __len__(self):
+        return len(self._bboxes)
+
+    def _cell_range(self, bbox):
+        cs = self.cell_size
+        return (int(math.floor(bbox[0] / cs)), int(math.floor(bbox[1] / cs)),
+                int(math.floor(bbox[2] / cs)), int(math.floor(bbox[3] / cs)))
+
+    def insert(self, key, bbox):
+        """항목 등록"""
+        self._bboxes[key] = bbox
+        i0, j0, i1, j1 = self._cell_range(bbox)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > self.MAX_CELLS_PER_ITEM:
+            self._large.add(key)
+            return
+        cells = self._cells
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                bucket = cells.get((i, j))
+                if bucket is None:
+                    cells[(i, j)] = [key]
+                else:
+                    bucket.append(key)
+
+    def bbox(self, key):
+        """등록된 항목의 bbox"""
+        return self._bboxes[key]
+
+    def query(self, bbox):
+        """bbox와 겹치는 항목 키 집합"""
+        found = set()
+        bboxes = self._bboxes
+        i0, j0, i1, j1 = self._cell_range(bbox)
+        n_cells = (i1 - i0 + 1) * (j1 - j0 + 1)
+        if n_cells > len(self._cells):
+            # 질의 범위가 격자보다 넓으면 채워진 칸만 순회
+            for (i, j), bucket in self._cells.items():
+                if i0 <= i <= i1 and j0 <= j <= j1:
+                    found.update(bucket)
+        else:
+            cells = self._cells
+            for i in range(i0, i1 + 1):
+                for j in range(j0, j1 + 1):
+                    bucket = cells.get((i, j))
+                    if bucket:
+                        found.update(bucket)
+        found.update(self._large)
+        return {k for k in found if bbox_intersects(bboxes[k], bbox)}
+
+    def query_point(self, x, y, tolerance=0.0):
+        """점(x, y) 주변 tolerance 범위와 겹치는 항목 키 집합"""
+        return self.query((x - tolerance, y - tolerance, x + tolerance, y + tolerance))
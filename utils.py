@@ -3,6 +3,20 @@ import math
 from PyQt5.QtWidgets import QGraphicsLineItem, QGraphicsEllipseItem, QGraphicsTextItem, QGraphicsPolygonItem,QGraphicsPathItem
 from PyQt5.QtGui import QPen, QColor, QFont, QPolygonF,QPainterPath,QFontMetricsF
 from PyQt5.QtCore import Qt, QPointF, QRectF
+from app_paths import get_app_data_dir
+from section_layout import get_compartment_haunches, get_section_layout
+from instrumentation import timed
+
+# 공개 이름 (get_app_data_dir, get_compartment_haunches는 app_paths/section_layout으로
+# 옮긴 뒤에도 utils에서 import하던 기존 코드를 위해 다시 내보냄)
+__all__ = [
+    'get_app_data_dir', 'setup_dimstyle', 'create_sample_dxf', 'dxf_color_to_qt',
+    'create_cosmetic_pen', 'draw_line', 'draw_circle', 'draw_arc', 'draw_text',
+    'draw_text_with_data', 'draw_lwpolyline', 'draw_dimension', 'display_dxf',
+    'find_intersection', 'find_midpoint', 'polar', 'calculate_angle', 'calculate_distance',
+    'add_culvert_pick_regions', 'create_culvert_dxf',
+    'get_compartment_haunches', 'get_section_layout',
+]
 
 def setup_dimstyle(doc, scale=50):
     """치수 스타일 설정 - 화면 표시와 DXF 내보내기 동일 적용"""
@@ -262,6 +276,7 @@ def draw_lwpolyline(scene, entity, color):
     scene.addItem(polyline_item)
 
 
+@timed('scene.draw_dimension')
 def draw_dimension(scene, entity, doc):
     dim_text = entity.dxf.text if entity.dxf.text != "<>" else f"{int(calculate_distance(entity.dxf.defpoint2, entity.dxf.defpoint3))}"
     dim_style = entity.dxf.dimstyle
@@ -342,6 +357,7 @@ def draw_dimension(scene, entity, doc):
 
 
 
+@timed('scene.display_dxf')
 def display_dxf(doc, scene):
     scene.clear()
     msp = doc.modelspace()
@@ -394,30 +410,90 @@ def calculate_distance(p1, p2):
     return math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
 
 
-def get_compartment_haunches(haunch_data, culvert_count, i):
-    """칸별 헌치 데이터 가져오기"""
-    if not haunch_data:
-        zero = {'width': 0, 'height': 0}
-        return {'ul': zero, 'll': zero, 'ur': zero, 'lr': zero}
+def _wall_haunch_info(culvert_count, wall_no):
+    """벽체 번호(0=좌측, culvert_count=우측) → (이름, 헌치 target 경로 앞부분)"""
+    if wall_no == 0:
+        return "좌측벽체", ('haunch', 'leftWall')
+    if wall_no == culvert_count:
+        return "우측벽체", ('haunch', 'rightWall')
+    return f"중간벽체{wall_no}", ('haunch', 'middleWalls', wall_no - 1)
 
-    lw = haunch_data.get('leftWall', {})
-    rw = haunch_data.get('rightWall', {})
-    mw = haunch_data.get('middleWalls', [])
-    last = culvert_count - 1
-    zero = {'width': 0, 'height': 0}
 
-    left_wall = lw if i == 0 else (mw[i - 1] if i - 1 < len(mw) else {})
-    right_wall = rw if i == last else (mw[i] if i < len(mw) else {})
+def add_culvert_pick_regions(pick_index, culvert_data):
+    """암거 단면의 부재 영역을 선택 인덱스에 등록 (벽체/슬래브/헌치/거더/내공)"""
+    LT = culvert_data['LT']
+    WL = culvert_data['WL']
+    WR = culvert_data['WR']
+    middle_walls = culvert_data['middle_walls']
+    culvert_count = culvert_data['culvert_count']
+    column_girder = culvert_data.get('columnGirder', None) or {}
+    anti_float = culvert_data.get('antiFloat', None)
 
-    return {
-        'ul': left_wall.get('upper', zero),
-        'll': left_wall.get('lower', zero),
-        'ur': right_wall.get('upper', zero),
-        'lr': right_wall.get('lower', zero)
-    }
+    layout = get_section_layout(culvert_data)
+    total_width = layout.total_width
+    total_height = layout.total_height
+    bottom, top = layout.bottom, layout.top
+
+    pick_index.add_rect("상부슬래브", 0, top, total_width, total_height, ('UT',))
+    pick_index.add_rect("하부슬래브", 0, 0, total_width, bottom, ('LT',))
+    pick_index.add_rect("좌측벽체", 0, bottom, WL, top, ('WL',))
+    pick_index.add_rect("우측벽체", total_width - WR, bottom, total_width, top, ('WR',))
+
+    upper_add = column_girder.get('upperAdditionalHeight', 0)
+    lower_add = column_girder.get('lowerAdditionalHeight', 0)
+    for i in range(culvert_count):
+        left, right = layout.cell(i)
+        pick_index.add_rect(f"내공 B{i+1}", left, bottom, right, top, ('B', i))
+
+        # 헌치 (칸의 좌측 벽체 = i번, 우측 벽체 = i+1번)
+        h = layout.haunches[i]
+        for corner, wall_no, pos in (('ul', i, 'upper'), ('ll', i, 'lower'),
+                                     ('ur', i + 1, 'upper'), ('lr', i + 1, 'lower')):
+            w, hh = h[corner].get('width', 0), h[corner].get('height', 0)
+            if w <= 0 or hh <= 0:
+                continue
+            wall_name, path = _wall_haunch_info(culvert_count, wall_no)
+            x_wall = left if corner in ('ul', 'll') else right
+            x_tip = x_wall + w if corner in ('ul', 'll') else x_wall - w
+            y_wall = top if pos == 'upper' else bottom
+            y_tip = y_wall - hh if pos == 'upper' else y_wall + hh
+            label = "상부헌치" if pos == 'upper' else "하부헌치"
+            pick_index.add_region(f"{wall_name} {label}",
+                                  [(x_wall, y_wall), (x_tip, y_wall), (x_wall, y_tip)],
+                                  path + (pos,))
 
+        if i < len(middle_walls):
+            wall = middle_walls[i]
+            w_left, w_right = layout.middle_wall(i)
+            if wall['type'] == '기둥':
+                pick_index.add_rect(f"중간벽체{i+1} (기둥)", w_left, bottom, w_right, top,
+                                    ('middle_walls', i, 'thickness'))
+                # 중간벽 i의 헌치 = 칸 i의 우측 헌치
+                upper_h = h['ur'].get('height', 0)
+                lower_h = h['lr'].get('height', 0)
+                if upper_add > 0:
+                    pick_index.add_rect(f"중간벽체{i+1} 상부종거더", w_left, top - upper_h - upper_add,
+                                        w_right, top, ('columnGirder', 'upperAdditionalHeight'))
+                if lower_add > 0:
+                    pick_index.add_rect(f"중간벽체{i+1} 하부종거더", w_left, bottom,
+                                        w_right, bottom + lower_h + lower_add,
+                                        ('columnGirder', 'lowerAdditionalHeight'))
+            else:
+                pick_index.add_rect(f"중간벽체{i+1}", w_left, bottom, w_right, top,
+                                    ('middle_walls', i, 'thickness'))
 
-def create_culvert_dxf(culvert_data, ground_info=None):
+    if anti_float and anti_float.get('use', False):
+        af_left_ext = anti_float.get('leftExtension', 0)
+        af_right_ext = anti_float.get('rightExtension', 0)
+        if af_left_ext > 0:
+            pick_index.add_rect("부상방지저판 좌측", -af_left_ext, 0, 0, LT, ('antiFloat', 'leftExtension'))
+        if af_right_ext > 0:
+            pick_index.add_rect("부상방지저판 우측", total_width, 0, total_width + af_right_ext, LT,
+                                ('antiFloat', 'rightExtension'))
+
+
+@timed('geometry.create_culvert_dxf')
+def create_culvert_dxf(culvert_data, ground_info=None, pick_index=None):
     """
     입력된 제원으로 암거 단면 DXF 생성
 
@@ -440,6 +516,7 @@ def create_culvert_dxf(culvert_data, ground_info=None):
         'frictionAngle': 내부마찰각,
         'soilUnitWeight': 단위중량
     }
+    pick_index: 부재 영역/끝점을 등록할 SectionPickIndex (선택)
     """
     doc = ezdxf.new('R2010')
     setup_dimstyle(doc, scale=50)
@@ -449,27 +526,23 @@ def create_culvert_dxf(culvert_data, ground_info=None):
         return doc
 
     H = culvert_data['H']
-    H4 = culvert_data['H4']
-    B_list = culvert_data['B']
     UT = culvert_data['UT']
     LT = culvert_data['LT']
     WL = culvert_data['WL']
     WR = culvert_data['WR']
     middle_walls = culvert_data['middle_walls']
     culvert_count = culvert_data['culvert_count']
-    haunch_data = culvert_data.get('haunch', None)
     anti_float = culvert_data.get('antiFloat', None)
 
     if ground_info is None:
         ground_info = {}
 
-    # 전체 폭 계산
-    total_inner_width = sum(B_list)
-    total_middle_wall_thickness = sum(w['thickness'] for w in middle_walls)
-    total_width = WL + total_inner_width + total_middle_wall_thickness + WR
+    # 벽체/칸 x좌표 (누적합, 단면 버전별 캐시)
+    layout = get_section_layout(culvert_data)
 
-    # 전체 높이 계산
-    total_height = LT + H + UT
+    # 전체 폭 / 높이
+    total_width = layout.total_width
+    total_height = layout.total_height
 
     # 부상방지저판 데이터
     af_use = anti_float and anti_float.get('use', False)
@@ -495,14 +568,11 @@ def create_culvert_dxf(culvert_data, ground_info=None):
         msp.add_lwpolyline(outer_points, dxfattribs={'color': 7})
 
     # 내공 그리기 (각 련별로 - 헌치 고려)
-    x_offset = WL
+    bottom = LT
+    top = LT + H
     for i in range(culvert_count):
-        B = B_list[i]
-        left = x_offset
-        right = x_offset + B
-        bottom = LT
-        top = LT + H
-        h = get_compartment_haunches(haunch_data, culvert_count, i)
+        left, right = layout.cell(i)
+        h = layout.haunches[i]
         ul, ur, ll, lr = h['ul'], h['ur'], h['ll'], h['lr']
 
         # 내공 사각형 (헌치를 고려하여 각 변 그리기)
@@ -511,19 +581,10 @@ def create_culvert_dxf(culvert_data, ground_info=None):
         msp.add_line((right - ur.get('width', 0), top), (left + ul.get('width', 0), top), dxfattribs={'color': 3})
         msp.add_line((left, top - ul.get('height', 0)), (left, bottom + ll.get('height', 0)), dxfattribs={'color': 3})
 
-        x_offset += B
-        if i < len(middle_walls):
-            x_offset += middle_walls[i]['thickness']
-
     # 헌치 대각선 그리기
-    x_offset = WL
     for i in range(culvert_count):
-        B = B_list[i]
-        left = x_offset
-        right = x_offset + B
-        bottom = LT
-        top = LT + H
-        h = get_compartment_haunches(haunch_data, culvert_count, i)
+        left, right = layout.cell(i)
+        h = layout.haunches[i]
         ul, ur, ll, lr = h['ul'], h['ur'], h['ll'], h['lr']
 
         if ul.get('width', 0) > 0 and ul.get('height', 0) > 0:
@@ -535,10 +596,6 @@ def create_culvert_dxf(culvert_data, ground_info=None):
         if lr.get('width', 0) > 0 and lr.get('height', 0) > 0:
             msp.add_line((right - lr['width'], bottom), (right, bottom + lr['height']), dxfattribs={'color': 3})
 
-        x_offset += B
-        if i < len(middle_walls):
-            x_offset += middle_walls[i]['thickness']
-
     # 기둥 종거더 그리기 (점선 + X표시)
     column_girder = culvert_data.get('columnGirder', None)
     if column_girder and len(middle_walls) > 0:
@@ -548,20 +605,15 @@ def create_culvert_dxf(culvert_data, ground_info=None):
             # DASHED 라인타입 등록
             if 'DASHED' not in doc.linetypes:
                 doc.linetypes.add('DASHED', pattern=[0.5, 0.25, -0.25])
-            bottom = LT
             top_y = LT + H
-            x_off = WL
             for i in range(culvert_count):
-                x_off += B_list[i]
                 if i < len(middle_walls):
                     wall = middle_walls[i]
                     if wall['type'] == '기둥':
-                        w_left = x_off
-                        w_right = x_off + wall['thickness']
-                        mw_haunch = haunch_data.get('middleWalls', []) if haunch_data else []
-                        mw_h = mw_haunch[i] if i < len(mw_haunch) else {}
-                        upper_h = mw_h.get('upper', {}).get('height', 0)
-                        lower_h = mw_h.get('lower', {}).get('height', 0)
+                        w_left, w_right = layout.middle_wall(i)
+                        # 중간벽 i의 헌치 = 칸 i의 우측 헌치
+                        upper_h = layout.haunches[i]['ur'].get('height', 0)
+                        lower_h = layout.haunches[i]['lr'].get('height', 0)
 
                         # 상부 거더 (헌치끝에서 아래로)
                         if upper_add > 0:
@@ -586,21 +638,17 @@ def create_culvert_dxf(culvert_data, ground_info=None):
                             msp.add_line((w_left, x_top), (w_right, x_bottom), dxfattribs={'color': 3})
                             msp.add_line((w_right, x_top), (w_left, x_bottom), dxfattribs={'color': 3})
 
-                    x_off += wall['thickness']
-
     # 기둥 리더선 그리기 (CTC, W 표시)
     if column_girder and len(middle_walls) > 0:
         mid_y = LT + H / 2
         leader_len = 800
         text_height = 150
         line_gap = text_height * 1.5
-        x_off = WL
         for i in range(culvert_count):
-            x_off += B_list[i]
             if i < len(middle_walls):
                 wall = middle_walls[i]
                 if wall['type'] == '기둥':
-                    w_surface = x_off + wall['thickness']
+                    w_surface = layout.middle_wall(i)[1]
                     leader_end = w_surface + leader_len
 
                     # 리더선
@@ -628,8 +676,6 @@ def create_culvert_dxf(culvert_data, ground_info=None):
                         }
                     )
 
-                x_off += wall['thickness']
-
     # 부상방지저판 그리기 (암거 저판과 같은 레벨에서 벽체 바깥으로 연장)
     if af_use:
         if af_left_ext > 0:
@@ -727,18 +773,14 @@ def create_culvert_dxf(culvert_data, ground_info=None):
     ).render()
 
     # 각 내공 폭 치수선 (상단)
-    x_offset = WL
     for i in range(culvert_count):
-        B = B_list[i]
+        left, right = layout.cell(i)
         msp.add_linear_dim(
-            base=(x_offset + B / 2, total_height + dim_offset),
-            p1=(x_offset, total_height),
-            p2=(x_offset + B, total_height),
+            base=((left + right) / 2, total_height + dim_offset),
+            p1=(left, total_height),
+            p2=(right, total_height),
             dimstyle="EZDXF"
         ).render()
-        x_offset += B
-        if i < len(middle_walls):
-            x_offset += middle_walls[i]['thickness']
 
     # 상부 슬래브 UT (좌측)
     msp.add_linear_dim(
@@ -776,18 +818,15 @@ def create_culvert_dxf(culvert_data, ground_info=None):
 
     # 중간벽 치수 (상단)
     if middle_walls:
-        x_offset = WL
         for i in range(culvert_count):
-            x_offset += B_list[i]
             if i < len(middle_walls):
-                wall_thickness = middle_walls[i]['thickness']
+                w_left, w_right = layout.middle_wall(i)
                 msp.add_linear_dim(
-                    base=(x_offset + wall_thickness / 2, total_height + dim_offset),
-                    p1=(x_offset, total_height),
-                    p2=(x_offset + wall_thickness, total_height),
+                    base=((w_left + w_right) / 2, total_height + dim_offset),
+                    p1=(w_left, total_height),
+                    p2=(w_right, total_height),
                     dimstyle="EZDXF"
                 ).render()
-                x_offset += wall_thickness
 
     # 부상방지저판 치수
     if af_use:
@@ -830,5 +869,9 @@ def create_culvert_dxf(culvert_data, ground_info=None):
                 dimstyle="EZDXF"
             ).render()
 
+    if pick_index is not None:
+        add_culvert_pick_regions(pick_index, culvert_data)
+        pick_index.add_endpoints_from_doc(doc)
+        pick_index.build()
 
     return doc
\ No newline at end of file